@@ -0,0 +1,3 @@
+"""
+Benchmarks and soak tests for CS-GradeCalculator.
+"""
@@ -0,0 +1,126 @@
+"""
+Benchmark of the binary codec against pickle and JSON for IPC payloads.
+
+Usage:
+    python -m benchmarks.bench_binary_codec --students 50000
+"""
+
+import argparse
+import json
+import pickle
+import sys
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from benchmarks.common import best_time, print_table
+from src.batch_grader import BatchGradeCalculator
+from src.binary_codec import GradingCodec
+from src.evaluation import Evaluation
+from src.grade_calculator import GradeCalculationResult
+from src.roster_generator import RosterGenerator
+from src.student import Student
+
+DEFAULT_STUDENTS = 50_000
+
+Codec = Tuple[Callable[[list], bytes], Callable[[bytes], list]]
+
+
+def parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=DEFAULT_STUDENTS)
+    parser.add_argument("--seed", type=int, default=RosterGenerator.DEFAULT_SEED)
+    return parser.parse_args(argv)
+
+
+def student_to_dict(student: Student) -> Dict[str, object]:
+    """Convert a student to the JSON document a service would send."""
+    evaluations = student.evaluation_view
+    return {
+        "student_id": student.student_id,
+        "has_reached_minimum_attendance": student.has_reached_minimum_attendance,
+        "grades": [evaluation.grade for evaluation in evaluations],
+        "weights": [evaluation.weight for evaluation in evaluations],
+    }
+
+
+def student_from_dict(data: Dict[str, object]) -> Student:
+    """Rebuild a student from student_to_dict()."""
+    student = Student(data["student_id"], data["has_reached_minimum_attendance"])
+    for grade, weight in zip(data["grades"], data["weights"]):
+        student.add_evaluation(Evaluation(grade, weight))
+    return student
+
+
+def result_to_dict(result: GradeCalculationResult) -> Dict[str, object]:
+    """Convert a result to a JSON document without rounding."""
+    return {
+        "weighted_average": result.weighted_average,
+        "attendance_penalty_applied": result.attendance_penalty_applied,
+        "extra_points_applied": result.extra_points_applied,
+        "final_grade": result.final_grade,
+    }
+
+
+def result_from_dict(data: Dict[str, object]) -> GradeCalculationResult:
+    """Rebuild a result from result_to_dict()."""
+    return GradeCalculationResult(**data)
+
+
+def json_codec(
+    to_dict: Callable[[object], dict], from_dict: Callable[[dict], object]
+) -> Codec:
+    """Build JSON encode and decode functions for one record type."""
+    return (
+        lambda items: json.dumps([to_dict(item) for item in items]).encode(),
+        lambda data: [from_dict(item) for item in json.loads(data)],
+    )
+
+
+def measure(label: str, codec: Codec, items: Sequence[object]) -> Dict[str, str]:
+    """Time encoding and decoding of a batch with one codec."""
+    encode, decode = codec
+    data = encode(items)
+    encode_time = best_time(lambda: encode(items))
+    decode_time = best_time(lambda: decode(data))
+    count = len(items)
+    return {
+        label: (
+            f"{len(data) / count:>7.1f} bytes/record, "
+            f"encode {count / encode_time:>10,.0f}/s, "
+            f"decode {count / decode_time:>10,.0f}/s"
+        )
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark for students and results with every codec."""
+    arguments = parse_arguments(argv)
+    roster = RosterGenerator(arguments.seed).generate(arguments.students)
+    students = roster.to_students()
+    results = BatchGradeCalculator().calculate_batch(
+        roster.grades, roster.weights, roster.attendance, [True] * len(roster)
+    )
+    pickle_codec: Codec = (pickle.dumps, pickle.loads)
+    workloads = {
+        "Student": (
+            students,
+            (GradingCodec.encode_students, GradingCodec.decode_students),
+            json_codec(student_to_dict, student_from_dict),
+        ),
+        "GradeCalculationResult": (
+            results,
+            (GradingCodec.encode_results, GradingCodec.decode_results),
+            json_codec(result_to_dict, result_from_dict),
+        ),
+    }
+    for name, (items, binary, json_functions) in workloads.items():
+        rows: Dict[str, str] = {}
+        rows.update(measure("binary codec", binary, items))
+        rows.update(measure("pickle", pickle_codec, items))
+        rows.update(measure("json", json_functions, items))
+        print_table(f"{name}: {len(items)} records", rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Benchmark of Monte Carlo pass probabilities for a whole cohort.
+
+Usage:
+    python -m benchmarks.bench_pass_probability --students 100000 --samples 10000
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+from benchmarks.common import print_table
+from src.pass_probability import PassProbabilityEngine
+from src.roster_generator import RosterGenerator
+
+DEFAULT_STUDENTS = 100_000
+DEFAULT_SAMPLES = PassProbabilityEngine.DEFAULT_SAMPLES
+GRADED_EVALUATIONS = 3
+PENDING_WEIGHTS = [40.0]
+PAST_COHORT_SIZE = 500
+TARGET_SECONDS = 120.0
+
+
+def parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=DEFAULT_STUDENTS)
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--seed", type=int, default=RosterGenerator.DEFAULT_SEED)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark; exit with 1 if it misses TARGET_SECONDS."""
+    arguments = parse_arguments(argv)
+    generator = RosterGenerator(arguments.seed)
+    roster = generator.generate(
+        arguments.students, GRADED_EVALUATIONS, shared_weights=True
+    )
+    # Graded evaluations cover what the pending final exam does not.
+    graded_share = 1 - sum(PENDING_WEIGHTS) / 100
+    weights = [[weight * graded_share for weight in row] for row in roster.weights]
+    past_cohort = generator.create_grades(PAST_COHORT_SIZE)
+
+    started_at = time.perf_counter()
+    engine = PassProbabilityEngine([past_cohort], arguments.samples, arguments.seed)
+    sampled_at = time.perf_counter()
+    estimates = engine.estimate_batch(
+        roster.grades,
+        weights,
+        [PENDING_WEIGHTS] * len(roster),
+        roster.attendance,
+        [True] * len(roster),
+    )
+    finished_at = time.perf_counter()
+
+    at_risk = sum(estimate.is_at_risk for estimate in estimates)
+    total = finished_at - started_at
+    title = (
+        f"Pass probability: {arguments.students} students x "
+        f"{arguments.samples} samples"
+    )
+    print_table(
+        title,
+        {
+            "draw samples": f"{sampled_at - started_at:>10.2f} s",
+            "estimate cohort": f"{finished_at - sampled_at:>10.2f} s",
+            "total": f"{total:>10.2f} s (target {TARGET_SECONDS:.0f} s)",
+            "students at risk": f"{at_risk:>10,}",
+        },
+    )
+    return 0 if total <= TARGET_SECONDS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Benchmark of ragged (CSR) evaluations against the dense padded layout.
+
+Usage:
+    python -m benchmarks.bench_ragged_evaluations --students 200000 --max-evaluations 4
+"""
+
+import argparse
+import random
+import sys
+from array import array
+from itertools import islice
+from operator import mul
+from typing import List, Optional
+
+from benchmarks.common import best_time, print_table
+from src.evaluation import Evaluation
+from src.grade_calculator import GradeCalculator
+from src.ragged_evaluations import RaggedEvaluations
+from src.roster_generator import RosterGenerator
+
+DEFAULT_STUDENTS = 100_000
+DEFAULT_MAX_EVALUATIONS = 4
+STRIDE = GradeCalculator.MAX_EVALUATIONS
+
+
+def parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=DEFAULT_STUDENTS)
+    parser.add_argument(
+        "--max-evaluations", type=int, default=DEFAULT_MAX_EVALUATIONS
+    )
+    parser.add_argument("--seed", type=int, default=RosterGenerator.DEFAULT_SEED)
+    return parser.parse_args(argv)
+
+
+def pack_dense(grades: List[List[float]], weights: List[List[float]]):
+    """Pack rows into row_count x MAX_EVALUATIONS matrices padded with zeros."""
+    padding = [0.0] * STRIDE
+    dense_grades = array("d")
+    dense_weights = array("d")
+    for row_grades, row_weights in zip(grades, weights):
+        dense_grades.extend(row_grades + padding[len(row_grades) :])
+        dense_weights.extend(row_weights + padding[len(row_weights) :])
+    return dense_grades, dense_weights
+
+
+def dense_weighted_averages(dense_grades: array, dense_weights: array) -> List[float]:
+    """Sum every padded row; zero padding leaves the sums unchanged."""
+    divisor = Evaluation.PERCENTAGE_DIVISOR
+    fractions = [weight / divisor for weight in dense_weights]
+    iterator = map(mul, dense_grades, fractions)
+    return [
+        sum(islice(iterator, STRIDE)) for _ in range(len(dense_grades) // STRIDE)
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and print memory and speed of both layouts."""
+    arguments = parse_arguments(argv)
+    generator = RosterGenerator(arguments.seed)
+    counts = random.Random(arguments.seed)
+    rows = [
+        generator.create_row(
+            f"U{index}",
+            counts.randint(RosterGenerator.MIN_EVALUATIONS, arguments.max_evaluations),
+        )
+        for index in range(arguments.students)
+    ]
+    grades = [row[1] for row in rows]
+    weights = [row[2] for row in rows]
+
+    dense_grades, dense_weights = pack_dense(grades, weights)
+    ragged = RaggedEvaluations.from_columns(grades, weights)
+    expected = dense_weighted_averages(dense_grades, dense_weights)
+    if ragged.weighted_averages() != expected:
+        print("Ragged and dense weighted averages differ")
+        return 1
+
+    dense_bytes = (len(dense_grades) + len(dense_weights)) * dense_grades.itemsize
+    timings = {
+        "dense weighted averages": best_time(
+            lambda: dense_weighted_averages(dense_grades, dense_weights)
+        ),
+        "ragged weighted averages": best_time(ragged.weighted_averages),
+        "ragged weight totals": best_time(ragged.weight_totals),
+        "ragged validate": best_time(ragged.validate),
+    }
+    students = arguments.students
+    table = {
+        label: f"{students / seconds:>12,.0f} rows/s"
+        for label, seconds in timings.items()
+    }
+    table["dense memory"] = f"{dense_bytes / students:>12,.1f} bytes/row"
+    table["ragged memory"] = f"{ragged.nbytes / students:>12,.1f} bytes/row"
+
+    title = (
+        f"Ragged evaluations: {students} students x "
+        f"1-{arguments.max_evaluations} evals"
+    )
+    print_table(title, table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Benchmark of grade slip rendering against throughput targets.
+
+Usage:
+    python -m benchmarks.bench_report_renderer --students 40000 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import List, Optional
+
+from benchmarks.common import best_time, print_table
+from src.batch_grader import BatchGradeCalculator
+from src.report_renderer import HTML_FORMAT, TEXT_FORMAT, ReportRenderer
+from src.roster_generator import RosterGenerator
+
+DEFAULT_STUDENTS = 40_000
+DEFAULT_WORKERS = 4
+TARGET_SLIPS_PER_SECOND = {TEXT_FORMAT: 50_000, HTML_FORMAT: 40_000}
+
+
+def parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=DEFAULT_STUDENTS)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--seed", type=int, default=RosterGenerator.DEFAULT_SEED)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and fail if a sequential run misses its target."""
+    arguments = parse_arguments(argv)
+    students = arguments.students
+    roster = RosterGenerator(arguments.seed).generate(students)
+    results = BatchGradeCalculator().calculate_batch(
+        roster.grades, roster.weights, roster.attendance, [True] * students
+    )
+    slips = list(zip(roster.student_ids, results))
+
+    rows = {}
+    missed = []
+    with tempfile.TemporaryDirectory() as directory:
+        for output_format in (TEXT_FORMAT, HTML_FORMAT):
+            path = os.path.join(directory, f"slips.{output_format}")
+            for workers in (ReportRenderer.SEQUENTIAL_WORKERS, arguments.workers):
+                renderer = ReportRenderer(output_format, workers=workers)
+                seconds = best_time(lambda: renderer.write(slips, path))
+                rate = students / seconds
+                target = TARGET_SLIPS_PER_SECOND[output_format]
+                label = f"{output_format} ({workers} workers)"
+                rows[label] = f"{rate:>12,.0f} slips/s (target {target:,})"
+                if workers == ReportRenderer.SEQUENTIAL_WORKERS and rate < target:
+                    missed.append(label)
+
+    print_table(f"Report renderer: {students} slips, {os.cpu_count()} CPUs", rows)
+    if missed:
+        print(f"Below target: {', '.join(missed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Benchmark of synthetic roster generation and roster file formats.
+
+Usage:
+    python -m benchmarks.bench_roster_generator --students 200000 --evaluations 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import List, Optional
+
+from benchmarks.common import best_time, print_table
+from src.roster_generator import RosterGenerator
+from src.roster_io import read_roster, write_roster
+
+DEFAULT_STUDENTS = 100_000
+DEFAULT_EVALUATIONS = 4
+
+
+def parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=DEFAULT_STUDENTS)
+    parser.add_argument("--evaluations", type=int, default=DEFAULT_EVALUATIONS)
+    parser.add_argument("--seed", type=int, default=RosterGenerator.DEFAULT_SEED)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and print rows per second for each step."""
+    arguments = parse_arguments(argv)
+    students = arguments.students
+
+    def generate(shared_weights: bool):
+        return RosterGenerator(arguments.seed).generate(
+            students, arguments.evaluations, shared_weights=shared_weights
+        )
+
+    rows = {
+        "generate (per-student weights)": best_time(lambda: generate(False)),
+        "generate (shared weights)": best_time(lambda: generate(True)),
+    }
+    roster = generate(False)
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in (".csv", ".jsonl", ".bin"):
+            path = os.path.join(directory, f"roster{extension}")
+            rows[f"write {extension}"] = best_time(
+                lambda: write_roster(roster.iter_rows(), path)
+            )
+            rows[f"read {extension}"] = best_time(lambda: read_roster(path))
+
+    title = f"Roster generator: {students} students x {arguments.evaluations} evals"
+    print_table(
+        title,
+        {
+            label: f"{students / seconds:>12,.0f} rows/s"
+            for label, seconds in rows.items()
+        },
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
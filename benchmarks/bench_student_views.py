@@ -0,0 +1,97 @@
+"""
+Benchmark of copied evaluation lists against cached tuple views.
+
+Usage:
+    python -m benchmarks.bench_student_views --students 50000 --passes 5
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Optional, Sequence
+
+from benchmarks.common import print_table
+from src.attendance_policy import AttendancePolicy
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+from src.roster_generator import RosterGenerator
+from src.student import Student
+
+DEFAULT_STUDENTS = 50_000
+DEFAULT_PASSES = 5
+
+
+def parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=DEFAULT_STUDENTS)
+    parser.add_argument("--passes", type=int, default=DEFAULT_PASSES)
+    parser.add_argument("--seed", type=int, default=RosterGenerator.DEFAULT_SEED)
+    return parser.parse_args(argv)
+
+
+def grade_all(
+    students: Sequence[Student],
+    passes: int,
+    evaluations_of: Callable[[Student], Sequence[Evaluation]],
+) -> None:
+    """Grade every student several times, as repeated regrades do."""
+    attendance = {True: AttendancePolicy(True), False: AttendancePolicy(False)}
+    extra_points_policy = ExtraPointsPolicy([True])
+    for _ in range(passes):
+        for student in students:
+            GradeCalculator(
+                evaluations_of(student),
+                attendance[student.has_reached_minimum_attendance],
+                extra_points_policy,
+                0,
+            ).calculate_final_grade()
+
+
+def allocated_bytes(
+    students: Sequence[Student],
+    evaluations_of: Callable[[Student], Sequence[Evaluation]],
+) -> int:
+    """Get the bytes allocated by reading every student's evaluations once."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    # Keep every result alive so freed copies are still counted.
+    kept = [evaluations_of(student) for student in students]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return max(0, after - before - sys.getsizeof(kept))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and print speed and allocations of both accessors."""
+    arguments = parse_arguments(argv)
+    roster = RosterGenerator(arguments.seed).generate(arguments.students)
+    students = roster.to_students()
+    passes = arguments.passes
+
+    accessors = {
+        "evaluations (list copy)": lambda student: student.evaluations,
+        "evaluation_view (tuple)": lambda student: student.evaluation_view,
+    }
+    rows = {}
+    for label, accessor in accessors.items():
+        # Build the views once so the measured passes only read them.
+        grade_all(students, 1, accessor)
+        started_at = time.perf_counter()
+        grade_all(students, passes, accessor)
+        duration = time.perf_counter() - started_at
+        allocated = allocated_bytes(students, accessor)
+        rows[label] = (
+            f"{len(students) * passes / duration:>10,.0f} gradings/s, "
+            f"{allocated / len(students):>6,.1f} bytes allocated per access"
+        )
+
+    title = f"Student views: {len(students)} students x {passes} passes"
+    print_table(title, rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Shared helpers for the benchmark scripts.
+"""
+
+import time
+from typing import Callable, Dict
+
+DEFAULT_REPEAT = 3
+
+
+def best_time(function: Callable[[], object], repeat: int = DEFAULT_REPEAT) -> float:
+    """
+    Run a function several times and keep the fastest wall-clock time.
+
+    Args:
+        function: Callable to time.
+        repeat: Number of runs.
+
+    Returns:
+        The best time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def print_table(title: str, rows: Dict[str, str]) -> None:
+    """
+    Print benchmark results as an aligned two-column table.
+
+    Args:
+        title: Title of the table.
+        rows: Label and formatted value of each measurement.
+    """
+    width = max(len(label) for label in rows)
+    print(title)
+    print("-" * len(title))
+    for label, value in rows.items():
+        print(f"{label.ljust(width)}  {value}")
+    print()
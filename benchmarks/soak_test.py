@@ -0,0 +1,55 @@
+"""
+Soak test: runs the grade calculator under sustained load for minutes.
+
+Usage:
+    python -m benchmarks.soak_test --mode constant --rate 2000 --duration 300
+    python -m benchmarks.soak_test --mode burst --burst-size 5000 --interval 2
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from src.load_generator import LoadGenerator
+
+DEFAULT_DURATION_SECONDS = 60.0
+DEFAULT_RATE_PER_SECOND = 1000.0
+DEFAULT_BURST_SIZE = 2000
+DEFAULT_BURST_INTERVAL_SECONDS = 1.0
+
+
+def parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--mode",
+        choices=[LoadGenerator.CONSTANT_MODE, LoadGenerator.BURST_MODE],
+        default=LoadGenerator.CONSTANT_MODE,
+    )
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION_SECONDS)
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE_PER_SECOND)
+    parser.add_argument("--burst-size", type=int, default=DEFAULT_BURST_SIZE)
+    parser.add_argument(
+        "--interval", type=float, default=DEFAULT_BURST_INTERVAL_SECONDS
+    )
+    parser.add_argument("--seed", type=int, default=LoadGenerator.DEFAULT_SEED)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the soak test and print the report as JSON."""
+    arguments = parse_arguments(argv)
+    generator = LoadGenerator(seed=arguments.seed)
+    if arguments.mode == LoadGenerator.CONSTANT_MODE:
+        report = generator.run_constant_rate(arguments.rate, arguments.duration)
+    else:
+        report = generator.run_bursts(
+            arguments.burst_size, arguments.interval, arguments.duration
+        )
+    print(json.dumps(report.to_dict(), indent=2))
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,15 +5,111 @@ Sistema de cálculo de notas finales para docentes UTEC.
 Caso de Uso: CU001 - Calcular nota final del estudiante
 """
 
+import json
 import sys
-from typing import List
+from typing import Dict, List, Optional
+
+from src.daemon_protocol import (
+    DEFAULT_SOCKET_PATH,
+    DEFAULT_TIMEOUT,
+    grade_request,
+    send_request,
+)
+
+FAST_GRADE_OPTIONS = (
+    "--grades",
+    "--weights",
+    "--attendance",
+    "--consensus",
+    "--year",
+    "--rounding",
+    "--decimals",
+    "--socket",
+)
+
+
+def forward_grade(argv: List[str]) -> Optional[Dict[str, object]]:
+    """
+    Grade a --grades call on a running daemon with a single request.
+
+    Runs before the imports below, which cost more than the request. Only
+    the options of FAST_GRADE_OPTIONS are understood; anything else, a
+    value that does not parse, an unreachable daemon or a rejected request
+    gives None, and main() handles the call and its errors as usual.
+
+    Args:
+        argv: Command-line arguments, without the program name.
+
+    Returns:
+        The result details, or None if the call was not forwarded.
+    """
+    values: Dict[str, str] = {}
+    arguments = iter(argv)
+    for argument in arguments:
+        option, separator, value = argument.partition("=")
+        if option not in FAST_GRADE_OPTIONS:
+            return None
+        values[option] = value if separator else next(arguments, "")
+    try:
+        grades = [float(value) for value in values["--grades"].split(",")]
+        weights = [float(value) for value in values["--weights"].split(",")]
+        year_index = int(values.get("--year", "1")) - 1
+        decimals = values.get("--decimals")
+        rounding = None
+        if "--rounding" in values:
+            rounding = {"mode": values["--rounding"]}
+            if decimals is not None:
+                rounding["decimals"] = int(decimals)
+    except (KeyError, ValueError):
+        return None
+    attendance = values.get("--attendance", "s")
+    consensus = [
+        answer.strip().lower() for answer in values.get("--consensus", "n").split(",")
+    ]
+    if (
+        len(grades) != len(weights)
+        or attendance not in ("s", "n")
+        or any(answer not in ("s", "n") for answer in consensus)
+    ):
+        return None
+    request = grade_request(
+        grades,
+        weights,
+        attendance == "s",
+        [answer == "s" for answer in consensus],
+        year_index,
+        rounding,
+    )
+    try:
+        return send_request(
+            values.get("--socket", DEFAULT_SOCKET_PATH), request, DEFAULT_TIMEOUT
+        )
+    except (OSError, ValueError):
+        return None
+
+
+if __name__ == "__main__" and "--grades" in sys.argv:
+    _details = forward_grade(sys.argv[1:])
+    if _details is not None:
+        print(json.dumps(_details))
+        sys.exit(0)
+
+# Imported after the fast path on purpose, see forward_grade().
+import argparse
+import logging
 
 from src.attendance_policy import AttendancePolicy
 from src.evaluation import Evaluation
 from src.extra_points_policy import ExtraPointsPolicy
 from src.grade_calculator import GradeCalculator
+from src.grading_daemon import GradingClient, GradingDaemon
+from src.grading_logging import GradingLogSession, get_logger, log_event
+from src.report_renderer import TEXT_SLIP, ReportTemplate
+from src.rounding_policy import RoundingPolicy
 from src.student import Student
 
+logger = get_logger("app")
+
 
 class GradeCalculatorApp:
     """
@@ -25,11 +121,18 @@ class GradeCalculatorApp:
     HEADER_WIDTH = 60
     INITIAL_YEAR_INDEX = 0
 
-    def __init__(self):
-        """Initialize the application."""
+    def __init__(self, rounding_policy: Optional[RoundingPolicy] = None):
+        """
+        Initialize the application.
+
+        Args:
+            rounding_policy: Rounding of the displayed result. Defaults to
+                             2 decimals.
+        """
         self.student = None
         self.extra_points_policy = None
         self.current_year_index = self.INITIAL_YEAR_INDEX
+        self.slip_template = ReportTemplate(TEXT_SLIP, rounding_policy=rounding_policy)
 
     def print_header(self) -> None:
         """Display application header."""
@@ -163,7 +266,7 @@ class GradeCalculatorApp:
             )
 
             calculator = GradeCalculator(
-                evaluations=self.student.evaluations,
+                evaluations=self.student.evaluation_view,
                 attendance_policy=attendance_policy,
                 extra_points_policy=self.extra_points_policy,
                 current_year_index=self.current_year_index,
@@ -171,27 +274,16 @@ class GradeCalculatorApp:
 
             result = calculator.calculate_final_grade()
 
-            print("\n" + "=" * self.HEADER_WIDTH)
-            print("RESULTADO DEL CALCULO")
-            print("=" * self.HEADER_WIDTH)
-            print(f"Estudiante: {self.student.student_id}")
-            print()
-
-            print("Detalle del Calculo:")
-            print(f"  1. Promedio Ponderado: {result.weighted_average:.2f}")
-
-            if result.attendance_penalty_applied:
-                print(f"  2. Penalizacion por Asistencia: SI (Nota = 0)")
-            else:
-                print(f"  2. Penalizacion por Asistencia: NO")
-
-            print(f"  3. Puntos Extra Aplicados: +{result.extra_points_applied:.2f}")
-            print()
-            print(f"NOTA FINAL: {result.final_grade:.2f}")
-            print("=" * self.HEADER_WIDTH)
-            print()
+            print(self.slip_template.render(self.student.student_id, result), end="")
 
         except Exception as e:
+            log_event(
+                logger,
+                logging.ERROR,
+                "grade_calculation_failed",
+                exc_info=True,
+                student_id=self.student.student_id,
+            )
             print(f"Error al calcular la nota: {e}")
             sys.exit(1)
 
@@ -209,14 +301,490 @@ class GradeCalculatorApp:
             print("\n\nOperacion cancelada por el usuario.")
             sys.exit(0)
         except Exception as e:
+            log_event(logger, logging.ERROR, "unexpected_error", exc_info=True)
             print(f"\nError inesperado: {e}")
             sys.exit(1)
 
 
-def main():
+def parse_consensus(text: str) -> List[bool]:
+    """
+    Parse a comma-separated list of s/n teacher consensus answers.
+
+    Args:
+        text: Answers per academic year, e.g. "s,n,s".
+
+    Returns:
+        One consensus flag per year.
+
+    Raises:
+        argparse.ArgumentTypeError: If an answer is not 's' or 'n'.
+    """
+    answers = [answer.strip().lower() for answer in text.split(",")]
+    if not answers or any(answer not in ("s", "n") for answer in answers):
+        raise argparse.ArgumentTypeError(
+            "El consenso debe ser una lista de 's'/'n' separada por comas"
+        )
+    return [answer == "s" for answer in answers]
+
+
+def parse_numbers(text: str) -> List[float]:
+    """
+    Parse a comma-separated list of numbers.
+
+    Args:
+        text: Numbers separated by commas, e.g. "15,12.5".
+
+    Returns:
+        The parsed numbers.
+
+    Raises:
+        argparse.ArgumentTypeError: If a value is not a number.
+    """
+    try:
+        return [float(value) for value in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            "Debe ser una lista de numeros separada por comas"
+        ) from None
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="CS-GradeCalculator - Sistema de Calculo de Notas UTEC"
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="ROSTER",
+        help="Calcular las notas de un roster (.csv, .jsonl o .bin) sin interaccion",
+    )
+    parser.add_argument(
+        "--output",
+        default="results.csv",
+        help="Archivo CSV de resultados del modo batch",
+    )
+    parser.add_argument(
+        "--consensus",
+        type=parse_consensus,
+        default=[False],
+        help="Consenso docente por año para el modo batch, ej. s,n,s",
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        default=GradeCalculatorApp.INITIAL_YEAR_INDEX + 1,
+        help="Año academico actual (desde 1) para el modo batch",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Procesos de calculo para el modo batch (por defecto 1)",
+    )
+    parser.add_argument(
+        "--shared-memory",
+        action="store_true",
+        help="Compartir el roster con los procesos de calculo via memoria compartida",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Leer, validar, calcular y escribir en etapas concurrentes",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        help="Bloques en espera entre etapas del modo --pipeline",
+    )
+    parser.add_argument(
+        "--skip-invalid",
+        action="store_true",
+        help="Omitir las filas invalidas del modo batch y reportarlas al final",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="DIR",
+        help="Reutilizar entre ejecuciones los resultados guardados en DIR",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        help="Tamaño maximo en MB de la cache de --cache (por defecto 256)",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        metavar="N",
+        help="Guardar el avance del modo batch cada N filas en <output>.checkpoint",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continuar el modo batch desde el ultimo punto de control guardado",
+    )
+    parser.add_argument(
+        "--rounding",
+        choices=RoundingPolicy.MODES,
+        help="Redondeo de las notas escritas (por defecto 2 decimales)",
+    )
+    parser.add_argument(
+        "--decimals",
+        type=int,
+        default=RoundingPolicy.DEFAULT_DECIMALS,
+        help="Decimales que conserva --rounding",
+    )
+    parser.add_argument(
+        "--rule-versions",
+        metavar="FILE",
+        help="Archivo JSON de versiones de reglas; el modo batch usa la version fijada",
+    )
+    parser.add_argument(
+        "--compare-rules",
+        nargs=2,
+        metavar=("BASE", "CANDIDATA"),
+        help="Calcular el roster con dos versiones de reglas y escribir en --output "
+        "solo los estudiantes con resultados distintos",
+    )
+    parser.add_argument(
+        "--grades",
+        type=parse_numbers,
+        help="Notas de un estudiante para calcular sin interaccion, ej. 15,12",
+    )
+    parser.add_argument(
+        "--weights",
+        type=parse_numbers,
+        help="Pesos porcentuales de las notas de --grades, ej. 40,60",
+    )
+    parser.add_argument(
+        "--attendance",
+        choices=("s", "n"),
+        default="s",
+        help="Si el estudiante de --grades cumplio la asistencia minima",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Iniciar el servicio de calculo en segundo plano en --socket",
+    )
+    parser.add_argument(
+        "--stop-daemon",
+        action="store_true",
+        help="Detener el servicio de calculo que escucha en --socket",
+    )
+    parser.add_argument(
+        "--socket",
+        default=DEFAULT_SOCKET_PATH,
+        help="Socket Unix del servicio de calculo",
+    )
+    parser.add_argument(
+        "--log-file",
+        metavar="FILE",
+        help="Registrar los eventos del calculo como lineas JSON en FILE",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=GradingLogSession.LEVELS,
+        default="INFO",
+        help="Nivel minimo de los eventos registrados en --log-file",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="Perfilar la ejecucion con cProfile/tracemalloc y guardar reportes en DIR",
+    )
+    arguments = parser.parse_args(argv)
+    arguments.rounding_policy = None
+    if arguments.rounding is not None:
+        try:
+            arguments.rounding_policy = RoundingPolicy(
+                arguments.rounding, arguments.decimals
+            )
+        except ValueError as e:
+            parser.error(str(e))
+    if arguments.profile is not None and (
+        arguments.serve or arguments.stop_daemon or arguments.grades is not None
+    ):
+        parser.error("--profile solo se admite con --batch o el modo interactivo")
+    return arguments
+
+
+def run_batch(arguments: argparse.Namespace) -> None:
+    """Grade a roster file with the batch runner."""
+    # Imported here so the single-grade path, which may only forward to the
+    # daemon, does not pay for multiprocessing at startup.
+    from src.batch_grader import BatchGradeCalculator
+    from src.batch_runner import BatchRunner
+    from src.result_cache import ResultCache
+    from src.rule_versions import RuleVersionRegistry
+    from src.shared_roster import SharedMemoryBatchGradeCalculator
+    from src.streaming_pipeline import StreamingPipeline
+
+    if arguments.compare_rules:
+        run_rule_comparison(arguments)
+        return
+
+    workers = arguments.workers
+    if workers is None:
+        workers = BatchGradeCalculator.SEQUENTIAL_WORKERS
+    queue_size = arguments.queue_size
+    if queue_size is None:
+        queue_size = StreamingPipeline.DEFAULT_QUEUE_SIZE
+    result_cache = None
+    if arguments.cache:
+        max_bytes = ResultCache.DEFAULT_MAX_BYTES
+        if arguments.cache_max_mb is not None:
+            max_bytes = arguments.cache_max_mb * ResultCache.BYTES_PER_MB
+        result_cache = ResultCache(arguments.cache, max_bytes=max_bytes)
+    checkpoint_every = arguments.checkpoint_every
+    if checkpoint_every is not None or arguments.resume:
+        if arguments.pipeline:
+            raise ValueError("--checkpoint-every y --resume no admiten --pipeline")
+        if checkpoint_every is None:
+            checkpoint_every = BatchRunner.DEFAULT_CHECKPOINT_EVERY
+    registry = RuleVersionRegistry.load(arguments.rule_versions)
+    extra_points_policy = ExtraPointsPolicy(arguments.consensus)
+    calculator_class = (
+        SharedMemoryBatchGradeCalculator
+        if arguments.shared_memory
+        else BatchGradeCalculator
+    )
+    with calculator_class(
+        rules=registry.pinned_rules, workers=workers
+    ) as batch_calculator:
+        if arguments.pipeline:
+            runner = StreamingPipeline(
+                extra_points_policy,
+                arguments.year - 1,
+                batch_calculator=batch_calculator,
+                queue_size=queue_size,
+                skip_invalid=arguments.skip_invalid,
+                result_cache=result_cache,
+                rounding_policy=arguments.rounding_policy,
+            )
+        else:
+            runner = BatchRunner(
+                extra_points_policy,
+                arguments.year - 1,
+                batch_calculator=batch_calculator,
+                skip_invalid=arguments.skip_invalid,
+                result_cache=result_cache,
+                rounding_policy=arguments.rounding_policy,
+                checkpoint_every=checkpoint_every,
+            )
+        if arguments.pipeline:
+            summary = runner.run(arguments.batch, arguments.output)
+        else:
+            summary = runner.run(
+                arguments.batch, arguments.output, resume=arguments.resume
+            )
+    if getattr(summary, "rows_resumed", 0):
+        print(
+            f"Reanudado desde el punto de control: {summary.rows_resumed} filas "
+            "ya calculadas"
+        )
+    print(
+        f"{summary.rows_processed - summary.rows_skipped} estudiantes calculados en "
+        f"{summary.duration:.2f}s -> {arguments.output}"
+    )
+    if result_cache is not None:
+        stats = result_cache.stats
+        print(
+            f"  cache: {stats.hits} bloques reutilizados, {stats.misses} calculados "
+            f"({stats.hit_rate:.0%})"
+        )
+    for stage in getattr(summary, "stages", []):
+        print(
+            f"  etapa {stage.name}: {stage.rows} filas, "
+            f"{stage.throughput:.0f} filas/s"
+        )
+    if summary.rows_skipped:
+        print(f"{summary.rows_skipped} filas invalidas omitidas:")
+        for code, count in sorted(summary.validation_report.count_by_code().items()):
+            print(f"  {code}: {count}")
+
+
+def run_rule_comparison(arguments: argparse.Namespace) -> None:
+    """Grade a roster file under two rule versions and write the differences."""
+    from src.rule_versions import DualRunComparator, RuleVersionRegistry
+
+    unsupported = [
+        flag
+        for flag, value in (
+            ("--workers", arguments.workers),
+            ("--shared-memory", arguments.shared_memory),
+            ("--pipeline", arguments.pipeline),
+            ("--queue-size", arguments.queue_size),
+            ("--skip-invalid", arguments.skip_invalid),
+            ("--cache", arguments.cache),
+            ("--cache-max-mb", arguments.cache_max_mb),
+            ("--checkpoint-every", arguments.checkpoint_every),
+            ("--resume", arguments.resume),
+        )
+        if value is not None and value is not False
+    ]
+    if unsupported:
+        raise ValueError(f"--compare-rules no admite {', '.join(unsupported)}")
+    baseline, candidate = arguments.compare_rules
+    comparator = DualRunComparator.from_registry(
+        RuleVersionRegistry.load(arguments.rule_versions), baseline, candidate
+    )
+    summary = comparator.compare_file(
+        arguments.batch,
+        arguments.output,
+        ExtraPointsPolicy(arguments.consensus),
+        arguments.year - 1,
+        rounding_policy=arguments.rounding_policy,
+    )
+    print(
+        f"{summary.rows_compared} estudiantes comparados ({baseline} -> "
+        f"{candidate}) en {summary.duration:.2f}s: {summary.disagreements} "
+        f"con resultados distintos -> {arguments.output}"
+    )
+    print(f"  aprobados que desaprobarian: {summary.pass_to_fail}")
+    print(f"  desaprobados que aprobarian: {summary.fail_to_pass}")
+
+
+def run_single_grade(arguments: argparse.Namespace) -> None:
+    """
+    Grade one student given on the command line.
+
+    The request goes to the grading daemon when one listens on the socket,
+    otherwise it is graded in this process. A call forwarded by
+    forward_grade() never gets here.
+    """
+    if arguments.weights is None:
+        raise ValueError("--grades requiere --weights")
+    if len(arguments.grades) != len(arguments.weights):
+        raise ValueError("--grades y --weights deben tener la misma cantidad")
+    has_attendance = arguments.attendance == "s"
+    try:
+        details = GradingClient(arguments.socket).grade(
+            arguments.grades,
+            arguments.weights,
+            has_attendance,
+            arguments.consensus,
+            arguments.year - 1,
+            arguments.rounding_policy,
+        )
+    except OSError:
+        calculator = GradeCalculator(
+            evaluations=[
+                Evaluation(grade, weight)
+                for grade, weight in zip(arguments.grades, arguments.weights)
+            ],
+            attendance_policy=AttendancePolicy(has_attendance),
+            extra_points_policy=ExtraPointsPolicy(arguments.consensus),
+            current_year_index=arguments.year - 1,
+        )
+        result = calculator.calculate_final_grade()
+        if arguments.rounding_policy is None:
+            details = result.get_details()
+        else:
+            details = arguments.rounding_policy.details(result)
+    print(json.dumps(details))
+
+
+def start_logging(arguments: argparse.Namespace) -> Optional[GradingLogSession]:
+    """Start logging to --log-file, if given."""
+    if not arguments.log_file:
+        return None
+    session = GradingLogSession(arguments.log_file, arguments.log_level)
+    try:
+        session.start()
+    except OSError as e:
+        print(f"No se pudo abrir el archivo de log: {e}")
+        sys.exit(1)
+    return session
+
+
+def stop_logging(session: Optional[GradingLogSession]) -> None:
+    """Flush the log and print the warnings and errors of the run."""
+    if session is None:
+        return
+    session.stop()
+    error_counts = session.error_counts
+    if error_counts:
+        print("Eventos de advertencia y error de la ejecucion:")
+        for kind, count in sorted(error_counts.items()):
+            print(f"  {kind}: {count}")
+    if session.suppressed or session.dropped:
+        print(
+            f"  {session.suppressed} eventos repetidos y {session.dropped} por "
+            "cola llena no se escribieron en el log"
+        )
+
+
+def run_profiled(profile_directory: Optional[str], function, *args):
+    """
+    Run a function, profiling it and printing the summary when asked.
+
+    Args:
+        profile_directory: Directory for the reports, or None to not profile.
+        function: Callable to run.
+        *args: Positional arguments for the callable.
+
+    Returns:
+        Whatever the callable returns.
+    """
+    if profile_directory is None:
+        return function(*args)
+    from src.profiling import ProfileSession
+
+    session = ProfileSession(profile_directory)
+    try:
+        with session:
+            return function(*args)
+    finally:
+        print(session.summary())
+
+
+def main(argv: Optional[List[str]] = None):
     """Main entry point."""
-    app = GradeCalculatorApp()
-    app.run()
+    arguments = parse_arguments(argv)
+    if arguments.serve:
+        daemon = GradingDaemon(arguments.socket)
+        try:
+            daemon.start()
+        except OSError as e:
+            print(f"No se pudo iniciar el servicio de calculo: {e}")
+            sys.exit(1)
+        print(f"Servicio de calculo escuchando en {arguments.socket}", flush=True)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if arguments.stop_daemon:
+        try:
+            GradingClient(arguments.socket).shutdown()
+        except OSError as e:
+            print(f"No hay un servicio de calculo en {arguments.socket}: {e}")
+            sys.exit(1)
+        return
+
+    if arguments.grades is not None:
+        try:
+            run_single_grade(arguments)
+        except (OSError, ValueError) as e:
+            print(f"Error al calcular la nota: {e}")
+            sys.exit(1)
+        return
+
+    session = start_logging(arguments)
+    try:
+        if arguments.batch:
+            try:
+                run_profiled(arguments.profile, run_batch, arguments)
+            except (OSError, ValueError) as e:
+                log_event(logger, logging.ERROR, "batch_failed", exc_info=True)
+                print(f"Error en el modo batch: {e}")
+                sys.exit(1)
+            return
+
+        app = GradeCalculatorApp(arguments.rounding_policy)
+        run_profiled(arguments.profile, app.run)
+    finally:
+        stop_logging(session)
 
 
 if __name__ == "__main__":
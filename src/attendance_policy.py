@@ -2,6 +2,16 @@
 Module for handling attendance policy and penalties.
 """
 
+from typing import List, Sequence
+
+
+def _count_set_bits(bitmap: int) -> int:
+    """Count the set bits of a bitmap on Python versions without int.bit_count."""
+    return bin(bitmap).count("1")
+
+
+_popcount = getattr(int, "bit_count", _count_set_bits)
+
 
 class AttendancePolicy:
     """
@@ -12,6 +22,8 @@ class AttendancePolicy:
     """
 
     PENALTY_FOR_INSUFFICIENT_ATTENDANCE = 0.0
+    MINIMUM_ATTENDANCE_PERCENTAGE = 70.0
+    PERCENTAGE_MULTIPLIER = 100.0
 
     def __init__(self, has_reached_minimum: bool):
         """
@@ -24,6 +36,30 @@ class AttendancePolicy:
             raise ValueError("has_reached_minimum must be a boolean")
         self._has_reached_minimum = has_reached_minimum
 
+    @classmethod
+    def from_session_bitmap(
+        cls,
+        attendance_bitmap: int,
+        total_sessions: int,
+        minimum_percentage: float = MINIMUM_ATTENDANCE_PERCENTAGE,
+    ) -> "AttendancePolicy":
+        """
+        Build a policy from one student's per-session attendance bitmap.
+
+        Args:
+            attendance_bitmap: Bit i is set if the student attended session i.
+            total_sessions: Number of sessions held.
+            minimum_percentage: Attendance percentage required (0-100).
+
+        Returns:
+            The attendance policy for the student.
+
+        Raises:
+            ValueError: If the bitmap or threshold are invalid.
+        """
+        attendance_log = SessionAttendanceLog([attendance_bitmap], total_sessions)
+        return cls(attendance_log.eligibility_mask(minimum_percentage)[0])
+
     @property
     def has_reached_minimum(self) -> bool:
         """Check if student reached minimum attendance."""
@@ -48,3 +84,190 @@ class AttendancePolicy:
         """String representation of attendance policy."""
         status = "Met" if self._has_reached_minimum else "Not met"
         return f"AttendancePolicy(minimum_attendance={status})"
+
+
+class SessionAttendanceLog:
+    """
+    Per-session attendance of a whole roster.
+
+    Each student is one integer bitmap where bit i is set if the student
+    attended session i, so the attendance count of a student is a popcount
+    and the whole roster is processed in one pass over the bitmaps.
+    """
+
+    def __init__(self, bitmaps: Sequence[int], total_sessions: int):
+        """
+        Initialize the attendance log.
+
+        Args:
+            bitmaps: One attendance bitmap per student.
+            total_sessions: Number of sessions held.
+
+        Raises:
+            ValueError: If total_sessions is not positive or a bitmap has
+                        bits beyond the last session.
+        """
+        if not isinstance(total_sessions, int) or total_sessions <= 0:
+            raise ValueError("total_sessions must be a positive integer")
+
+        session_limit = 1 << total_sessions
+        for row, bitmap in enumerate(bitmaps):
+            if not isinstance(bitmap, int) or bitmap < 0 or bitmap >= session_limit:
+                raise ValueError(
+                    f"Row {row}: bitmap must be an integer between 0 and "
+                    f"{session_limit - 1}"
+                )
+
+        self._bitmaps = list(bitmaps)
+        self._total_sessions = total_sessions
+
+    @classmethod
+    def from_sessions(
+        cls, attendance_rows: Sequence[Sequence[bool]], total_sessions: int
+    ) -> "SessionAttendanceLog":
+        """
+        Build the log from per-student lists of attended flags.
+
+        Args:
+            attendance_rows: For each student, one flag per session.
+            total_sessions: Number of sessions held.
+
+        Returns:
+            The attendance log.
+
+        Raises:
+            ValueError: If a row has more flags than sessions.
+        """
+        bitmaps = []
+        for row, sessions in enumerate(attendance_rows):
+            if len(sessions) > total_sessions:
+                raise ValueError(f"Row {row}: more flags than sessions")
+            bitmap = 0
+            for session, attended in enumerate(sessions):
+                if attended:
+                    bitmap |= 1 << session
+            bitmaps.append(bitmap)
+        return cls(bitmaps, total_sessions)
+
+    @property
+    def total_sessions(self) -> int:
+        """Get the number of sessions held."""
+        return self._total_sessions
+
+    @property
+    def bitmaps(self) -> List[int]:
+        """Get a copy of the attendance bitmaps."""
+        return self._bitmaps.copy()
+
+    def mark_attended(self, row: int, session: int) -> None:
+        """
+        Record that a student attended a session.
+
+        Args:
+            row: Index of the student in the roster.
+            session: Index of the session (0-based).
+
+        Raises:
+            ValueError: If row or session are out of range.
+        """
+        if not 0 <= row < len(self._bitmaps):
+            raise ValueError(f"Row must be between 0 and {len(self._bitmaps) - 1}")
+        if not 0 <= session < self._total_sessions:
+            raise ValueError(
+                f"Session must be between 0 and {self._total_sessions - 1}"
+            )
+        self._bitmaps[row] |= 1 << session
+
+    def attended_counts(self) -> List[int]:
+        """
+        Count the attended sessions of every student.
+
+        Returns:
+            Number of attended sessions per student.
+        """
+        return list(map(_popcount, self._bitmaps))
+
+    def percentages(self) -> List[float]:
+        """
+        Calculate the attendance percentage of every student.
+
+        Returns:
+            Attendance percentage (0-100) per student.
+        """
+        scale = AttendancePolicy.PERCENTAGE_MULTIPLIER / self._total_sessions
+        return [count * scale for count in self.attended_counts()]
+
+    def eligibility_mask(
+        self,
+        minimum_percentage: float = AttendancePolicy.MINIMUM_ATTENDANCE_PERCENTAGE,
+    ) -> List[bool]:
+        """
+        Check which students reached the attendance threshold.
+
+        The threshold is converted once to a minimum session count, so
+        each student is a single integer comparison. The mask can be passed
+        directly as the attendance column of BatchGradeCalculator.
+
+        Args:
+            minimum_percentage: Attendance percentage required (0-100).
+
+        Returns:
+            True for every student meeting the threshold.
+
+        Raises:
+            ValueError: If the threshold is invalid.
+        """
+        self._validate_minimum_percentage(minimum_percentage)
+        required_sessions = (
+            minimum_percentage
+            * self._total_sessions
+            / AttendancePolicy.PERCENTAGE_MULTIPLIER
+        )
+        return [count >= required_sessions for count in self.attended_counts()]
+
+    def policies(
+        self,
+        minimum_percentage: float = AttendancePolicy.MINIMUM_ATTENDANCE_PERCENTAGE,
+    ) -> List[AttendancePolicy]:
+        """
+        Build one AttendancePolicy per student.
+
+        Args:
+            minimum_percentage: Attendance percentage required (0-100).
+
+        Returns:
+            Attendance policy per student.
+        """
+        return [
+            AttendancePolicy(eligible)
+            for eligible in self.eligibility_mask(minimum_percentage)
+        ]
+
+    @staticmethod
+    def _validate_minimum_percentage(minimum_percentage: float) -> None:
+        """
+        Validate an attendance threshold.
+
+        Args:
+            minimum_percentage: Threshold to validate.
+
+        Raises:
+            ValueError: If the threshold is not a number between 0 and 100.
+        """
+        if isinstance(minimum_percentage, bool) or not isinstance(
+            minimum_percentage, (int, float)
+        ):
+            raise ValueError("minimum_percentage must be a number")
+        if not 0.0 <= minimum_percentage <= AttendancePolicy.PERCENTAGE_MULTIPLIER:
+            raise ValueError("minimum_percentage must be between 0 and 100")
+
+    def __len__(self) -> int:
+        """Get the number of students in the log."""
+        return len(self._bitmaps)
+
+    def __repr__(self) -> str:
+        """String representation of the attendance log."""
+        return (
+            f"SessionAttendanceLog(students={len(self._bitmaps)}, "
+            f"sessions={self._total_sessions})"
+        )
@@ -0,0 +1,251 @@
+"""
+Module for the append-only audit log of grade calculations.
+"""
+
+import json
+import time
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence
+
+from src.attendance_policy import AttendancePolicy
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+
+
+class AuditRecord:
+    """
+    One grading event: every input of the calculation and its output.
+
+    Attributes:
+        student_id: Identifier of the graded student.
+        grades: Grades of the evaluations.
+        weights: Weights of the evaluations.
+        has_reached_minimum_attendance: Attendance status used.
+        consensus_history: Teacher consensus per academic year.
+        current_year_index: Academic year used for extra points.
+        weighted_average: Recorded weighted average.
+        attendance_penalty_applied: Recorded penalty flag.
+        extra_points_applied: Recorded extra points.
+        final_grade: Recorded final grade.
+        recorded_at: Unix timestamp of the calculation.
+    """
+
+    def __init__(
+        self,
+        student_id: str,
+        grades: Sequence[float],
+        weights: Sequence[float],
+        has_reached_minimum_attendance: bool,
+        consensus_history: Sequence[bool],
+        current_year_index: int,
+        weighted_average: float,
+        attendance_penalty_applied: bool,
+        extra_points_applied: float,
+        final_grade: float,
+        recorded_at: float,
+    ):
+        """Initialize the audit record."""
+        self.student_id = student_id
+        self.grades = list(grades)
+        self.weights = list(weights)
+        self.has_reached_minimum_attendance = has_reached_minimum_attendance
+        self.consensus_history = list(consensus_history)
+        self.current_year_index = current_year_index
+        self.weighted_average = weighted_average
+        self.attendance_penalty_applied = attendance_penalty_applied
+        self.extra_points_applied = extra_points_applied
+        self.final_grade = final_grade
+        self.recorded_at = recorded_at
+
+    @property
+    def has_extra_points_consensus(self) -> bool:
+        """Check if the recorded year had teacher consensus."""
+        if 0 <= self.current_year_index < len(self.consensus_history):
+            return self.consensus_history[self.current_year_index]
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with all record fields.
+        """
+        return {
+            "student_id": self.student_id,
+            "grades": self.grades,
+            "weights": self.weights,
+            "has_reached_minimum_attendance": self.has_reached_minimum_attendance,
+            "consensus_history": self.consensus_history,
+            "current_year_index": self.current_year_index,
+            "weighted_average": self.weighted_average,
+            "attendance_penalty_applied": self.attendance_penalty_applied,
+            "extra_points_applied": self.extra_points_applied,
+            "final_grade": self.final_grade,
+            "recorded_at": self.recorded_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AuditRecord":
+        """
+        Build a record from a dictionary produced by to_dict().
+
+        Args:
+            data: Dictionary with all record fields.
+
+        Returns:
+            The audit record.
+
+        Raises:
+            ValueError: If a field is missing.
+        """
+        try:
+            return cls(**data)
+        except TypeError as error:
+            raise ValueError(f"Invalid audit record: {error}") from error
+
+    def __repr__(self) -> str:
+        """String representation of the audit record."""
+        return (
+            f"AuditRecord(student={self.student_id}, "
+            f"evaluations={len(self.grades)}, final={self.final_grade:.2f})"
+        )
+
+
+class AuditLog:
+    """
+    Append-only JSON Lines log of grade calculations.
+
+    Records are only ever appended; reading streams the file line by line
+    so logs much larger than memory can be replayed.
+    """
+
+    ENCODING = "utf-8"
+
+    def __init__(self, path: str):
+        """
+        Initialize the audit log.
+
+        Args:
+            path: Path of the log file. It is created on the first append.
+
+        Raises:
+            ValueError: If path is empty.
+        """
+        if not isinstance(path, str) or not path.strip():
+            raise ValueError("Audit log path must be a non-empty string")
+        self._path = path
+        self._writer: Optional[IO[str]] = None
+
+    @property
+    def path(self) -> str:
+        """Get the path of the log file."""
+        return self._path
+
+    def append(self, record: AuditRecord) -> None:
+        """
+        Append a record to the log.
+
+        Args:
+            record: The record to append.
+
+        Raises:
+            ValueError: If record is not an AuditRecord.
+        """
+        if not isinstance(record, AuditRecord):
+            raise ValueError("Must provide a valid AuditRecord instance")
+        if self._writer is None:
+            self._writer = open(self._path, "a", encoding=self.ENCODING)
+        self._writer.write(json.dumps(record.to_dict(), separators=(",", ":")))
+        self._writer.write("\n")
+        self._writer.flush()
+
+    def record_calculation(
+        self,
+        student_id: str,
+        evaluations: Sequence[Evaluation],
+        attendance_policy: AttendancePolicy,
+        extra_points_policy: ExtraPointsPolicy,
+        current_year_index: int,
+        result: Any,
+    ) -> AuditRecord:
+        """
+        Append the inputs and output of one GradeCalculator run.
+
+        Args:
+            student_id: Identifier of the graded student.
+            evaluations: Evaluations used in the calculation.
+            attendance_policy: Attendance policy used.
+            extra_points_policy: Extra points policy used.
+            current_year_index: Academic year used.
+            result: The GradeCalculationResult produced.
+
+        Returns:
+            The appended record.
+        """
+        record = AuditRecord(
+            student_id=student_id,
+            grades=[evaluation.grade for evaluation in evaluations],
+            weights=[evaluation.weight for evaluation in evaluations],
+            has_reached_minimum_attendance=attendance_policy.has_reached_minimum,
+            consensus_history=extra_points_policy.consensus_history,
+            current_year_index=current_year_index,
+            weighted_average=result.weighted_average,
+            attendance_penalty_applied=result.attendance_penalty_applied,
+            extra_points_applied=result.extra_points_applied,
+            final_grade=result.final_grade,
+            recorded_at=time.time(),
+        )
+        self.append(record)
+        return record
+
+    def __iter__(self) -> Iterator[AuditRecord]:
+        """Stream the records of the log in append order."""
+        if self._writer is not None:
+            self._writer.flush()
+        try:
+            log_file = open(self._path, "r", encoding=self.ENCODING)
+        except FileNotFoundError:
+            return
+        with log_file:
+            for line in log_file:
+                if line.strip():
+                    yield AuditRecord.from_dict(json.loads(line))
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[List[AuditRecord]]:
+        """
+        Stream the records of the log in lists of at most chunk_size.
+
+        Args:
+            chunk_size: Maximum number of records per chunk.
+
+        Raises:
+            ValueError: If chunk_size is not a positive integer.
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        chunk: List[AuditRecord] = []
+        for record in self:
+            chunk.append(record)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def close(self) -> None:
+        """Close the underlying file, if open."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "AuditLog":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the log when leaving the context."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation of the audit log."""
+        return f"AuditLog(path={self._path})"
@@ -0,0 +1,216 @@
+"""
+Module for checkpointing batch runs so they can resume after a crash.
+
+A checkpoint records how many input rows have been graded and how many
+bytes of the results CSV hold them. It is only written after those bytes
+are fsynced, so a resumed run truncates the output back to that length
+and grades the remaining rows: every student is written exactly once.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Optional, Sequence
+
+from src.validation import ValidationIssue, ValidationReport
+
+ENCODING = "utf-8"
+
+
+class BatchCheckpoint:
+    """
+    Progress of a batch run committed to disk.
+
+    Attributes:
+        run_key: Digest of the input file and the grading settings.
+        rows_processed: Number of input rows whose results are committed.
+        output_bytes: Length of the results CSV holding those rows.
+        validation_report: Problems of the rows skipped so far.
+    """
+
+    SCHEME_VERSION = 1
+    SUFFIX = ".checkpoint"
+    TEMP_SUFFIX = ".tmp"
+    FIELDS = ("version", "run_key", "rows_processed", "output_bytes", "issues")
+
+    def __init__(
+        self,
+        run_key: str,
+        rows_processed: int = 0,
+        output_bytes: int = 0,
+        validation_report: Optional[ValidationReport] = None,
+    ):
+        """Initialize the checkpoint."""
+        self.run_key = run_key
+        self.rows_processed = rows_processed
+        self.output_bytes = output_bytes
+        self.validation_report = (
+            validation_report if validation_report is not None else ValidationReport()
+        )
+
+    @classmethod
+    def path_for(cls, output_path: str) -> str:
+        """
+        Get the checkpoint path of a results file.
+
+        Args:
+            output_path: Destination CSV of the batch run.
+
+        Returns:
+            The results path followed by SUFFIX.
+        """
+        return output_path + cls.SUFFIX
+
+    @classmethod
+    def make_run_key(cls, input_path: str, settings: Sequence[object]) -> str:
+        """
+        Identify a run by its input file and its grading settings.
+
+        A checkpoint is only resumed by a run with the same key, so an
+        edited roster or different rules never mix into one results file.
+
+        Args:
+            input_path: Roster file of the run.
+            settings: Values the results depend on, compared by repr().
+
+        Returns:
+            Hex SHA-256 digest.
+
+        Raises:
+            OSError: If the input file cannot be read.
+        """
+        stat = os.stat(input_path)
+        payload = json.dumps(
+            [
+                cls.SCHEME_VERSION,
+                os.path.abspath(input_path),
+                stat.st_size,
+                stat.st_mtime_ns,
+                [repr(setting) for setting in settings],
+            ],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode(ENCODING)).hexdigest()
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the checkpoint to a dictionary.
+
+        Returns:
+            Dictionary with FIELDS as keys.
+        """
+        return {
+            "version": self.SCHEME_VERSION,
+            "run_key": self.run_key,
+            "rows_processed": self.rows_processed,
+            "output_bytes": self.output_bytes,
+            "issues": [
+                [issue.row, issue.field, issue.code, issue.params]
+                for issue in self.validation_report.issues
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "BatchCheckpoint":
+        """
+        Create a checkpoint from a dictionary.
+
+        Args:
+            data: Dictionary produced by to_dict().
+
+        Returns:
+            The checkpoint.
+
+        Raises:
+            ValueError: If the dictionary is not a checkpoint of this scheme.
+        """
+        if not isinstance(data, dict) or set(data) != set(cls.FIELDS):
+            raise ValueError(f"A checkpoint must have exactly {list(cls.FIELDS)}")
+        if data["version"] != cls.SCHEME_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {data['version']}")
+        try:
+            issues = [
+                ValidationIssue(int(row), str(field), str(code), dict(params))
+                for row, field, code, params in data["issues"]
+            ]
+            return cls(
+                str(data["run_key"]),
+                int(data["rows_processed"]),
+                int(data["output_bytes"]),
+                ValidationReport(issues),
+            )
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"Malformed checkpoint: {error}") from error
+
+    @classmethod
+    def load(cls, path: str) -> Optional["BatchCheckpoint"]:
+        """
+        Read a checkpoint file.
+
+        Args:
+            path: Checkpoint file.
+
+        Returns:
+            The checkpoint, or None if the file does not exist.
+
+        Raises:
+            ValueError: If the file is not a valid checkpoint.
+        """
+        try:
+            with open(path, encoding=ENCODING) as checkpoint_file:
+                data = json.load(checkpoint_file)
+        except FileNotFoundError:
+            return None
+        except ValueError as error:
+            raise ValueError(f"Checkpoint {path} is not valid JSON: {error}") from error
+        return cls.from_dict(data)
+
+    def save(self, path: str) -> None:
+        """
+        Write the checkpoint atomically.
+
+        The data goes to a temporary file that is fsynced and renamed over
+        the previous checkpoint, so a crash leaves either one intact.
+
+        Args:
+            path: Checkpoint file.
+
+        Raises:
+            OSError: If the checkpoint cannot be written.
+        """
+        data = json.dumps(self.to_dict(), separators=(",", ":")).encode(ENCODING)
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=directory, suffix=self.TEMP_SUFFIX
+        )
+        try:
+            with os.fdopen(descriptor, "wb") as temp_file:
+                temp_file.write(data)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def remove(path: str) -> None:
+        """
+        Delete a checkpoint file if it exists.
+
+        Args:
+            path: Checkpoint file.
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        """String representation of the checkpoint."""
+        return (
+            f"BatchCheckpoint(rows_processed={self.rows_processed}, "
+            f"output_bytes={self.output_bytes})"
+        )
@@ -0,0 +1,486 @@
+"""
+Module for grading whole rosters in a single columnar pass.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
+from src.attendance_policy import AttendancePolicy
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculationResult, GradeCalculator
+from src.student import Student
+
+
+class GradingRules:
+    """
+    Set of constants used to turn a weighted average into a final grade.
+
+    The defaults mirror the class constants of the single-student policies,
+    so a default instance grades exactly like GradeCalculator.
+    """
+
+    def __init__(
+        self,
+        extra_points_value: float = ExtraPointsPolicy.EXTRA_POINTS_VALUE,
+        attendance_penalty: float = AttendancePolicy.PENALTY_FOR_INSUFFICIENT_ATTENDANCE,
+        min_final_grade: float = GradeCalculator.MIN_FINAL_GRADE,
+        max_final_grade: float = GradeCalculator.MAX_FINAL_GRADE,
+    ):
+        """
+        Initialize the grading rules.
+
+        Args:
+            extra_points_value: Points added when the year has teacher consensus.
+            attendance_penalty: Grade assigned when attendance is insufficient.
+            min_final_grade: Lower bound of the final grade.
+            max_final_grade: Upper bound of the final grade.
+
+        Raises:
+            ValueError: If a value is not a number or the bounds are inverted.
+        """
+        values = (
+            extra_points_value,
+            attendance_penalty,
+            min_final_grade,
+            max_final_grade,
+        )
+        if not all(isinstance(value, (int, float)) for value in values):
+            raise ValueError("Grading rule values must be numbers")
+        if min_final_grade > max_final_grade:
+            raise ValueError("min_final_grade cannot be greater than max_final_grade")
+
+        self._extra_points_value = float(extra_points_value)
+        self._attendance_penalty = float(attendance_penalty)
+        self._min_final_grade = float(min_final_grade)
+        self._max_final_grade = float(max_final_grade)
+
+    @property
+    def extra_points_value(self) -> float:
+        """Get the points awarded on years with consensus."""
+        return self._extra_points_value
+
+    @property
+    def attendance_penalty(self) -> float:
+        """Get the grade assigned when attendance is insufficient."""
+        return self._attendance_penalty
+
+    @property
+    def min_final_grade(self) -> float:
+        """Get the lower bound of the final grade."""
+        return self._min_final_grade
+
+    @property
+    def max_final_grade(self) -> float:
+        """Get the upper bound of the final grade."""
+        return self._max_final_grade
+
+    def apply(
+        self, weighted_average: float, has_reached_minimum: bool, has_consensus: bool
+    ) -> GradeCalculationResult:
+        """
+        Apply attendance, extra points and bounds to a weighted average.
+
+        Args:
+            weighted_average: The weighted average of the evaluations.
+            has_reached_minimum: Whether the student met minimum attendance.
+            has_consensus: Whether teachers agreed on extra points that year.
+
+        Returns:
+            GradeCalculationResult with detailed breakdown.
+        """
+        if has_reached_minimum:
+            grade_after_attendance = weighted_average
+            extra_points = (
+                self._extra_points_value
+                if has_consensus
+                else ExtraPointsPolicy.NO_EXTRA_POINTS
+            )
+        else:
+            grade_after_attendance = self._attendance_penalty
+            extra_points = GradeCalculator.INITIAL_EXTRA_POINTS
+
+        final_grade = grade_after_attendance + extra_points
+        final_grade = max(
+            self._min_final_grade, min(self._max_final_grade, final_grade)
+        )
+
+        return GradeCalculationResult(
+            weighted_average=weighted_average,
+            attendance_penalty_applied=not has_reached_minimum,
+            extra_points_applied=extra_points,
+            final_grade=final_grade,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two rule sets by value."""
+        if not isinstance(other, GradingRules):
+            return NotImplemented
+        return self._as_tuple() == other._as_tuple()
+
+    def __hash__(self) -> int:
+        """Hash the rule set by value."""
+        return hash(self._as_tuple())
+
+    def _as_tuple(self) -> tuple:
+        """Get the rule values as a tuple."""
+        return (
+            self._extra_points_value,
+            self._attendance_penalty,
+            self._min_final_grade,
+            self._max_final_grade,
+        )
+
+    def __repr__(self) -> str:
+        """String representation of the grading rules."""
+        return (
+            f"GradingRules(extra_points={self._extra_points_value}, "
+            f"attendance_penalty={self._attendance_penalty}, "
+            f"bounds=[{self._min_final_grade}, {self._max_final_grade}])"
+        )
+
+
+def calculate_weighted_average(
+    grades: Sequence[float], weights: Sequence[float]
+) -> float:
+    """
+    Calculate a weighted average exactly as Evaluation/GradeCalculator do.
+
+    Args:
+        grades: Grades of the evaluations.
+        weights: Percentage weights of the evaluations.
+
+    Returns:
+        The weighted average grade.
+    """
+    divisor = Evaluation.PERCENTAGE_DIVISOR
+    return sum(grade * (weight / divisor) for grade, weight in zip(grades, weights))
+
+
+def validate_row(
+    row: int,
+    grades: Sequence[float],
+    weights: Sequence[float],
+    has_reached_minimum: bool,
+) -> None:
+    """
+    Validate one roster row with the same rules as Evaluation and GradeCalculator.
+
+    Args:
+        row: Index of the row, used in error messages.
+        grades: Grades of the evaluations.
+        weights: Percentage weights of the evaluations.
+        has_reached_minimum: Whether the student met minimum attendance.
+
+    Raises:
+        ValueError: If the row would be rejected by the single-student path.
+    """
+    validate_attendance(row, has_reached_minimum)
+    try:
+        _check_row(row, grades, weights)
+    except TypeError as error:
+        # A roster file can hold any JSON value where numbers belong.
+        raise ValueError(
+            f"Row {row}: grades and weights must be lists of numbers"
+        ) from error
+
+
+def validate_attendance(row: int, has_reached_minimum: object) -> None:
+    """
+    Check an attendance flag like Student does.
+
+    GradingRules.apply() grades attendance by truthiness, so a value such
+    as "n" would otherwise count as attended.
+
+    Args:
+        row: Index of the row, used in error messages.
+        has_reached_minimum: Attendance value of the row.
+
+    Raises:
+        ValueError: If the value is not a bool.
+    """
+    if not isinstance(has_reached_minimum, bool):
+        raise ValueError(
+            f"Row {row}: has_reached_minimum_attendance must be a boolean"
+        )
+
+
+def _check_row(row: int, grades: Sequence[float], weights: Sequence[float]) -> None:
+    """Apply validate_row's checks; malformed values surface as TypeError."""
+    if isinstance(grades, (str, bytes)) or isinstance(weights, (str, bytes)):
+        raise TypeError("grades and weights cannot be strings")
+    if len(grades) != len(weights):
+        raise ValueError(f"Row {row}: grades and weights must have the same length")
+    if len(grades) == 0:
+        raise ValueError(f"Row {row}: must have at least one evaluation")
+    if len(grades) > GradeCalculator.MAX_EVALUATIONS:
+        raise ValueError(
+            f"Row {row}: cannot have more than "
+            f"{GradeCalculator.MAX_EVALUATIONS} evaluations"
+        )
+    for grade in grades:
+        if not Evaluation.MIN_GRADE <= grade <= Evaluation.MAX_GRADE:
+            raise ValueError(
+                f"Row {row}: grade must be between "
+                f"{Evaluation.MIN_GRADE} and {Evaluation.MAX_GRADE}"
+            )
+    for weight in weights:
+        if not Evaluation.MIN_WEIGHT <= weight <= Evaluation.MAX_WEIGHT:
+            raise ValueError(
+                f"Row {row}: weight must be between "
+                f"{Evaluation.MIN_WEIGHT} and {Evaluation.MAX_WEIGHT}"
+            )
+    total_weight = sum(weights)
+    if (
+        abs(total_weight - GradeCalculator.EXPECTED_TOTAL_WEIGHT)
+        > GradeCalculator.WEIGHT_TOLERANCE
+    ):
+        raise ValueError(
+            f"Row {row}: total weight must sum to "
+            f"{GradeCalculator.EXPECTED_TOTAL_WEIGHT}, got {total_weight}"
+        )
+
+
+def _grade_rows(
+    rules: GradingRules,
+    grades: Sequence[Sequence[float]],
+    weights: Sequence[Sequence[float]],
+    attendance: Sequence[bool],
+    consensus: Sequence[bool],
+    row_offset: int = 0,
+    validate: bool = True,
+) -> List[GradeCalculationResult]:
+    """
+    Grade a slice of a roster.
+
+    Kept at module level so it can be shipped to worker processes.
+
+    Args:
+        rules: Grading rules to apply.
+        grades: Grade vector per row.
+        weights: Weight vector per row.
+        attendance: Attendance flag per row.
+        consensus: Extra points consensus flag per row.
+        row_offset: Index of the first row, used in error messages.
+        validate: Whether to check each row before grading it.
+
+    Returns:
+        One GradeCalculationResult per row.
+
+    Raises:
+        ValueError: If any row is invalid.
+    """
+    results = []
+    for index, (row_grades, row_weights) in enumerate(zip(grades, weights)):
+        if validate:
+            validate_row(
+                row_offset + index, row_grades, row_weights, attendance[index]
+            )
+        weighted_average = calculate_weighted_average(row_grades, row_weights)
+        results.append(
+            rules.apply(weighted_average, attendance[index], consensus[index])
+        )
+    return results
+
+
+class BatchGradeCalculator:
+    """
+    Grades many students at once from column data.
+
+    Rows are graded with the same arithmetic as GradeCalculator. With more
+    than one worker the roster is split into chunks graded in a process pool,
+    which is created lazily and reused until close() is called.
+    """
+
+    DEFAULT_CHUNK_SIZE = 5000
+    SEQUENTIAL_WORKERS = 1
+
+    def __init__(
+        self,
+        rules: Optional[GradingRules] = None,
+        workers: int = SEQUENTIAL_WORKERS,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Initialize the batch calculator.
+
+        Args:
+            rules: Grading rules to apply. Defaults to the current rules.
+            workers: Number of worker processes. 1 grades in-process.
+            chunk_size: Number of rows handed to a worker at a time.
+
+        Raises:
+            ValueError: If workers or chunk_size are not positive integers.
+        """
+        if not isinstance(workers, int) or workers < self.SEQUENTIAL_WORKERS:
+            raise ValueError("workers must be a positive integer")
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+
+        self._rules = rules if rules is not None else GradingRules()
+        self._workers = workers
+        self._chunk_size = chunk_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def rules(self) -> GradingRules:
+        """Get the grading rules."""
+        return self._rules
+
+    @property
+    def workers(self) -> int:
+        """Get the number of worker processes."""
+        return self._workers
+
+    def calculate_batch(
+        self,
+        grades: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]],
+        attendance: Sequence[bool],
+        consensus: Sequence[bool],
+        validate: bool = True,
+    ) -> List[GradeCalculationResult]:
+        """
+        Grade a roster given as columns.
+
+        Args:
+            grades: Grade vector per student.
+            weights: Weight vector per student.
+            attendance: Whether each student met minimum attendance.
+            consensus: Whether extra points apply to each student's year.
+            validate: Whether to check each row. Pass False only for rows
+                      already accepted by BatchValidator.
+
+        Returns:
+            One GradeCalculationResult per student, in input order.
+
+        Raises:
+            ValueError: If columns differ in length or any row is invalid.
+        """
+        row_count = len(grades)
+        if not len(weights) == len(attendance) == len(consensus) == row_count:
+            raise ValueError("All roster columns must have the same length")
+
+        if self._workers == self.SEQUENTIAL_WORKERS or row_count <= self._chunk_size:
+            return _grade_rows(
+                self._rules, grades, weights, attendance, consensus, 0, validate
+            )
+
+        executor = self._get_executor()
+        starts = range(0, row_count, self._chunk_size)
+        futures = [
+            executor.submit(
+                _grade_rows,
+                self._rules,
+                grades[start : start + self._chunk_size],
+                weights[start : start + self._chunk_size],
+                attendance[start : start + self._chunk_size],
+                consensus[start : start + self._chunk_size],
+                start,
+                validate,
+            )
+            for start in starts
+        ]
+        results: List[GradeCalculationResult] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def calculate_years(
+        self,
+        grades: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]],
+        attendance: Sequence[bool],
+        year_indices: Sequence[int],
+        extra_points_policy: ExtraPointsPolicy,
+        validate: bool = True,
+    ) -> List[GradeCalculationResult]:
+        """
+        Grade a roster spanning several academic years.
+
+        The consensus of every row is gathered from the policy's per-year
+        table in one pass, instead of one bounds-checked lookup per student.
+
+        Args:
+            grades: Grade vector per student.
+            weights: Weight vector per student.
+            attendance: Whether each student met minimum attendance.
+            year_indices: Academic year index (0-based) per student.
+            extra_points_policy: Policy holding the consensus of every year.
+            validate: Whether to check each row. Pass False only for rows
+                      already accepted by BatchValidator.
+
+        Returns:
+            One GradeCalculationResult per student, in input order.
+
+        Raises:
+            ValueError: If columns differ in length, any year index is out of
+                        range (every offending row is listed) or any row is
+                        invalid.
+        """
+        if len(year_indices) != len(grades):
+            raise ValueError("All roster columns must have the same length")
+        consensus = extra_points_policy.consensus_for_years(year_indices)
+        return self.calculate_batch(grades, weights, attendance, consensus, validate)
+
+    def calculate_students(
+        self,
+        students: Sequence[Student],
+        extra_points_policy: ExtraPointsPolicy,
+        current_year_index: int,
+    ) -> List[GradeCalculationResult]:
+        """
+        Grade a list of students sharing one extra points policy and year.
+
+        Args:
+            students: Students to grade.
+            extra_points_policy: Policy for extra points.
+            current_year_index: Index of current academic year.
+
+        Returns:
+            One GradeCalculationResult per student, in input order.
+
+        Raises:
+            ValueError: If the year index is out of range or a row is invalid.
+        """
+        has_consensus = (
+            extra_points_policy.calculate_extra_points(current_year_index)
+            != ExtraPointsPolicy.NO_EXTRA_POINTS
+        )
+        grades = []
+        weights = []
+        for student in students:
+            evaluations = student.evaluation_view
+            grades.append([evaluation.grade for evaluation in evaluations])
+            weights.append([evaluation.weight for evaluation in evaluations])
+        attendance = [student.has_reached_minimum_attendance for student in students]
+        return self.calculate_batch(
+            grades, weights, attendance, [has_consensus] * len(students)
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "BatchGradeCalculator":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Shut down the worker pool when leaving the context."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation of the batch calculator."""
+        return (
+            f"BatchGradeCalculator(workers={self._workers}, "
+            f"chunk_size={self._chunk_size}, rules={self._rules})"
+        )
@@ -0,0 +1,428 @@
+"""
+Module for grading roster files end to end.
+"""
+
+import csv
+import logging
+import os
+import time
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence, TextIO
+
+from src.batch_checkpoint import BatchCheckpoint
+from src.batch_grader import BatchGradeCalculator
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculationResult
+from src.grading_logging import get_logger, log_event
+from src.result_cache import ResultCache, rules_fingerprint
+from src.roster_columns import RosterColumns, RosterRow
+from src.roster_io import ENCODING, iter_roster
+from src.rounding_policy import RoundingPolicy
+from src.validation import BatchValidator, ValidationReport
+
+logger = get_logger("batch_runner")
+
+
+class BatchRunSummary:
+    """
+    Outcome of one batch run.
+
+    Attributes:
+        rows_processed: Number of rows read.
+        duration: Wall-clock duration in seconds.
+        validation_report: Problems of the skipped rows, if any.
+        rows_resumed: Rows already committed by an interrupted run.
+    """
+
+    def __init__(
+        self,
+        rows_processed: int,
+        duration: float,
+        validation_report: Optional[ValidationReport] = None,
+        rows_resumed: int = 0,
+    ):
+        """Initialize the batch run summary."""
+        self.rows_processed = rows_processed
+        self.duration = duration
+        self.validation_report = (
+            validation_report if validation_report is not None else ValidationReport()
+        )
+        self.rows_resumed = rows_resumed
+
+    @property
+    def rows_skipped(self) -> int:
+        """Get the number of invalid rows left out of the results."""
+        return len(self.validation_report.invalid_rows)
+
+    @property
+    def throughput(self) -> float:
+        """Get the students graded per second by this run."""
+        if self.duration <= 0:
+            return 0.0
+        return (self.rows_processed - self.rows_resumed) / self.duration
+
+    def __repr__(self) -> str:
+        """String representation of the summary."""
+        return (
+            f"BatchRunSummary(rows={self.rows_processed}, "
+            f"duration={self.duration:.3f}s)"
+        )
+
+
+class BatchRunner:
+    """
+    Reads a roster file, grades it in chunks and writes a results CSV.
+
+    The input is streamed chunk by chunk, so memory use depends on the
+    chunk size and not on the size of the roster. With checkpoint_every
+    set, progress is committed to a BatchCheckpoint next to the results
+    so an interrupted run can be resumed.
+    """
+
+    DEFAULT_CHUNK_SIZE = 10000
+    DEFAULT_CHECKPOINT_EVERY = 100000
+    RESULT_FIELDS = [
+        "student_id",
+        "weighted_average",
+        "attendance_penalty_applied",
+        "extra_points_applied",
+        "final_grade",
+    ]
+
+    def __init__(
+        self,
+        extra_points_policy: ExtraPointsPolicy,
+        current_year_index: int,
+        batch_calculator: Optional[BatchGradeCalculator] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        skip_invalid: bool = False,
+        result_cache: Optional[ResultCache] = None,
+        rounding_policy: Optional[RoundingPolicy] = None,
+        checkpoint_every: Optional[int] = None,
+    ):
+        """
+        Initialize the batch runner.
+
+        Args:
+            extra_points_policy: Policy for extra points.
+            current_year_index: Index of current academic year.
+            batch_calculator: Calculator to grade with. Defaults to a
+                              sequential calculator with current rules.
+            chunk_size: Number of rows read and graded at a time.
+            skip_invalid: Leave invalid rows out and report them in the
+                          summary instead of stopping at the first one.
+            result_cache: On-disk cache of graded chunks, reused across runs.
+            rounding_policy: Rounding of the written numbers. Defaults to
+                             the 2 decimals of get_details().
+            checkpoint_every: Commit the progress after at least this many
+                              rows, at the end of a chunk. None disables
+                              checkpoints.
+
+        Raises:
+            ValueError: If the year is out of range, or chunk_size or
+                        checkpoint_every invalid.
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        if checkpoint_every is not None and (
+            not isinstance(checkpoint_every, int) or checkpoint_every <= 0
+        ):
+            raise ValueError("checkpoint_every must be a positive integer")
+        extra_points_policy.calculate_extra_points(current_year_index)
+
+        self._has_consensus = extra_points_policy.has_consensus_for_year(
+            current_year_index
+        )
+        self._batch_calculator = (
+            batch_calculator if batch_calculator is not None else BatchGradeCalculator()
+        )
+        self._chunk_size = chunk_size
+        self._validator = BatchValidator() if skip_invalid else None
+        self._result_cache = result_cache
+        self._rounding_policy = rounding_policy
+        self._checkpoint_every = checkpoint_every
+
+    def run(
+        self, input_path: str, output_path: str, resume: bool = False
+    ) -> BatchRunSummary:
+        """
+        Grade every student of a roster file.
+
+        Args:
+            input_path: Roster file (.csv, .jsonl or .bin).
+            output_path: Destination CSV of results.
+            resume: Continue from the checkpoint of an interrupted run of
+                    the same input and settings, if there is one.
+
+        Returns:
+            Summary of the run.
+
+        Raises:
+            ValueError: If the roster is malformed, a row is invalid and
+                        skip_invalid is off, resume is set without
+                        checkpoint_every, or the checkpoint does not match
+                        this run.
+        """
+        if resume and self._checkpoint_every is None:
+            raise ValueError("resume requires checkpoint_every")
+        started_at = time.perf_counter()
+        checkpoint_path = BatchCheckpoint.path_for(output_path)
+        checkpoint = self._open_checkpoint(
+            input_path, output_path, checkpoint_path, resume
+        )
+        rows = iter_roster(input_path)
+        rows_resumed = 0
+        validation_report = ValidationReport()
+        if checkpoint is not None:
+            # The checkpoint saves the report of the rows it commits.
+            validation_report = checkpoint.validation_report
+            rows_resumed = checkpoint.rows_processed
+            # Consume the committed rows without grading them.
+            next(islice(rows, rows_resumed, rows_resumed), None)
+        rows_processed = rows_resumed
+        committed_rows = rows_resumed
+        log_event(
+            logger,
+            logging.INFO,
+            "batch_started",
+            input=input_path,
+            resumed=rows_resumed,
+        )
+        mode = "a" if rows_resumed else "w"
+        with open(output_path, mode, encoding=ENCODING, newline="") as output_file:
+            writer = csv.writer(output_file)
+            if mode == "w":
+                writer.writerow(self.RESULT_FIELDS)
+            for chunk in self._iter_chunks(rows):
+                chunk_size = len(chunk)
+                validate = self._validator is None
+                if not validate:
+                    chunk_report = self._validator.validate_roster(chunk)
+                    if not chunk_report.is_valid:
+                        self.log_issues(chunk_report, rows_processed)
+                        validation_report.extend(chunk_report, rows_processed)
+                        chunk = self._select_rows(
+                            chunk, chunk_report.valid_mask(chunk_size)
+                        )
+                writer.writerows(self._grade_chunk(chunk, rows_processed, validate))
+                log_event(
+                    logger,
+                    logging.DEBUG,
+                    "chunk_graded",
+                    first_row=rows_processed,
+                    rows=chunk_size,
+                )
+                rows_processed += chunk_size
+                if (
+                    checkpoint is not None
+                    and rows_processed - committed_rows >= self._checkpoint_every
+                ):
+                    self._commit(
+                        output_file, checkpoint, checkpoint_path, rows_processed
+                    )
+                    committed_rows = rows_processed
+        if checkpoint is not None:
+            BatchCheckpoint.remove(checkpoint_path)
+        summary = BatchRunSummary(
+            rows_processed,
+            time.perf_counter() - started_at,
+            validation_report,
+            rows_resumed,
+        )
+        log_event(
+            logger,
+            logging.INFO,
+            "batch_finished",
+            rows=summary.rows_processed,
+            skipped=summary.rows_skipped,
+            duration=round(summary.duration, 3),
+        )
+        return summary
+
+    def _open_checkpoint(
+        self, input_path: str, output_path: str, checkpoint_path: str, resume: bool
+    ) -> Optional[BatchCheckpoint]:
+        """
+        Get the checkpoint of this run, truncating the output to match it.
+
+        Returns None when checkpoints are off. Without resume, or without a
+        checkpoint on disk, a new checkpoint at row 0 is returned and any
+        stale checkpoint file is removed.
+        """
+        if self._checkpoint_every is None:
+            return None
+        run_key = BatchCheckpoint.make_run_key(
+            input_path,
+            [
+                self._batch_calculator.rules,
+                self._has_consensus,
+                self._rounding_policy,
+                self._validator is not None,
+                rules_fingerprint(),
+            ],
+        )
+        checkpoint = BatchCheckpoint.load(checkpoint_path) if resume else None
+        if checkpoint is None:
+            BatchCheckpoint.remove(checkpoint_path)
+            return BatchCheckpoint(run_key)
+        if checkpoint.run_key != run_key:
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} belongs to a run with a different "
+                "input file or grading settings"
+            )
+        if (
+            not os.path.exists(output_path)
+            or os.path.getsize(output_path) < checkpoint.output_bytes
+        ):
+            raise ValueError(
+                f"Results file {output_path} is shorter than its checkpoint"
+            )
+        # Rows written after the last commit are graded again.
+        os.truncate(output_path, checkpoint.output_bytes)
+        log_event(
+            logger,
+            logging.INFO,
+            "batch_resumed",
+            rows=checkpoint.rows_processed,
+            output_bytes=checkpoint.output_bytes,
+        )
+        return checkpoint
+
+    @staticmethod
+    def _commit(
+        output_file: TextIO,
+        checkpoint: BatchCheckpoint,
+        checkpoint_path: str,
+        rows_processed: int,
+    ) -> None:
+        """Make the written results durable, then record them as committed."""
+        output_file.flush()
+        os.fsync(output_file.fileno())
+        checkpoint.rows_processed = rows_processed
+        checkpoint.output_bytes = os.fstat(output_file.fileno()).st_size
+        checkpoint.save(checkpoint_path)
+        log_event(
+            logger,
+            logging.DEBUG,
+            "checkpoint_saved",
+            rows=rows_processed,
+            output_bytes=checkpoint.output_bytes,
+        )
+
+    @staticmethod
+    def log_issues(
+        report: ValidationReport,
+        first_row: int,
+        event_logger: logging.Logger = logger,
+    ) -> None:
+        """
+        Log every problem of a chunk as an invalid_row warning.
+
+        Args:
+            report: Validation report of the chunk.
+            first_row: Index of the chunk's first row in the roster.
+            event_logger: Logger to use. Defaults to the batch runner's.
+        """
+        if not event_logger.isEnabledFor(logging.WARNING):
+            return
+        for issue in report.issues:
+            log_event(
+                event_logger,
+                logging.WARNING,
+                "invalid_row",
+                row=first_row + issue.row,
+                field=issue.field,
+                code=issue.code,
+            )
+
+    def _iter_chunks(self, rows: Iterator[RosterRow]) -> Iterator[RosterColumns]:
+        """Group streamed rows into roster columns of at most chunk_size."""
+        while True:
+            chunk = RosterColumns.from_rows(islice(rows, self._chunk_size))
+            if not len(chunk):
+                return
+            yield chunk
+
+    @staticmethod
+    def _select_rows(chunk: RosterColumns, mask: List[bool]) -> RosterColumns:
+        """Keep only the rows whose mask entry is True."""
+        return RosterColumns.from_rows(
+            [row for row, keep in zip(chunk.iter_rows(), mask) if keep]
+        )
+
+    def _grade_chunk(
+        self, chunk: RosterColumns, first_row: int, validate: bool = True
+    ) -> List[list]:
+        """Grade one chunk and format its result rows."""
+        cache_key = None
+        if self._result_cache is not None:
+            cache_key = self._result_cache.chunk_key(
+                self._batch_calculator.rules,
+                self._has_consensus,
+                chunk,
+                self._rounding_policy,
+            )
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            results = self._batch_calculator.calculate_batch(
+                chunk.grades,
+                chunk.weights,
+                chunk.attendance,
+                [self._has_consensus] * len(chunk),
+                validate=validate,
+            )
+        except ValueError as error:
+            log_event(
+                logger,
+                logging.ERROR,
+                "chunk_failed",
+                exc_info=True,
+                first_row=first_row,
+            )
+            raise ValueError(f"Chunk starting at row {first_row}: {error}") from error
+
+        formatted = self.format_rows(
+            chunk.student_ids, results, self._rounding_policy
+        )
+        if cache_key is not None:
+            self._result_cache.put(cache_key, formatted)
+        return formatted
+
+    @classmethod
+    def format_rows(
+        cls,
+        student_ids: Sequence[str],
+        results: Sequence[GradeCalculationResult],
+        rounding_policy: Optional[RoundingPolicy] = None,
+    ) -> List[list]:
+        """
+        Format graded students as rows of RESULT_FIELDS.
+
+        Args:
+            student_ids: Identifier of each student.
+            results: The matching grade calculation results.
+            rounding_policy: Rounding of the numbers. Defaults to the
+                             2 decimals of get_details().
+
+        Returns:
+            One result row per student.
+        """
+        if rounding_policy is None:
+            all_details = [result.get_details() for result in results]
+        else:
+            all_details = rounding_policy.details_batch(results)
+        fields = cls.RESULT_FIELDS[1:]
+        return [
+            [student_id] + [details[field] for field in fields]
+            for student_id, details in zip(student_ids, all_details)
+        ]
+
+    def __repr__(self) -> str:
+        """String representation of the batch runner."""
+        return (
+            f"BatchRunner(chunk_size={self._chunk_size}, "
+            f"calculator={self._batch_calculator})"
+        )
@@ -0,0 +1,314 @@
+"""
+Module for compact binary encoding of students and grade results.
+
+Records are packed with struct in little-endian order. A student uses the
+row layout of binary roster files; a result is a fixed 25-byte record. A
+batch is a frame: a header with the record kind, the record count and the
+payload length, followed by the records, so a reader on a pipe or socket
+knows how many bytes to wait for before decoding.
+"""
+
+import struct
+from typing import BinaryIO, List, Sequence, Tuple, Union
+
+from src.evaluation import Evaluation
+from src.grade_calculator import GradeCalculationResult
+from src.roster_io import BINARY_ROW_HEADER, ENCODING, FLOAT64_SIZE
+from src.student import Student
+
+
+class GradingCodec:
+    """
+    Encodes and decodes Student and GradeCalculationResult objects.
+
+    Student layout: a uint16 id length, a bool attendance flag, a uint8
+    evaluation count, the UTF-8 id, then the grades followed by the
+    weights as float64. Result layout: weighted average (float64),
+    attendance penalty flag (bool), extra points and final grade (float64).
+    Decoded students are rebuilt through Student and Evaluation, so their
+    validation still applies.
+    """
+
+    MAGIC = b"CSGC"
+    VERSION = 1
+    STUDENT_KIND = 1
+    RESULT_KIND = 2
+    FRAME_HEADER = struct.Struct("<4sBBII")
+    STUDENT_HEADER = BINARY_ROW_HEADER
+    RESULT_RECORD = struct.Struct("<d?dd")
+    MAX_ID_BYTES = 2**16 - 1
+
+    @classmethod
+    def encode_student(cls, student: Student) -> bytes:
+        """
+        Encode one student.
+
+        Args:
+            student: The student to encode.
+
+        Returns:
+            The packed record.
+
+        Raises:
+            ValueError: If the encoded student ID is too long.
+        """
+        encoded_id = student.student_id.encode(ENCODING)
+        if len(encoded_id) > cls.MAX_ID_BYTES:
+            raise ValueError(
+                f"Student ID must be at most {cls.MAX_ID_BYTES} bytes in {ENCODING}"
+            )
+        evaluations = student.evaluation_view
+        count = len(evaluations)
+        return (
+            cls.STUDENT_HEADER.pack(
+                len(encoded_id), student.has_reached_minimum_attendance, count
+            )
+            + encoded_id
+            + struct.pack(
+                f"<{2 * count}d",
+                *[evaluation.grade for evaluation in evaluations],
+                *[evaluation.weight for evaluation in evaluations],
+            )
+        )
+
+    @classmethod
+    def decode_student(cls, data: bytes) -> Student:
+        """
+        Decode one student encoded by encode_student().
+
+        Args:
+            data: The packed record.
+
+        Returns:
+            The student.
+
+        Raises:
+            ValueError: If the record is truncated, has trailing bytes or
+                        holds an invalid student.
+        """
+        student, end = cls._unpack_student(data, 0)
+        if end != len(data):
+            raise ValueError("Trailing bytes after student record")
+        return student
+
+    @classmethod
+    def encode_result(cls, result: GradeCalculationResult) -> bytes:
+        """
+        Encode one grade calculation result.
+
+        Args:
+            result: The result to encode.
+
+        Returns:
+            The packed RESULT_RECORD.
+        """
+        return cls.RESULT_RECORD.pack(
+            result.weighted_average,
+            result.attendance_penalty_applied,
+            result.extra_points_applied,
+            result.final_grade,
+        )
+
+    @classmethod
+    def decode_result(cls, data: bytes) -> GradeCalculationResult:
+        """
+        Decode one result encoded by encode_result().
+
+        Args:
+            data: The packed record.
+
+        Returns:
+            The grade calculation result.
+
+        Raises:
+            ValueError: If the record does not have the size of RESULT_RECORD.
+        """
+        if len(data) != cls.RESULT_RECORD.size:
+            raise ValueError(
+                f"A result record must be {cls.RESULT_RECORD.size} bytes, "
+                f"got {len(data)}"
+            )
+        return GradeCalculationResult(*cls.RESULT_RECORD.unpack(data))
+
+    @classmethod
+    def encode_students(cls, students: Sequence[Student]) -> bytes:
+        """
+        Encode a batch of students as one frame.
+
+        Args:
+            students: The students to encode.
+
+        Returns:
+            The frame header followed by one record per student.
+
+        Raises:
+            ValueError: If a student ID is too long.
+        """
+        payload = b"".join([cls.encode_student(student) for student in students])
+        return cls._frame(cls.STUDENT_KIND, len(students), payload)
+
+    @classmethod
+    def decode_students(cls, data: bytes) -> List[Student]:
+        """
+        Decode a frame encoded by encode_students().
+
+        Args:
+            data: The whole frame.
+
+        Returns:
+            The students, in encoding order.
+
+        Raises:
+            ValueError: If the frame is malformed or holds an invalid student.
+        """
+        count, payload = cls._unframe(data, cls.STUDENT_KIND)
+        return cls._unpack_students(payload, count)
+
+    @classmethod
+    def encode_results(cls, results: Sequence[GradeCalculationResult]) -> bytes:
+        """
+        Encode a batch of results as one frame.
+
+        Args:
+            results: The results to encode.
+
+        Returns:
+            The frame header followed by one RESULT_RECORD per result.
+        """
+        values = []
+        for result in results:
+            values += (
+                result.weighted_average,
+                result.attendance_penalty_applied,
+                result.extra_points_applied,
+                result.final_grade,
+            )
+        # One pack call for the whole batch; "<" formats have no padding,
+        # so the records are laid out back to back.
+        record_format = cls.RESULT_RECORD.format[1:]
+        payload = struct.pack(f"<{record_format * len(results)}", *values)
+        return cls._frame(cls.RESULT_KIND, len(results), payload)
+
+    @classmethod
+    def decode_results(cls, data: bytes) -> List[GradeCalculationResult]:
+        """
+        Decode a frame encoded by encode_results().
+
+        Args:
+            data: The whole frame.
+
+        Returns:
+            The results, in encoding order.
+
+        Raises:
+            ValueError: If the frame is malformed.
+        """
+        count, payload = cls._unframe(data, cls.RESULT_KIND)
+        return cls._unpack_results(payload, count)
+
+    @classmethod
+    def read_frame(
+        cls, stream: BinaryIO
+    ) -> Union[List[Student], List[GradeCalculationResult]]:
+        """
+        Read and decode the next frame of a stream.
+
+        Args:
+            stream: Binary stream positioned at a frame header.
+
+        Returns:
+            The students or the results of the frame, depending on its kind.
+
+        Raises:
+            ValueError: If the stream ends early or the frame is malformed.
+        """
+        header = cls._read_exactly(stream, cls.FRAME_HEADER.size)
+        kind, count, length = cls._parse_header(header)
+        payload = cls._read_exactly(stream, length)
+        if kind == cls.STUDENT_KIND:
+            return cls._unpack_students(payload, count)
+        return cls._unpack_results(payload, count)
+
+    @classmethod
+    def _frame(cls, kind: int, count: int, payload: bytes) -> bytes:
+        """Prefix a payload with its frame header."""
+        return (
+            cls.FRAME_HEADER.pack(cls.MAGIC, cls.VERSION, kind, count, len(payload))
+            + payload
+        )
+
+    @classmethod
+    def _parse_header(cls, header: bytes) -> Tuple[int, int, int]:
+        """Validate a frame header and get its kind, count and length."""
+        magic, version, kind, count, length = cls.FRAME_HEADER.unpack(header)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Not a grading codec frame")
+        if kind not in (cls.STUDENT_KIND, cls.RESULT_KIND):
+            raise ValueError(f"Unknown frame kind: {kind}")
+        return kind, count, length
+
+    @classmethod
+    def _unframe(cls, data: bytes, expected_kind: int) -> Tuple[int, memoryview]:
+        """Validate a whole frame and get its record count and payload."""
+        if len(data) < cls.FRAME_HEADER.size:
+            raise ValueError("Truncated frame header")
+        kind, count, length = cls._parse_header(data[: cls.FRAME_HEADER.size])
+        if kind != expected_kind:
+            raise ValueError(f"Expected frame kind {expected_kind}, got {kind}")
+        if len(data) != cls.FRAME_HEADER.size + length:
+            raise ValueError(
+                f"Frame payload must be {length} bytes, "
+                f"got {len(data) - cls.FRAME_HEADER.size}"
+            )
+        return count, memoryview(data)[cls.FRAME_HEADER.size :]
+
+    @classmethod
+    def _unpack_student(cls, data: bytes, offset: int) -> Tuple[Student, int]:
+        """Unpack the student record at offset; get it and the end offset."""
+        id_start = offset + cls.STUDENT_HEADER.size
+        if id_start > len(data):
+            raise ValueError("Truncated student record")
+        id_length, attendance, count = cls.STUDENT_HEADER.unpack_from(data, offset)
+        id_end = id_start + id_length
+        values_end = id_end + 2 * FLOAT64_SIZE * count
+        if values_end > len(data):
+            raise ValueError("Truncated student record")
+        student = Student(bytes(data[id_start:id_end]).decode(ENCODING), attendance)
+        values = struct.unpack_from(f"<{2 * count}d", data, id_end)
+        for grade, weight in zip(values[:count], values[count:]):
+            student.add_evaluation(Evaluation(grade, weight))
+        return student, values_end
+
+    @classmethod
+    def _unpack_students(cls, payload: bytes, count: int) -> List[Student]:
+        """Unpack count back-to-back student records filling the payload."""
+        students = []
+        offset = 0
+        for _ in range(count):
+            student, offset = cls._unpack_student(payload, offset)
+            students.append(student)
+        if offset != len(payload):
+            raise ValueError("Trailing bytes after student records")
+        return students
+
+    @classmethod
+    def _unpack_results(
+        cls, payload: bytes, count: int
+    ) -> List[GradeCalculationResult]:
+        """Unpack count back-to-back result records filling the payload."""
+        if len(payload) != count * cls.RESULT_RECORD.size:
+            raise ValueError(
+                f"Expected {count} result records of {cls.RESULT_RECORD.size} bytes"
+            )
+        return [
+            GradeCalculationResult(*values)
+            for values in cls.RESULT_RECORD.iter_unpack(payload)
+        ]
+
+    @staticmethod
+    def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+        """Read size bytes or raise ValueError if the stream ends early."""
+        data = stream.read(size)
+        if len(data) != size:
+            raise ValueError("Truncated frame")
+        return data
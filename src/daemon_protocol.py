@@ -0,0 +1,157 @@
+"""
+Module for the wire protocol and socket location of the grading daemon.
+
+It only depends on the standard library, so a client forwarding one
+request does not pay for importing the grading engine. Requests and
+responses are JSON objects, one per line.
+"""
+
+import json
+import os
+import socket
+import stat
+import tempfile
+from typing import Dict, List, Optional
+
+ENCODING = "utf-8"
+SOCKET_NAME = "cs-grade-calculator.sock"
+PRIVATE_MODE = 0o700
+DEFAULT_TIMEOUT = 5.0
+
+PING = "ping"
+GRADE = "grade"
+SHUTDOWN = "shutdown"
+
+
+def default_socket_directory() -> str:
+    """
+    Get the per-user directory of the default socket.
+
+    Returns:
+        $XDG_RUNTIME_DIR when set, otherwise a directory named after the
+        user ID inside the temporary directory.
+    """
+    runtime_directory = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_directory:
+        return runtime_directory
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "")
+    return os.path.join(tempfile.gettempdir(), f"cs-grade-calculator-{user}")
+
+
+DEFAULT_SOCKET_PATH = os.path.join(default_socket_directory(), SOCKET_NAME)
+
+
+def ensure_private_directory(directory: str) -> None:
+    """
+    Create a directory only the current user can use, or check an existing one.
+
+    Args:
+        directory: Directory that will hold the socket.
+
+    Raises:
+        OSError: If the directory cannot be created, or belongs to another
+                 user or is open to other users.
+    """
+    os.makedirs(directory, mode=PRIVATE_MODE, exist_ok=True)
+    if not hasattr(os, "getuid"):
+        return
+    status = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(status.st_mode)
+        or status.st_uid != os.getuid()
+        or status.st_mode & 0o077
+    ):
+        raise OSError(
+            f"{directory} must be a directory owned by the current user "
+            f"with mode {PRIVATE_MODE:o}"
+        )
+
+
+def check_socket_owner(socket_path: str) -> None:
+    """
+    Check that a path is a socket of the current user before trusting it.
+
+    Args:
+        socket_path: Filesystem path of the Unix socket.
+
+    Raises:
+        OSError: If the path does not exist, is not a socket or belongs to
+                 another user.
+    """
+    status = os.lstat(socket_path)
+    if not stat.S_ISSOCK(status.st_mode):
+        raise OSError(f"{socket_path} is not a socket")
+    if hasattr(os, "getuid") and status.st_uid != os.getuid():
+        raise OSError(f"{socket_path} belongs to another user")
+
+
+def grade_request(
+    grades: List[float],
+    weights: List[float],
+    has_reached_minimum: bool,
+    consensus: List[bool],
+    current_year_index: int,
+    rounding: Optional[Dict[str, object]] = None,
+) -> Dict[str, object]:
+    """
+    Build the request grading one student.
+
+    Args:
+        grades: Grades of the evaluations.
+        weights: Percentage weights of the evaluations.
+        has_reached_minimum: Whether the student met minimum attendance.
+        consensus: Teacher consensus per academic year.
+        current_year_index: Index of current academic year.
+        rounding: RoundingPolicy arguments, "mode" and optionally
+                  "decimals". Defaults to the 2 decimals of get_details().
+
+    Returns:
+        The GRADE request.
+    """
+    request = {
+        "op": GRADE,
+        "grades": grades,
+        "weights": weights,
+        "attendance": has_reached_minimum,
+        "consensus": consensus,
+        "year": current_year_index,
+    }
+    if rounding is not None:
+        request["rounding"] = rounding
+    return request
+
+
+def send_request(
+    socket_path: str, request: Dict[str, object], timeout: float
+) -> object:
+    """
+    Send one request to the daemon and decode its response.
+
+    Args:
+        socket_path: Filesystem path of the daemon's Unix socket.
+        request: Request with an "op" field.
+        timeout: Seconds to wait for the daemon.
+
+    Returns:
+        The "result" of the response.
+
+    Raises:
+        ValueError: If the daemon rejected the request.
+        OSError: If the daemon cannot be reached or the socket is not
+                 owned by the current user.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix sockets are not available on this platform")
+    check_socket_owner(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(socket_path)
+        connection.sendall(json.dumps(request).encode(ENCODING) + b"\n")
+        with connection.makefile("rb") as response_file:
+            line = response_file.readline()
+    if not line:
+        raise ConnectionError("The daemon closed the connection")
+    response = json.loads(line.decode(ENCODING))
+    if not response.get("ok"):
+        raise ValueError(response.get("error", "Unknown daemon error"))
+    return response.get("result")
@@ -0,0 +1,425 @@
+"""
+Module for syncing repeated roster imports by regrading only what changed.
+"""
+
+import hashlib
+import struct
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.batch_grader import BatchGradeCalculator, validate_row
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculationResult
+from src.roster_columns import RosterColumns, RosterRow
+from src.student import Student
+
+EvaluationPair = Tuple[float, float]
+
+FINGERPRINT_SIZE = 16
+_FLOAT_PAIR = struct.Struct("<dd")
+_HEADER = struct.Struct("<?HH")
+
+
+def fingerprint_row(
+    grades: Sequence[float], weights: Sequence[float], has_reached_minimum: bool
+) -> bytes:
+    """
+    Fingerprint a student's evaluation set and attendance.
+
+    Args:
+        grades: Grades of the evaluations.
+        weights: Weights of the evaluations.
+        has_reached_minimum: Whether the student met minimum attendance.
+
+    Returns:
+        A short digest that changes whenever any input changes.
+
+    Raises:
+        ValueError: If a grade or weight is not a number.
+    """
+    digest = hashlib.blake2b(digest_size=FINGERPRINT_SIZE)
+    try:
+        digest.update(_HEADER.pack(has_reached_minimum, len(grades), len(weights)))
+        for grade, weight in zip(grades, weights):
+            digest.update(_FLOAT_PAIR.pack(grade, weight))
+    except struct.error as error:
+        raise ValueError("Grades and weights must be numbers") from error
+    return digest.digest()
+
+
+def fingerprint_student(student: Student) -> bytes:
+    """
+    Fingerprint a Student.
+
+    Args:
+        student: The student to fingerprint.
+
+    Returns:
+        The fingerprint of the student's evaluations and attendance.
+    """
+    evaluations = student.evaluation_view
+    return fingerprint_row(
+        [evaluation.grade for evaluation in evaluations],
+        [evaluation.weight for evaluation in evaluations],
+        student.has_reached_minimum_attendance,
+    )
+
+
+class EvaluationChange:
+    """
+    One evaluation added, changed or removed between two imports.
+
+    Attributes:
+        position: Index of the evaluation in the student's list.
+        kind: ADDED, CHANGED or REMOVED.
+        previous: Previous (grade, weight), or None if added.
+        current: Current (grade, weight), or None if removed.
+    """
+
+    ADDED = "added"
+    CHANGED = "changed"
+    REMOVED = "removed"
+
+    __slots__ = ("position", "kind", "previous", "current")
+
+    def __init__(
+        self,
+        position: int,
+        kind: str,
+        previous: Optional[EvaluationPair],
+        current: Optional[EvaluationPair],
+    ):
+        """Initialize the evaluation change."""
+        self.position = position
+        self.kind = kind
+        self.previous = previous
+        self.current = current
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the change to a dictionary.
+
+        Returns:
+            Dictionary with position, kind and the grade/weight pairs.
+        """
+        return {
+            "position": self.position,
+            "change": self.kind,
+            "previous": list(self.previous) if self.previous is not None else None,
+            "current": list(self.current) if self.current is not None else None,
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the evaluation change."""
+        return f"EvaluationChange(position={self.position}, kind={self.kind})"
+
+
+class StudentChange:
+    """
+    One student added, changed or removed between two imports.
+
+    Attributes:
+        student_id: Identifier of the student.
+        kind: ADDED, CHANGED or REMOVED.
+        evaluation_changes: Evaluation-level differences.
+        attendance_changed: Whether the attendance flag changed.
+        result: New grade, or None for removed students.
+    """
+
+    ADDED = EvaluationChange.ADDED
+    CHANGED = EvaluationChange.CHANGED
+    REMOVED = EvaluationChange.REMOVED
+
+    def __init__(
+        self,
+        student_id: str,
+        kind: str,
+        evaluation_changes: List[EvaluationChange],
+        attendance_changed: bool = False,
+        result: Optional[GradeCalculationResult] = None,
+    ):
+        """Initialize the student change."""
+        self.student_id = student_id
+        self.kind = kind
+        self.evaluation_changes = evaluation_changes
+        self.attendance_changed = attendance_changed
+        self.result = result
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the change to a dictionary ready to push downstream.
+
+        Returns:
+            Dictionary with the student, kind, evaluation changes and result.
+        """
+        return {
+            "student_id": self.student_id,
+            "change": self.kind,
+            "attendance_changed": self.attendance_changed,
+            "evaluations": [change.to_dict() for change in self.evaluation_changes],
+            "result": self.result.get_details() if self.result is not None else None,
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the student change."""
+        return f"StudentChange(student={self.student_id}, kind={self.kind})"
+
+
+class ChangeSet:
+    """
+    Every student difference found by one sync.
+
+    Attributes:
+        changes: Student changes, added and changed in import order followed
+                 by removed students.
+    """
+
+    def __init__(self, changes: Optional[List[StudentChange]] = None):
+        """Initialize the change set."""
+        self.changes = changes if changes is not None else []
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if nothing changed."""
+        return not self.changes
+
+    @property
+    def added(self) -> List[StudentChange]:
+        """Get the students that are new in this import."""
+        return self._of_kind(StudentChange.ADDED)
+
+    @property
+    def changed(self) -> List[StudentChange]:
+        """Get the students whose evaluations or attendance changed."""
+        return self._of_kind(StudentChange.CHANGED)
+
+    @property
+    def removed(self) -> List[StudentChange]:
+        """Get the students missing from this import."""
+        return self._of_kind(StudentChange.REMOVED)
+
+    def _of_kind(self, kind: str) -> List[StudentChange]:
+        """Get the changes of one kind."""
+        return [change for change in self.changes if change.kind == kind]
+
+    def to_dicts(self) -> List[Dict[str, object]]:
+        """
+        Convert every change to a dictionary.
+
+        Returns:
+            One dictionary per student change.
+        """
+        return [change.to_dict() for change in self.changes]
+
+    def __len__(self) -> int:
+        """Get the number of changed students."""
+        return len(self.changes)
+
+    def __repr__(self) -> str:
+        """String representation of the change set."""
+        return (
+            f"ChangeSet(added={len(self.added)}, changed={len(self.changed)}, "
+            f"removed={len(self.removed)})"
+        )
+
+
+class DeltaSyncEngine:
+    """
+    Keeps the last imported roster and regrades only the students that differ.
+
+    Each student is stored with a fingerprint of their evaluation set, so a
+    full import costs one hash per student and only added or changed
+    students are diffed evaluation by evaluation and regraded. Feeds that
+    already carry only the modified rows can use apply(), whose cost depends
+    on the size of the change alone.
+    """
+
+    def __init__(
+        self,
+        extra_points_policy: ExtraPointsPolicy,
+        current_year_index: int,
+        batch_calculator: Optional[BatchGradeCalculator] = None,
+    ):
+        """
+        Initialize the delta sync engine.
+
+        Args:
+            extra_points_policy: Policy for extra points.
+            current_year_index: Index of current academic year.
+            batch_calculator: Calculator used to regrade changed students.
+
+        Raises:
+            ValueError: If the year index is out of range.
+        """
+        extra_points_policy.calculate_extra_points(current_year_index)
+        self._has_consensus = extra_points_policy.has_consensus_for_year(
+            current_year_index
+        )
+        self._batch_calculator = (
+            batch_calculator if batch_calculator is not None else BatchGradeCalculator()
+        )
+        self._snapshot: Dict[str, Tuple[bytes, RosterRow]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of students in the last import."""
+        return len(self._snapshot)
+
+    def __contains__(self, student_id: str) -> bool:
+        """Check if a student was in the last import."""
+        return student_id in self._snapshot
+
+    def sync(self, roster: RosterColumns) -> ChangeSet:
+        """
+        Sync a full export: students missing from it are reported as removed.
+
+        Args:
+            roster: The complete roster of the new import.
+
+        Returns:
+            The change set, with new results for added and changed students.
+
+        Raises:
+            ValueError: If a student ID is repeated or a changed row is
+                        invalid. The previous import is kept in that case.
+        """
+        imported_ids = set(roster.student_ids)
+        if len(imported_ids) != len(roster):
+            raise ValueError("Student IDs must be unique within an import")
+        removed_ids = [
+            student_id
+            for student_id in self._snapshot
+            if student_id not in imported_ids
+        ]
+        return self.apply(roster, removed_ids)
+
+    def apply(
+        self, upserts: RosterColumns, removed_ids: Iterable[str] = ()
+    ) -> ChangeSet:
+        """
+        Apply a partial import of new or modified students and removals.
+
+        Args:
+            upserts: Students to add or replace.
+            removed_ids: Students to drop.
+
+        Returns:
+            The change set, with new results for added and changed students.
+
+        Raises:
+            ValueError: If a student ID is repeated or a changed row is
+                        invalid. The previous import is kept in that case.
+        """
+        pending: Dict[str, Tuple[bytes, RosterRow]] = {}
+        changes: List[StudentChange] = []
+        for row in upserts.iter_rows():
+            student_id, grades, weights, attendance = row
+            if student_id in pending:
+                raise ValueError(f"Student {student_id} appears more than once")
+            fingerprint = fingerprint_row(grades, weights, attendance)
+            previous = self._snapshot.get(student_id)
+            if previous is not None and previous[0] == fingerprint:
+                continue
+            pending[student_id] = (fingerprint, row)
+            changes.append(self._diff(student_id, previous, row))
+
+        self._regrade(changes, pending)
+
+        removed = []
+        for student_id in removed_ids:
+            previous = self._snapshot.get(student_id)
+            if previous is None or student_id in pending:
+                continue
+            _, previous_grades, previous_weights, _ = previous[1]
+            removed.append(
+                StudentChange(
+                    student_id,
+                    StudentChange.REMOVED,
+                    self._diff_evaluations(previous_grades, previous_weights, [], []),
+                )
+            )
+
+        self._snapshot.update(pending)
+        for change in removed:
+            del self._snapshot[change.student_id]
+        return ChangeSet(changes + removed)
+
+    def _diff(
+        self,
+        student_id: str,
+        previous: Optional[Tuple[bytes, RosterRow]],
+        row: RosterRow,
+    ) -> StudentChange:
+        """Describe how a row differs from its previous version."""
+        _, grades, weights, attendance = row
+        if previous is None:
+            return StudentChange(
+                student_id,
+                StudentChange.ADDED,
+                self._diff_evaluations([], [], grades, weights),
+            )
+        _, previous_grades, previous_weights, previous_attendance = previous[1]
+        return StudentChange(
+            student_id,
+            StudentChange.CHANGED,
+            self._diff_evaluations(previous_grades, previous_weights, grades, weights),
+            attendance_changed=previous_attendance != attendance,
+        )
+
+    @staticmethod
+    def _diff_evaluations(
+        previous_grades: Sequence[float],
+        previous_weights: Sequence[float],
+        grades: Sequence[float],
+        weights: Sequence[float],
+    ) -> List[EvaluationChange]:
+        """Compare two evaluation lists position by position."""
+        previous = list(zip(previous_grades, previous_weights))
+        current = list(zip(grades, weights))
+        changes = []
+        for position in range(max(len(previous), len(current))):
+            old = previous[position] if position < len(previous) else None
+            new = current[position] if position < len(current) else None
+            if old == new:
+                continue
+            if old is None:
+                kind = EvaluationChange.ADDED
+            elif new is None:
+                kind = EvaluationChange.REMOVED
+            else:
+                kind = EvaluationChange.CHANGED
+            changes.append(EvaluationChange(position, kind, old, new))
+        return changes
+
+    def _regrade(
+        self,
+        changes: List[StudentChange],
+        pending: Dict[str, Tuple[bytes, RosterRow]],
+    ) -> None:
+        """Grade the added and changed students in one batch."""
+        if not changes:
+            return
+        rows = RosterColumns.from_rows(
+            [pending[change.student_id][1] for change in changes]
+        )
+        for index, change in enumerate(changes):
+            try:
+                validate_row(
+                    index,
+                    rows.grades[index],
+                    rows.weights[index],
+                    rows.attendance[index],
+                )
+            except ValueError as error:
+                raise ValueError(f"Student {change.student_id}: {error}") from error
+        results = self._batch_calculator.calculate_batch(
+            rows.grades,
+            rows.weights,
+            rows.attendance,
+            [self._has_consensus] * len(rows),
+            validate=False,
+        )
+        for change, result in zip(changes, results):
+            change.result = result
+
+    def __repr__(self) -> str:
+        """String representation of the delta sync engine."""
+        return f"DeltaSyncEngine(students={len(self._snapshot)})"
@@ -2,7 +2,7 @@
 Module for handling extra points policy based on teacher consensus.
 """
 
-from typing import List
+from typing import List, Sequence, Tuple
 
 
 class ExtraPointsPolicy:
@@ -15,6 +15,7 @@ class ExtraPointsPolicy:
 
     EXTRA_POINTS_VALUE = 1.0
     NO_EXTRA_POINTS = 0.0
+    MAX_REPORTED_ROWS = 10
 
     def __init__(self, all_years_teachers: List[bool]):
         """
@@ -33,12 +34,23 @@ class ExtraPointsPolicy:
         if not all(isinstance(decision, bool) for decision in all_years_teachers):
             raise ValueError("All elements in all_years_teachers must be boolean")
 
-        self._all_years_teachers = all_years_teachers
+        # Every method reads this snapshot, so later changes to the caller's
+        # list cannot make the consensus and the bonus disagree.
+        self._consensus_table: Tuple[bool, ...] = tuple(all_years_teachers)
+        self._bonus_table: Tuple[float, ...] = tuple(
+            self.EXTRA_POINTS_VALUE if decision else self.NO_EXTRA_POINTS
+            for decision in all_years_teachers
+        )
 
     @property
     def consensus_history(self) -> List[bool]:
         """Get the teacher consensus history."""
-        return self._all_years_teachers.copy()
+        return list(self._consensus_table)
+
+    @property
+    def bonus_table(self) -> Tuple[float, ...]:
+        """Get the extra points of every academic year, by year index."""
+        return self._bonus_table
 
     def calculate_extra_points(self, current_year_index: int) -> float:
         """
@@ -53,16 +65,78 @@ class ExtraPointsPolicy:
         Raises:
             ValueError: If year index is out of range.
         """
-        if current_year_index < 0 or current_year_index >= len(
-            self._all_years_teachers
-        ):
+        if current_year_index < 0 or current_year_index >= len(self._bonus_table):
             raise ValueError(
-                f"Year index must be between 0 and {len(self._all_years_teachers) - 1}"
+                f"Year index must be between 0 and {len(self._bonus_table) - 1}"
             )
+        return self._bonus_table[current_year_index]
+
+    def extra_points_for_years(self, year_indices: Sequence[int]) -> List[float]:
+        """
+        Calculate the extra points of many students at once.
+
+        Args:
+            year_indices: Academic year index (0-based) per student.
+
+        Returns:
+            Extra points value per student, in input order.
+
+        Raises:
+            ValueError: If any year index is out of range. The message lists
+                        every offending row.
+        """
+        return self._gather(self._bonus_table, year_indices)
+
+    def consensus_for_years(self, year_indices: Sequence[int]) -> List[bool]:
+        """
+        Look up the teacher consensus of many students at once.
 
-        if self._all_years_teachers[current_year_index]:
-            return self.EXTRA_POINTS_VALUE
-        return self.NO_EXTRA_POINTS
+        Args:
+            year_indices: Academic year index (0-based) per student.
+
+        Returns:
+            Whether teachers agreed on extra points, per student.
+
+        Raises:
+            ValueError: If any year index is out of range. The message lists
+                        every offending row.
+        """
+        return self._gather(self._consensus_table, year_indices)
+
+    def invalid_year_rows(self, year_indices: Sequence[int]) -> List[int]:
+        """
+        Find the rows whose year index is out of range.
+
+        Args:
+            year_indices: Academic year index (0-based) per student.
+
+        Returns:
+            Sorted indices of the rows with an invalid year.
+        """
+        year_count = len(self._bonus_table)
+        return [
+            row
+            for row, year_index in enumerate(year_indices)
+            if not isinstance(year_index, int) or not 0 <= year_index < year_count
+        ]
+
+    def _gather(self, table: tuple, year_indices: Sequence[int]) -> list:
+        """Index a per-year table with a whole column, checking bounds once."""
+        try:
+            if not year_indices or (
+                min(year_indices) >= 0 and max(year_indices) < len(table)
+            ):
+                return list(map(table.__getitem__, year_indices))
+        except TypeError:
+            pass
+        invalid_rows = self.invalid_year_rows(year_indices)
+        shown = ", ".join(str(row) for row in invalid_rows[: self.MAX_REPORTED_ROWS])
+        hidden = len(invalid_rows) - self.MAX_REPORTED_ROWS
+        raise ValueError(
+            f"Year index must be between 0 and {len(table) - 1}; "
+            f"{len(invalid_rows)} rows out of range: {shown}"
+            + (f" and {hidden} more" if hidden > 0 else "")
+        )
 
     def has_consensus_for_year(self, year_index: int) -> bool:
         """
@@ -74,10 +148,10 @@ class ExtraPointsPolicy:
         Returns:
             True if consensus was reached, False otherwise.
         """
-        if year_index < 0 or year_index >= len(self._all_years_teachers):
+        if year_index < 0 or year_index >= len(self._consensus_table):
             return False
-        return self._all_years_teachers[year_index]
+        return self._consensus_table[year_index]
 
     def __repr__(self) -> str:
         """String representation of extra points policy."""
-        return f"ExtraPointsPolicy(consensus={self._all_years_teachers})"
+        return f"ExtraPointsPolicy(consensus={list(self._consensus_table)})"
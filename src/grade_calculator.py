@@ -2,9 +2,10 @@
 Module for calculating final grades with detailed breakdown.
 """
 
-from typing import Dict, List
+from typing import Dict, Optional, Sequence
 
 from src.attendance_policy import AttendancePolicy
+from src.audit_log import AuditLog
 from src.evaluation import Evaluation
 from src.extra_points_policy import ExtraPointsPolicy
 
@@ -71,22 +72,28 @@ class GradeCalculator:
     MIN_FINAL_GRADE = 0.0
     MAX_FINAL_GRADE = 20.0
     INITIAL_EXTRA_POINTS = 0.0
+    PASSING_GRADE = 11.0
 
     def __init__(
         self,
-        evaluations: List[Evaluation],
+        evaluations: Sequence[Evaluation],
         attendance_policy: AttendancePolicy,
         extra_points_policy: ExtraPointsPolicy,
         current_year_index: int,
+        audit_log: Optional[AuditLog] = None,
+        student_id: str = "",
     ):
         """
         Initialize the grade calculator.
 
         Args:
-            evaluations: List of student evaluations.
+            evaluations: Student evaluations, as a list or a tuple such as
+                         Student.evaluation_view.
             attendance_policy: Policy for handling attendance.
             extra_points_policy: Policy for extra points.
             current_year_index: Index of current academic year.
+            audit_log: Optional log receiving every calculation.
+            student_id: Identifier recorded in the audit log.
 
         Raises:
             ValueError: If evaluations exceed maximum or weights don't sum to 100.
@@ -96,8 +103,10 @@ class GradeCalculator:
         self._attendance_policy = attendance_policy
         self._extra_points_policy = extra_points_policy
         self._current_year_index = current_year_index
+        self._audit_log = audit_log
+        self._student_id = student_id
 
-    def _validate_evaluations(self, evaluations: List[Evaluation]) -> None:
+    def _validate_evaluations(self, evaluations: Sequence[Evaluation]) -> None:
         """
         Validate evaluations list.
 
@@ -107,8 +116,8 @@ class GradeCalculator:
         Raises:
             ValueError: If validations fail.
         """
-        if not isinstance(evaluations, list):
-            raise ValueError("Evaluations must be a list")
+        if not isinstance(evaluations, (list, tuple)):
+            raise ValueError("Evaluations must be a list or tuple")
 
         if len(evaluations) == 0:
             raise ValueError("Must have at least one evaluation")
@@ -162,13 +171,25 @@ class GradeCalculator:
 
         final_grade = max(self.MIN_FINAL_GRADE, min(self.MAX_FINAL_GRADE, final_grade))
 
-        return GradeCalculationResult(
+        result = GradeCalculationResult(
             weighted_average=weighted_avg,
             attendance_penalty_applied=attendance_penalty_applied,
             extra_points_applied=extra_points,
             final_grade=final_grade,
         )
 
+        if self._audit_log is not None:
+            self._audit_log.record_calculation(
+                self._student_id,
+                self._evaluations,
+                self._attendance_policy,
+                self._extra_points_policy,
+                self._current_year_index,
+                result,
+            )
+
+        return result
+
     def __repr__(self) -> str:
         """String representation of the calculator."""
         return (
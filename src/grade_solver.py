@@ -0,0 +1,391 @@
+"""
+Module for solving the minimum grade needed on pending evaluations to pass.
+"""
+
+import math
+import sys
+from typing import Dict, List, Optional, Sequence
+
+from src.batch_grader import GradingRules, calculate_weighted_average
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+from src.student import Student
+
+
+def _approximate_ulp(value: float) -> float:
+    """Bound the spacing of floats at value on Python versions without math.ulp."""
+    if value == 0:
+        return sys.float_info.min * sys.float_info.epsilon
+    return abs(value) * sys.float_info.epsilon
+
+
+_ulp = getattr(math, "ulp", _approximate_ulp)
+
+
+def validate_pending_row(
+    row: int,
+    grades: Sequence[float],
+    weights: Sequence[float],
+    pending_weights: Sequence[float],
+) -> None:
+    """
+    Validate graded and pending evaluations of one student.
+
+    Args:
+        row: Index of the row, used in error messages.
+        grades: Grades of the graded evaluations.
+        weights: Weights of the graded evaluations.
+        pending_weights: Weights of the evaluations not yet graded.
+
+    Raises:
+        ValueError: If graded and pending weights are not a full course.
+    """
+    if len(grades) != len(weights):
+        raise ValueError(f"Row {row}: grades and weights must have the same length")
+    if len(weights) + len(pending_weights) > GradeCalculator.MAX_EVALUATIONS:
+        raise ValueError(
+            f"Row {row}: cannot have more than "
+            f"{GradeCalculator.MAX_EVALUATIONS} evaluations"
+        )
+    for grade in grades:
+        if not Evaluation.MIN_GRADE <= grade <= Evaluation.MAX_GRADE:
+            raise ValueError(
+                f"Row {row}: grade must be between "
+                f"{Evaluation.MIN_GRADE} and {Evaluation.MAX_GRADE}"
+            )
+    for weight in list(weights) + list(pending_weights):
+        if not Evaluation.MIN_WEIGHT <= weight <= Evaluation.MAX_WEIGHT:
+            raise ValueError(
+                f"Row {row}: weight must be between "
+                f"{Evaluation.MIN_WEIGHT} and {Evaluation.MAX_WEIGHT}"
+            )
+    total_weight = sum(weights) + sum(pending_weights)
+    if (
+        abs(total_weight - GradeCalculator.EXPECTED_TOTAL_WEIGHT)
+        > GradeCalculator.WEIGHT_TOLERANCE
+    ):
+        raise ValueError(
+            f"Row {row}: graded and pending weights must sum to "
+            f"{GradeCalculator.EXPECTED_TOTAL_WEIGHT}, got {total_weight}"
+        )
+
+
+class RequiredGradeResult:
+    """
+    Answer to "what do I need on the remaining evaluations to pass".
+
+    Attributes:
+        status: PASSED, ATTAINABLE or UNREACHABLE.
+        required_grade: Minimum grade needed on every pending evaluation, or
+                        None if the student cannot pass.
+        current_contribution: Points already earned by graded evaluations.
+        pending_weight: Total weight of the pending evaluations.
+        extra_points: Extra points the student will receive.
+    """
+
+    PASSED = "passed"
+    ATTAINABLE = "attainable"
+    UNREACHABLE = "unreachable"
+
+    __slots__ = (
+        "status",
+        "required_grade",
+        "current_contribution",
+        "pending_weight",
+        "extra_points",
+    )
+
+    def __init__(
+        self,
+        status: str,
+        required_grade: Optional[float],
+        current_contribution: float,
+        pending_weight: float,
+        extra_points: float,
+    ):
+        """Initialize the required grade result."""
+        self.status = status
+        self.required_grade = required_grade
+        self.current_contribution = current_contribution
+        self.pending_weight = pending_weight
+        self.extra_points = extra_points
+
+    @property
+    def can_pass(self) -> bool:
+        """Check if the student can still pass."""
+        return self.status != self.UNREACHABLE
+
+    def get_details(self) -> Dict[str, object]:
+        """
+        Get detailed breakdown of the answer.
+
+        Returns:
+            Dictionary with the status and values.
+        """
+        return {
+            "status": self.status,
+            "required_grade": (
+                round(self.required_grade, 2)
+                if self.required_grade is not None
+                else None
+            ),
+            "current_contribution": round(self.current_contribution, 2),
+            "pending_weight": round(self.pending_weight, 2),
+            "extra_points": round(self.extra_points, 2),
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the result."""
+        return (
+            f"RequiredGradeResult(status={self.status}, "
+            f"required_grade={self.required_grade})"
+        )
+
+
+class PassingGradeSolver:
+    """
+    Closed-form solver for the minimum uniform grade on pending evaluations.
+
+    With graded contribution C, pending weight fraction P and extra points E,
+    the final grade is clamp(C + x * P + E), so the answer is
+    x = (passing_grade - E - C) / P. The candidate is then checked with the
+    exact GradeCalculator arithmetic and nudged up by a few ulps when
+    rounding leaves it a hair short, so a student who scores required_grade
+    on every pending evaluation passes in GradeCalculator too.
+    """
+
+    MAX_NUDGES = 32
+
+    def __init__(
+        self,
+        rules: Optional[GradingRules] = None,
+        passing_grade: float = GradeCalculator.PASSING_GRADE,
+    ):
+        """
+        Initialize the solver.
+
+        Args:
+            rules: Grading rules to apply. Defaults to the current rules.
+            passing_grade: Final grade needed to pass.
+
+        Raises:
+            ValueError: If passing_grade is not a number.
+        """
+        if not isinstance(passing_grade, (int, float)):
+            raise ValueError("passing_grade must be a number")
+        self._rules = rules if rules is not None else GradingRules()
+        self._passing_grade = float(passing_grade)
+
+    @property
+    def passing_grade(self) -> float:
+        """Get the final grade needed to pass."""
+        return self._passing_grade
+
+    def solve(
+        self,
+        evaluations: Sequence[Evaluation],
+        pending_weights: Sequence[float],
+        has_reached_minimum: bool,
+        has_consensus: bool,
+    ) -> RequiredGradeResult:
+        """
+        Solve for one student's graded evaluations.
+
+        Args:
+            evaluations: Evaluations already graded.
+            pending_weights: Weights of the evaluations not yet graded.
+            has_reached_minimum: Whether the student met minimum attendance.
+            has_consensus: Whether teachers agreed on extra points that year.
+
+        Returns:
+            The required grade result.
+
+        Raises:
+            ValueError: If the weights do not add up to a full course.
+        """
+        return self.solve_batch(
+            [[evaluation.grade for evaluation in evaluations]],
+            [[evaluation.weight for evaluation in evaluations]],
+            [pending_weights],
+            [has_reached_minimum],
+            [has_consensus],
+        )[0]
+
+    def solve_student(
+        self,
+        student: Student,
+        pending_weights: Sequence[float],
+        extra_points_policy: ExtraPointsPolicy,
+        current_year_index: int,
+    ) -> RequiredGradeResult:
+        """
+        Solve for a student's current evaluations.
+
+        Args:
+            student: Student with the evaluations graded so far.
+            pending_weights: Weights of the evaluations not yet graded.
+            extra_points_policy: Policy for extra points.
+            current_year_index: Index of current academic year.
+
+        Returns:
+            The required grade result.
+
+        Raises:
+            ValueError: If the year is out of range or the weights are invalid.
+        """
+        has_consensus = (
+            extra_points_policy.calculate_extra_points(current_year_index)
+            != ExtraPointsPolicy.NO_EXTRA_POINTS
+        )
+        return self.solve(
+            student.evaluation_view,
+            pending_weights,
+            student.has_reached_minimum_attendance,
+            has_consensus,
+        )
+
+    def solve_batch(
+        self,
+        grades: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]],
+        pending_weights: Sequence[Sequence[float]],
+        attendance: Sequence[bool],
+        consensus: Sequence[bool],
+    ) -> List[RequiredGradeResult]:
+        """
+        Solve for a whole section given as columns in one pass.
+
+        Args:
+            grades: Grades of the graded evaluations per student.
+            weights: Weights of the graded evaluations per student.
+            pending_weights: Weights of the pending evaluations per student.
+            attendance: Whether each student met minimum attendance.
+            consensus: Whether extra points apply to each student's year.
+
+        Returns:
+            One RequiredGradeResult per student, in input order.
+
+        Raises:
+            ValueError: If columns differ in length or a row's weights are
+                        invalid.
+        """
+        row_count = len(grades)
+        if not (
+            len(weights)
+            == len(pending_weights)
+            == len(attendance)
+            == len(consensus)
+            == row_count
+        ):
+            raise ValueError("All roster columns must have the same length")
+
+        rules = self._rules
+        passing_grade = self._passing_grade
+        divisor = Evaluation.PERCENTAGE_DIVISOR
+        penalty_passes = (
+            rules.apply(Evaluation.MIN_GRADE, False, False).final_grade
+            >= passing_grade
+        )
+        results = []
+        for row in range(row_count):
+            row_grades = grades[row]
+            row_weights = weights[row]
+            row_pending = pending_weights[row]
+            validate_pending_row(row, row_grades, row_weights, row_pending)
+
+            current = calculate_weighted_average(row_grades, row_weights)
+            pending_weight = sum(row_pending)
+            if not attendance[row]:
+                status = (
+                    RequiredGradeResult.PASSED
+                    if penalty_passes
+                    else RequiredGradeResult.UNREACHABLE
+                )
+                results.append(
+                    RequiredGradeResult(
+                        status,
+                        Evaluation.MIN_GRADE if penalty_passes else None,
+                        current,
+                        pending_weight,
+                        GradeCalculator.INITIAL_EXTRA_POINTS,
+                    )
+                )
+                continue
+
+            has_consensus = consensus[row]
+            extra_points = (
+                rules.extra_points_value
+                if has_consensus
+                else ExtraPointsPolicy.NO_EXTRA_POINTS
+            )
+            minimum = Evaluation.MIN_GRADE
+            if self._passes(
+                row_grades, row_weights, row_pending, minimum, has_consensus
+            ):
+                status = RequiredGradeResult.PASSED
+                required = minimum
+            else:
+                candidate = (
+                    (passing_grade - extra_points - current)
+                    / (pending_weight / divisor)
+                    if pending_weight
+                    else math.inf
+                )
+                required = self._confirm(
+                    row_grades, row_weights, row_pending, candidate, has_consensus
+                )
+                status = (
+                    RequiredGradeResult.ATTAINABLE
+                    if required is not None
+                    else RequiredGradeResult.UNREACHABLE
+                )
+            results.append(
+                RequiredGradeResult(
+                    status, required, current, pending_weight, extra_points
+                )
+            )
+        return results
+
+    def _confirm(
+        self,
+        grades: Sequence[float],
+        weights: Sequence[float],
+        pending_weights: Sequence[float],
+        candidate: float,
+        has_consensus: bool,
+    ) -> Optional[float]:
+        """Nudge the closed-form candidate until it passes exactly, if it can."""
+        if not candidate <= Evaluation.MAX_GRADE:
+            return None
+        required = max(candidate, Evaluation.MIN_GRADE)
+        step = _ulp(required)
+        for _ in range(self.MAX_NUDGES):
+            if self._passes(grades, weights, pending_weights, required, has_consensus):
+                return required
+            required = min(required + step, Evaluation.MAX_GRADE)
+            step *= 2
+        return None
+
+    def _passes(
+        self,
+        grades: Sequence[float],
+        weights: Sequence[float],
+        pending_weights: Sequence[float],
+        pending_grade: float,
+        has_consensus: bool,
+    ) -> bool:
+        """Check with GradeCalculator arithmetic if a pending grade passes."""
+        weighted_average = calculate_weighted_average(
+            list(grades) + [pending_grade] * len(pending_weights),
+            list(weights) + list(pending_weights),
+        )
+        final_grade = self._rules.apply(weighted_average, True, has_consensus)
+        return final_grade.final_grade >= self._passing_grade
+
+    def __repr__(self) -> str:
+        """String representation of the solver."""
+        return (
+            f"PassingGradeSolver(passing_grade={self._passing_grade}, "
+            f"rules={self._rules})"
+        )
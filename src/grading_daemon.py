@@ -0,0 +1,340 @@
+"""
+Module for a background grading daemon reachable over a local Unix socket.
+
+The daemon keeps the grading engine and the extra points policies warm, so
+scripts calling the CLI repeatedly get answers without recomputing setup.
+Requests and responses are JSON objects, one per line, as described in
+daemon_protocol.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.attendance_policy import AttendancePolicy
+from src.daemon_protocol import (
+    DEFAULT_SOCKET_PATH,
+    DEFAULT_TIMEOUT,
+    ENCODING,
+    GRADE,
+    PING,
+    SHUTDOWN,
+    default_socket_directory,
+    ensure_private_directory,
+    grade_request,
+    send_request,
+)
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculationResult, GradeCalculator
+from src.rounding_policy import RoundingPolicy
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Answers every JSON line of one connection."""
+
+    def handle(self) -> None:
+        """Decode each request line and write its response line."""
+        for line in self.rfile:
+            try:
+                request = json.loads(line.decode(ENCODING))
+            except ValueError as error:
+                response = {"ok": False, "error": f"Invalid JSON: {error}"}
+            else:
+                response = self.server.grading_daemon.handle(request)
+            self.wfile.write(json.dumps(response).encode(ENCODING) + b"\n")
+            self.wfile.flush()
+            # Only stop once the client has its answer, or a foreground
+            # daemon could exit before the response is written.
+            self.server.grading_daemon.shutdown_if_requested()
+
+
+class GradingDaemon:
+    """
+    Serves grade calculations over a Unix socket until shut down.
+
+    Each request is graded with GradeCalculator, so results and validation
+    errors are exactly those of the interactive CLI. Extra points policies
+    are cached per consensus history. The socket is only accessible to the
+    user running the daemon.
+    """
+
+    MAX_CACHED_POLICIES = 128
+    POLL_INTERVAL = 0.1
+    SOCKET_MODE = 0o600
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
+        """
+        Initialize the daemon.
+
+        Args:
+            socket_path: Filesystem path of the Unix socket.
+        """
+        self._socket_path = socket_path
+        self._policies: "OrderedDict[Tuple[bool, ...], ExtraPointsPolicy]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._attendance_policies = {
+            True: AttendancePolicy(True),
+            False: AttendancePolicy(False),
+        }
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self._requests_served = 0
+        self._shutdown_requested = False
+
+    @property
+    def socket_path(self) -> str:
+        """Get the path of the Unix socket."""
+        return self._socket_path
+
+    @property
+    def requests_served(self) -> int:
+        """Get the number of requests answered."""
+        return self._requests_served
+
+    def handle(self, request: Dict[str, object]) -> Dict[str, object]:
+        """
+        Answer one request.
+
+        Args:
+            request: Decoded request with an "op" field.
+
+        Returns:
+            Response with "ok" and either "result" or "error".
+        """
+        with self._lock:
+            self._requests_served += 1
+        operation = request.get("op") if isinstance(request, dict) else None
+        try:
+            if operation == PING:
+                return {"ok": True, "result": {"requests": self._requests_served}}
+            if operation == GRADE:
+                return {"ok": True, "result": self._details(request)}
+            if operation == SHUTDOWN:
+                self._shutdown_requested = True
+                return {"ok": True, "result": None}
+            raise ValueError(f"Unknown operation: {operation}")
+        except (ValueError, TypeError, KeyError) as error:
+            return {"ok": False, "error": str(error)}
+
+    def _details(self, request: Dict[str, object]) -> Dict[str, object]:
+        """Grade a request and describe the result with its rounding."""
+        result = self._grade(request)
+        rounding = request.get("rounding")
+        if rounding is None:
+            return result.get_details()
+        if not isinstance(rounding, dict):
+            raise ValueError("rounding must be an object with mode and decimals")
+        return RoundingPolicy(**rounding).details(result)
+
+    def _grade(self, request: Dict[str, object]) -> GradeCalculationResult:
+        """Grade one student described by a request."""
+        grades = request["grades"]
+        weights = request["weights"]
+        if not isinstance(grades, list) or not isinstance(weights, list):
+            raise ValueError("grades and weights must be lists")
+        if len(grades) != len(weights):
+            raise ValueError("grades and weights must have the same length")
+        attendance = request.get("attendance", True)
+        if not isinstance(attendance, bool):
+            raise ValueError("attendance must be a boolean")
+
+        calculator = GradeCalculator(
+            evaluations=[
+                Evaluation(grade, weight) for grade, weight in zip(grades, weights)
+            ],
+            attendance_policy=self._attendance_policies[attendance],
+            extra_points_policy=self._policy(request.get("consensus", [False])),
+            current_year_index=request.get("year", 0),
+        )
+        return calculator.calculate_final_grade()
+
+    def _policy(self, consensus: Sequence[bool]) -> ExtraPointsPolicy:
+        """Get the cached policy of a consensus history."""
+        if not isinstance(consensus, list):
+            raise ValueError("consensus must be a list of booleans")
+        key = tuple(consensus)
+        with self._lock:
+            policy = self._policies.get(key)
+            if policy is not None:
+                self._policies.move_to_end(key)
+                return policy
+        policy = ExtraPointsPolicy(list(consensus))
+        with self._lock:
+            self._policies[key] = policy
+            if len(self._policies) > self.MAX_CACHED_POLICIES:
+                self._policies.popitem(last=False)
+        return policy
+
+    def start(self) -> None:
+        """
+        Bind the socket.
+
+        Raises:
+            OSError: If Unix sockets are unavailable, the default socket
+                     directory is not private or a daemon already listens
+                     on the path.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Unix sockets are not available on this platform")
+        directory = os.path.dirname(os.path.abspath(self._socket_path))
+        if directory == os.path.abspath(default_socket_directory()):
+            ensure_private_directory(directory)
+        if os.path.lexists(self._socket_path):
+            if GradingClient(self._socket_path).is_available():
+                raise OSError(f"A daemon is already running on {self._socket_path}")
+            os.unlink(self._socket_path)
+
+        self._shutdown_requested = False
+        self._server = socketserver.ThreadingUnixStreamServer(
+            self._socket_path, _DaemonRequestHandler
+        )
+        os.chmod(self._socket_path, self.SOCKET_MODE)
+        self._server.daemon_threads = True
+        self._server.grading_daemon = self
+
+    def serve_forever(self) -> None:
+        """Answer requests until a shutdown request or close()."""
+        if self._server is None:
+            self.start()
+        try:
+            self._server.serve_forever(poll_interval=self.POLL_INTERVAL)
+        finally:
+            self.close()
+
+    def serve_in_background(self) -> threading.Thread:
+        """
+        Start answering requests in a daemon thread.
+
+        Returns:
+            The serving thread.
+        """
+        self.start()
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        """Stop a serve_forever() loop running in another thread."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def shutdown_if_requested(self) -> None:
+        """Stop serve_forever() in the background after a shutdown request."""
+        if self._shutdown_requested and self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def close(self) -> None:
+        """Close the socket and remove its file."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            if os.path.exists(self._socket_path):
+                os.unlink(self._socket_path)
+
+    def __repr__(self) -> str:
+        """String representation of the daemon."""
+        return (
+            f"GradingDaemon(socket={self._socket_path}, "
+            f"served={self._requests_served})"
+        )
+
+
+class GradingClient:
+    """
+    Sends requests to a running GradingDaemon.
+
+    A socket that is not owned by the current user is never connected to.
+    """
+
+    DEFAULT_TIMEOUT = DEFAULT_TIMEOUT
+
+    def __init__(
+        self, socket_path: str = DEFAULT_SOCKET_PATH, timeout: float = DEFAULT_TIMEOUT
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            socket_path: Filesystem path of the daemon's Unix socket.
+            timeout: Seconds to wait for the daemon.
+        """
+        self._socket_path = socket_path
+        self._timeout = timeout
+
+    def is_available(self) -> bool:
+        """Check if a daemon answers on the socket."""
+        if not hasattr(socket, "AF_UNIX") or not os.path.exists(self._socket_path):
+            return False
+        try:
+            self._send({"op": PING})
+        except OSError:
+            return False
+        return True
+
+    def grade(
+        self,
+        grades: List[float],
+        weights: List[float],
+        has_reached_minimum: bool,
+        consensus: List[bool],
+        current_year_index: int,
+        rounding_policy: Optional[RoundingPolicy] = None,
+    ) -> Dict[str, object]:
+        """
+        Grade one student on the daemon.
+
+        Args:
+            grades: Grades of the evaluations.
+            weights: Percentage weights of the evaluations.
+            has_reached_minimum: Whether the student met minimum attendance.
+            consensus: Teacher consensus per academic year.
+            current_year_index: Index of current academic year.
+            rounding_policy: Rounding of the details. Defaults to the
+                             2 decimals of get_details().
+
+        Returns:
+            The result details, as GradeCalculationResult.get_details().
+
+        Raises:
+            ValueError: If the daemon rejected the request.
+            OSError: If the daemon cannot be reached.
+        """
+        rounding = None
+        if rounding_policy is not None:
+            rounding = {
+                "mode": rounding_policy.mode,
+                "decimals": rounding_policy.decimals,
+            }
+        return self._send(
+            grade_request(
+                grades,
+                weights,
+                has_reached_minimum,
+                consensus,
+                current_year_index,
+                rounding,
+            )
+        )
+
+    def shutdown(self) -> None:
+        """
+        Ask the daemon to stop.
+
+        Raises:
+            OSError: If the daemon cannot be reached.
+        """
+        self._send({"op": SHUTDOWN})
+
+    def _send(self, request: Dict[str, object]) -> object:
+        """Send one request and decode its response."""
+        return send_request(self._socket_path, request, self._timeout)
+
+    def __repr__(self) -> str:
+        """String representation of the client."""
+        return f"GradingClient(socket={self._socket_path})"
@@ -0,0 +1,431 @@
+"""
+Module for structured, non-blocking logging of grading events.
+
+Events are logged under LOGGER_NAME as JSON lines. The grading thread only
+filters, counts and enqueues a record; a QueueListener thread formats and
+writes it. Repeated warnings and errors are rate-limited: the first burst
+of each kind goes through, then one in sample_every per interval.
+"""
+
+import copy
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+LOGGER_NAME = "grade_calculator"
+FIELDS_ATTRIBUTE = "grading_fields"
+ERROR_ATTRIBUTE = "grading_error"
+SUPPRESSED_ATTRIBUTE = "grading_suppressed"
+ENCODING = "utf-8"
+
+# Without a handler, Python's last-resort handler would print every warning
+# of a library logger to stderr.
+logging.getLogger(LOGGER_NAME).addHandler(logging.NullHandler())
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a child logger of LOGGER_NAME.
+
+    Args:
+        name: Name of the component, e.g. "batch_runner".
+
+    Returns:
+        The logger.
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+def log_event(
+    logger: logging.Logger,
+    level: int,
+    event: str,
+    exc_info: bool = False,
+    **fields: object,
+) -> None:
+    """
+    Log a grading event with structured fields.
+
+    Returns before building the record when the level is disabled, so
+    per-student calls cost one comparison when logging is off.
+
+    Args:
+        logger: Logger to use.
+        level: Logging level.
+        event: Machine-readable event name, e.g. "invalid_row".
+        exc_info: Whether to attach the exception being handled.
+        **fields: Values describing the event.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    logger.log(level, event, exc_info=exc_info, extra={FIELDS_ATTRIBUTE: fields})
+
+
+def _event_kind(record: logging.LogRecord) -> str:
+    """Get the kind of a record: its code, error type or event name."""
+    fields = getattr(record, FIELDS_ATTRIBUTE, None) or {}
+    if "code" in fields:
+        return str(fields["code"])
+    if record.exc_info and record.exc_info[0] is not None:
+        return record.exc_info[0].__name__
+    return record.getMessage()
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record.
+
+        Args:
+            record: The record to format.
+
+        Returns:
+            The JSON line, without trailing newline.
+        """
+        document = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        document.update(getattr(record, FIELDS_ATTRIBUTE, None) or {})
+        suppressed = getattr(record, SUPPRESSED_ATTRIBUTE, 0)
+        if suppressed:
+            document["suppressed"] = suppressed
+        error = getattr(record, ERROR_ATTRIBUTE, None)
+        if error is None and record.exc_info:
+            error = _describe_error(record)
+        if error is not None:
+            document["error"] = error
+        return json.dumps(document, default=str, ensure_ascii=False)
+
+
+def _describe_error(record: logging.LogRecord) -> Optional[Dict[str, str]]:
+    """Describe the exception of a record as type, message and traceback."""
+    exc_type, exc_value, _ = record.exc_info
+    if exc_type is None:
+        return None
+    return {
+        "type": exc_type.__name__,
+        "message": str(exc_value),
+        "traceback": logging.Formatter().formatException(record.exc_info),
+    }
+
+
+class ErrorCounter(logging.Filter):
+    """
+    Counts warnings and errors per kind, before any sampling.
+
+    Attributes:
+        min_level: Lowest level counted.
+    """
+
+    def __init__(self, min_level: int = logging.WARNING):
+        """Initialize the counter."""
+        super().__init__()
+        self.min_level = min_level
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Count the record and let it through."""
+        if record.levelno >= self.min_level:
+            kind = _event_kind(record)
+            with self._lock:
+                self._counts[kind] += 1
+        return True
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Get the number of records per kind."""
+        with self._lock:
+            return dict(self._counts)
+
+
+class LevelFilter(logging.Filter):
+    """
+    Drops records below a level.
+
+    Used instead of the logger level when records below it must still
+    reach an earlier filter, such as ErrorCounter.
+    """
+
+    def __init__(self, level: int):
+        """Initialize the level filter."""
+        super().__init__()
+        self.level = level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Keep the record if it is at or above the level."""
+        return record.levelno >= self.level
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Rate-limits repeated warnings and errors of the same kind.
+
+    Within each interval, the first `burst` records of a kind pass, then
+    one in every `sample_every`. A passing record carries the number of
+    records of its kind suppressed since the previous one.
+    """
+
+    DEFAULT_BURST = 10
+    DEFAULT_INTERVAL = 60.0
+    DEFAULT_SAMPLE_EVERY = 100
+
+    def __init__(
+        self,
+        burst: int = DEFAULT_BURST,
+        interval: float = DEFAULT_INTERVAL,
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
+        min_level: int = logging.WARNING,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the sampling filter.
+
+        Args:
+            burst: Records of a kind always let through per interval.
+            interval: Length of a rate-limiting window, in seconds.
+            sample_every: After the burst, let one record in this many pass.
+            min_level: Records below this level are never sampled.
+            clock: Monotonic clock, in seconds.
+
+        Raises:
+            ValueError: If burst, interval or sample_every are invalid.
+        """
+        super().__init__()
+        if not isinstance(burst, int) or burst < 0:
+            raise ValueError("burst must be a non-negative integer")
+        if not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError("interval must be a positive number")
+        if not isinstance(sample_every, int) or sample_every <= 0:
+            raise ValueError("sample_every must be a positive integer")
+        self._burst = burst
+        self._interval = float(interval)
+        self._sample_every = sample_every
+        self._min_level = min_level
+        self._clock = clock
+        self._windows: Dict[Hashable, Tuple[float, int, int]] = {}
+        self._suppressed_total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def suppressed_total(self) -> int:
+        """Get the number of records dropped by sampling."""
+        return self._suppressed_total
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide if a record is kept."""
+        if record.levelno < self._min_level:
+            return True
+        key = (record.levelno, _event_kind(record))
+        now = self._clock()
+        with self._lock:
+            started_at, seen, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - started_at >= self._interval:
+                started_at, seen = now, 0
+            seen += 1
+            keep = (
+                seen <= self._burst or (seen - self._burst) % self._sample_every == 0
+            )
+            if keep:
+                setattr(record, SUPPRESSED_ATTRIBUTE, suppressed)
+                suppressed = 0
+            else:
+                suppressed += 1
+                self._suppressed_total += 1
+            self._windows[key] = (started_at, seen, suppressed)
+        return keep
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the logging thread.
+
+    When the queue is full the record is dropped and counted instead.
+    Exceptions are turned into plain fields before queueing, so the
+    traceback is rendered where it was raised.
+    """
+
+    def __init__(self, record_queue: "queue.Queue[logging.LogRecord]"):
+        """Initialize the handler."""
+        super().__init__(record_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Capture the message and exception of a record before queueing."""
+        record = copy.copy(record)
+        if record.exc_info:
+            setattr(record, ERROR_ATTRIBUTE, _describe_error(record))
+            record.exc_info = None
+            record.exc_text = None
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DrainingQueueListener(QueueListener):
+    """Queue listener whose stop() waits for room for its sentinel."""
+
+    def enqueue_sentinel(self) -> None:
+        """Block until the sentinel fits, so stop() cannot fail on a full queue."""
+        self.queue.put(self._sentinel)
+
+
+class GradingLogSession:
+    """
+    Logging set up for one grading run.
+
+    While started, every event under LOGGER_NAME at or above `level` is
+    sampled and handed to a background thread that writes JSON lines to a
+    file or to stderr. Warnings and errors are counted before the level
+    is applied, so a run logged at ERROR still counts its warnings.
+    stop() flushes every queued record.
+    """
+
+    DEFAULT_QUEUE_SIZE = 10000
+    LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        level: str = "INFO",
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        sampling_filter: Optional[SamplingFilter] = None,
+    ):
+        """
+        Initialize the session.
+
+        Args:
+            path: File receiving the JSON lines. Defaults to stderr.
+            level: Lowest level logged, one of LEVELS.
+            queue_size: Records waiting to be written before new ones are
+                        dropped.
+            sampling_filter: Rate limiting of repeated events. Defaults to
+                             SamplingFilter().
+
+        Raises:
+            ValueError: If the level or queue_size are invalid.
+        """
+        if level not in self.LEVELS:
+            raise ValueError(
+                f"Unknown log level: {level}. Expected one of {list(self.LEVELS)}"
+            )
+        if not isinstance(queue_size, int) or queue_size <= 0:
+            raise ValueError("queue_size must be a positive integer")
+        self._path = path
+        self._level = getattr(logging, level)
+        self._queue_size = queue_size
+        self._error_counter = ErrorCounter()
+        self._sampling_filter = (
+            sampling_filter if sampling_filter is not None else SamplingFilter()
+        )
+        self._queue_handler: Optional[DroppingQueueHandler] = None
+        self._listener: Optional[QueueListener] = None
+        self._target: Optional[logging.Handler] = None
+        self._previous_level = logging.NOTSET
+        self._previous_propagate = True
+
+    @property
+    def error_counts(self) -> Dict[str, int]:
+        """Get the warnings and errors of the run, per kind."""
+        return self._error_counter.counts
+
+    @property
+    def suppressed(self) -> int:
+        """Get the number of records dropped by sampling."""
+        return self._sampling_filter.suppressed_total
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of records dropped because the queue was full."""
+        return self._queue_handler.dropped if self._queue_handler else 0
+
+    def start(self) -> None:
+        """
+        Attach the handlers and start the writer thread.
+
+        Raises:
+            OSError: If the log file cannot be opened.
+        """
+        if self._path is None:
+            target: logging.Handler = logging.StreamHandler(sys.stderr)
+        else:
+            target = logging.FileHandler(self._path, encoding=ENCODING)
+        target.setFormatter(JsonFormatter())
+        record_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(self._queue_size)
+        queue_handler = DroppingQueueHandler(record_queue)
+        queue_handler.addFilter(self._error_counter)
+        queue_handler.addFilter(LevelFilter(self._level))
+        queue_handler.addFilter(self._sampling_filter)
+
+        logger = logging.getLogger(LOGGER_NAME)
+        self._previous_level = logger.level
+        self._previous_propagate = logger.propagate
+        # The logger lets counted levels through; LevelFilter applies `level`.
+        logger.setLevel(min(self._level, self._error_counter.min_level))
+        logger.propagate = False
+        logger.addHandler(queue_handler)
+
+        self._target = target
+        self._queue_handler = queue_handler
+        self._listener = _DrainingQueueListener(record_queue, target)
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Detach the handlers and write every queued record."""
+        if self._listener is None:
+            return
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.removeHandler(self._queue_handler)
+        logger.setLevel(self._previous_level)
+        logger.propagate = self._previous_propagate
+        self._listener.stop()
+        self._target.close()
+        self._listener = None
+
+    def summary(self) -> Dict[str, object]:
+        """
+        Get the counts of the run.
+
+        Returns:
+            Dictionary with errors per kind, suppressed and dropped records.
+        """
+        return {
+            "errors": self.error_counts,
+            "suppressed": self.suppressed,
+            "dropped": self.dropped,
+        }
+
+    def __enter__(self) -> "GradingLogSession":
+        """Start the session when entering the context."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop the session when leaving the context."""
+        self.stop()
+
+    def __repr__(self) -> str:
+        """String representation of the session."""
+        return (
+            f"GradingLogSession(path={self._path}, "
+            f"level={logging.getLevelName(self._level)})"
+        )
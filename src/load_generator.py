@@ -0,0 +1,433 @@
+"""
+Module for driving the grade calculator under sustained synthetic load.
+"""
+
+import gc
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.attendance_policy import AttendancePolicy
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+from src.roster_generator import RosterGenerator
+from src.student import Student
+
+
+BYTES_PER_KB = 1024
+
+
+def _current_rss_kb() -> Optional[int]:
+    """
+    Get the current resident set size of this process.
+
+    Returns:
+        RSS in kilobytes, or None if the platform has no /proc/self/statm.
+    """
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") // BYTES_PER_KB
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _peak_rss_kb() -> Optional[int]:
+    """
+    Get the highest resident set size this process has reached.
+
+    Returns:
+        Peak RSS in kilobytes, or None if the resource module is missing.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux and the BSDs.
+    if sys.platform == "darwin":
+        return peak // BYTES_PER_KB
+    return peak
+
+
+class SyntheticStudentFactory:
+    """
+    Seeded generator of realistic students and consensus vectors.
+
+    Student data comes from RosterGenerator, so every generated student is
+    accepted by GradeCalculator.
+    """
+
+    DEFAULT_ATTENDANCE_RATE = RosterGenerator.DEFAULT_ATTENDANCE_RATE
+    DEFAULT_CONSENSUS_RATE = RosterGenerator.DEFAULT_CONSENSUS_RATE
+
+    def __init__(
+        self,
+        seed: int,
+        attendance_rate: float = DEFAULT_ATTENDANCE_RATE,
+        consensus_rate: float = DEFAULT_CONSENSUS_RATE,
+    ):
+        """
+        Initialize the factory.
+
+        Args:
+            seed: Seed of the random generator.
+            attendance_rate: Probability that a student met attendance.
+            consensus_rate: Probability that a year has extra points.
+
+        Raises:
+            ValueError: If a rate is not between 0 and 1.
+        """
+        if not isinstance(consensus_rate, (int, float)) or not (
+            0.0 <= consensus_rate <= 1.0
+        ):
+            raise ValueError("Rates must be between 0 and 1")
+        self._generator = RosterGenerator(seed, attendance_rate)
+        self._consensus_rate = consensus_rate
+
+    def create_weights(self, count: int) -> List[float]:
+        """
+        Create integer percentage weights summing exactly to 100.
+
+        Args:
+            count: Number of weights.
+
+        Returns:
+            The weights.
+        """
+        return self._generator.create_weights(count)
+
+    def create_student(self, student_id: str) -> Student:
+        """
+        Create a student with random evaluations and attendance.
+
+        Args:
+            student_id: Identifier of the student.
+
+        Returns:
+            The synthetic student.
+        """
+        _, grades, weights, has_attendance = self._generator.create_row(student_id)
+        student = Student(student_id, has_reached_minimum_attendance=has_attendance)
+        for grade, weight in zip(grades, weights):
+            student.add_evaluation(Evaluation(grade, weight))
+        return student
+
+    def create_consensus(self, years: int) -> List[bool]:
+        """
+        Create a teacher consensus vector.
+
+        Args:
+            years: Number of academic years.
+
+        Returns:
+            One consensus flag per year.
+        """
+        return self._generator.create_consensus(years, self._consensus_rate)
+
+    def choose_year(self, years: int) -> int:
+        """Pick a random academic year index."""
+        return self._generator.choose_year(years)
+
+
+class _GcPauseMonitor:
+    """Measures garbage collector pauses through gc.callbacks."""
+
+    def __init__(self):
+        """Initialize the monitor."""
+        self.pauses: List[float] = []
+        self._started_at = 0.0
+
+    def _callback(self, phase: str, info: Dict[str, int]) -> None:
+        """Record the duration between a collection's start and stop."""
+        if phase == "start":
+            self._started_at = time.perf_counter()
+        elif phase == "stop":
+            self.pauses.append(time.perf_counter() - self._started_at)
+
+    def __enter__(self) -> "_GcPauseMonitor":
+        """Start listening to collections."""
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop listening to collections."""
+        gc.callbacks.remove(self._callback)
+
+
+class LoadReport:
+    """
+    Summary of one load run.
+
+    Attributes:
+        mode: Name of the load pattern.
+        requests: Number of grade calculations performed.
+        errors: Number of calculations that raised.
+        duration: Wall-clock duration in seconds.
+        latencies: Latency of every calculation in seconds, from its
+                   scheduled send time to its answer.
+        rss_start_kb: Current RSS before the run, if available.
+        rss_end_kb: Current RSS after the run, if available.
+        gc_pauses: Duration of every garbage collection in seconds.
+        peak_rss_kb: Highest RSS of the process up to the end of the run,
+                     if available. It never decreases, so it cannot show
+                     growth after an earlier peak.
+    """
+
+    PERCENTILES = (50, 90, 99)
+    PERCENT = 100
+    MICROSECONDS = 1_000_000
+
+    def __init__(
+        self,
+        mode: str,
+        requests: int,
+        errors: int,
+        duration: float,
+        latencies: List[float],
+        rss_start_kb: Optional[int],
+        rss_end_kb: Optional[int],
+        gc_pauses: List[float],
+        peak_rss_kb: Optional[int] = None,
+    ):
+        """Initialize the load report."""
+        self.mode = mode
+        self.requests = requests
+        self.errors = errors
+        self.duration = duration
+        self.latencies = sorted(latencies)
+        self.rss_start_kb = rss_start_kb
+        self.rss_end_kb = rss_end_kb
+        self.gc_pauses = gc_pauses
+        self.peak_rss_kb = peak_rss_kb
+
+    @property
+    def throughput(self) -> float:
+        """Get the calculations per second."""
+        if self.duration <= 0:
+            return 0.0
+        return self.requests / self.duration
+
+    @property
+    def rss_growth_kb(self) -> Optional[int]:
+        """Get the RSS growth during the run, if available."""
+        if self.rss_start_kb is None or self.rss_end_kb is None:
+            return None
+        return self.rss_end_kb - self.rss_start_kb
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get a latency percentile using the nearest-rank method.
+
+        Args:
+            percent: Percentile to compute (0-100).
+
+        Returns:
+            The latency in seconds, or 0 if nothing ran.
+        """
+        if not self.latencies:
+            return 0.0
+        rank = max(1, -(-len(self.latencies) * percent // self.PERCENT))
+        return self.latencies[int(rank) - 1]
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Get the report as a dictionary, latencies in microseconds.
+
+        Returns:
+            Dictionary with the report metrics.
+        """
+        report: Dict[str, object] = {
+            "mode": self.mode,
+            "requests": self.requests,
+            "errors": self.errors,
+            "duration_s": round(self.duration, 3),
+            "throughput_per_s": round(self.throughput, 1),
+        }
+        for percent in self.PERCENTILES:
+            report[f"latency_p{percent}_us"] = round(
+                self.percentile(percent) * self.MICROSECONDS, 1
+            )
+        report["latency_max_us"] = round(
+            (self.latencies[-1] if self.latencies else 0.0) * self.MICROSECONDS, 1
+        )
+        report["rss_start_kb"] = self.rss_start_kb
+        report["rss_end_kb"] = self.rss_end_kb
+        report["rss_growth_kb"] = self.rss_growth_kb
+        report["peak_rss_kb"] = self.peak_rss_kb
+        report["gc_collections"] = len(self.gc_pauses)
+        report["gc_pause_total_us"] = round(sum(self.gc_pauses) * self.MICROSECONDS, 1)
+        report["gc_pause_max_us"] = round(
+            max(self.gc_pauses, default=0.0) * self.MICROSECONDS, 1
+        )
+        return report
+
+    def __repr__(self) -> str:
+        """String representation of the load report."""
+        return (
+            f"LoadReport(mode={self.mode}, requests={self.requests}, "
+            f"throughput={self.throughput:.1f}/s, "
+            f"p99={self.percentile(99) * self.MICROSECONDS:.1f}us)"
+        )
+
+
+class LoadGenerator:
+    """
+    Drives Student/GradeCalculator usage at a constant rate or in bursts.
+
+    Each request uses a fresh synthetic Student, passes its
+    evaluation_view to a GradeCalculator and computes the final grade,
+    which is the same object churn as the CLI, so leaks or slowdowns in
+    those classes show up as latency or RSS drift over a long run.
+
+    The students of a batch are generated before its scheduled send time,
+    so the random generator is not part of the latency. Latency is measured
+    from the scheduled send time rather than from when the calculation
+    actually started: when the run falls behind the target rate, the wait
+    shows in the percentiles instead of being hidden (coordinated
+    omission). In burst mode every calculation of a burst is scheduled at
+    the burst start, so later ones include the wait behind earlier ones.
+    """
+
+    DEFAULT_SEED = 42
+    DEFAULT_YEARS = 5
+    CONSTANT_MODE = "constant"
+    BURST_MODE = "burst"
+
+    def __init__(self, seed: int = DEFAULT_SEED, years: int = DEFAULT_YEARS):
+        """
+        Initialize the load generator.
+
+        Args:
+            seed: Seed of the synthetic data, for reproducible runs.
+            years: Number of academic years in the consensus vector.
+
+        Raises:
+            ValueError: If years is not a positive integer.
+        """
+        if not isinstance(years, int) or years <= 0:
+            raise ValueError("years must be a positive integer")
+        self._factory = SyntheticStudentFactory(seed)
+        self._years = years
+        self._extra_points_policy = ExtraPointsPolicy(
+            self._factory.create_consensus(years)
+        )
+        self._next_student = 0
+
+    def run_constant_rate(
+        self, rate_per_second: float, duration_seconds: float
+    ) -> LoadReport:
+        """
+        Issue calculations at a fixed rate.
+
+        Args:
+            rate_per_second: Target calculations per second.
+            duration_seconds: How long to run.
+
+        Returns:
+            The load report.
+
+        Raises:
+            ValueError: If rate or duration are not positive.
+        """
+        self._validate_positive(rate_per_second, "rate_per_second")
+        self._validate_positive(duration_seconds, "duration_seconds")
+        interval = 1.0 / rate_per_second
+        return self._run(
+            self.CONSTANT_MODE, duration_seconds, batch_size=1, interval=interval
+        )
+
+    def run_bursts(
+        self, burst_size: int, burst_interval_seconds: float, duration_seconds: float
+    ) -> LoadReport:
+        """
+        Issue calculations in back-to-back bursts.
+
+        Args:
+            burst_size: Calculations per burst.
+            burst_interval_seconds: Time between the start of two bursts.
+            duration_seconds: How long to run.
+
+        Returns:
+            The load report.
+
+        Raises:
+            ValueError: If an argument is not positive.
+        """
+        self._validate_positive(burst_size, "burst_size")
+        self._validate_positive(burst_interval_seconds, "burst_interval_seconds")
+        self._validate_positive(duration_seconds, "duration_seconds")
+        return self._run(
+            self.BURST_MODE,
+            duration_seconds,
+            batch_size=int(burst_size),
+            interval=burst_interval_seconds,
+        )
+
+    def _run(
+        self, mode: str, duration_seconds: float, batch_size: int, interval: float
+    ) -> LoadReport:
+        """Issue batch_size calculations every interval until the deadline."""
+        latencies: List[float] = []
+        errors = 0
+        rss_start = _current_rss_kb()
+
+        with _GcPauseMonitor() as gc_monitor:
+            batch = [self._create_request() for _ in range(batch_size)]
+            started_at = time.perf_counter()
+            deadline = started_at + duration_seconds
+            next_tick = started_at
+            while next_tick < deadline:
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                for student, year_index in batch:
+                    try:
+                        self._grade(student, year_index)
+                    except ValueError:
+                        errors += 1
+                    latencies.append(time.perf_counter() - next_tick)
+                next_tick += interval
+                if next_tick < deadline:
+                    batch = [self._create_request() for _ in range(batch_size)]
+            duration = time.perf_counter() - started_at
+
+        return LoadReport(
+            mode=mode,
+            requests=len(latencies),
+            errors=errors,
+            duration=duration,
+            latencies=latencies,
+            rss_start_kb=rss_start,
+            rss_end_kb=_current_rss_kb(),
+            gc_pauses=gc_monitor.pauses,
+            peak_rss_kb=_peak_rss_kb(),
+        )
+
+    def _create_request(self) -> Tuple[Student, int]:
+        """Build a synthetic student and pick their academic year."""
+        student = self._factory.create_student(f"LOAD{self._next_student:08d}")
+        self._next_student += 1
+        return student, self._factory.choose_year(self._years)
+
+    def _grade(self, student: Student, year_index: int) -> float:
+        """Compute the final grade of a synthetic student."""
+        calculator = GradeCalculator(
+            evaluations=student.evaluation_view,
+            attendance_policy=AttendancePolicy(student.has_reached_minimum_attendance),
+            extra_points_policy=self._extra_points_policy,
+            current_year_index=year_index,
+        )
+        return calculator.calculate_final_grade().final_grade
+
+    @staticmethod
+    def _validate_positive(value: float, name: str) -> None:
+        """Raise ValueError if value is not a positive number."""
+        if not isinstance(value, (int, float)) or value <= 0:
+            raise ValueError(f"{name} must be a positive number")
+
+    def __repr__(self) -> str:
+        """String representation of the load generator."""
+        return f"LoadGenerator(years={self._years}, issued={self._next_student})"
@@ -0,0 +1,374 @@
+"""
+Module for estimating the probability of passing before every grade is in.
+
+Pending evaluation grades are drawn from empirical distributions (for
+example, the grades of past cohorts on the final exam). The draws are
+made once per engine and shared by every student, so each student's
+estimate only depends on the seed and not on who else is in the roster.
+"""
+
+import math
+import random
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.batch_grader import GradingRules, calculate_weighted_average
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+from src.grade_solver import validate_pending_row
+from src.student import Student
+
+
+class PassProbability:
+    """
+    Estimated probability of passing for one student.
+
+    Attributes:
+        passing_samples: Number of simulated outcomes that pass.
+        samples: Number of simulated outcomes.
+    """
+
+    RISK_THRESHOLD = 0.5
+
+    __slots__ = ("passing_samples", "samples")
+
+    def __init__(self, passing_samples: int, samples: int):
+        """Initialize the estimate."""
+        self.passing_samples = passing_samples
+        self.samples = samples
+
+    @property
+    def probability(self) -> float:
+        """Get the fraction of simulated outcomes that pass."""
+        return self.passing_samples / self.samples
+
+    @property
+    def standard_error(self) -> float:
+        """Get the standard error of the probability."""
+        probability = self.probability
+        return math.sqrt(probability * (1 - probability) / self.samples)
+
+    @property
+    def is_at_risk(self) -> bool:
+        """Check if the student is more likely to fail than RISK_THRESHOLD."""
+        return self.probability < self.RISK_THRESHOLD
+
+    def get_details(self) -> Dict[str, object]:
+        """
+        Get detailed breakdown of the estimate.
+
+        Returns:
+            Dictionary with the probability, its standard error and counts.
+        """
+        return {
+            "probability": round(self.probability, 4),
+            "standard_error": round(self.standard_error, 4),
+            "passing_samples": self.passing_samples,
+            "samples": self.samples,
+            "at_risk": self.is_at_risk,
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the estimate."""
+        return (
+            f"PassProbability(probability={self.probability:.4f}, "
+            f"samples={self.samples})"
+        )
+
+
+class PassProbabilityEngine:
+    """
+    Monte Carlo estimate of passing, for a whole cohort at once.
+
+    Pending evaluation k of every student is drawn from distributions[k].
+    For each distinct vector of pending weights, the pending contribution
+    of every sample is computed once and sorted. A student passes in a
+    sample when that contribution reaches passing_grade minus the graded
+    contribution and extra points, so counting passing samples is a binary
+    search instead of one grading per sample. Samples within TIE_TOLERANCE
+    of the threshold are graded with the exact GradeCalculator arithmetic,
+    so every count agrees with grading that sample outcome one by one.
+    """
+
+    DEFAULT_SAMPLES = 10_000
+    DEFAULT_SEED = 42
+    TIE_TOLERANCE = 1e-9
+
+    def __init__(
+        self,
+        distributions: Sequence[Sequence[float]],
+        samples: int = DEFAULT_SAMPLES,
+        seed: int = DEFAULT_SEED,
+        rules: Optional[GradingRules] = None,
+        passing_grade: float = GradeCalculator.PASSING_GRADE,
+    ):
+        """
+        Initialize the engine and draw every sample.
+
+        Args:
+            distributions: Observed grades of each pending evaluation, in the
+                           order pending weights are given.
+            samples: Number of simulated outcomes per student.
+            seed: Seed of the random generator.
+            rules: Grading rules to apply. Defaults to the current rules.
+            passing_grade: Final grade needed to pass.
+
+        Raises:
+            ValueError: If a distribution is empty or has an invalid grade,
+                        there are more distributions than MAX_EVALUATIONS,
+                        or samples or passing_grade are invalid.
+        """
+        if not isinstance(samples, int) or samples <= 0:
+            raise ValueError("samples must be a positive integer")
+        if not isinstance(passing_grade, (int, float)):
+            raise ValueError("passing_grade must be a number")
+        if len(distributions) > GradeCalculator.MAX_EVALUATIONS:
+            raise ValueError(
+                f"Cannot have more than {GradeCalculator.MAX_EVALUATIONS} "
+                "pending evaluation distributions"
+            )
+        for index, observed in enumerate(distributions):
+            if len(observed) == 0:
+                raise ValueError(f"Distribution {index} must have at least one grade")
+            for grade in observed:
+                if not Evaluation.MIN_GRADE <= grade <= Evaluation.MAX_GRADE:
+                    raise ValueError(
+                        f"Distribution {index}: grade must be between "
+                        f"{Evaluation.MIN_GRADE} and {Evaluation.MAX_GRADE}"
+                    )
+
+        generator = random.Random(seed)
+        self._draws = [
+            [float(grade) for grade in generator.choices(observed, k=samples)]
+            for observed in distributions
+        ]
+        self._samples = samples
+        self._seed = seed
+        self._rules = rules if rules is not None else GradingRules()
+        self._passing_grade = float(passing_grade)
+        self._sorted_contributions: Dict[
+            Tuple[float, ...], Tuple[List[float], List[int]]
+        ] = {}
+
+    @property
+    def samples(self) -> int:
+        """Get the number of simulated outcomes per student."""
+        return self._samples
+
+    @property
+    def passing_grade(self) -> float:
+        """Get the final grade needed to pass."""
+        return self._passing_grade
+
+    def estimate(
+        self,
+        evaluations: Sequence[Evaluation],
+        pending_weights: Sequence[float],
+        has_reached_minimum: bool,
+        has_consensus: bool,
+    ) -> PassProbability:
+        """
+        Estimate for one student's graded evaluations.
+
+        Args:
+            evaluations: Evaluations already graded.
+            pending_weights: Weights of the evaluations not yet graded.
+            has_reached_minimum: Whether the student met minimum attendance.
+            has_consensus: Whether teachers agreed on extra points that year.
+
+        Returns:
+            The pass probability estimate.
+
+        Raises:
+            ValueError: If the weights do not add up to a full course.
+        """
+        return self.estimate_batch(
+            [[evaluation.grade for evaluation in evaluations]],
+            [[evaluation.weight for evaluation in evaluations]],
+            [pending_weights],
+            [has_reached_minimum],
+            [has_consensus],
+        )[0]
+
+    def estimate_student(
+        self,
+        student: Student,
+        pending_weights: Sequence[float],
+        extra_points_policy: ExtraPointsPolicy,
+        current_year_index: int,
+    ) -> PassProbability:
+        """
+        Estimate for a student's current evaluations.
+
+        Args:
+            student: Student with the evaluations graded so far.
+            pending_weights: Weights of the evaluations not yet graded.
+            extra_points_policy: Policy for extra points.
+            current_year_index: Index of current academic year.
+
+        Returns:
+            The pass probability estimate.
+
+        Raises:
+            ValueError: If the year is out of range or the weights are invalid.
+        """
+        return self.estimate(
+            student.evaluation_view,
+            pending_weights,
+            student.has_reached_minimum_attendance,
+            extra_points_policy.has_consensus_for_year(current_year_index),
+        )
+
+    def estimate_batch(
+        self,
+        grades: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]],
+        pending_weights: Sequence[Sequence[float]],
+        attendance: Sequence[bool],
+        consensus: Sequence[bool],
+    ) -> List[PassProbability]:
+        """
+        Estimate for a whole cohort given as columns.
+
+        Args:
+            grades: Grades of the graded evaluations per student.
+            weights: Weights of the graded evaluations per student.
+            pending_weights: Weights of the pending evaluations per student.
+            attendance: Whether each student met minimum attendance.
+            consensus: Whether extra points apply to each student's year.
+
+        Returns:
+            One PassProbability per student, in input order.
+
+        Raises:
+            ValueError: If columns differ in length, a row's weights are
+                        invalid or a row has more pending evaluations than
+                        distributions.
+        """
+        row_count = len(grades)
+        if not (
+            len(weights)
+            == len(pending_weights)
+            == len(attendance)
+            == len(consensus)
+            == row_count
+        ):
+            raise ValueError("All roster columns must have the same length")
+
+        rules = self._rules
+        samples = self._samples
+        passing_grade = self._passing_grade
+        estimates = []
+        for row in range(row_count):
+            row_grades = grades[row]
+            row_weights = weights[row]
+            row_pending = pending_weights[row]
+            validate_pending_row(row, row_grades, row_weights, row_pending)
+            if len(row_pending) > len(self._draws):
+                raise ValueError(
+                    f"Row {row}: has {len(row_pending)} pending evaluations but "
+                    f"only {len(self._draws)} distributions"
+                )
+
+            if not attendance[row]:
+                # Without attendance the final grade does not depend on the
+                # evaluations, so every sample has the same outcome.
+                passes = (
+                    rules.apply(Evaluation.MIN_GRADE, False, False).final_grade
+                    >= passing_grade
+                )
+                estimates.append(PassProbability(samples if passes else 0, samples))
+                continue
+
+            estimates.append(
+                PassProbability(
+                    self._count_passing(
+                        row_grades, row_weights, row_pending, consensus[row]
+                    ),
+                    samples,
+                )
+            )
+        return estimates
+
+    def _count_passing(
+        self,
+        grades: Sequence[float],
+        weights: Sequence[float],
+        pending_weights: Sequence[float],
+        has_consensus: bool,
+    ) -> int:
+        """Count the samples in which a student with attendance passes."""
+        rules = self._rules
+        if rules.min_final_grade >= self._passing_grade:
+            return self._samples
+        if rules.max_final_grade < self._passing_grade:
+            return 0
+
+        contributions, order = self._contributions(pending_weights)
+        extra_points = (
+            rules.extra_points_value
+            if has_consensus
+            else ExtraPointsPolicy.NO_EXTRA_POINTS
+        )
+        threshold = (
+            self._passing_grade
+            - extra_points
+            - calculate_weighted_average(grades, weights)
+        )
+        low = bisect_left(contributions, threshold - self.TIE_TOLERANCE)
+        high = bisect_right(contributions, threshold + self.TIE_TOLERANCE)
+        passing = len(contributions) - high
+        for position in range(low, high):
+            if self._passes(
+                grades, weights, pending_weights, order[position], has_consensus
+            ):
+                passing += 1
+        return passing
+
+    def _contributions(
+        self, pending_weights: Sequence[float]
+    ) -> Tuple[List[float], List[int]]:
+        """Get the sorted pending contribution of every sample, and its order."""
+        key = tuple(pending_weights)
+        cached = self._sorted_contributions.get(key)
+        if cached is not None:
+            return cached
+
+        divisor = Evaluation.PERCENTAGE_DIVISOR
+        columns = [
+            [grade * (weight / divisor) for grade in draws]
+            for draws, weight in zip(self._draws, pending_weights)
+        ]
+        if columns:
+            contributions = [sum(products) for products in zip(*columns)]
+        else:
+            contributions = [0.0] * self._samples
+        order = sorted(range(self._samples), key=contributions.__getitem__)
+        cached = ([contributions[index] for index in order], order)
+        self._sorted_contributions[key] = cached
+        return cached
+
+    def _passes(
+        self,
+        grades: Sequence[float],
+        weights: Sequence[float],
+        pending_weights: Sequence[float],
+        sample: int,
+        has_consensus: bool,
+    ) -> bool:
+        """Grade one sample with the exact GradeCalculator arithmetic."""
+        pending_draws = self._draws[: len(pending_weights)]
+        pending_grades = [draws[sample] for draws in pending_draws]
+        weighted_average = calculate_weighted_average(
+            list(grades) + pending_grades, list(weights) + list(pending_weights)
+        )
+        final_grade = self._rules.apply(weighted_average, True, has_consensus)
+        return final_grade.final_grade >= self._passing_grade
+
+    def __repr__(self) -> str:
+        """String representation of the engine."""
+        return (
+            f"PassProbabilityEngine(distributions={len(self._draws)}, "
+            f"samples={self._samples}, seed={self._seed})"
+        )
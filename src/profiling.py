@@ -0,0 +1,262 @@
+"""
+Module for capturing CPU and memory profiles of a run.
+"""
+
+import cProfile
+import os
+import pstats
+import threading
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+FunctionKey = Tuple[str, int, str]
+
+SOURCE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+class ProfileSession:
+    """
+    Context manager wrapping a run in cProfile and tracemalloc.
+
+    On exit it writes into the output directory:
+        profile.pstats: raw cProfile data, loadable with pstats/snakeviz.
+        profile_stats.txt: functions sorted by cumulative time.
+        profile.collapsed: collapsed stacks for flamegraph.pl/speedscope.
+        allocations.txt: top allocation sites inside src/ at the highest
+                         traced memory seen during the run, relative to
+                         its start, plus the traced peak.
+
+    A background thread polls the traced memory and snapshots the source
+    allocations each time it grows by PEAK_GROWTH over the best snapshot
+    so far, so objects built and released while grading, such as the
+    Evaluation objects of a chunk, are reported and not only what is still
+    alive at exit. If tracemalloc is already tracing, it is left running.
+    """
+
+    RAW_STATS_FILE = "profile.pstats"
+    STATS_FILE = "profile_stats.txt"
+    COLLAPSED_FILE = "profile.collapsed"
+    ALLOCATIONS_FILE = "allocations.txt"
+    DEFAULT_TOP_ALLOCATIONS = 10
+    DEFAULT_TOP_FUNCTIONS = 50
+    TRACEMALLOC_FRAMES = 1
+    SAMPLE_INTERVAL = 0.01
+    PEAK_GROWTH = 1.1
+    MICROSECONDS = 1_000_000
+    MAX_STACK_DEPTH = 64
+    ENCODING = "utf-8"
+
+    def __init__(
+        self,
+        output_directory: str,
+        top_allocations: int = DEFAULT_TOP_ALLOCATIONS,
+        source_directory: str = SOURCE_DIRECTORY,
+    ):
+        """
+        Initialize the profile session.
+
+        Args:
+            output_directory: Directory receiving the report files.
+            top_allocations: Number of allocation sites to report.
+            source_directory: Directory whose allocations are reported.
+
+        Raises:
+            ValueError: If output_directory is empty or top_allocations invalid.
+        """
+        if not isinstance(output_directory, str) or not output_directory.strip():
+            raise ValueError("output_directory must be a non-empty string")
+        if not isinstance(top_allocations, int) or top_allocations <= 0:
+            raise ValueError("top_allocations must be a positive integer")
+        self._output_directory = output_directory
+        self._top_allocations = top_allocations
+        self._source_directory = source_directory
+        self._profiler = cProfile.Profile()
+        self._allocation_sites: List[Tuple[str, int, int]] = []
+        self._peak_bytes = 0
+        self._start_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._start_bytes = 0
+        self._peak_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._peak_snapshot_bytes = 0
+        self._snapshot_overhead = 0
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_sampling = threading.Event()
+        self._was_tracing = False
+
+    @property
+    def allocation_sites(self) -> List[Tuple[str, int, int]]:
+        """Get the top (location, bytes, blocks) at the sampled peak."""
+        return list(self._allocation_sites)
+
+    def __enter__(self) -> "ProfileSession":
+        """Start profiling."""
+        self._was_tracing = tracemalloc.is_tracing()
+        if not self._was_tracing:
+            tracemalloc.start(self.TRACEMALLOC_FRAMES)
+        elif hasattr(tracemalloc, "reset_peak"):
+            # Python 3.9+; on 3.8 the peak includes the time before the run.
+            tracemalloc.reset_peak()
+        self._start_snapshot = self._source_snapshot()
+        self._start_bytes = tracemalloc.get_traced_memory()[0]
+        self._peak_snapshot = None
+        self._peak_snapshot_bytes = self._start_bytes
+        self._snapshot_overhead = 0
+        self._stop_sampling.clear()
+        self._sampler = threading.Thread(target=self._sample_peak, daemon=True)
+        self._sampler.start()
+        self._profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop profiling and write the reports, even if the run failed."""
+        self._profiler.disable()
+        self._stop_sampling.set()
+        self._sampler.join()
+        # The end of the run is a candidate too, for runs shorter than
+        # one sample or whose memory only grows.
+        self._snapshot_if_higher()
+        self._peak_bytes = tracemalloc.get_traced_memory()[1]
+        if not self._was_tracing:
+            tracemalloc.stop()
+
+        os.makedirs(self._output_directory, exist_ok=True)
+        self._profiler.dump_stats(self._path(self.RAW_STATS_FILE))
+        self._write_sorted_stats()
+        self._write_collapsed_stacks()
+        self._write_allocations(self._peak_snapshot)
+
+    def summary(self) -> str:
+        """
+        Get a short human-readable summary of the reports.
+
+        Returns:
+            Multi-line summary with report paths and allocation sites.
+        """
+        lines = [f"Profile written to {self._output_directory}"]
+        lines.append(f"Peak traced memory: {self._peak_bytes / 1024:.1f} KiB")
+        lines.append(f"Top allocation sites in {self._source_directory}:")
+        for location, size, count in self._allocation_sites:
+            lines.append(f"  {location}: {size / 1024:.1f} KiB in {count} blocks")
+        if not self._allocation_sites:
+            lines.append("  (no allocations traced)")
+        return "\n".join(lines)
+
+    def _sample_peak(self) -> None:
+        """Snapshot the source allocations whenever traced memory grows."""
+        while not self._stop_sampling.wait(self.SAMPLE_INTERVAL):
+            growth = self._peak_snapshot_bytes - self._start_bytes
+            if self._run_bytes() - self._start_bytes > growth * self.PEAK_GROWTH:
+                self._snapshot_if_higher()
+
+    def _run_bytes(self) -> int:
+        """Get the traced memory of the run, without the kept peak snapshot."""
+        return tracemalloc.get_traced_memory()[0] - self._snapshot_overhead
+
+    def _snapshot_if_higher(self) -> None:
+        """Replace the peak snapshot if the run now traces at least as much."""
+        current = self._run_bytes()
+        if self._peak_snapshot is not None and current < self._peak_snapshot_bytes:
+            return
+        # The snapshot is itself traced; its size is left out of comparisons.
+        self._peak_snapshot = None
+        self._snapshot_overhead = 0
+        before = tracemalloc.get_traced_memory()[0]
+        self._peak_snapshot = self._source_snapshot()
+        self._snapshot_overhead = tracemalloc.get_traced_memory()[0] - before
+        self._peak_snapshot_bytes = current
+
+    def _source_snapshot(self) -> tracemalloc.Snapshot:
+        """Take a snapshot of the allocations made from the source directory."""
+        source_filter = tracemalloc.Filter(
+            True, os.path.join(self._source_directory, "*")
+        )
+        return tracemalloc.take_snapshot().filter_traces([source_filter])
+
+    def _path(self, file_name: str) -> str:
+        """Get the path of a report file."""
+        return os.path.join(self._output_directory, file_name)
+
+    def _write_sorted_stats(self) -> None:
+        """Write the functions sorted by cumulative time."""
+        with open(self._path(self.STATS_FILE), "w", encoding=self.ENCODING) as report:
+            stats = pstats.Stats(self._profiler, stream=report)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE)
+            stats.print_stats(self.DEFAULT_TOP_FUNCTIONS)
+
+    def _write_collapsed_stacks(self) -> None:
+        """
+        Write collapsed stacks in the "a;b;c microseconds" flamegraph format.
+
+        cProfile records caller/callee edges, not full stacks, so each edge's
+        own time is attached to the caller's dominant call path (the caller
+        chain with the highest cumulative time). Exact for tree-shaped call
+        graphs, an approximation for functions reached from several places.
+        """
+        raw_stats: Dict = pstats.Stats(self._profiler).stats
+        with open(
+            self._path(self.COLLAPSED_FILE), "w", encoding=self.ENCODING
+        ) as report:
+            for function, (_, _, own_time, _, callers) in raw_stats.items():
+                if not callers:
+                    self._write_stack(report, [function], own_time)
+                    continue
+                for caller, edge in callers.items():
+                    path = self._dominant_path(raw_stats, caller)
+                    self._write_stack(report, path + [function], edge[2])
+
+    def _dominant_path(
+        self, raw_stats: Dict, function: FunctionKey
+    ) -> List[FunctionKey]:
+        """Follow the highest-cumulative-time callers up to a root."""
+        path = [function]
+        visited = {function}
+        while len(path) < self.MAX_STACK_DEPTH:
+            callers = raw_stats.get(path[0], (0, 0, 0, 0, {}))[4]
+            candidates = [caller for caller in callers if caller not in visited]
+            if not candidates:
+                break
+            caller = max(candidates, key=lambda key: callers[key][3])
+            visited.add(caller)
+            path.insert(0, caller)
+        return path
+
+    def _write_stack(self, report, path: List[FunctionKey], seconds: float) -> None:
+        """Write one collapsed stack line, skipping empty samples."""
+        microseconds = int(seconds * self.MICROSECONDS)
+        if microseconds <= 0:
+            return
+        frames = ";".join(self._label(function) for function in path)
+        report.write(f"{frames} {microseconds}\n")
+
+    @staticmethod
+    def _label(function: FunctionKey) -> str:
+        """Format a cProfile function key as a flamegraph frame."""
+        file_name, line, name = function
+        label = f"{os.path.basename(file_name)}:{name}:{line}" if line else name
+        return label.replace(";", ",").replace(" ", "_")
+
+    def _write_allocations(self, snapshot: tracemalloc.Snapshot) -> None:
+        """Write the top allocation sites of a snapshot, net of the start."""
+        statistics = snapshot.compare_to(self._start_snapshot, "lineno")
+        statistics = [
+            statistic for statistic in statistics if statistic.size_diff > 0
+        ][: self._top_allocations]
+        self._allocation_sites = [
+            (str(statistic.traceback[0]), statistic.size_diff, statistic.count_diff)
+            for statistic in statistics
+        ]
+        with open(
+            self._path(self.ALLOCATIONS_FILE), "w", encoding=self.ENCODING
+        ) as report:
+            report.write(f"Peak traced memory: {self._peak_bytes} bytes\n")
+            report.write(
+                "Allocation sites at "
+                f"{self._peak_snapshot_bytes - self._start_bytes} bytes "
+                "over the start of the run:\n"
+            )
+            for statistic in statistics:
+                report.write(f"{statistic}\n")
+
+    def __repr__(self) -> str:
+        """String representation of the profile session."""
+        return f"ProfileSession(output={self._output_directory})"
+
@@ -0,0 +1,305 @@
+"""
+Module for storing evaluations of many students without padding.
+
+Every student's grades and weights are stored back to back in two flat
+float64 arrays, and an offsets array marks where each student starts
+(CSR layout). A roster where most students have 3 or 4 evaluations takes
+a third of the memory of a dense row_count x MAX_EVALUATIONS matrix, and
+the kernels only touch evaluations that exist.
+"""
+
+import math
+from array import array
+from itertools import islice
+from operator import mul
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from src.batch_grader import GradingRules, validate_attendance, validate_row
+from src.evaluation import Evaluation
+from src.grade_calculator import GradeCalculationResult, GradeCalculator
+from src.roster_columns import RosterColumns
+from src.student import Student
+
+
+class RaggedEvaluations:
+    """
+    Evaluations of a roster as flat values plus per-student offsets.
+
+    The evaluations of row i are grades[offsets[i]:offsets[i + 1]] and
+    weights[offsets[i]:offsets[i + 1]]. Weighted averages are summed in the
+    same order and with the same arithmetic as GradeCalculator, so results
+    are identical to the single-student path.
+    """
+
+    FLOAT_FORMAT = "d"
+    OFFSET_FORMAT = "q"
+
+    def __init__(self, grades: array, weights: array, offsets: array):
+        """
+        Initialize the ragged evaluations. Use from_columns() instead.
+
+        Args:
+            grades: Grades of every evaluation, row after row.
+            weights: Weights of every evaluation, row after row.
+            offsets: Start of every row plus the end of the last one.
+
+        Raises:
+            ValueError: If the arrays do not describe a valid layout.
+        """
+        if len(grades) != len(weights):
+            raise ValueError("grades and weights must have the same length")
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(grades):
+            raise ValueError("offsets must start at 0 and end at the value count")
+        if any(end < start for start, end in zip(offsets, islice(offsets, 1, None))):
+            raise ValueError("offsets must be non-decreasing")
+        self._grades = grades
+        self._weights = weights
+        self._offsets = offsets
+
+    @classmethod
+    def from_columns(
+        cls, grades: Sequence[Sequence[float]], weights: Sequence[Sequence[float]]
+    ) -> "RaggedEvaluations":
+        """
+        Pack grade and weight vectors per student.
+
+        Args:
+            grades: Grade vector per student.
+            weights: Weight vector per student.
+
+        Returns:
+            The packed evaluations.
+
+        Raises:
+            ValueError: If the columns differ in length, or a row has
+                        grades and weights of different lengths or
+                        non-numeric values.
+        """
+        if len(grades) != len(weights):
+            raise ValueError("All roster columns must have the same length")
+        grade_values = array(cls.FLOAT_FORMAT)
+        weight_values = array(cls.FLOAT_FORMAT)
+        offsets = array(cls.OFFSET_FORMAT, [0])
+        for row, (row_grades, row_weights) in enumerate(zip(grades, weights)):
+            if len(row_grades) != len(row_weights):
+                raise ValueError(
+                    f"Row {row}: grades and weights must have the same length"
+                )
+            try:
+                grade_values.extend(row_grades)
+                weight_values.extend(row_weights)
+            except TypeError as error:
+                raise ValueError(
+                    f"Row {row}: grades and weights must be numbers"
+                ) from error
+            offsets.append(len(grade_values))
+        return cls(grade_values, weight_values, offsets)
+
+    @classmethod
+    def from_roster(cls, roster: RosterColumns) -> "RaggedEvaluations":
+        """
+        Pack the evaluations of roster columns.
+
+        Args:
+            roster: The roster columns.
+
+        Returns:
+            The packed evaluations, one row per student of the roster.
+        """
+        return cls.from_columns(roster.grades, roster.weights)
+
+    @classmethod
+    def from_students(cls, students: Sequence[Student]) -> "RaggedEvaluations":
+        """
+        Pack the evaluations of Student objects.
+
+        Args:
+            students: The students, in row order.
+
+        Returns:
+            The packed evaluations.
+        """
+        grades = array(cls.FLOAT_FORMAT)
+        weights = array(cls.FLOAT_FORMAT)
+        offsets = array(cls.OFFSET_FORMAT, [0])
+        for student in students:
+            for evaluation in student.evaluation_view:
+                grades.append(evaluation.grade)
+                weights.append(evaluation.weight)
+            offsets.append(len(grades))
+        return cls(grades, weights, offsets)
+
+    @property
+    def grades(self) -> array:
+        """Get the flat grade values."""
+        return self._grades
+
+    @property
+    def weights(self) -> array:
+        """Get the flat weight values."""
+        return self._weights
+
+    @property
+    def offsets(self) -> array:
+        """Get the start of every row plus the end of the last one."""
+        return self._offsets
+
+    @property
+    def nbytes(self) -> int:
+        """Get the memory used by the three arrays, in bytes."""
+        return sum(
+            len(values) * values.itemsize
+            for values in (self._grades, self._weights, self._offsets)
+        )
+
+    def counts(self) -> List[int]:
+        """
+        Get the number of evaluations of every row.
+
+        Returns:
+            One count per row.
+        """
+        offsets = self._offsets
+        return [end - start for start, end in zip(offsets, islice(offsets, 1, None))]
+
+    def row(self, index: int) -> Tuple[List[float], List[float]]:
+        """
+        Get the evaluations of one row.
+
+        Args:
+            index: Index of the row.
+
+        Returns:
+            The grades and the weights of the row.
+
+        Raises:
+            ValueError: If the index is out of range.
+        """
+        if not 0 <= index < len(self):
+            raise ValueError(f"Row index must be between 0 and {len(self) - 1}")
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._grades[start:end].tolist(), self._weights[start:end].tolist()
+
+    def _segment_sums(self, values: Iterable[float]) -> List[float]:
+        """Sum the values of every row, left to right like builtin sum()."""
+        iterator = iter(values)
+        return [sum(islice(iterator, count)) for count in self.counts()]
+
+    def weighted_averages(self) -> List[float]:
+        """
+        Get the weighted average of every row.
+
+        Returns:
+            One weighted average per row, identical to GradeCalculator's.
+        """
+        divisor = Evaluation.PERCENTAGE_DIVISOR
+        fractions = [weight / divisor for weight in self._weights]
+        return self._segment_sums(map(mul, self._grades, fractions))
+
+    def weight_totals(self) -> List[float]:
+        """
+        Get the total weight of every row.
+
+        Returns:
+            One total per row, summed like validate_row does.
+        """
+        return self._segment_sums(self._weights)
+
+    def invalid_weight_rows(self) -> List[int]:
+        """
+        Get the rows whose weights do not sum to EXPECTED_TOTAL_WEIGHT.
+
+        Returns:
+            Indexes of the offending rows, in order.
+        """
+        expected = GradeCalculator.EXPECTED_TOTAL_WEIGHT
+        tolerance = GradeCalculator.WEIGHT_TOLERANCE
+        return [
+            row
+            for row, total in enumerate(self.weight_totals())
+            if abs(total - expected) > tolerance
+        ]
+
+    def validate(self) -> None:
+        """
+        Check every row with the rules of Evaluation and GradeCalculator.
+
+        Counts, value ranges and weight totals are first checked over whole
+        columns; rows are only checked one by one when something is wrong,
+        to report the first invalid row with validate_row's message.
+
+        Raises:
+            ValueError: If any row would be rejected by the single-student path.
+        """
+        if self._is_valid():
+            return
+        for row in range(len(self)):
+            # Attendance is not stored here; grade() checks it separately.
+            validate_row(row, *self.row(row), True)
+
+    def _is_valid(self) -> bool:
+        """Check the whole layout at once, without locating the bad rows."""
+        counts = self.counts()
+        if counts and (
+            min(counts) == 0 or max(counts) > GradeCalculator.MAX_EVALUATIONS
+        ):
+            return False
+        grades, weights = self._grades, self._weights
+        if grades and not (
+            Evaluation.MIN_GRADE <= min(grades)
+            and max(grades) <= Evaluation.MAX_GRADE
+            and Evaluation.MIN_WEIGHT <= min(weights)
+            and max(weights) <= Evaluation.MAX_WEIGHT
+        ):
+            return False
+        # min() and max() skip over NaN, but a NaN makes the column sum NaN.
+        if any(math.isnan(sum(values)) for values in (grades, weights)):
+            return False
+        return not self.invalid_weight_rows()
+
+    def grade(
+        self,
+        attendance: Sequence[bool],
+        consensus: Sequence[bool],
+        rules: Optional[GradingRules] = None,
+        validate: bool = True,
+    ) -> List[GradeCalculationResult]:
+        """
+        Grade every row.
+
+        Args:
+            attendance: Whether each student met minimum attendance.
+            consensus: Whether extra points apply to each student's year.
+            rules: Grading rules to apply. Defaults to the current rules.
+            validate: Whether to check the rows first. Pass False only for
+                      rows already accepted by validate().
+
+        Returns:
+            One GradeCalculationResult per row, in order.
+
+        Raises:
+            ValueError: If the columns differ in length or any row is invalid.
+        """
+        if not len(attendance) == len(consensus) == len(self):
+            raise ValueError("All roster columns must have the same length")
+        if validate:
+            self.validate()
+            for row, has_reached_minimum in enumerate(attendance):
+                validate_attendance(row, has_reached_minimum)
+        apply = (rules if rules is not None else GradingRules()).apply
+        return [
+            apply(weighted_average, has_reached_minimum, has_consensus)
+            for weighted_average, has_reached_minimum, has_consensus in zip(
+                self.weighted_averages(), attendance, consensus
+            )
+        ]
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+        return len(self._offsets) - 1
+
+    def __repr__(self) -> str:
+        """String representation of the ragged evaluations."""
+        return (
+            f"RaggedEvaluations(rows={len(self)}, evaluations={len(self._grades)})"
+        )
@@ -0,0 +1,341 @@
+"""
+Module for ranking final grades within course sections.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.grade_calculator import GradeCalculationResult, GradeCalculator
+
+
+class SectionRanking:
+    """
+    Sorted index of the final grades of one section.
+
+    Grades are kept in a sorted array, so rank, passing counts and grade
+    band queries are answered with binary search instead of re-sorting.
+    An update finds its position by binary search but inserting into the
+    array shifts the entries after it, so it costs O(n) per update; that
+    shift is a single memmove, cheap for section-sized rankings.
+    """
+
+    PERCENTAGE_DIVISOR = 100.0
+    FIRST_RANK = 1
+
+    def __init__(self):
+        """Initialize an empty section ranking."""
+        self._entries: List[Tuple[float, str]] = []
+        self._grades: List[float] = []
+        self._grade_by_student: Dict[str, float] = {}
+
+    def update(self, student_id: str, final_grade: float) -> None:
+        """
+        Insert a student's grade or replace it after a recalculation.
+
+        Args:
+            student_id: Identifier of the student.
+            final_grade: The student's final grade.
+
+        Raises:
+            ValueError: If student_id is empty or the grade is out of range.
+        """
+        self.validate_entry(student_id, final_grade)
+        if student_id in self._grade_by_student:
+            self.remove(student_id)
+
+        entry = (float(final_grade), student_id)
+        position = bisect_left(self._entries, entry)
+        self._entries.insert(position, entry)
+        self._grades.insert(position, entry[0])
+        self._grade_by_student[student_id] = entry[0]
+
+    @staticmethod
+    def validate_entry(student_id: str, final_grade: float) -> None:
+        """
+        Check a student's grade before it is ranked.
+
+        Args:
+            student_id: Identifier of the student.
+            final_grade: The student's final grade.
+
+        Raises:
+            ValueError: If student_id is empty or the grade is out of range.
+        """
+        if not isinstance(student_id, str) or not student_id:
+            raise ValueError("Student ID must be a non-empty string")
+        if not isinstance(final_grade, (int, float)):
+            raise ValueError("Final grade must be a number")
+        if not (
+            GradeCalculator.MIN_FINAL_GRADE
+            <= final_grade
+            <= GradeCalculator.MAX_FINAL_GRADE
+        ):
+            raise ValueError(
+                f"Final grade must be between {GradeCalculator.MIN_FINAL_GRADE} "
+                f"and {GradeCalculator.MAX_FINAL_GRADE}"
+            )
+
+    def remove(self, student_id: str) -> None:
+        """
+        Remove a student from the ranking.
+
+        Args:
+            student_id: Identifier of the student.
+
+        Raises:
+            ValueError: If the student is not ranked.
+        """
+        final_grade = self.get_grade(student_id)
+        position = bisect_left(self._entries, (final_grade, student_id))
+        del self._entries[position]
+        del self._grades[position]
+        del self._grade_by_student[student_id]
+
+    def get_grade(self, student_id: str) -> float:
+        """
+        Get the ranked final grade of a student.
+
+        Args:
+            student_id: Identifier of the student.
+
+        Returns:
+            The student's final grade.
+
+        Raises:
+            ValueError: If the student is not ranked.
+        """
+        if student_id not in self._grade_by_student:
+            raise ValueError(f"Student {student_id} is not ranked")
+        return self._grade_by_student[student_id]
+
+    def rank(self, student_id: str) -> int:
+        """
+        Get a student's rank, where 1 is the highest grade.
+
+        Students with the same grade share the same rank.
+
+        Args:
+            student_id: Identifier of the student.
+
+        Returns:
+            The 1-based rank of the student.
+
+        Raises:
+            ValueError: If the student is not ranked.
+        """
+        final_grade = self.get_grade(student_id)
+        higher = len(self._grades) - bisect_right(self._grades, final_grade)
+        return higher + self.FIRST_RANK
+
+    def top(self, count: int) -> List[Tuple[str, float]]:
+        """
+        Get the students with the highest grades.
+
+        Args:
+            count: Maximum number of students to return.
+
+        Returns:
+            (student_id, final_grade) pairs, highest grade first.
+
+        Raises:
+            ValueError: If count is negative.
+        """
+        if not isinstance(count, int) or count < 0:
+            raise ValueError("count must be a non-negative integer")
+        start = max(0, len(self._entries) - count)
+        return self._descending(self._entries[start:])
+
+    def top_percent(self, percent: float) -> List[Tuple[str, float]]:
+        """
+        Get the top percentage of the section.
+
+        Args:
+            percent: Percentage of the section to return (0-100).
+
+        Returns:
+            (student_id, final_grade) pairs, highest grade first.
+
+        Raises:
+            ValueError: If percent is out of range.
+        """
+        if not isinstance(percent, (int, float)) or not 0 <= percent <= 100:
+            raise ValueError("percent must be between 0 and 100")
+        count = math.ceil(len(self._entries) * percent / self.PERCENTAGE_DIVISOR)
+        return self.top(count)
+
+    def in_band(self, low: float, high: float) -> List[Tuple[str, float]]:
+        """
+        Get the students whose grade lies in [low, high].
+
+        Args:
+            low: Lowest grade of the band, inclusive.
+            high: Highest grade of the band, inclusive.
+
+        Returns:
+            (student_id, final_grade) pairs, highest grade first.
+
+        Raises:
+            ValueError: If low is greater than high.
+        """
+        if low > high:
+            raise ValueError("low cannot be greater than high")
+        start = bisect_left(self._grades, low)
+        end = bisect_right(self._grades, high)
+        return self._descending(self._entries[start:end])
+
+    def near_passing(
+        self, margin: float, passing_grade: float = GradeCalculator.PASSING_GRADE
+    ) -> List[Tuple[str, float]]:
+        """
+        Get the students within a margin of the passing grade.
+
+        Args:
+            margin: Maximum distance to the passing grade.
+            passing_grade: Grade needed to pass.
+
+        Returns:
+            (student_id, final_grade) pairs, highest grade first.
+
+        Raises:
+            ValueError: If margin is negative.
+        """
+        if margin < 0:
+            raise ValueError("margin cannot be negative")
+        return self.in_band(passing_grade - margin, passing_grade + margin)
+
+    def count_passing(
+        self, passing_grade: float = GradeCalculator.PASSING_GRADE
+    ) -> int:
+        """
+        Count the students at or above the passing grade.
+
+        Args:
+            passing_grade: Grade needed to pass.
+
+        Returns:
+            Number of passing students.
+        """
+        return len(self._grades) - bisect_left(self._grades, passing_grade)
+
+    @staticmethod
+    def _descending(entries: List[Tuple[float, str]]) -> List[Tuple[str, float]]:
+        """Convert sorted entries to (student_id, grade) pairs, highest first."""
+        return [(student_id, grade) for grade, student_id in reversed(entries)]
+
+    def __len__(self) -> int:
+        """Get the number of ranked students."""
+        return len(self._entries)
+
+    def __contains__(self, student_id: object) -> bool:
+        """Check if a student is ranked."""
+        return student_id in self._grade_by_student
+
+    def __repr__(self) -> str:
+        """String representation of the section ranking."""
+        return f"SectionRanking(students={len(self._entries)})"
+
+
+class RankingIndex:
+    """
+    Maintained rankings of final grades, one per course section.
+
+    Each student belongs to one section at a time; updating a student in a
+    different section moves them.
+    """
+
+    def __init__(self):
+        """Initialize an empty ranking index."""
+        self._sections: Dict[str, SectionRanking] = {}
+        self._section_by_student: Dict[str, str] = {}
+
+    def update(self, section: str, student_id: str, final_grade: float) -> None:
+        """
+        Insert or replace a student's grade in a section.
+
+        Args:
+            section: Name of the course section.
+            student_id: Identifier of the student.
+            final_grade: The student's final grade.
+
+        Raises:
+            ValueError: If section is empty or the grade is invalid.
+        """
+        if not isinstance(section, str) or not section:
+            raise ValueError("Section must be a non-empty string")
+        # Validate before touching either section, so a rejected update
+        # leaves the student ranked where they were.
+        SectionRanking.validate_entry(student_id, final_grade)
+
+        previous_section = self._section_by_student.get(student_id)
+        if previous_section is not None and previous_section != section:
+            self._sections[previous_section].remove(student_id)
+
+        ranking = self._sections.setdefault(section, SectionRanking())
+        ranking.update(student_id, final_grade)
+        self._section_by_student[student_id] = section
+
+    def update_results(
+        self,
+        section: str,
+        student_ids: Iterable[str],
+        results: Iterable[GradeCalculationResult],
+    ) -> None:
+        """
+        Index the results of a batch calculation.
+
+        Args:
+            section: Name of the course section.
+            student_ids: Identifier of each graded student.
+            results: The matching grade calculation results.
+        """
+        for student_id, result in zip(student_ids, results):
+            self.update(section, student_id, result.final_grade)
+
+    def remove(self, student_id: str) -> None:
+        """
+        Remove a student from the index.
+
+        Args:
+            student_id: Identifier of the student.
+
+        Raises:
+            ValueError: If the student is not indexed.
+        """
+        section = self._section_by_student.pop(student_id, None)
+        if section is None:
+            raise ValueError(f"Student {student_id} is not ranked")
+        self._sections[section].remove(student_id)
+
+    def section(self, section: str) -> SectionRanking:
+        """
+        Get the ranking of a section.
+
+        Args:
+            section: Name of the course section.
+
+        Returns:
+            The section ranking.
+
+        Raises:
+            ValueError: If the section has no ranked students.
+        """
+        if section not in self._sections:
+            raise ValueError(f"Section {section} has no ranked students")
+        return self._sections[section]
+
+    def section_of(self, student_id: str) -> Optional[str]:
+        """Get the section a student is ranked in, if any."""
+        return self._section_by_student.get(student_id)
+
+    @property
+    def sections(self) -> List[str]:
+        """Get the names of the indexed sections."""
+        return list(self._sections)
+
+    def __repr__(self) -> str:
+        """String representation of the ranking index."""
+        return (
+            f"RankingIndex(sections={len(self._sections)}, "
+            f"students={len(self._section_by_student)})"
+        )
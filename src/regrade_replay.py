@@ -0,0 +1,131 @@
+"""
+Module for regrading historical audit logs under a new rule set.
+"""
+
+from typing import Iterator, List, Optional
+
+from src.audit_log import AuditLog, AuditRecord
+from src.batch_grader import BatchGradeCalculator
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculationResult
+
+
+class RegradeChange:
+    """
+    A student whose final grade changed after a replay.
+
+    Attributes:
+        record: The original audit record.
+        new_result: The result under the new rule set.
+    """
+
+    def __init__(self, record: AuditRecord, new_result: GradeCalculationResult):
+        """Initialize the regrade change."""
+        self.record = record
+        self.new_result = new_result
+
+    @property
+    def student_id(self) -> str:
+        """Get the identifier of the regraded student."""
+        return self.record.student_id
+
+    @property
+    def previous_final_grade(self) -> float:
+        """Get the final grade recorded in the log."""
+        return self.record.final_grade
+
+    @property
+    def new_final_grade(self) -> float:
+        """Get the final grade under the new rule set."""
+        return self.new_result.final_grade
+
+    @property
+    def difference(self) -> float:
+        """Get the change of the final grade."""
+        return self.new_final_grade - self.previous_final_grade
+
+    def __repr__(self) -> str:
+        """String representation of the regrade change."""
+        return (
+            f"RegradeChange(student={self.student_id}, "
+            f"previous={self.previous_final_grade:.2f}, "
+            f"new={self.new_final_grade:.2f})"
+        )
+
+
+class ReplayEngine:
+    """
+    Streams an audit log and regrades every entry with a batch calculator.
+
+    The log is read in chunks, so memory use depends on the chunk size and
+    not on the length of the log. Only students whose final grade changed
+    are reported.
+    """
+
+    DEFAULT_CHUNK_SIZE = 50000
+    GRADE_CHANGE_TOLERANCE = 1e-9
+
+    def __init__(
+        self,
+        batch_calculator: BatchGradeCalculator,
+        extra_points_policy: Optional[ExtraPointsPolicy] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Initialize the replay engine.
+
+        Args:
+            batch_calculator: Calculator configured with the new rule set.
+            extra_points_policy: Optional consensus history replacing the
+                                 recorded one, e.g. after fixing a policy bug.
+            chunk_size: Number of records read and graded at a time.
+
+        Raises:
+            ValueError: If chunk_size is not a positive integer.
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        self._batch_calculator = batch_calculator
+        self._extra_points_policy = extra_points_policy
+        self._chunk_size = chunk_size
+
+    def replay(self, audit_log: AuditLog) -> Iterator[RegradeChange]:
+        """
+        Regrade every record of the log.
+
+        Args:
+            audit_log: The log to replay.
+
+        Yields:
+            A RegradeChange for every student whose final grade changed,
+            in log order.
+        """
+        for chunk in audit_log.iter_chunks(self._chunk_size):
+            results = self._batch_calculator.calculate_batch(
+                [record.grades for record in chunk],
+                [record.weights for record in chunk],
+                [record.has_reached_minimum_attendance for record in chunk],
+                self._resolve_consensus(chunk),
+            )
+            for record, result in zip(chunk, results):
+                if (
+                    abs(result.final_grade - record.final_grade)
+                    > self.GRADE_CHANGE_TOLERANCE
+                ):
+                    yield RegradeChange(record, result)
+
+    def _resolve_consensus(self, chunk: List[AuditRecord]) -> List[bool]:
+        """Get the extra points consensus flag of each record."""
+        if self._extra_points_policy is None:
+            return [record.has_extra_points_consensus for record in chunk]
+        return [
+            self._extra_points_policy.has_consensus_for_year(record.current_year_index)
+            for record in chunk
+        ]
+
+    def __repr__(self) -> str:
+        """String representation of the replay engine."""
+        return (
+            f"ReplayEngine(chunk_size={self._chunk_size}, "
+            f"calculator={self._batch_calculator})"
+        )
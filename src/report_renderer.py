@@ -0,0 +1,435 @@
+"""
+Module for rendering per-student grade slips as text or HTML.
+
+Templates use string.Template placeholders ($name or ${name}) and are
+compiled once into a format string, so rendering a slip is a single
+str.format_map() call.
+"""
+
+import concurrent.futures
+import html
+import string
+from collections import deque
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.grade_calculator import GradeCalculationResult
+from src.rounding_policy import RoundingPolicy
+
+TEXT_FORMAT = "text"
+HTML_FORMAT = "html"
+ENCODING = "utf-8"
+
+Slip = Tuple[str, GradeCalculationResult]
+# A slip as sent to a rendering process: the student ID and the fields of
+# the result, which pickle much faster than the result object.
+SlipRow = Tuple[str, float, bool, float, float]
+
+TEXT_SLIP = """
+============================================================
+RESULTADO DEL CALCULO
+============================================================
+Estudiante: $student_id
+
+Detalle del Calculo:
+  1. Promedio Ponderado: $weighted_average
+  2. Penalizacion por Asistencia: $attendance_penalty
+  3. Puntos Extra Aplicados: +$extra_points_applied
+
+NOTA FINAL: $final_grade
+============================================================
+
+"""
+
+HTML_SLIP = """<section class="slip">
+<h2>Resultado del calculo</h2>
+<p>Estudiante: <strong>$student_id</strong></p>
+<ol>
+<li>Promedio Ponderado: $weighted_average</li>
+<li>Penalizacion por Asistencia: $attendance_penalty</li>
+<li>Puntos Extra Aplicados: +$extra_points_applied</li>
+</ol>
+<p class="final">Nota final: <strong>$final_grade</strong></p>
+</section>
+"""
+
+HTML_HEADER = """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<title>Boletas de notas</title>
+<style>.slip { page-break-after: always; }</style>
+</head>
+<body>
+"""
+
+HTML_FOOTER = """</body>
+</html>
+"""
+
+
+class ReportTemplate:
+    """
+    A grade slip template compiled once and rendered many times.
+
+    Placeholders are checked against FIELDS when the template is built, so
+    a typo fails immediately instead of on the first student.
+    """
+
+    FIELDS = (
+        "student_id",
+        "weighted_average",
+        "attendance_penalty",
+        "extra_points_applied",
+        "final_grade",
+    )
+    PENALTY_APPLIED = "SI (Nota = 0)"
+    PENALTY_NOT_APPLIED = "NO"
+    DEFAULT_NUMBER_FORMAT = "{:.2f}"
+
+    def __init__(
+        self,
+        source: str,
+        escape_html: bool = False,
+        rounding_policy: Optional[RoundingPolicy] = None,
+    ):
+        """
+        Compile a template.
+
+        Args:
+            source: Template text with string.Template placeholders.
+            escape_html: Whether to HTML-escape the substituted values.
+            rounding_policy: Rounding and decimals of the numbers. Defaults
+                             to the 2 decimals of get_details().
+
+        Raises:
+            ValueError: If the source is not a string, or has an invalid or
+                        unknown placeholder.
+        """
+        if not isinstance(source, str):
+            raise ValueError("Template source must be a string")
+        self._source = source
+        self._escape_html = escape_html
+        self._rounding_policy = rounding_policy
+        self._format_string, self._fields = self._compile(source)
+
+    @classmethod
+    def _compile(cls, source: str) -> Tuple[str, Tuple[str, ...]]:
+        """Translate string.Template syntax into a format string."""
+        parts: List[str] = []
+        fields: List[str] = []
+        position = 0
+        for match in string.Template.pattern.finditer(source):
+            parts.append(cls._literal(source[position : match.start()]))
+            position = match.end()
+            if match.group("escaped") is not None:
+                parts.append("$")
+                continue
+            name = match.group("named") or match.group("braced")
+            if name is None:
+                raise ValueError(
+                    f"Invalid placeholder in template at position {match.start()}"
+                )
+            if name not in cls.FIELDS:
+                raise ValueError(
+                    f"Unknown template field: {name}. "
+                    f"Expected one of {list(cls.FIELDS)}"
+                )
+            parts.append("{" + name + "}")
+            if name not in fields:
+                fields.append(name)
+        parts.append(cls._literal(source[position:]))
+        return "".join(parts), tuple(fields)
+
+    @staticmethod
+    def _literal(text: str) -> str:
+        """Escape format braces in literal template text."""
+        return text.replace("{", "{{").replace("}", "}}")
+
+    @property
+    def source(self) -> str:
+        """Get the template text."""
+        return self._source
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Get the fields used by the template, in order of appearance."""
+        return self._fields
+
+    def values(
+        self, student_id: str, result: GradeCalculationResult
+    ) -> Dict[str, str]:
+        """
+        Format the slip fields of one student.
+
+        Args:
+            student_id: Identifier of the student.
+            result: The student's grade calculation result.
+
+        Returns:
+            Formatted value of every field.
+        """
+        policy = self._rounding_policy
+        if policy is None:
+            details = result.get_details()
+            number_format = self.DEFAULT_NUMBER_FORMAT.format
+        else:
+            details = policy.details(result)
+            number_format = policy.format
+        values = {
+            "student_id": student_id,
+            "weighted_average": number_format(details["weighted_average"]),
+            "attendance_penalty": (
+                self.PENALTY_APPLIED
+                if details["attendance_penalty_applied"]
+                else self.PENALTY_NOT_APPLIED
+            ),
+            "extra_points_applied": number_format(details["extra_points_applied"]),
+            "final_grade": number_format(details["final_grade"]),
+        }
+        if self._escape_html:
+            return {name: html.escape(value) for name, value in values.items()}
+        return values
+
+    def render(self, student_id: str, result: GradeCalculationResult) -> str:
+        """
+        Render the slip of one student.
+
+        Args:
+            student_id: Identifier of the student.
+            result: The student's grade calculation result.
+
+        Returns:
+            The rendered slip.
+        """
+        return self._format_string.format_map(self.values(student_id, result))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two templates by source, escaping and rounding."""
+        if not isinstance(other, ReportTemplate):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        """Hash the template by source, escaping and rounding."""
+        return hash(self._key())
+
+    def _key(self) -> tuple:
+        """Get the values identifying the template."""
+        return (self._source, self._escape_html, self._rounding_policy)
+
+    def __repr__(self) -> str:
+        """String representation of the template."""
+        return f"ReportTemplate(fields={list(self._fields)}, html={self._escape_html})"
+
+
+def _render_batch(template: ReportTemplate, slips: Sequence[Slip]) -> str:
+    """Render a batch of slips into one string."""
+    render = template.render
+    return "".join([render(student_id, result) for student_id, result in slips])
+
+
+_worker_template: Optional[ReportTemplate] = None
+
+
+def _init_worker(template: ReportTemplate) -> None:
+    """Keep the template in a rendering process, so it is sent only once."""
+    global _worker_template
+    _worker_template = template
+
+
+def _render_rows(rows: Sequence[SlipRow]) -> str:
+    """Render a batch of compact slip rows (worker entry point)."""
+    render = _worker_template.render
+    return "".join(
+        [render(row[0], GradeCalculationResult(*row[1:])) for row in rows]
+    )
+
+
+def _slip_rows(slips: Sequence[Slip]) -> List[SlipRow]:
+    """Convert slips to the compact rows sent to rendering processes."""
+    return [
+        (
+            student_id,
+            result.weighted_average,
+            result.attendance_penalty_applied,
+            result.extra_points_applied,
+            result.final_grade,
+        )
+        for student_id, result in slips
+    ]
+
+
+class ReportRenderer:
+    """
+    Renders grade slips in batches into a buffered output file.
+
+    Slips are grouped into batches of batch_size; each batch is rendered to
+    one string and written with a single call. With more than one worker,
+    batches are rendered in a process pool while earlier batches are
+    written, keeping at most two batches per worker in flight so memory
+    does not grow with the number of students.
+
+    The pool is opt-in: the built-in slips render faster than a batch can
+    be pickled, shipped and returned, so workers only pay off with several
+    free cores and a template that is expensive to fill. Measure with
+    benchmarks.bench_report_renderer before enabling it. Workers receive
+    the template once and each batch as compact rows.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+    SEQUENTIAL_WORKERS = 1
+    BUFFER_SIZE = 1024 * 1024
+    IN_FLIGHT_PER_WORKER = 2
+    FORMATS = (TEXT_FORMAT, HTML_FORMAT)
+
+    def __init__(
+        self,
+        output_format: str = TEXT_FORMAT,
+        template: Optional[ReportTemplate] = None,
+        workers: int = SEQUENTIAL_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        rounding_policy: Optional[RoundingPolicy] = None,
+    ):
+        """
+        Initialize the renderer.
+
+        Args:
+            output_format: "text" or "html".
+            template: Slip template. Defaults to the built-in slip of the
+                      output format.
+            workers: Number of rendering processes. 1, the default,
+                     renders in-process, which is faster for the
+                     built-in slips.
+            batch_size: Number of slips rendered and written at a time.
+            rounding_policy: Rounding of the built-in slip. A custom
+                             template carries its own rounding policy.
+
+        Raises:
+            ValueError: If the format, workers or batch_size are invalid, or
+                        both a template and a rounding policy are given.
+        """
+        if output_format not in self.FORMATS:
+            raise ValueError(
+                f"Unknown report format: {output_format}. "
+                f"Expected one of {list(self.FORMATS)}"
+            )
+        if not isinstance(workers, int) or workers < self.SEQUENTIAL_WORKERS:
+            raise ValueError("workers must be a positive integer")
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        if template is not None and rounding_policy is not None:
+            raise ValueError("Pass the rounding policy to the custom template")
+
+        if template is None:
+            template = (
+                ReportTemplate(HTML_SLIP, True, rounding_policy)
+                if output_format == HTML_FORMAT
+                else ReportTemplate(TEXT_SLIP, False, rounding_policy)
+            )
+        self._output_format = output_format
+        self._template = template
+        self._workers = workers
+        self._batch_size = batch_size
+
+    @property
+    def template(self) -> ReportTemplate:
+        """Get the slip template."""
+        return self._template
+
+    @property
+    def output_format(self) -> str:
+        """Get the output format."""
+        return self._output_format
+
+    def render_slip(self, student_id: str, result: GradeCalculationResult) -> str:
+        """
+        Render the slip of one student.
+
+        Args:
+            student_id: Identifier of the student.
+            result: The student's grade calculation result.
+
+        Returns:
+            The rendered slip.
+        """
+        return self._template.render(student_id, result)
+
+    def render_batch(self, slips: Sequence[Slip]) -> str:
+        """
+        Render several slips into one string.
+
+        Args:
+            slips: Pairs of student identifier and result.
+
+        Returns:
+            The rendered slips, concatenated in input order.
+        """
+        return _render_batch(self._template, slips)
+
+    def write(self, slips: Iterable[Slip], output_path: str) -> int:
+        """
+        Render every slip into one file.
+
+        Args:
+            slips: Pairs of student identifier and result, streamed in order.
+            output_path: Destination file. HTML output is wrapped in a
+                         document printing one slip per page.
+
+        Returns:
+            Number of slips written.
+
+        Raises:
+            OSError: If the output file cannot be written.
+        """
+        written = 0
+        with open(
+            output_path, "w", encoding=ENCODING, buffering=self.BUFFER_SIZE
+        ) as output_file:
+            if self._output_format == HTML_FORMAT:
+                output_file.write(HTML_HEADER)
+            for count, rendered in self._iter_rendered(slips):
+                output_file.write(rendered)
+                written += count
+            if self._output_format == HTML_FORMAT:
+                output_file.write(HTML_FOOTER)
+        return written
+
+    def _iter_batches(self, slips: Iterable[Slip]) -> Iterator[List[Slip]]:
+        """Group streamed slips into lists of at most batch_size."""
+        iterator = iter(slips)
+        while True:
+            batch = list(islice(iterator, self._batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _iter_rendered(self, slips: Iterable[Slip]) -> Iterator[Tuple[int, str]]:
+        """Yield the slip count and rendered text of each batch, in order."""
+        if self._workers == self.SEQUENTIAL_WORKERS:
+            for batch in self._iter_batches(slips):
+                yield len(batch), self.render_batch(batch)
+            return
+
+        max_in_flight = self._workers * self.IN_FLIGHT_PER_WORKER
+        pending: "deque[Tuple[int, concurrent.futures.Future]]" = deque()
+        with concurrent.futures.ProcessPoolExecutor(
+            self._workers, initializer=_init_worker, initargs=(self._template,)
+        ) as executor:
+            for batch in self._iter_batches(slips):
+                pending.append(
+                    (len(batch), executor.submit(_render_rows, _slip_rows(batch)))
+                )
+                if len(pending) >= max_in_flight:
+                    count, future = pending.popleft()
+                    yield count, future.result()
+            while pending:
+                count, future = pending.popleft()
+                yield count, future.result()
+
+    def __repr__(self) -> str:
+        """String representation of the renderer."""
+        return (
+            f"ReportRenderer(format={self._output_format}, "
+            f"workers={self._workers}, batch_size={self._batch_size})"
+        )
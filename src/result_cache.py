@@ -0,0 +1,337 @@
+"""
+Module for caching graded chunks on disk across process restarts.
+
+Entries are content addressed: the key of a chunk is a SHA-256 digest of
+its inputs and of a fingerprint of the grading rule sources, so an entry
+can never be served for different data, and editing any rule module
+invalidates every entry without an explicit flush.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from src.batch_grader import GradingRules
+from src.roster_columns import RosterColumns
+from src.rounding_policy import RoundingPolicy
+
+SCHEME_VERSION = 1
+# Entries hold rounded, formatted result rows, so the rounding and the row
+# formatting code are part of the rules as far as the cache is concerned, and
+# so is shared_roster.py, which builds the grading inputs of --shared-memory
+# runs.
+RULE_SOURCES = (
+    "evaluation.py",
+    "attendance_policy.py",
+    "extra_points_policy.py",
+    "grade_calculator.py",
+    "batch_grader.py",
+    "rounding_policy.py",
+    "batch_runner.py",
+    "shared_roster.py",
+)
+ENCODING = "utf-8"
+
+
+def rules_fingerprint(source_directory: Optional[str] = None) -> str:
+    """
+    Fingerprint the cache scheme and the grading rule sources.
+
+    Args:
+        source_directory: Directory holding RULE_SOURCES. Defaults to the
+                          directory of this module.
+
+    Returns:
+        Hex SHA-256 digest of the scheme version and every rule source.
+
+    Raises:
+        OSError: If a rule source cannot be read.
+    """
+    if source_directory is None:
+        source_directory = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256(f"scheme:{SCHEME_VERSION}".encode(ENCODING))
+    for name in RULE_SOURCES:
+        with open(os.path.join(source_directory, name), "rb") as source_file:
+            digest.update(name.encode(ENCODING) + b"\0" + source_file.read())
+    return digest.hexdigest()
+
+
+class CacheStats:
+    """
+    Counters of one ResultCache.
+
+    Attributes:
+        hits: Lookups answered from disk.
+        misses: Lookups with no usable entry.
+        writes: Entries stored.
+        evictions: Entries removed to stay under the size limit.
+    """
+
+    def __init__(self):
+        """Initialize every counter at zero."""
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of lookups answered from disk."""
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Convert the counters to a dictionary.
+
+        Returns:
+            Dictionary with hits, misses, writes and evictions.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the counters."""
+        return f"CacheStats(hits={self.hits}, misses={self.misses})"
+
+
+class ResultCache:
+    """
+    Size-bounded, content-addressed cache of graded chunks in a directory.
+
+    Each entry is a JSON file named after its key and sharded by the first
+    two hex digits, as in a git object store. Writes go to a temporary
+    file that is renamed into place, so readers and concurrent runs never
+    see a partial entry. When the stored bytes exceed max_bytes, the least
+    recently used entries are removed.
+    """
+
+    BYTES_PER_MB = 1024 * 1024
+    DEFAULT_MAX_BYTES = 256 * BYTES_PER_MB
+    ENTRY_SUFFIX = ".json"
+    TEMP_SUFFIX = ".tmp"
+    SHARD_LENGTH = 2
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        fingerprint: Optional[str] = None,
+    ):
+        """
+        Initialize the cache, creating the directory if needed.
+
+        Args:
+            directory: Directory holding the entries.
+            max_bytes: Maximum total size of the entries.
+            fingerprint: Rules fingerprint mixed into every key. Defaults to
+                         rules_fingerprint() of the installed sources.
+
+        Raises:
+            ValueError: If max_bytes is not a positive integer.
+            OSError: If the directory cannot be created or scanned.
+        """
+        if not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._fingerprint = (
+            fingerprint if fingerprint is not None else rules_fingerprint()
+        )
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._stats = CacheStats()
+        self._scan()
+
+    @property
+    def directory(self) -> str:
+        """Get the cache directory."""
+        return self._directory
+
+    @property
+    def fingerprint(self) -> str:
+        """Get the rules fingerprint mixed into every key."""
+        return self._fingerprint
+
+    @property
+    def total_bytes(self) -> int:
+        """Get the total size of the stored entries."""
+        return self._total_bytes
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get the hit, miss, write and eviction counters."""
+        return self._stats
+
+    def __len__(self) -> int:
+        """Get the number of stored entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        """Check if an entry is stored under a key."""
+        return key in self._entries
+
+    def make_key(self, payload: bytes) -> str:
+        """
+        Address a payload under the current rules fingerprint.
+
+        Args:
+            payload: Canonical encoding of the inputs.
+
+        Returns:
+            Hex SHA-256 key.
+        """
+        digest = hashlib.sha256(self._fingerprint.encode(ENCODING))
+        digest.update(payload)
+        return digest.hexdigest()
+
+    def chunk_key(
+        self,
+        rules: GradingRules,
+        has_consensus: bool,
+        chunk: RosterColumns,
+        rounding_policy: Optional[RoundingPolicy] = None,
+    ) -> str:
+        """
+        Address the results of a roster chunk.
+
+        Args:
+            rules: Grading rules the chunk is graded with.
+            has_consensus: Whether extra points apply to the chunk's year.
+            chunk: Rows to grade.
+            rounding_policy: Rounding of the stored results, if not the
+                             default of get_details().
+
+        Returns:
+            Hex SHA-256 key of the chunk's inputs.
+        """
+        payload = json.dumps(
+            [
+                repr(rules),
+                repr(rounding_policy),
+                has_consensus,
+                chunk.student_ids,
+                chunk.grades,
+                chunk.weights,
+                chunk.attendance,
+            ],
+            separators=(",", ":"),
+        )
+        return self.make_key(payload.encode(ENCODING))
+
+    def get(self, key: str) -> Optional[list]:
+        """
+        Look up an entry.
+
+        Args:
+            key: Key returned by make_key() or chunk_key().
+
+        Returns:
+            The stored value, or None on a miss. Unreadable entries are
+            dropped and count as misses.
+        """
+        if key not in self._entries:
+            self._stats.misses += 1
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding=ENCODING) as entry_file:
+                value = json.load(entry_file)
+            os.utime(path)
+        except (OSError, ValueError):
+            self._discard(key)
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def put(self, key: str, value: list) -> None:
+        """
+        Store an entry atomically, evicting old entries if needed.
+
+        Args:
+            key: Key returned by make_key() or chunk_key().
+            value: JSON-serializable value.
+
+        Raises:
+            OSError: If the entry cannot be written.
+        """
+        data = json.dumps(value, separators=(",", ":")).encode(ENCODING)
+        path = self._path(key)
+        shard = os.path.dirname(path)
+        os.makedirs(shard, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=shard, suffix=self.TEMP_SUFFIX)
+        try:
+            with os.fdopen(descriptor, "wb") as temp_file:
+                temp_file.write(data)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        self._total_bytes += len(data) - self._entries.pop(key, 0)
+        self._entries[key] = len(data)
+        self._stats.writes += 1
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for key in list(self._entries):
+            self._discard(key)
+
+    def _path(self, key: str) -> str:
+        """Get the file path of an entry."""
+        return os.path.join(
+            self._directory, key[: self.SHARD_LENGTH], key + self.ENTRY_SUFFIX
+        )
+
+    def _scan(self) -> None:
+        """Index the stored entries, least recently used first."""
+        found: List[Tuple[float, str, int]] = []
+        for shard in os.scandir(self._directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.name.endswith(self.ENTRY_SUFFIX):
+                    continue
+                status = entry.stat()
+                key = entry.name[: -len(self.ENTRY_SUFFIX)]
+                found.append((status.st_mtime, key, status.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under max_bytes."""
+        while self._total_bytes > self._max_bytes and len(self._entries) > 1:
+            self._discard(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def _discard(self, key: str) -> None:
+        """Forget an entry and remove its file, if still present."""
+        self._total_bytes -= self._entries.pop(key, 0)
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        """String representation of the cache."""
+        return (
+            f"ResultCache(directory={self._directory}, entries={len(self._entries)}, "
+            f"bytes={self._total_bytes})"
+        )
@@ -0,0 +1,162 @@
+"""
+Module for holding a roster as parallel columns.
+"""
+
+from typing import Iterator, List, Sequence, Tuple
+
+from src.evaluation import Evaluation
+from src.student import Student
+
+RosterRow = Tuple[str, List[float], List[float], bool]
+
+
+class RosterColumns:
+    """
+    A roster stored column-wise, ready for BatchGradeCalculator.
+
+    Attributes:
+        student_ids: Identifier of each student.
+        grades: Grade vector of each student.
+        weights: Weight vector of each student.
+        attendance: Whether each student met minimum attendance.
+    """
+
+    def __init__(
+        self,
+        student_ids: List[str],
+        grades: List[List[float]],
+        weights: List[List[float]],
+        attendance: List[bool],
+    ):
+        """
+        Initialize the roster columns.
+
+        Args:
+            student_ids: Identifier of each student.
+            grades: Grade vector of each student.
+            weights: Weight vector of each student.
+            attendance: Whether each student met minimum attendance.
+
+        Raises:
+            ValueError: If the columns differ in length.
+        """
+        if not len(grades) == len(weights) == len(attendance) == len(student_ids):
+            raise ValueError("All roster columns must have the same length")
+        self.student_ids = student_ids
+        self.grades = grades
+        self.weights = weights
+        self.attendance = attendance
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[RosterRow]) -> "RosterColumns":
+        """
+        Build the columns from (student_id, grades, weights, attendance) rows.
+
+        Args:
+            rows: The roster rows.
+
+        Returns:
+            The roster columns.
+        """
+        roster = cls([], [], [], [])
+        for row in rows:
+            roster.append(*row)
+        return roster
+
+    @classmethod
+    def from_students(cls, students: Sequence[Student]) -> "RosterColumns":
+        """
+        Build the columns from Student objects.
+
+        Args:
+            students: The students of the roster.
+
+        Returns:
+            The roster columns.
+        """
+        roster = cls([], [], [], [])
+        for student in students:
+            evaluations = student.evaluation_view
+            roster.append(
+                student.student_id,
+                [evaluation.grade for evaluation in evaluations],
+                [evaluation.weight for evaluation in evaluations],
+                student.has_reached_minimum_attendance,
+            )
+        return roster
+
+    def append(
+        self,
+        student_id: str,
+        grades: List[float],
+        weights: List[float],
+        has_reached_minimum_attendance: bool,
+    ) -> None:
+        """
+        Append one student to the roster.
+
+        Args:
+            student_id: Identifier of the student.
+            grades: Grade vector of the student.
+            weights: Weight vector of the student.
+            has_reached_minimum_attendance: Attendance status.
+        """
+        self.student_ids.append(student_id)
+        self.grades.append(grades)
+        self.weights.append(weights)
+        self.attendance.append(has_reached_minimum_attendance)
+
+    def to_students(self) -> List[Student]:
+        """
+        Build Student objects, validating every evaluation.
+
+        Returns:
+            One Student per row.
+
+        Raises:
+            ValueError: If a row is not a valid student.
+        """
+        students = []
+        for student_id, grades, weights, attendance in self.iter_rows():
+            student = Student(student_id, has_reached_minimum_attendance=attendance)
+            for grade, weight in zip(grades, weights):
+                student.add_evaluation(Evaluation(grade, weight))
+            students.append(student)
+        return students
+
+    def iter_rows(self) -> Iterator[RosterRow]:
+        """Iterate over the roster as (student_id, grades, weights, attendance)."""
+        return zip(self.student_ids, self.grades, self.weights, self.attendance)
+
+    def slice(self, start: int, end: int) -> "RosterColumns":
+        """
+        Get a contiguous part of the roster.
+
+        Args:
+            start: Index of the first row.
+            end: Index after the last row.
+
+        Returns:
+            The sliced roster columns.
+        """
+        return RosterColumns(
+            self.student_ids[start:end],
+            self.grades[start:end],
+            self.weights[start:end],
+            self.attendance[start:end],
+        )
+
+    def evaluation_count(self) -> int:
+        """Get the total number of evaluations in the roster."""
+        return sum(len(row) for row in self.grades)
+
+    def __len__(self) -> int:
+        """Get the number of students in the roster."""
+        return len(self.student_ids)
+
+    def __repr__(self) -> str:
+        """String representation of the roster columns."""
+        return (
+            f"RosterColumns(students={len(self.student_ids)}, "
+            f"evaluations={self.evaluation_count()})"
+        )
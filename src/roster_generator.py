@@ -0,0 +1,218 @@
+"""
+Module for generating seeded synthetic rosters for benchmarks and tests.
+"""
+
+import random
+from typing import Iterator, List, Optional
+
+from src.evaluation import Evaluation
+from src.grade_calculator import GradeCalculator
+from src.roster_columns import RosterColumns, RosterRow
+
+
+class RosterGenerator:
+    """
+    Seeded generator of rosters that GradeCalculator always accepts.
+
+    Grades are drawn on a 0.1-point grid inside the Evaluation range and
+    every weight vector is a random partition of 100 into integer
+    percentages, so weight sums are exact. The same seed always produces
+    the same roster.
+    """
+
+    DEFAULT_SEED = 42
+    DEFAULT_ATTENDANCE_RATE = 0.85
+    DEFAULT_CONSENSUS_RATE = 0.5
+    MIN_EVALUATIONS = 1
+    GRADE_RESOLUTION = 10.0
+    STUDENT_ID_PREFIX = "U"
+    STUDENT_ID_DIGITS = 9
+
+    def __init__(
+        self,
+        seed: int = DEFAULT_SEED,
+        attendance_rate: float = DEFAULT_ATTENDANCE_RATE,
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            seed: Seed of the random generator.
+            attendance_rate: Probability that a student met attendance.
+
+        Raises:
+            ValueError: If attendance_rate is not between 0 and 1.
+        """
+        self._validate_rate(attendance_rate)
+        self._random = random.Random(seed)
+        self._attendance_rate = attendance_rate
+        self._grade_steps = int(
+            (Evaluation.MAX_GRADE - Evaluation.MIN_GRADE) * self.GRADE_RESOLUTION
+        )
+
+    def create_weights(self, count: int) -> List[float]:
+        """
+        Create integer percentage weights summing exactly to 100.
+
+        Args:
+            count: Number of weights (1 to MAX_EVALUATIONS).
+
+        Returns:
+            The weights.
+
+        Raises:
+            ValueError: If count is out of range.
+        """
+        self._validate_evaluation_count(count)
+        total = int(GradeCalculator.EXPECTED_TOTAL_WEIGHT)
+        cuts = sorted(self._random.sample(range(1, total), count - 1))
+        bounds = [0] + cuts + [total]
+        return [float(bounds[i + 1] - bounds[i]) for i in range(count)]
+
+    def create_grades(self, count: int) -> List[float]:
+        """
+        Create grades on a 0.1-point grid within the Evaluation range.
+
+        Args:
+            count: Number of grades.
+
+        Returns:
+            The grades.
+        """
+        draw = self._random.random
+        steps = self._grade_steps + 1
+        minimum = Evaluation.MIN_GRADE
+        resolution = self.GRADE_RESOLUTION
+        return [minimum + int(draw() * steps) / resolution for _ in range(count)]
+
+    def create_consensus(
+        self, years: int, consensus_rate: float = DEFAULT_CONSENSUS_RATE
+    ) -> List[bool]:
+        """
+        Create a teacher consensus vector.
+
+        Args:
+            years: Number of academic years.
+            consensus_rate: Probability that a year has extra points.
+
+        Returns:
+            One consensus flag per year.
+        """
+        self._validate_rate(consensus_rate)
+        return [self._random.random() < consensus_rate for _ in range(years)]
+
+    def choose_year(self, years: int) -> int:
+        """Pick a random academic year index."""
+        return self._random.randrange(years)
+
+    def create_row(
+        self, student_id: str, evaluation_count: Optional[int] = None
+    ) -> RosterRow:
+        """
+        Create one roster row.
+
+        Args:
+            student_id: Identifier of the student.
+            evaluation_count: Number of evaluations, random if None.
+
+        Returns:
+            (student_id, grades, weights, attendance).
+        """
+        if evaluation_count is None:
+            evaluation_count = self._random.randint(
+                self.MIN_EVALUATIONS, GradeCalculator.MAX_EVALUATIONS
+            )
+        weights = self.create_weights(evaluation_count)
+        grades = self.create_grades(evaluation_count)
+        return (
+            student_id,
+            grades,
+            weights,
+            self._random.random() < self._attendance_rate,
+        )
+
+    def iter_rows(
+        self,
+        student_count: int,
+        evaluation_count: Optional[int] = None,
+        shared_weights: bool = False,
+        first_index: int = 0,
+    ) -> Iterator[RosterRow]:
+        """
+        Stream generated rows, e.g. straight into roster_io.write_roster().
+
+        Args:
+            student_count: Number of students.
+            evaluation_count: Evaluations per student, random 1-10 if None.
+            shared_weights: Give every student the same weight vector, as in
+                            a course section. Requires evaluation_count.
+            first_index: Number used for the first student id.
+
+        Yields:
+            (student_id, grades, weights, attendance) rows.
+
+        Raises:
+            ValueError: If the arguments are invalid.
+        """
+        if not isinstance(student_count, int) or student_count < 0:
+            raise ValueError("student_count must be a non-negative integer")
+        if evaluation_count is not None:
+            self._validate_evaluation_count(evaluation_count)
+        if shared_weights and evaluation_count is None:
+            raise ValueError("shared_weights requires a fixed evaluation_count")
+
+        template = self.create_weights(evaluation_count) if shared_weights else None
+        draw = self._random.random
+        attendance_rate = self._attendance_rate
+        for index in range(first_index, first_index + student_count):
+            student_id = f"{self.STUDENT_ID_PREFIX}{index:0{self.STUDENT_ID_DIGITS}d}"
+            if template is None:
+                yield self.create_row(student_id, evaluation_count)
+            else:
+                yield (
+                    student_id,
+                    self.create_grades(evaluation_count),
+                    list(template),
+                    draw() < attendance_rate,
+                )
+
+    def generate(
+        self,
+        student_count: int,
+        evaluation_count: Optional[int] = None,
+        shared_weights: bool = False,
+    ) -> RosterColumns:
+        """
+        Generate an in-memory roster.
+
+        Args:
+            student_count: Number of students.
+            evaluation_count: Evaluations per student, random 1-10 if None.
+            shared_weights: Give every student the same weight vector.
+
+        Returns:
+            The roster columns.
+        """
+        return RosterColumns.from_rows(
+            self.iter_rows(student_count, evaluation_count, shared_weights)
+        )
+
+    def _validate_evaluation_count(self, count: int) -> None:
+        """Raise ValueError if count is not a valid number of evaluations."""
+        if not isinstance(count, int) or not (
+            self.MIN_EVALUATIONS <= count <= GradeCalculator.MAX_EVALUATIONS
+        ):
+            raise ValueError(
+                f"evaluation_count must be between {self.MIN_EVALUATIONS} "
+                f"and {GradeCalculator.MAX_EVALUATIONS}"
+            )
+
+    @staticmethod
+    def _validate_rate(rate: float) -> None:
+        """Raise ValueError if rate is not a probability."""
+        if not isinstance(rate, (int, float)) or not 0.0 <= rate <= 1.0:
+            raise ValueError("Rates must be between 0 and 1")
+
+    def __repr__(self) -> str:
+        """String representation of the roster generator."""
+        return f"RosterGenerator(attendance_rate={self._attendance_rate})"
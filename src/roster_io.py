@@ -0,0 +1,278 @@
+"""
+Module for reading and writing rosters as CSV, JSON Lines or binary files.
+
+All readers stream the file row by row, so rosters larger than memory can
+be processed without loading them whole.
+"""
+
+import csv
+import json
+import os
+import struct
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+
+from src.roster_columns import RosterColumns, RosterRow
+
+CSV_FORMAT = "csv"
+JSONL_FORMAT = "jsonl"
+BINARY_FORMAT = "bin"
+FORMATS_BY_EXTENSION = {
+    ".csv": CSV_FORMAT,
+    ".jsonl": JSONL_FORMAT,
+    ".bin": BINARY_FORMAT,
+}
+
+CSV_FIELDS = ["student_id", "has_reached_minimum_attendance", "grades", "weights"]
+CSV_LIST_SEPARATOR = ";"
+CSV_TRUE_VALUES = ("1", "true", "s", "si")
+CSV_TRUE = "1"
+CSV_FALSE = "0"
+ENCODING = "utf-8"
+
+BINARY_MAGIC = b"CSGR"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sB")
+BINARY_ROW_HEADER = struct.Struct("<H?B")
+FLOAT64_SIZE = struct.calcsize("<d")
+
+
+def detect_format(path: str, roster_format: Optional[str] = None) -> str:
+    """
+    Resolve the roster format of a file.
+
+    Args:
+        path: Path of the roster file.
+        roster_format: Explicit format, overriding the file extension.
+
+    Returns:
+        One of "csv", "jsonl" or "bin".
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if roster_format is None:
+        extension = os.path.splitext(path)[1].lower()
+        roster_format = FORMATS_BY_EXTENSION.get(extension)
+    if roster_format not in FORMATS_BY_EXTENSION.values():
+        raise ValueError(
+            f"Unknown roster format for {path}; expected one of "
+            f"{sorted(FORMATS_BY_EXTENSION.values())}"
+        )
+    return roster_format
+
+
+def write_roster(
+    rows: Iterable[RosterRow], path: str, roster_format: Optional[str] = None
+) -> int:
+    """
+    Write roster rows to a file.
+
+    Args:
+        rows: Rows to write, e.g. RosterColumns.iter_rows().
+        path: Destination path.
+        roster_format: Explicit format, overriding the file extension.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    roster_format = detect_format(path, roster_format)
+    if roster_format == CSV_FORMAT:
+        return _write_csv(rows, path)
+    if roster_format == JSONL_FORMAT:
+        return _write_jsonl(rows, path)
+    return _write_binary(rows, path)
+
+
+def iter_roster(path: str, roster_format: Optional[str] = None) -> Iterator[RosterRow]:
+    """
+    Stream the rows of a roster file.
+
+    Args:
+        path: Path of the roster file.
+        roster_format: Explicit format, overriding the file extension.
+
+    Yields:
+        (student_id, grades, weights, attendance) rows in file order.
+
+    Raises:
+        ValueError: If the format is unknown or the file is malformed.
+    """
+    roster_format = detect_format(path, roster_format)
+    if roster_format == CSV_FORMAT:
+        return _iter_csv(path)
+    if roster_format == JSONL_FORMAT:
+        return _iter_jsonl(path)
+    return _iter_binary(path)
+
+
+def read_roster(path: str, roster_format: Optional[str] = None) -> RosterColumns:
+    """
+    Load a whole roster file into columns.
+
+    Args:
+        path: Path of the roster file.
+        roster_format: Explicit format, overriding the file extension.
+
+    Returns:
+        The roster columns.
+    """
+    return RosterColumns.from_rows(iter_roster(path, roster_format))
+
+
+def _format_numbers(values: List[float]) -> str:
+    """Join numbers with the CSV list separator."""
+    return CSV_LIST_SEPARATOR.join(repr(float(value)) for value in values)
+
+
+def _parse_numbers(text: str) -> List[float]:
+    """Split a CSV list field into numbers."""
+    if not text:
+        return []
+    return [float(value) for value in text.split(CSV_LIST_SEPARATOR)]
+
+
+def _write_csv(rows: Iterable[RosterRow], path: str) -> int:
+    """Write rows as CSV with list fields joined by semicolons."""
+    count = 0
+    with open(path, "w", encoding=ENCODING, newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(CSV_FIELDS)
+        for student_id, grades, weights, attendance in rows:
+            writer.writerow(
+                [
+                    student_id,
+                    CSV_TRUE if attendance else CSV_FALSE,
+                    _format_numbers(grades),
+                    _format_numbers(weights),
+                ]
+            )
+            count += 1
+    return count
+
+
+def _iter_csv(path: str) -> Iterator[RosterRow]:
+    """Stream rows from a CSV roster."""
+    with open(path, "r", encoding=ENCODING, newline="") as csv_file:
+        reader = csv.DictReader(csv_file)
+        for line_number, record in enumerate(reader, start=2):
+            try:
+                yield (
+                    record["student_id"],
+                    _parse_numbers(record["grades"]),
+                    _parse_numbers(record["weights"]),
+                    record["has_reached_minimum_attendance"].strip().lower()
+                    in CSV_TRUE_VALUES,
+                )
+            except (KeyError, AttributeError, ValueError) as error:
+                raise ValueError(
+                    f"Line {line_number}: malformed row ({error})"
+                ) from error
+
+
+def _write_jsonl(rows: Iterable[RosterRow], path: str) -> int:
+    """Write rows as one JSON object per line."""
+    count = 0
+    with open(path, "w", encoding=ENCODING) as jsonl_file:
+        for student_id, grades, weights, attendance in rows:
+            record = {
+                "student_id": student_id,
+                "grades": grades,
+                "weights": weights,
+                "has_reached_minimum_attendance": attendance,
+            }
+            jsonl_file.write(json.dumps(record, separators=(",", ":")))
+            jsonl_file.write("\n")
+            count += 1
+    return count
+
+
+def _iter_jsonl(path: str) -> Iterator[RosterRow]:
+    """Stream rows from a JSON Lines roster."""
+    with open(path, "r", encoding=ENCODING) as jsonl_file:
+        for line_number, line in enumerate(jsonl_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield (
+                    record["student_id"],
+                    record["grades"],
+                    record["weights"],
+                    record["has_reached_minimum_attendance"],
+                )
+            except (KeyError, TypeError, ValueError) as error:
+                raise ValueError(
+                    f"Line {line_number}: malformed row ({error})"
+                ) from error
+
+
+def _write_binary(rows: Iterable[RosterRow], path: str) -> int:
+    """
+    Write rows as packed binary records.
+
+    Layout: a "CSGR" magic and version byte, then per row a little-endian
+    uint16 id length, a bool attendance flag, a uint8 evaluation count, the
+    UTF-8 id and the grades followed by the weights as float64.
+    """
+    count = 0
+    with open(path, "wb") as binary_file:
+        binary_file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION))
+        for student_id, grades, weights, attendance in rows:
+            if len(grades) != len(weights):
+                raise ValueError(
+                    f"Row {count}: grades and weights must have the same length"
+                )
+            encoded_id = student_id.encode(ENCODING)
+            evaluation_count = len(grades)
+            binary_file.write(
+                BINARY_ROW_HEADER.pack(len(encoded_id), attendance, evaluation_count)
+            )
+            binary_file.write(encoded_id)
+            binary_file.write(
+                struct.pack(f"<{2 * evaluation_count}d", *grades, *weights)
+            )
+            count += 1
+    return count
+
+
+def _read_exactly(binary_file: BinaryIO, size: int) -> bytes:
+    """Read size bytes or raise ValueError on a truncated file."""
+    data = binary_file.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated binary roster")
+    return data
+
+
+def _iter_binary(path: str) -> Iterator[RosterRow]:
+    """Stream rows from a binary roster."""
+    with open(path, "rb") as binary_file:
+        header = binary_file.read(BINARY_HEADER.size)
+        if len(header) != BINARY_HEADER.size:
+            raise ValueError("Not a binary roster file")
+        magic, version = BINARY_HEADER.unpack(header)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError("Not a binary roster file")
+
+        while True:
+            row_header = binary_file.read(BINARY_ROW_HEADER.size)
+            if not row_header:
+                return
+            if len(row_header) != BINARY_ROW_HEADER.size:
+                raise ValueError("Truncated binary roster")
+            id_length, attendance, evaluation_count = BINARY_ROW_HEADER.unpack(
+                row_header
+            )
+            student_id = _read_exactly(binary_file, id_length).decode(ENCODING)
+            values = struct.unpack(
+                f"<{2 * evaluation_count}d",
+                _read_exactly(binary_file, 2 * FLOAT64_SIZE * evaluation_count),
+            )
+            yield (
+                student_id,
+                list(values[:evaluation_count]),
+                list(values[evaluation_count:]),
+                attendance,
+            )
@@ -0,0 +1,228 @@
+"""
+Module for rounding grade results once, the same way for every writer.
+
+Values are rounded as the decimal number they print as, so 2.675 rounds
+half-up to 2.68 even though its binary value is slightly below the tie.
+Most values are far from a tie or boundary and take a fast float path;
+only the ones within TIE_TOLERANCE of one fall back to Decimal.
+"""
+
+import decimal
+import math
+from typing import Dict, List, Sequence
+
+from src.grade_calculator import GradeCalculationResult
+
+
+class RoundingPolicy:
+    """
+    Rounds results to a number of decimals with a chosen tie rule.
+
+    Attributes:
+        mode: HALF_UP, HALF_EVEN or TRUNCATE.
+        decimals: Number of decimals kept.
+    """
+
+    HALF_UP = "half_up"
+    HALF_EVEN = "half_even"
+    TRUNCATE = "truncate"
+    MODES = (HALF_UP, HALF_EVEN, TRUNCATE)
+    DEFAULT_DECIMALS = 2
+    MAX_DECIMALS = 6
+    TIE_TOLERANCE = 1e-9
+    HALF = 0.5
+
+    _DECIMAL_ROUNDING = {
+        HALF_UP: decimal.ROUND_HALF_UP,
+        HALF_EVEN: decimal.ROUND_HALF_EVEN,
+        TRUNCATE: decimal.ROUND_DOWN,
+    }
+
+    def __init__(self, mode: str = HALF_EVEN, decimals: int = DEFAULT_DECIMALS):
+        """
+        Initialize the rounding policy.
+
+        Args:
+            mode: HALF_UP, HALF_EVEN or TRUNCATE.
+            decimals: Number of decimals kept, from 0 to MAX_DECIMALS.
+
+        Raises:
+            ValueError: If the mode is unknown or decimals is out of range.
+        """
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Unknown rounding mode: {mode}. Expected one of {list(self.MODES)}"
+            )
+        if (
+            not isinstance(decimals, int)
+            or isinstance(decimals, bool)
+            or not 0 <= decimals <= self.MAX_DECIMALS
+        ):
+            raise ValueError(f"decimals must be between 0 and {self.MAX_DECIMALS}")
+        self._mode = mode
+        self._decimals = decimals
+        self._scale = 10**decimals
+        self._quantum = decimal.Decimal(1).scaleb(-decimals)
+
+    @property
+    def mode(self) -> str:
+        """Get the tie rule."""
+        return self._mode
+
+    @property
+    def decimals(self) -> int:
+        """Get the number of decimals kept."""
+        return self._decimals
+
+    def round(self, value: float) -> float:
+        """
+        Round one value.
+
+        Args:
+            value: Value to round.
+
+        Returns:
+            The rounded value.
+        """
+        return self.round_many((value,))[0]
+
+    def round_many(self, values: Sequence[float]) -> List[float]:
+        """
+        Round a column of values in one pass.
+
+        Args:
+            values: Values to round.
+
+        Returns:
+            The rounded values, in input order.
+        """
+        scale = self._scale
+        truncate = self._mode == self.TRUNCATE
+        tolerance = self.TIE_TOLERANCE
+        half = self.HALF
+        floor = math.floor
+        rounded = []
+        for value in values:
+            scaled = abs(value) * scale
+            whole = floor(scaled)
+            fraction = scaled - whole
+            if (
+                fraction < tolerance
+                or fraction > 1 - tolerance
+                or abs(fraction - half) < tolerance
+            ):
+                rounded.append(self._round_decimal(value))
+                continue
+            # Ties went to Decimal above, so half-up and half-even agree here.
+            if not truncate and fraction > half:
+                whole += 1
+            result = whole / scale
+            rounded.append(result if value >= 0 else -result)
+        return rounded
+
+    def _round_decimal(self, value: float) -> float:
+        """Round the printed decimal form of a value with Decimal."""
+        return float(
+            decimal.Decimal(repr(value)).quantize(
+                self._quantum, rounding=self._DECIMAL_ROUNDING[self._mode]
+            )
+        )
+
+    def format(self, value: float) -> str:
+        """
+        Format an already rounded value with the policy's decimals.
+
+        Args:
+            value: Value returned by round() or round_many().
+
+        Returns:
+            The value with exactly `decimals` decimals.
+        """
+        return f"{value:.{self._decimals}f}"
+
+    def apply(self, result: GradeCalculationResult) -> GradeCalculationResult:
+        """
+        Round the numbers of one result.
+
+        Args:
+            result: Result to round.
+
+        Returns:
+            A new result with rounded weighted average, extra points and
+            final grade.
+        """
+        return self.apply_batch([result])[0]
+
+    def apply_batch(
+        self, results: Sequence[GradeCalculationResult]
+    ) -> List[GradeCalculationResult]:
+        """
+        Round the numbers of many results, one column at a time.
+
+        Args:
+            results: Results to round.
+
+        Returns:
+            New rounded results, in input order.
+        """
+        averages = self.round_many([result.weighted_average for result in results])
+        extra_points = self.round_many(
+            [result.extra_points_applied for result in results]
+        )
+        final_grades = self.round_many([result.final_grade for result in results])
+        return [
+            GradeCalculationResult(
+                average, result.attendance_penalty_applied, extra, final_grade
+            )
+            for result, average, extra, final_grade in zip(
+                results, averages, extra_points, final_grades
+            )
+        ]
+
+    def details(self, result: GradeCalculationResult) -> Dict[str, object]:
+        """
+        Get the breakdown of a result rounded by this policy.
+
+        Args:
+            result: Result to describe.
+
+        Returns:
+            Dictionary with the keys of GradeCalculationResult.get_details().
+        """
+        return self.details_batch([result])[0]
+
+    def details_batch(
+        self, results: Sequence[GradeCalculationResult]
+    ) -> List[Dict[str, object]]:
+        """
+        Get the rounded breakdown of many results.
+
+        Args:
+            results: Results to describe.
+
+        Returns:
+            One dictionary per result, with the keys of get_details().
+        """
+        return [
+            {
+                "weighted_average": rounded.weighted_average,
+                "attendance_penalty_applied": rounded.attendance_penalty_applied,
+                "extra_points_applied": rounded.extra_points_applied,
+                "final_grade": rounded.final_grade,
+            }
+            for rounded in self.apply_batch(results)
+        ]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two policies by mode and decimals."""
+        if not isinstance(other, RoundingPolicy):
+            return NotImplemented
+        return (self._mode, self._decimals) == (other._mode, other._decimals)
+
+    def __hash__(self) -> int:
+        """Hash the policy by mode and decimals."""
+        return hash((self._mode, self._decimals))
+
+    def __repr__(self) -> str:
+        """String representation of the rounding policy."""
+        return f"RoundingPolicy(mode={self._mode}, decimals={self._decimals})"
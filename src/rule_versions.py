@@ -0,0 +1,513 @@
+"""
+Module for versioned grading rules and side-by-side rule comparisons.
+
+A rule change (a new EXTRA_POINTS_VALUE, a different attendance penalty)
+is registered as a new version next to the one in use. Before cutover,
+DualRunComparator grades the same roster under both versions in a single
+pass and keeps only the students whose result changes.
+"""
+
+import csv
+import json
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.batch_grader import GradingRules, calculate_weighted_average, validate_row
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculationResult, GradeCalculator
+from src.roster_columns import RosterRow
+from src.roster_io import ENCODING, iter_roster
+from src.rounding_policy import RoundingPolicy
+
+
+class RuleVersionRegistry:
+    """
+    Named GradingRules versions, one of them pinned for regular grading.
+
+    The registry always knows CURRENT_VERSION, the rules built from the
+    class constants of the policies, unless a file redefines it.
+    """
+
+    CURRENT_VERSION = "current"
+    PINNED_KEY = "pinned"
+    VERSIONS_KEY = "versions"
+    RULE_FIELDS = (
+        "extra_points_value",
+        "attendance_penalty",
+        "min_final_grade",
+        "max_final_grade",
+    )
+
+    def __init__(self):
+        """Initialize the registry with the current rules pinned."""
+        self._versions: Dict[str, GradingRules] = {
+            self.CURRENT_VERSION: GradingRules()
+        }
+        self._pinned = self.CURRENT_VERSION
+
+    @classmethod
+    def from_json(cls, path: str) -> "RuleVersionRegistry":
+        """
+        Load versions from a JSON file.
+
+        The file maps version names to GradingRules values; missing values
+        keep their defaults:
+
+            {"pinned": "2026-1",
+             "versions": {"2026-1": {"extra_points_value": 1.5}}}
+
+        Args:
+            path: Path of the JSON file.
+
+        Returns:
+            The registry, with the file's pinned version (or CURRENT_VERSION).
+
+        Raises:
+            ValueError: If the file is malformed, a value is unknown or
+                        invalid, or the pinned version is not defined.
+            OSError: If the file cannot be read.
+        """
+        with open(path, encoding=ENCODING) as rules_file:
+            try:
+                document = json.load(rules_file)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Invalid rule versions file: {error}") from error
+        if not isinstance(document, dict) or not isinstance(
+            document.get(cls.VERSIONS_KEY), dict
+        ):
+            raise ValueError(
+                f"Rule versions file must have a '{cls.VERSIONS_KEY}' object"
+            )
+
+        registry = cls()
+        for version, values in document[cls.VERSIONS_KEY].items():
+            if not isinstance(values, dict):
+                raise ValueError(f"Rule version {version} must be an object")
+            unknown = sorted(set(values) - set(cls.RULE_FIELDS))
+            if unknown:
+                raise ValueError(
+                    f"Rule version {version} has unknown values: {unknown}. "
+                    f"Expected some of {list(cls.RULE_FIELDS)}"
+                )
+            registry.register(version, GradingRules(**values), replace=True)
+        registry.pin(document.get(cls.PINNED_KEY, cls.CURRENT_VERSION))
+        return registry
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "RuleVersionRegistry":
+        """
+        Load versions from a JSON file, or only the current rules.
+
+        Args:
+            path: Path of the JSON file, or None.
+
+        Returns:
+            The registry.
+
+        Raises:
+            ValueError: If the file is invalid.
+            OSError: If the file cannot be read.
+        """
+        return cls.from_json(path) if path else cls()
+
+    @property
+    def versions(self) -> List[str]:
+        """Get the registered version names, in registration order."""
+        return list(self._versions)
+
+    @property
+    def pinned(self) -> str:
+        """Get the version used for regular grading."""
+        return self._pinned
+
+    @property
+    def pinned_rules(self) -> GradingRules:
+        """Get the rules of the pinned version."""
+        return self._versions[self._pinned]
+
+    def register(
+        self, version: str, rules: GradingRules, replace: bool = False
+    ) -> None:
+        """
+        Register a version.
+
+        Args:
+            version: Name of the version.
+            rules: Rules of the version.
+            replace: Whether an existing version may be redefined.
+
+        Raises:
+            ValueError: If the name is empty, the rules are not GradingRules,
+                        or the version exists and replace is off.
+        """
+        if not isinstance(version, str) or not version.strip():
+            raise ValueError("Rule version must be a non-empty string")
+        if not isinstance(rules, GradingRules):
+            raise ValueError("Rule version must hold GradingRules")
+        if version in self._versions and not replace:
+            raise ValueError(f"Rule version {version} is already registered")
+        self._versions[version] = rules
+
+    def get(self, version: str) -> GradingRules:
+        """
+        Get the rules of a version.
+
+        Args:
+            version: Name of the version.
+
+        Returns:
+            The rules of the version.
+
+        Raises:
+            ValueError: If the version is not registered.
+        """
+        if version not in self._versions:
+            raise ValueError(
+                f"Unknown rule version: {version}. Expected one of {self.versions}"
+            )
+        return self._versions[version]
+
+    def pin(self, version: str) -> None:
+        """
+        Use a version for regular grading.
+
+        Args:
+            version: Name of the version.
+
+        Raises:
+            ValueError: If the version is not registered.
+        """
+        self.get(version)
+        self._pinned = version
+
+    def __contains__(self, version: object) -> bool:
+        """Check if a version is registered."""
+        return version in self._versions
+
+    def __len__(self) -> int:
+        """Get the number of registered versions."""
+        return len(self._versions)
+
+    def __repr__(self) -> str:
+        """String representation of the registry."""
+        return f"RuleVersionRegistry(versions={self.versions}, pinned={self._pinned})"
+
+
+class RuleDisagreement:
+    """
+    A student graded differently by two rule versions.
+
+    Attributes:
+        row: Index of the student in the roster.
+        student_id: Identifier of the student.
+        baseline: Result under the baseline rules.
+        candidate: Result under the candidate rules.
+        outcome_change: "", PASS_TO_FAIL or FAIL_TO_PASS.
+    """
+
+    PASS_TO_FAIL = "pass_to_fail"
+    FAIL_TO_PASS = "fail_to_pass"
+    NO_OUTCOME_CHANGE = ""
+    CSV_FIELDS = [
+        "student_id",
+        "baseline_final_grade",
+        "candidate_final_grade",
+        "difference",
+        "baseline_extra_points",
+        "candidate_extra_points",
+        "outcome_change",
+    ]
+
+    __slots__ = ("row", "student_id", "baseline", "candidate", "outcome_change")
+
+    def __init__(
+        self,
+        row: int,
+        student_id: str,
+        baseline: GradeCalculationResult,
+        candidate: GradeCalculationResult,
+        outcome_change: str,
+    ):
+        """Initialize the disagreement."""
+        self.row = row
+        self.student_id = student_id
+        self.baseline = baseline
+        self.candidate = candidate
+        self.outcome_change = outcome_change
+
+    @property
+    def difference(self) -> float:
+        """Get the candidate final grade minus the baseline final grade."""
+        return self.candidate.final_grade - self.baseline.final_grade
+
+    def to_row(self, rounding_policy: Optional[RoundingPolicy] = None) -> list:
+        """
+        Format the disagreement as a row of CSV_FIELDS.
+
+        Args:
+            rounding_policy: Rounding of the numbers. Defaults to the
+                             2 decimals of get_details().
+
+        Returns:
+            The CSV row.
+        """
+        if rounding_policy is None:
+            baseline = self.baseline.get_details()
+            candidate = self.candidate.get_details()
+            difference = round(self.difference, 2)
+        else:
+            baseline, candidate = rounding_policy.details_batch(
+                [self.baseline, self.candidate]
+            )
+            difference = rounding_policy.round(self.difference)
+        return [
+            self.student_id,
+            baseline["final_grade"],
+            candidate["final_grade"],
+            difference,
+            baseline["extra_points_applied"],
+            candidate["extra_points_applied"],
+            self.outcome_change,
+        ]
+
+    def __repr__(self) -> str:
+        """String representation of the disagreement."""
+        return (
+            f"RuleDisagreement(student_id={self.student_id}, "
+            f"baseline={self.baseline.final_grade:.2f}, "
+            f"candidate={self.candidate.final_grade:.2f})"
+        )
+
+
+class DualRunSummary:
+    """
+    Counts of a dual run.
+
+    Attributes:
+        rows_compared: Number of students graded under both versions.
+        disagreements: Number of students whose result changed.
+        pass_to_fail: Students who pass with the baseline only.
+        fail_to_pass: Students who pass with the candidate only.
+        duration: Wall-clock duration in seconds.
+    """
+
+    def __init__(self):
+        """Initialize an empty summary."""
+        self.rows_compared = 0
+        self.disagreements = 0
+        self.pass_to_fail = 0
+        self.fail_to_pass = 0
+        self.duration = 0.0
+
+    def add(self, disagreement: Optional[RuleDisagreement]) -> None:
+        """Count one compared student and its disagreement, if any."""
+        self.rows_compared += 1
+        if disagreement is None:
+            return
+        self.disagreements += 1
+        if disagreement.outcome_change == RuleDisagreement.PASS_TO_FAIL:
+            self.pass_to_fail += 1
+        elif disagreement.outcome_change == RuleDisagreement.FAIL_TO_PASS:
+            self.fail_to_pass += 1
+
+    def to_dict(self) -> Dict[str, object]:
+        """Get the counts as a dictionary."""
+        return {
+            "rows_compared": self.rows_compared,
+            "disagreements": self.disagreements,
+            "pass_to_fail": self.pass_to_fail,
+            "fail_to_pass": self.fail_to_pass,
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the summary."""
+        return (
+            f"DualRunSummary(rows={self.rows_compared}, "
+            f"disagreements={self.disagreements})"
+        )
+
+
+class DualRunComparator:
+    """
+    Grades a roster under two rule versions in a single pass.
+
+    Each row is validated and its weighted average computed once; only
+    GradingRules.apply() runs twice. Final grades and extra points are
+    compared exactly, so even a change below the printed decimals is
+    reported.
+    """
+
+    def __init__(
+        self,
+        baseline: GradingRules,
+        candidate: GradingRules,
+        passing_grade: float = GradeCalculator.PASSING_GRADE,
+    ):
+        """
+        Initialize the comparator.
+
+        Args:
+            baseline: Rules in use.
+            candidate: Rules to evaluate.
+            passing_grade: Final grade needed to pass, to flag outcome changes.
+
+        Raises:
+            ValueError: If the rules are not GradingRules or passing_grade is
+                        not a number.
+        """
+        if not isinstance(baseline, GradingRules) or not isinstance(
+            candidate, GradingRules
+        ):
+            raise ValueError("baseline and candidate must be GradingRules")
+        if not isinstance(passing_grade, (int, float)):
+            raise ValueError("passing_grade must be a number")
+        self._baseline = baseline
+        self._candidate = candidate
+        self._passing_grade = float(passing_grade)
+
+    @classmethod
+    def from_registry(
+        cls, registry: RuleVersionRegistry, baseline: str, candidate: str
+    ) -> "DualRunComparator":
+        """
+        Build a comparator for two registered versions.
+
+        Args:
+            registry: Registry holding both versions.
+            baseline: Name of the version in use.
+            candidate: Name of the version to evaluate.
+
+        Returns:
+            The comparator.
+
+        Raises:
+            ValueError: If a version is not registered.
+        """
+        return cls(registry.get(baseline), registry.get(candidate))
+
+    def compare_rows(
+        self, rows: Iterable[RosterRow], has_consensus: bool, validate: bool = True
+    ) -> Iterator[Optional[RuleDisagreement]]:
+        """
+        Grade streamed rows under both versions.
+
+        Args:
+            rows: (student_id, grades, weights, attendance) rows.
+            has_consensus: Whether extra points apply to the graded year.
+            validate: Whether to check each row before grading it.
+
+        Yields:
+            The disagreement of each row, or None if both versions agree.
+
+        Raises:
+            ValueError: If a row is invalid.
+        """
+        baseline = self._baseline.apply
+        candidate = self._candidate.apply
+        for row, (student_id, grades, weights, attendance) in enumerate(rows):
+            if validate:
+                validate_row(row, grades, weights, attendance)
+            weighted_average = calculate_weighted_average(grades, weights)
+            old = baseline(weighted_average, attendance, has_consensus)
+            new = candidate(weighted_average, attendance, has_consensus)
+            if (
+                old.final_grade == new.final_grade
+                and old.extra_points_applied == new.extra_points_applied
+            ):
+                yield None
+                continue
+            yield RuleDisagreement(
+                row, student_id, old, new, self._outcome_change(old, new)
+            )
+
+    def compare(
+        self, rows: Iterable[RosterRow], has_consensus: bool, validate: bool = True
+    ) -> Tuple[List[RuleDisagreement], DualRunSummary]:
+        """
+        Grade rows under both versions and keep the disagreements.
+
+        Args:
+            rows: (student_id, grades, weights, attendance) rows.
+            has_consensus: Whether extra points apply to the graded year.
+            validate: Whether to check each row before grading it.
+
+        Returns:
+            The disagreements, in roster order, and the summary.
+
+        Raises:
+            ValueError: If a row is invalid.
+        """
+        started_at = time.perf_counter()
+        summary = DualRunSummary()
+        disagreements = []
+        for disagreement in self.compare_rows(rows, has_consensus, validate):
+            summary.add(disagreement)
+            if disagreement is not None:
+                disagreements.append(disagreement)
+        summary.duration = time.perf_counter() - started_at
+        return disagreements, summary
+
+    def compare_file(
+        self,
+        input_path: str,
+        output_path: str,
+        extra_points_policy: ExtraPointsPolicy,
+        current_year_index: int,
+        rounding_policy: Optional[RoundingPolicy] = None,
+    ) -> DualRunSummary:
+        """
+        Compare a roster file and write only the disagreements as CSV.
+
+        The roster is streamed, so memory does not grow with its size.
+
+        Args:
+            input_path: Roster file (.csv, .jsonl or .bin).
+            output_path: Destination CSV of disagreements.
+            extra_points_policy: Policy for extra points.
+            current_year_index: Index of current academic year.
+            rounding_policy: Rounding of the written numbers. Defaults to
+                             the 2 decimals of get_details().
+
+        Returns:
+            Summary of the comparison.
+
+        Raises:
+            ValueError: If the year is out of range, or the roster is
+                        malformed or has an invalid row.
+        """
+        # Raises for an out-of-range year, like the batch runner.
+        extra_points_policy.calculate_extra_points(current_year_index)
+        has_consensus = extra_points_policy.has_consensus_for_year(current_year_index)
+        started_at = time.perf_counter()
+        summary = DualRunSummary()
+        with open(output_path, "w", encoding=ENCODING, newline="") as output_file:
+            writer = csv.writer(output_file)
+            writer.writerow(RuleDisagreement.CSV_FIELDS)
+            for disagreement in self.compare_rows(
+                iter_roster(input_path), has_consensus
+            ):
+                summary.add(disagreement)
+                if disagreement is not None:
+                    writer.writerow(disagreement.to_row(rounding_policy))
+        summary.duration = time.perf_counter() - started_at
+        return summary
+
+    def _outcome_change(
+        self, baseline: GradeCalculationResult, candidate: GradeCalculationResult
+    ) -> str:
+        """Classify how the pass/fail outcome changes between versions."""
+        passed_before = baseline.final_grade >= self._passing_grade
+        passes_now = candidate.final_grade >= self._passing_grade
+        if passed_before and not passes_now:
+            return RuleDisagreement.PASS_TO_FAIL
+        if passes_now and not passed_before:
+            return RuleDisagreement.FAIL_TO_PASS
+        return RuleDisagreement.NO_OUTCOME_CHANGE
+
+    def __repr__(self) -> str:
+        """String representation of the comparator."""
+        return (
+            f"DualRunComparator(baseline={self._baseline}, "
+            f"candidate={self._candidate})"
+        )
+
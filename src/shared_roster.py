@@ -0,0 +1,383 @@
+"""
+Module for handing rosters to grading workers through shared memory.
+"""
+
+from array import array
+from multiprocessing import shared_memory
+from typing import Dict, List, Sequence, Tuple
+
+from src.batch_grader import (
+    BatchGradeCalculator,
+    GradingRules,
+    calculate_weighted_average,
+    validate_attendance,
+    validate_row,
+)
+from src.grade_calculator import GradeCalculationResult, GradeCalculator
+
+
+class SharedRosterDescriptor:
+    """
+    Everything a worker needs to attach to a shared roster.
+
+    Only block names and sizes are pickled to workers, never student data.
+
+    Attributes:
+        block_names: Shared memory block name per column.
+        row_count: Number of students.
+        stride: Evaluation slots reserved per student.
+    """
+
+    def __init__(self, block_names: Dict[str, str], row_count: int, stride: int):
+        """Initialize the descriptor."""
+        self.block_names = block_names
+        self.row_count = row_count
+        self.stride = stride
+
+    def __repr__(self) -> str:
+        """String representation of the descriptor."""
+        return f"SharedRosterDescriptor(rows={self.row_count}, stride={self.stride})"
+
+
+class SharedRoster:
+    """
+    Roster columns stored in multiprocessing.shared_memory blocks.
+
+    Grades and weights are dense float64 matrices of row_count x
+    MAX_EVALUATIONS with a per-row evaluation count; attendance and
+    consensus are one byte per row. Results are written in place into a
+    float64 output block of (weighted average, extra points, final grade)
+    per row.
+    """
+
+    GRADES = "grades"
+    WEIGHTS = "weights"
+    COUNTS = "counts"
+    ATTENDANCE = "attendance"
+    CONSENSUS = "consensus"
+    RESULTS = "results"
+    FLOAT_FORMAT = "d"
+    BYTE_FORMAT = "B"
+    FLOAT_SIZE = 8
+    RESULT_WIDTH = 3
+    STRIDE = GradeCalculator.MAX_EVALUATIONS
+
+    def __init__(
+        self,
+        descriptor: SharedRosterDescriptor,
+        blocks: Dict[str, shared_memory.SharedMemory],
+        owner: bool,
+    ):
+        """
+        Initialize the shared roster. Use create() or attach() instead.
+
+        Args:
+            descriptor: Names and sizes of the blocks.
+            blocks: Open shared memory blocks per column.
+            owner: Whether this instance created (and must unlink) the blocks.
+        """
+        self._descriptor = descriptor
+        self._blocks = blocks
+        self._owner = owner
+        self._views = {
+            self.GRADES: blocks[self.GRADES].buf.cast(self.FLOAT_FORMAT),
+            self.WEIGHTS: blocks[self.WEIGHTS].buf.cast(self.FLOAT_FORMAT),
+            self.RESULTS: blocks[self.RESULTS].buf.cast(self.FLOAT_FORMAT),
+            self.COUNTS: blocks[self.COUNTS].buf.cast(self.BYTE_FORMAT),
+            self.ATTENDANCE: blocks[self.ATTENDANCE].buf.cast(self.BYTE_FORMAT),
+            self.CONSENSUS: blocks[self.CONSENSUS].buf.cast(self.BYTE_FORMAT),
+        }
+
+    @classmethod
+    def create(
+        cls,
+        grades: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]],
+        attendance: Sequence[bool],
+        consensus: Sequence[bool],
+    ) -> "SharedRoster":
+        """
+        Copy roster columns into new shared memory blocks.
+
+        Args:
+            grades: Grade vector per student.
+            weights: Weight vector per student.
+            attendance: Whether each student met minimum attendance.
+            consensus: Whether extra points apply to each student's year.
+
+        Returns:
+            The shared roster, owning its blocks.
+
+        Raises:
+            ValueError: If columns differ in length, or a row has more
+                        evaluations than MAX_EVALUATIONS or non-numeric values.
+        """
+        row_count = len(grades)
+        if not len(weights) == len(attendance) == len(consensus) == row_count:
+            raise ValueError("All roster columns must have the same length")
+
+        # Shared memory blocks cannot be empty, so reserve at least one row.
+        capacity = max(row_count, 1)
+        sizes = {
+            cls.GRADES: capacity * cls.STRIDE * cls.FLOAT_SIZE,
+            cls.WEIGHTS: capacity * cls.STRIDE * cls.FLOAT_SIZE,
+            cls.RESULTS: capacity * cls.RESULT_WIDTH * cls.FLOAT_SIZE,
+            cls.COUNTS: capacity,
+            cls.ATTENDANCE: capacity,
+            cls.CONSENSUS: capacity,
+        }
+        blocks = {}
+        try:
+            for column, size in sizes.items():
+                blocks[column] = shared_memory.SharedMemory(create=True, size=size)
+        except OSError:
+            for block in blocks.values():
+                block.close()
+                block.unlink()
+            raise
+
+        descriptor = SharedRosterDescriptor(
+            {column: block.name for column, block in blocks.items()},
+            row_count,
+            cls.STRIDE,
+        )
+        shared = cls(descriptor, blocks, owner=True)
+        try:
+            shared._fill(grades, weights, attendance, consensus)
+        except ValueError:
+            shared.close()
+            raise
+        return shared
+
+    @classmethod
+    def attach(cls, descriptor: SharedRosterDescriptor) -> "SharedRoster":
+        """
+        Attach to blocks created by another process.
+
+        Args:
+            descriptor: Descriptor received from the owner.
+
+        Returns:
+            The shared roster, not owning its blocks.
+        """
+        blocks = {
+            column: shared_memory.SharedMemory(name=name)
+            for column, name in descriptor.block_names.items()
+        }
+        return cls(descriptor, blocks, owner=False)
+
+    @property
+    def descriptor(self) -> SharedRosterDescriptor:
+        """Get the descriptor to send to workers."""
+        return self._descriptor
+
+    def __len__(self) -> int:
+        """Get the number of students."""
+        return self._descriptor.row_count
+
+    def _fill(
+        self,
+        grades: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]],
+        attendance: Sequence[bool],
+        consensus: Sequence[bool],
+    ) -> None:
+        """Copy the roster columns into the blocks."""
+        grade_view = self._views[self.GRADES]
+        weight_view = self._views[self.WEIGHTS]
+        counts = self._views[self.COUNTS]
+        for row, (row_grades, row_weights) in enumerate(zip(grades, weights)):
+            count = len(row_grades)
+            if count > self.STRIDE or len(row_weights) > self.STRIDE:
+                raise ValueError(
+                    f"Row {row}: cannot have more than {self.STRIDE} evaluations"
+                )
+            if count != len(row_weights):
+                raise ValueError(
+                    f"Row {row}: grades and weights must have the same length"
+                )
+            base = row * self.STRIDE
+            try:
+                grade_view[base : base + count] = array(self.FLOAT_FORMAT, row_grades)
+                weight_view[base : base + count] = array(
+                    self.FLOAT_FORMAT, row_weights
+                )
+            except TypeError as error:
+                raise ValueError(
+                    f"Row {row}: grades and weights must be numbers"
+                ) from error
+            counts[row] = count
+        # The block stores bytes, so a value like "n" must be rejected here.
+        for row, has_reached_minimum in enumerate(attendance):
+            validate_attendance(row, has_reached_minimum)
+        row_count = len(attendance)
+        self._views[self.ATTENDANCE][:row_count] = bytes(map(bool, attendance))
+        self._views[self.CONSENSUS][:row_count] = bytes(map(bool, consensus))
+
+    def grade_slice(
+        self, rules: GradingRules, start: int, end: int, validate: bool = True
+    ) -> None:
+        """
+        Grade rows [start, end) and write their results in place.
+
+        Args:
+            rules: Grading rules to apply.
+            start: First row to grade.
+            end: Row after the last one to grade.
+            validate: Whether to check each row before grading it.
+
+        Raises:
+            ValueError: If a row is invalid.
+        """
+        grade_view = self._views[self.GRADES]
+        weight_view = self._views[self.WEIGHTS]
+        counts = self._views[self.COUNTS]
+        attendance = self._views[self.ATTENDANCE]
+        consensus = self._views[self.CONSENSUS]
+        results = self._views[self.RESULTS]
+        for row in range(start, end):
+            base = row * self.STRIDE
+            count = counts[row]
+            row_grades = grade_view[base : base + count].tolist()
+            row_weights = weight_view[base : base + count].tolist()
+            has_reached_minimum = bool(attendance[row])
+            if validate:
+                validate_row(row, row_grades, row_weights, has_reached_minimum)
+            weighted_average = calculate_weighted_average(row_grades, row_weights)
+            result = rules.apply(
+                weighted_average, has_reached_minimum, bool(consensus[row])
+            )
+            output = row * self.RESULT_WIDTH
+            results[output] = result.weighted_average
+            results[output + 1] = result.extra_points_applied
+            results[output + 2] = result.final_grade
+
+    def read_results(self) -> List[GradeCalculationResult]:
+        """
+        Build results from the output block.
+
+        Returns:
+            One GradeCalculationResult per student.
+        """
+        values = self._views[self.RESULTS].tolist()
+        attendance = self._views[self.ATTENDANCE]
+        results = []
+        for row in range(self._descriptor.row_count):
+            output = row * self.RESULT_WIDTH
+            results.append(
+                GradeCalculationResult(
+                    weighted_average=values[output],
+                    attendance_penalty_applied=not attendance[row],
+                    extra_points_applied=values[output + 1],
+                    final_grade=values[output + 2],
+                )
+            )
+        return results
+
+    def close(self) -> None:
+        """Detach from the blocks, unlinking them if this instance owns them."""
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        for block in self._blocks.values():
+            block.close()
+            if self._owner:
+                block.unlink()
+        self._blocks = {}
+
+    def __enter__(self) -> "SharedRoster":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Release the blocks when leaving the context."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation of the shared roster."""
+        return f"SharedRoster(rows={self._descriptor.row_count}, owner={self._owner})"
+
+
+def _grade_shared_slice(
+    descriptor: SharedRosterDescriptor,
+    rules: GradingRules,
+    start: int,
+    end: int,
+    validate: bool,
+) -> Tuple[int, int]:
+    """
+    Worker entry point: attach by name, grade a slice in place, detach.
+
+    Returns:
+        The graded (start, end) range.
+    """
+    shared = SharedRoster.attach(descriptor)
+    try:
+        shared.grade_slice(rules, start, end, validate)
+    finally:
+        shared.close()
+    return start, end
+
+
+class SharedMemoryBatchGradeCalculator(BatchGradeCalculator):
+    """
+    Batch calculator whose workers read and write a shared-memory roster.
+
+    The roster is copied once into shared blocks; each worker receives only
+    the block names and a row range, grades it in place and writes into the
+    shared output block, so no per-student data is pickled.
+    """
+
+    def calculate_batch(
+        self,
+        grades: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]],
+        attendance: Sequence[bool],
+        consensus: Sequence[bool],
+        validate: bool = True,
+    ) -> List[GradeCalculationResult]:
+        """
+        Grade a roster given as columns through shared memory.
+
+        Args:
+            grades: Grade vector per student.
+            weights: Weight vector per student.
+            attendance: Whether each student met minimum attendance.
+            consensus: Whether extra points apply to each student's year.
+            validate: Whether to check each row.
+
+        Returns:
+            One GradeCalculationResult per student, in input order.
+
+        Raises:
+            ValueError: If columns differ in length or any row is invalid.
+        """
+        row_count = len(grades)
+        if self._workers == self.SEQUENTIAL_WORKERS or row_count <= self._chunk_size:
+            return super().calculate_batch(
+                grades, weights, attendance, consensus, validate
+            )
+
+        with SharedRoster.create(grades, weights, attendance, consensus) as shared:
+            executor = self._get_executor()
+            futures = [
+                executor.submit(
+                    _grade_shared_slice,
+                    shared.descriptor,
+                    self._rules,
+                    start,
+                    min(start + self._chunk_size, row_count),
+                    validate,
+                )
+                for start in range(0, row_count, self._chunk_size)
+            ]
+            for future in futures:
+                future.result()
+            return shared.read_results()
+
+    def __repr__(self) -> str:
+        """String representation of the shared-memory batch calculator."""
+        return (
+            f"SharedMemoryBatchGradeCalculator(workers={self._workers}, "
+            f"chunk_size={self._chunk_size}, rules={self._rules})"
+        )
@@ -0,0 +1,415 @@
+"""
+Module for grading roster files in overlapping read/validate/grade/write stages.
+"""
+
+import csv
+import logging
+import queue
+import threading
+import time
+from itertools import islice
+from typing import Callable, Dict, List, Optional
+
+from src.batch_grader import BatchGradeCalculator
+from src.batch_runner import BatchRunner, BatchRunSummary
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grading_logging import get_logger, log_event
+from src.result_cache import ResultCache
+from src.rounding_policy import RoundingPolicy
+from src.roster_columns import RosterColumns
+from src.roster_io import ENCODING, iter_roster
+from src.validation import BatchValidator, ValidationReport
+
+_END = object()
+
+logger = get_logger("streaming_pipeline")
+
+
+class _Cancelled(Exception):
+    """Raised inside a stage when another stage failed."""
+
+
+class StageMetrics:
+    """
+    Counters of one pipeline stage.
+
+    Attributes:
+        name: Name of the stage.
+        chunks: Number of chunks handled.
+        rows: Number of rows handled.
+        busy_seconds: Time spent working, excluding waits on the queues.
+    """
+
+    def __init__(self, name: str):
+        """Initialize the stage metrics."""
+        self.name = name
+        self.chunks = 0
+        self.rows = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Get the rows handled per busy second."""
+        if self.busy_seconds <= 0:
+            return 0.0
+        return self.rows / self.busy_seconds
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the metrics to a dictionary.
+
+        Returns:
+            Dictionary with the stage counters.
+        """
+        return {
+            "stage": self.name,
+            "chunks": self.chunks,
+            "rows": self.rows,
+            "busy_s": round(self.busy_seconds, 3),
+            "throughput_per_s": round(self.throughput, 1),
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the stage metrics."""
+        return (
+            f"StageMetrics(stage={self.name}, rows={self.rows}, "
+            f"throughput={self.throughput:.1f}/s)"
+        )
+
+
+class PipelineSummary(BatchRunSummary):
+    """
+    Outcome of one pipelined run.
+
+    Attributes:
+        stages: Metrics of every stage, in pipeline order.
+    """
+
+    def __init__(
+        self,
+        rows_processed: int,
+        duration: float,
+        stages: List[StageMetrics],
+        validation_report: Optional[ValidationReport] = None,
+    ):
+        """Initialize the pipeline summary."""
+        super().__init__(rows_processed, duration, validation_report)
+        self.stages = stages
+
+    def __repr__(self) -> str:
+        """String representation of the summary."""
+        return (
+            f"PipelineSummary(rows={self.rows_processed}, "
+            f"duration={self.duration:.3f}s, stages={len(self.stages)})"
+        )
+
+
+class StreamingPipeline:
+    """
+    Grades a roster file with one thread per stage linked by bounded queues.
+
+    Reading, validation, grading and writing run concurrently on chunks of
+    rows. A full queue blocks the stage feeding it, so at most
+    queue_size chunks wait between two stages and memory use depends on
+    chunk_size and queue_size, not on the size of the file. File I/O
+    releases the GIL, so it overlaps with validation and grading; a batch
+    calculator with workers moves grading off the GIL as well. If a stage
+    fails, every other stage stops at its next queue operation and the
+    error is raised from run(). The stages log the same events as
+    BatchRunner.
+    """
+
+    READ_STAGE = "read"
+    VALIDATE_STAGE = "validate"
+    GRADE_STAGE = "grade"
+    WRITE_STAGE = "write"
+    DEFAULT_CHUNK_SIZE = 1000
+    DEFAULT_QUEUE_SIZE = 4
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        extra_points_policy: ExtraPointsPolicy,
+        current_year_index: int,
+        batch_calculator: Optional[BatchGradeCalculator] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        skip_invalid: bool = False,
+        result_cache: Optional[ResultCache] = None,
+        rounding_policy: Optional[RoundingPolicy] = None,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            extra_points_policy: Policy for extra points.
+            current_year_index: Index of current academic year.
+            batch_calculator: Calculator to grade with. Defaults to a
+                              sequential calculator with current rules.
+            chunk_size: Number of rows moved between stages at a time.
+            queue_size: Maximum chunks waiting between two stages.
+            skip_invalid: Leave invalid rows out and report them in the
+                          summary instead of stopping at the first one.
+            result_cache: On-disk cache of graded chunks, reused across runs.
+            rounding_policy: Rounding of the written numbers. Defaults to
+                             the 2 decimals of get_details().
+
+        Raises:
+            ValueError: If the year is out of range or a size is invalid.
+        """
+        for value, name in ((chunk_size, "chunk_size"), (queue_size, "queue_size")):
+            if not isinstance(value, int) or value <= 0:
+                raise ValueError(f"{name} must be a positive integer")
+        extra_points_policy.calculate_extra_points(current_year_index)
+
+        self._has_consensus = extra_points_policy.has_consensus_for_year(
+            current_year_index
+        )
+        self._batch_calculator = (
+            batch_calculator if batch_calculator is not None else BatchGradeCalculator()
+        )
+        self._chunk_size = chunk_size
+        self._queue_size = queue_size
+        self._skip_invalid = skip_invalid
+        self._result_cache = result_cache
+        self._rounding_policy = rounding_policy
+        self._validator = BatchValidator()
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+        self._validation_report = ValidationReport()
+
+    def run(self, input_path: str, output_path: str) -> PipelineSummary:
+        """
+        Grade every student of a roster file.
+
+        Args:
+            input_path: Roster file (.csv, .jsonl or .bin).
+            output_path: Destination CSV of results.
+
+        Returns:
+            Summary of the run with per-stage metrics.
+
+        Raises:
+            ValueError: If the roster is malformed, or a row is invalid and
+                        skip_invalid is off.
+            OSError: If a file cannot be read or written.
+        """
+        started_at = time.perf_counter()
+        self._stop = threading.Event()
+        self._errors = []
+        self._validation_report = ValidationReport()
+        metrics = [
+            StageMetrics(name)
+            for name in (
+                self.READ_STAGE,
+                self.VALIDATE_STAGE,
+                self.GRADE_STAGE,
+                self.WRITE_STAGE,
+            )
+        ]
+        queues = [queue.Queue(maxsize=self._queue_size) for _ in range(3)]
+        log_event(logger, logging.INFO, "batch_started", input=input_path, resumed=0)
+
+        with open(output_path, "w", encoding=ENCODING, newline="") as output_file:
+            writer = csv.writer(output_file)
+            writer.writerow(BatchRunner.RESULT_FIELDS)
+            threads = [
+                threading.Thread(
+                    target=self._read_stage,
+                    args=(input_path, queues[0], metrics[0]),
+                    name=self.READ_STAGE,
+                ),
+                threading.Thread(
+                    target=self._transform_stage,
+                    args=(self._validate, queues[0], queues[1], metrics[1]),
+                    name=self.VALIDATE_STAGE,
+                ),
+                threading.Thread(
+                    target=self._transform_stage,
+                    args=(self._grade, queues[1], queues[2], metrics[2]),
+                    name=self.GRADE_STAGE,
+                ),
+                threading.Thread(
+                    target=self._write_stage,
+                    args=(writer, queues[2], metrics[3]),
+                    name=self.WRITE_STAGE,
+                ),
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+        summary = PipelineSummary(
+            metrics[0].rows,
+            time.perf_counter() - started_at,
+            metrics,
+            self._validation_report,
+        )
+        log_event(
+            logger,
+            logging.INFO,
+            "batch_finished",
+            rows=summary.rows_processed,
+            skipped=summary.rows_skipped,
+            duration=round(summary.duration, 3),
+        )
+        return summary
+
+    def _read_stage(
+        self, input_path: str, sink: queue.Queue, metrics: StageMetrics
+    ) -> None:
+        """Stream the roster file into chunks."""
+        try:
+            rows = iter_roster(input_path)
+            first_row = 0
+            while True:
+                started_at = time.perf_counter()
+                chunk = RosterColumns.from_rows(islice(rows, self._chunk_size))
+                self._record(metrics, len(chunk), started_at)
+                if not len(chunk):
+                    break
+                self._put(sink, (first_row, chunk))
+                first_row += len(chunk)
+            self._put(sink, _END)
+        except _Cancelled:
+            return
+        except Exception as error:
+            self._fail(error)
+
+    def _transform_stage(
+        self,
+        work: Callable[[int, object], object],
+        source: queue.Queue,
+        sink: queue.Queue,
+        metrics: StageMetrics,
+    ) -> None:
+        """Apply work to every chunk of source and pass the result on."""
+        try:
+            while True:
+                item = self._get(source)
+                if item is _END:
+                    self._put(sink, _END)
+                    return
+                first_row, payload = item
+                started_at = time.perf_counter()
+                try:
+                    result = work(first_row, payload)
+                except ValueError:
+                    log_event(
+                        logger,
+                        logging.ERROR,
+                        "chunk_failed",
+                        exc_info=True,
+                        first_row=first_row,
+                        stage=metrics.name,
+                    )
+                    raise
+                self._record(metrics, len(payload), started_at)
+                self._put(sink, (first_row, result))
+        except _Cancelled:
+            return
+        except Exception as error:
+            self._fail(error)
+
+    def _write_stage(self, writer, source: queue.Queue, metrics: StageMetrics) -> None:
+        """Write formatted result rows."""
+        try:
+            while True:
+                item = self._get(source)
+                if item is _END:
+                    return
+                _, rows = item
+                started_at = time.perf_counter()
+                writer.writerows(rows)
+                self._record(metrics, len(rows), started_at)
+        except _Cancelled:
+            return
+        except Exception as error:
+            self._fail(error)
+
+    def _validate(self, first_row: int, chunk: RosterColumns) -> RosterColumns:
+        """Check a chunk with the Evaluation rules, dropping or rejecting rows."""
+        report = self._validator.validate_roster(chunk)
+        if report.is_valid:
+            return chunk
+        if not self._skip_invalid:
+            issue = report.issues[0]
+            raise ValueError(f"Row {first_row + issue.row}: {issue.message}")
+        BatchRunner.log_issues(report, first_row, logger)
+        self._validation_report.extend(report, first_row)
+        mask = report.valid_mask(len(chunk))
+        return RosterColumns.from_rows(
+            [row for row, keep in zip(chunk.iter_rows(), mask) if keep]
+        )
+
+    def _grade(self, first_row: int, chunk: RosterColumns) -> List[list]:
+        """Grade an already validated chunk and format its result rows."""
+        cache_key = None
+        if self._result_cache is not None:
+            cache_key = self._result_cache.chunk_key(
+                self._batch_calculator.rules,
+                self._has_consensus,
+                chunk,
+                self._rounding_policy,
+            )
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        results = self._batch_calculator.calculate_batch(
+            chunk.grades,
+            chunk.weights,
+            chunk.attendance,
+            [self._has_consensus] * len(chunk),
+            validate=False,
+        )
+        formatted = BatchRunner.format_rows(
+            chunk.student_ids, results, self._rounding_policy
+        )
+        if cache_key is not None:
+            self._result_cache.put(cache_key, formatted)
+        return formatted
+
+    def _put(self, sink: queue.Queue, item: object) -> None:
+        """Put an item, blocking while the queue is full unless cancelled."""
+        while True:
+            if self._stop.is_set():
+                raise _Cancelled()
+            try:
+                sink.put(item, timeout=self.POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, source: queue.Queue) -> object:
+        """Get an item, blocking while the queue is empty unless cancelled."""
+        while True:
+            if self._stop.is_set():
+                raise _Cancelled()
+            try:
+                return source.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+    def _fail(self, error: BaseException) -> None:
+        """Record a stage error and tell every stage to stop."""
+        self._errors.append(error)
+        self._stop.set()
+
+    @staticmethod
+    def _record(metrics: StageMetrics, rows: int, started_at: float) -> None:
+        """Add one chunk of work to a stage's metrics."""
+        metrics.busy_seconds += time.perf_counter() - started_at
+        if rows:
+            metrics.chunks += 1
+            metrics.rows += rows
+
+    def __repr__(self) -> str:
+        """String representation of the pipeline."""
+        return (
+            f"StreamingPipeline(chunk_size={self._chunk_size}, "
+            f"queue_size={self._queue_size}, calculator={self._batch_calculator})"
+        )
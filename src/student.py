@@ -2,7 +2,7 @@
 Module for managing student data and evaluations.
 """
 
-from typing import List
+from typing import List, Optional, Tuple
 
 from src.evaluation import Evaluation
 
@@ -41,6 +41,7 @@ class Student:
 
         self._student_id = student_id.strip()
         self._evaluations: List[Evaluation] = []
+        self._evaluation_view: Optional[Tuple[Evaluation, ...]] = None
         self._has_reached_minimum_attendance = has_reached_minimum_attendance
 
     @property
@@ -53,6 +54,18 @@ class Student:
         """Get a copy of the evaluations list."""
         return self._evaluations.copy()
 
+    @property
+    def evaluation_view(self) -> Tuple[Evaluation, ...]:
+        """
+        Get a read-only snapshot of the evaluations without copying.
+
+        The tuple is built once and reused until the evaluations change,
+        so read-heavy grading paths do not allocate on every access.
+        """
+        if self._evaluation_view is None:
+            self._evaluation_view = tuple(self._evaluations)
+        return self._evaluation_view
+
     @property
     def has_reached_minimum_attendance(self) -> bool:
         """Check if student met minimum attendance."""
@@ -90,10 +103,12 @@ class Student:
             raise ValueError(f"Cannot add more than {self.MAX_EVALUATIONS} evaluations")
 
         self._evaluations.append(evaluation)
+        self._evaluation_view = None
 
     def clear_evaluations(self) -> None:
         """Remove all evaluations from the student's record."""
         self._evaluations.clear()
+        self._evaluation_view = None
 
     def get_evaluation_count(self) -> int:
         """
@@ -0,0 +1,326 @@
+"""
+Module for keeping the students of a term indexed by identifier.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.roster_columns import RosterColumns
+from src.student import Student
+
+
+class StudentRegistry:
+    """
+    Students indexed by normalized identifier, section and attendance.
+
+    Every lookup and update is a dictionary operation, so corrections stay
+    constant-time on large rosters. Iteration follows registration order;
+    replacing a student keeps their position, so batch output built from
+    the registry is deterministic.
+
+    Attendance changes must go through set_attendance() (or an upsert) for
+    the attendance index to stay current.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._students: Dict[str, Student] = {}
+        self._section_by_student: Dict[str, str] = {}
+        # Dictionaries used as ordered sets: O(1) removal, stable iteration.
+        self._students_by_section: Dict[str, Dict[str, None]] = {}
+        self._students_by_attendance: Dict[bool, Dict[str, None]] = {
+            True: {},
+            False: {},
+        }
+        # The attendance each student is indexed under. Student's setter is
+        # public, so the live attribute may no longer match the index.
+        self._attendance_by_student: Dict[str, bool] = {}
+
+    @staticmethod
+    def normalize_id(student_id: str) -> str:
+        """
+        Normalize an identifier the way Student does.
+
+        Args:
+            student_id: Identifier to normalize.
+
+        Returns:
+            The identifier without surrounding whitespace.
+
+        Raises:
+            ValueError: If student_id is not a non-empty string.
+        """
+        if not isinstance(student_id, str) or not student_id.strip():
+            raise ValueError("Student ID must be a non-empty string")
+        return student_id.strip()
+
+    def add(self, student: Student, section: Optional[str] = None) -> None:
+        """
+        Register a new student.
+
+        Args:
+            student: Student to register.
+            section: Course section of the student, if any.
+
+        Raises:
+            ValueError: If the student is already registered or the section
+                        is invalid.
+        """
+        self._check_student(student)
+        if student.student_id in self._students:
+            raise ValueError(f"Student {student.student_id} is already registered")
+        self.upsert(student, section)
+
+    def upsert(self, student: Student, section: Optional[str] = None) -> bool:
+        """
+        Register a student or replace the registered one with the same id.
+
+        Args:
+            student: Student to store.
+            section: Course section of the student. None keeps the current
+                     section of a replaced student.
+
+        Returns:
+            True if the student was new, False if one was replaced.
+
+        Raises:
+            ValueError: If student is not a Student or the section is invalid.
+        """
+        self._check_student(student)
+        if section is not None:
+            self._check_section(section)
+
+        student_id = student.student_id
+        previous = self._students.get(student_id)
+        self._students[student_id] = student
+        self._index_attendance(student_id, student.has_reached_minimum_attendance)
+        if section is not None:
+            self._move_to_section(student_id, section)
+        return previous is None
+
+    def upsert_many(
+        self, students: Iterable[Student], section: Optional[str] = None
+    ) -> Tuple[int, int]:
+        """
+        Register or replace many students.
+
+        Args:
+            students: Students to store. A later duplicate replaces an
+                      earlier one.
+            section: Course section of every student. None keeps the current
+                     section of replaced students.
+
+        Returns:
+            Number of students added and number replaced.
+
+        Raises:
+            ValueError: If any element is not a Student or the section is
+                        invalid. Nothing is stored in that case.
+        """
+        students = list(students)
+        for student in students:
+            self._check_student(student)
+        if section is not None:
+            self._check_section(section)
+
+        added = 0
+        for student in students:
+            if self.upsert(student, section):
+                added += 1
+        return added, len(students) - added
+
+    def get(self, student_id: str) -> Student:
+        """
+        Get a registered student.
+
+        Args:
+            student_id: Identifier, normalized before the lookup.
+
+        Returns:
+            The registered student.
+
+        Raises:
+            ValueError: If the identifier is invalid or not registered.
+        """
+        student = self._students.get(self.normalize_id(student_id))
+        if student is None:
+            raise ValueError(f"Student {student_id.strip()} is not registered")
+        return student
+
+    def find(self, student_id: str) -> Optional[Student]:
+        """
+        Get a registered student, if any.
+
+        Args:
+            student_id: Identifier, normalized before the lookup.
+
+        Returns:
+            The registered student, or None.
+        """
+        if not isinstance(student_id, str):
+            return None
+        return self._students.get(student_id.strip())
+
+    def remove(self, student_id: str) -> Student:
+        """
+        Unregister a student.
+
+        Args:
+            student_id: Identifier, normalized before the lookup.
+
+        Returns:
+            The removed student.
+
+        Raises:
+            ValueError: If the identifier is invalid or not registered.
+        """
+        student = self.get(student_id)
+        normalized = student.student_id
+        del self._students[normalized]
+        self._index_attendance(normalized, None)
+        self._move_to_section(normalized, None)
+        return student
+
+    def set_attendance(self, student_id: str, value: bool) -> None:
+        """
+        Update a student's attendance and the attendance index.
+
+        Args:
+            student_id: Identifier, normalized before the lookup.
+            value: New attendance status.
+
+        Raises:
+            ValueError: If the student is not registered or value is not a
+                        boolean.
+        """
+        student = self.get(student_id)
+        student.has_reached_minimum_attendance = value
+        self._index_attendance(student.student_id, value)
+
+    def set_section(self, student_id: str, section: Optional[str]) -> None:
+        """
+        Move a student to another section.
+
+        Args:
+            student_id: Identifier, normalized before the lookup.
+            section: New section, or None to leave every section.
+
+        Raises:
+            ValueError: If the student is not registered or the section is
+                        invalid.
+        """
+        if section is not None:
+            self._check_section(section)
+        self._move_to_section(self.get(student_id).student_id, section)
+
+    def section_of(self, student_id: str) -> Optional[str]:
+        """Get the section of a student, if any."""
+        if not isinstance(student_id, str):
+            return None
+        return self._section_by_student.get(student_id.strip())
+
+    def in_section(self, section: str) -> List[Student]:
+        """
+        Get the students of a section.
+
+        Args:
+            section: Name of the course section.
+
+        Returns:
+            The section's students, in the order they joined it.
+        """
+        members = self._students_by_section.get(section, {})
+        return [self._students[student_id] for student_id in members]
+
+    def with_attendance(self, has_reached_minimum: bool) -> List[Student]:
+        """
+        Get the students with a given attendance status.
+
+        Args:
+            has_reached_minimum: Attendance status to select.
+
+        Returns:
+            The matching students, in the order they were indexed.
+
+        Raises:
+            ValueError: If has_reached_minimum is not a boolean.
+        """
+        if not isinstance(has_reached_minimum, bool):
+            raise ValueError("has_reached_minimum_attendance must be a boolean")
+        members = self._students_by_attendance[has_reached_minimum]
+        return [self._students[student_id] for student_id in members]
+
+    @property
+    def sections(self) -> List[str]:
+        """Get the names of the sections with at least one student."""
+        return list(self._students_by_section)
+
+    def to_roster(self, section: Optional[str] = None) -> RosterColumns:
+        """
+        Convert registered students to roster columns for batch grading.
+
+        Args:
+            section: Only convert this section. Defaults to every student.
+
+        Returns:
+            The roster, in registration (or section) order.
+        """
+        students = list(self) if section is None else self.in_section(section)
+        return RosterColumns.from_students(students)
+
+    def _index_attendance(self, student_id: str, value: Optional[bool]) -> None:
+        """Move one student to the attendance index of value, or out if None."""
+        previous = self._attendance_by_student.get(student_id)
+        if previous == value:
+            return
+        if previous is not None:
+            del self._attendance_by_student[student_id]
+            del self._students_by_attendance[previous][student_id]
+        if value is not None:
+            self._students_by_attendance[value][student_id] = None
+            self._attendance_by_student[student_id] = value
+
+    def _move_to_section(self, student_id: str, section: Optional[str]) -> None:
+        """Update the section indexes of one student."""
+        previous = self._section_by_student.get(student_id)
+        if previous == section:
+            return
+        if previous is not None:
+            members = self._students_by_section[previous]
+            del members[student_id]
+            if not members:
+                del self._students_by_section[previous]
+            del self._section_by_student[student_id]
+        if section is not None:
+            self._students_by_section.setdefault(section, {})[student_id] = None
+            self._section_by_student[student_id] = section
+
+    @staticmethod
+    def _check_student(student: Student) -> None:
+        """Check that a value is a Student."""
+        if not isinstance(student, Student):
+            raise ValueError("Must provide a valid Student instance")
+
+    @staticmethod
+    def _check_section(section: str) -> None:
+        """Check that a section name is a non-empty string."""
+        if not isinstance(section, str) or not section:
+            raise ValueError("Section must be a non-empty string")
+
+    def __contains__(self, student_id: object) -> bool:
+        """Check if a student is registered."""
+        return isinstance(student_id, str) and student_id.strip() in self._students
+
+    def __iter__(self) -> Iterator[Student]:
+        """Iterate over the students in registration order."""
+        return iter(list(self._students.values()))
+
+    def __len__(self) -> int:
+        """Get the number of registered students."""
+        return len(self._students)
+
+    def __repr__(self) -> str:
+        """String representation of the registry."""
+        return (
+            f"StudentRegistry(students={len(self._students)}, "
+            f"sections={len(self._students_by_section)})"
+        )
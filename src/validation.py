@@ -0,0 +1,378 @@
+"""
+Module for validating whole rosters without raising per record.
+
+Evaluation, Student and GradeCalculator keep raising ValueError for single
+objects; this module applies the same rules to column data and collects
+every problem into a compact report instead.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+from src.roster_columns import RosterColumns
+
+
+class ValidationIssue:
+    """
+    One problem found in a roster.
+
+    Attributes:
+        row: Index of the offending row.
+        field: Name of the offending field.
+        code: Machine-readable error code.
+        params: Values substituted into the message template.
+    """
+
+    __slots__ = ("row", "field", "code", "params")
+
+    def __init__(self, row: int, field: str, code: str, params: Dict[str, object]):
+        """Initialize the validation issue."""
+        self.row = row
+        self.field = field
+        self.code = code
+        self.params = params
+
+    @property
+    def message(self) -> str:
+        """Get the human-readable message, rendered on demand."""
+        return BatchValidator.MESSAGE_TEMPLATES[self.code].format(**self.params)
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the issue to a dictionary.
+
+        Returns:
+            Dictionary with row, field, code and message.
+        """
+        return {
+            "row": self.row,
+            "field": self.field,
+            "code": self.code,
+            "message": self.message,
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the issue."""
+        return f"ValidationIssue(row={self.row}, field={self.field}, code={self.code})"
+
+
+class ValidationReport:
+    """
+    Every problem found in a roster, in row order.
+
+    Attributes:
+        issues: The validation issues.
+    """
+
+    def __init__(self, issues: Optional[List[ValidationIssue]] = None):
+        """Initialize the validation report."""
+        self.issues = issues if issues is not None else []
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if no problems were found."""
+        return not self.issues
+
+    @property
+    def invalid_rows(self) -> List[int]:
+        """Get the sorted indices of rows with at least one problem."""
+        return sorted({issue.row for issue in self.issues})
+
+    def count_by_code(self) -> Dict[str, int]:
+        """
+        Count the problems per error code.
+
+        Returns:
+            Number of issues per code.
+        """
+        counts: Dict[str, int] = {}
+        for issue in self.issues:
+            counts[issue.code] = counts.get(issue.code, 0) + 1
+        return counts
+
+    def valid_mask(self, row_count: int) -> List[bool]:
+        """
+        Get a mask of the rows without problems.
+
+        Args:
+            row_count: Number of rows validated.
+
+        Returns:
+            True for every valid row.
+        """
+        mask = [True] * row_count
+        for issue in self.issues:
+            mask[issue.row] = False
+        return mask
+
+    def extend(self, other: "ValidationReport", row_offset: int = 0) -> None:
+        """
+        Append the issues of another report, e.g. from a later chunk.
+
+        Args:
+            other: Report to append.
+            row_offset: Value added to the row indices of the other report.
+        """
+        for issue in other.issues:
+            self.issues.append(
+                ValidationIssue(
+                    issue.row + row_offset, issue.field, issue.code, issue.params
+                )
+            )
+
+    def __len__(self) -> int:
+        """Get the number of issues."""
+        return len(self.issues)
+
+    def __repr__(self) -> str:
+        """String representation of the report."""
+        return (
+            f"ValidationReport(issues={len(self.issues)}, "
+            f"invalid_rows={len(self.invalid_rows)})"
+        )
+
+
+class BatchValidator:
+    """
+    Checks column data against the Evaluation and GradeCalculator rules.
+
+    The hot loop only compares values and appends issues; nothing is raised
+    and messages are rendered lazily from templates.
+    """
+
+    STUDENT_ID_EMPTY = "student_id_empty"
+    NOT_A_LIST = "not_a_list"
+    LENGTH_MISMATCH = "length_mismatch"
+    NO_EVALUATIONS = "no_evaluations"
+    TOO_MANY_EVALUATIONS = "too_many_evaluations"
+    GRADE_NOT_NUMBER = "grade_not_number"
+    GRADE_OUT_OF_RANGE = "grade_out_of_range"
+    WEIGHT_NOT_NUMBER = "weight_not_number"
+    WEIGHT_OUT_OF_RANGE = "weight_out_of_range"
+    WEIGHT_SUM = "weight_sum"
+    ATTENDANCE_NOT_BOOLEAN = "attendance_not_boolean"
+    YEAR_OUT_OF_RANGE = "year_out_of_range"
+
+    MESSAGE_TEMPLATES = {
+        STUDENT_ID_EMPTY: "Student ID must be a non-empty string",
+        NOT_A_LIST: "{field} must be a list of numbers",
+        LENGTH_MISMATCH: "Got {grades} grades but {weights} weights",
+        NO_EVALUATIONS: "Must have at least one evaluation",
+        TOO_MANY_EVALUATIONS: "Cannot have more than {maximum} evaluations",
+        GRADE_NOT_NUMBER: "Grade {position} must be a number",
+        GRADE_OUT_OF_RANGE: "Grade {position} must be between {minimum} and {maximum}",
+        WEIGHT_NOT_NUMBER: "Weight {position} must be a number",
+        WEIGHT_OUT_OF_RANGE: (
+            "Weight {position} must be between {minimum} and {maximum}"
+        ),
+        WEIGHT_SUM: "Total weight must sum to {expected}, got {total}",
+        ATTENDANCE_NOT_BOOLEAN: "has_reached_minimum_attendance must be a boolean",
+        YEAR_OUT_OF_RANGE: "Year index must be between 0 and {maximum}, got {year}",
+    }
+
+    def validate(
+        self,
+        grades: Sequence[Sequence[float]],
+        weights: Sequence[Sequence[float]],
+        attendance: Optional[Sequence[bool]] = None,
+        student_ids: Optional[Sequence[str]] = None,
+    ) -> ValidationReport:
+        """
+        Validate a roster given as columns.
+
+        Args:
+            grades: Grade vector per student.
+            weights: Weight vector per student.
+            attendance: Optional attendance flag per student.
+            student_ids: Optional identifier per student.
+
+        Returns:
+            Report with every problem found.
+
+        Raises:
+            ValueError: If the columns differ in length, which is a caller
+                        bug rather than a data problem.
+        """
+        row_count = len(grades)
+        optional_columns = [
+            column for column in (attendance, student_ids) if column is not None
+        ]
+        if len(weights) != row_count or any(
+            len(column) != row_count for column in optional_columns
+        ):
+            raise ValueError("All roster columns must have the same length")
+
+        issues: List[ValidationIssue] = []
+        for row in range(row_count):
+            if student_ids is not None:
+                student_id = student_ids[row]
+                if not isinstance(student_id, str) or not student_id.strip():
+                    issues.append(
+                        ValidationIssue(row, "student_id", self.STUDENT_ID_EMPTY, {})
+                    )
+            if attendance is not None and not isinstance(attendance[row], bool):
+                issues.append(
+                    ValidationIssue(
+                        row, "attendance", self.ATTENDANCE_NOT_BOOLEAN, {}
+                    )
+                )
+            self._validate_evaluations(row, grades[row], weights[row], issues)
+        return ValidationReport(issues)
+
+    def validate_roster(self, roster: RosterColumns) -> ValidationReport:
+        """
+        Validate every column of a roster.
+
+        Args:
+            roster: The roster to validate.
+
+        Returns:
+            Report with every problem found.
+        """
+        return self.validate(
+            roster.grades, roster.weights, roster.attendance, roster.student_ids
+        )
+
+    def validate_years(
+        self,
+        year_indices: Sequence[int],
+        extra_points_policy: ExtraPointsPolicy,
+    ) -> ValidationReport:
+        """
+        Validate a year index column against the years of a policy.
+
+        Args:
+            year_indices: Academic year index (0-based) per student.
+            extra_points_policy: Policy holding the consensus of every year.
+
+        Returns:
+            Report with one issue per row whose year is out of range.
+        """
+        maximum = len(extra_points_policy.bonus_table) - 1
+        return ValidationReport(
+            [
+                ValidationIssue(
+                    row,
+                    "year",
+                    self.YEAR_OUT_OF_RANGE,
+                    {"maximum": maximum, "year": year_indices[row]},
+                )
+                for row in extra_points_policy.invalid_year_rows(year_indices)
+            ]
+        )
+
+    def _validate_evaluations(
+        self,
+        row: int,
+        row_grades: Sequence[float],
+        row_weights: Sequence[float],
+        issues: List[ValidationIssue],
+    ) -> None:
+        """Append the problems of one row's evaluations to issues."""
+        for field, values in (("grades", row_grades), ("weights", row_weights)):
+            if not self._is_list(values):
+                issues.append(
+                    ValidationIssue(row, field, self.NOT_A_LIST, {"field": field})
+                )
+                return
+        count = len(row_grades)
+        if count != len(row_weights):
+            issues.append(
+                ValidationIssue(
+                    row,
+                    "weights",
+                    self.LENGTH_MISMATCH,
+                    {"grades": count, "weights": len(row_weights)},
+                )
+            )
+            return
+        if count == 0:
+            issues.append(ValidationIssue(row, "grades", self.NO_EVALUATIONS, {}))
+            return
+        if count > GradeCalculator.MAX_EVALUATIONS:
+            issues.append(
+                ValidationIssue(
+                    row,
+                    "grades",
+                    self.TOO_MANY_EVALUATIONS,
+                    {"maximum": GradeCalculator.MAX_EVALUATIONS},
+                )
+            )
+
+        weights_are_numbers = True
+        for position in range(count):
+            grade = row_grades[position]
+            if not isinstance(grade, (int, float)):
+                issues.append(
+                    ValidationIssue(
+                        row, "grades", self.GRADE_NOT_NUMBER, {"position": position}
+                    )
+                )
+            elif not Evaluation.MIN_GRADE <= grade <= Evaluation.MAX_GRADE:
+                issues.append(
+                    ValidationIssue(
+                        row,
+                        "grades",
+                        self.GRADE_OUT_OF_RANGE,
+                        {
+                            "position": position,
+                            "minimum": Evaluation.MIN_GRADE,
+                            "maximum": Evaluation.MAX_GRADE,
+                        },
+                    )
+                )
+
+            weight = row_weights[position]
+            if not isinstance(weight, (int, float)):
+                weights_are_numbers = False
+                issues.append(
+                    ValidationIssue(
+                        row, "weights", self.WEIGHT_NOT_NUMBER, {"position": position}
+                    )
+                )
+            elif not Evaluation.MIN_WEIGHT <= weight <= Evaluation.MAX_WEIGHT:
+                issues.append(
+                    ValidationIssue(
+                        row,
+                        "weights",
+                        self.WEIGHT_OUT_OF_RANGE,
+                        {
+                            "position": position,
+                            "minimum": Evaluation.MIN_WEIGHT,
+                            "maximum": Evaluation.MAX_WEIGHT,
+                        },
+                    )
+                )
+
+        if weights_are_numbers:
+            total_weight = sum(row_weights)
+            if (
+                abs(total_weight - GradeCalculator.EXPECTED_TOTAL_WEIGHT)
+                > GradeCalculator.WEIGHT_TOLERANCE
+            ):
+                issues.append(
+                    ValidationIssue(
+                        row,
+                        "weights",
+                        self.WEIGHT_SUM,
+                        {
+                            "expected": GradeCalculator.EXPECTED_TOTAL_WEIGHT,
+                            "total": total_weight,
+                        },
+                    )
+                )
+
+    @staticmethod
+    def _is_list(values: object) -> bool:
+        """Check if a value can hold one number per evaluation."""
+        return (
+            hasattr(values, "__len__")
+            and hasattr(values, "__getitem__")
+            and not isinstance(values, (str, bytes, dict))
+        )
+
+    def __repr__(self) -> str:
+        """String representation of the validator."""
+        return "BatchValidator()"
@@ -0,0 +1,323 @@
+"""
+Module for evaluation weight templates shared by a whole course section.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.batch_grader import GradingRules
+from src.evaluation import Evaluation
+from src.grade_calculator import GradeCalculationResult, GradeCalculator
+
+
+class WeightTemplate:
+    """
+    Evaluation weights validated once and shared by every student of a course.
+
+    The weights are stored as fractions (weight / 100), so a student's
+    weighted average is a plain dot product with their grade vector and
+    matches GradeCalculator exactly.
+    """
+
+    def __init__(
+        self,
+        weights: Sequence[float],
+        rules: Optional[GradingRules] = None,
+    ):
+        """
+        Initialize the weight template.
+
+        Args:
+            weights: Percentage weight of each evaluation, in order.
+            rules: Grading rules to apply. Defaults to the current rules.
+
+        Raises:
+            ValueError: If the weights would be rejected by GradeCalculator.
+        """
+        self._validate_weights(weights)
+        self._weights: Tuple[float, ...] = tuple(float(weight) for weight in weights)
+        self._fractions: Tuple[float, ...] = tuple(
+            weight / Evaluation.PERCENTAGE_DIVISOR for weight in self._weights
+        )
+        self._rules = rules if rules is not None else GradingRules()
+
+    @staticmethod
+    def _validate_weights(weights: Sequence[float]) -> None:
+        """Apply the Evaluation and GradeCalculator weight rules once."""
+        if not isinstance(weights, (list, tuple)):
+            raise ValueError("Weights must be a list or tuple")
+        if len(weights) == 0:
+            raise ValueError("Must have at least one evaluation")
+        if len(weights) > GradeCalculator.MAX_EVALUATIONS:
+            raise ValueError(
+                f"Cannot have more than {GradeCalculator.MAX_EVALUATIONS} evaluations"
+            )
+        for weight in weights:
+            if not isinstance(weight, (int, float)):
+                raise ValueError("Weight must be a number")
+            if not Evaluation.MIN_WEIGHT <= weight <= Evaluation.MAX_WEIGHT:
+                raise ValueError(
+                    f"Weight must be between {Evaluation.MIN_WEIGHT} "
+                    f"and {Evaluation.MAX_WEIGHT}"
+                )
+        total_weight = sum(weights)
+        if (
+            abs(total_weight - GradeCalculator.EXPECTED_TOTAL_WEIGHT)
+            > GradeCalculator.WEIGHT_TOLERANCE
+        ):
+            raise ValueError(
+                f"Total weight must sum to {GradeCalculator.EXPECTED_TOTAL_WEIGHT}, "
+                f"got {total_weight}"
+            )
+
+    @property
+    def weights(self) -> Tuple[float, ...]:
+        """Get the percentage weights."""
+        return self._weights
+
+    @property
+    def fractions(self) -> Tuple[float, ...]:
+        """Get the weights as fractions of the final grade."""
+        return self._fractions
+
+    @property
+    def rules(self) -> GradingRules:
+        """Get the grading rules."""
+        return self._rules
+
+    def __len__(self) -> int:
+        """Get the number of evaluations."""
+        return len(self._weights)
+
+    def weighted_average(self, grades: Sequence[float]) -> float:
+        """
+        Calculate the weighted average of a grade vector.
+
+        Args:
+            grades: One grade per evaluation of the template.
+
+        Returns:
+            The weighted average grade.
+
+        Raises:
+            ValueError: If the number of grades does not match the template.
+        """
+        if len(grades) != len(self._fractions):
+            raise ValueError(
+                f"Expected {len(self._fractions)} grades, got {len(grades)}"
+            )
+        return sum(grade * fraction for grade, fraction in zip(grades, self._fractions))
+
+    def calculate(
+        self,
+        grades: Sequence[float],
+        has_reached_minimum: bool,
+        has_consensus: bool,
+        validate: bool = True,
+    ) -> GradeCalculationResult:
+        """
+        Grade one student from a grade vector.
+
+        Args:
+            grades: One grade per evaluation of the template.
+            has_reached_minimum: Whether the student met minimum attendance.
+            has_consensus: Whether teachers agreed on extra points that year.
+            validate: Whether to check the grade range.
+
+        Returns:
+            GradeCalculationResult with detailed breakdown.
+
+        Raises:
+            ValueError: If the grades do not fit the template.
+        """
+        if validate:
+            self._validate_grades(grades)
+        return self._rules.apply(
+            self.weighted_average(grades), has_reached_minimum, has_consensus
+        )
+
+    def calculate_batch(
+        self,
+        grades: Sequence[Sequence[float]],
+        attendance: Sequence[bool],
+        consensus: Sequence[bool],
+        validate: bool = True,
+    ) -> List[GradeCalculationResult]:
+        """
+        Grade a section of students sharing this template.
+
+        Args:
+            grades: Grade vector per student.
+            attendance: Whether each student met minimum attendance.
+            consensus: Whether extra points apply to each student's year.
+            validate: Whether to check the grade range of each vector. The
+                      grade count is always checked.
+
+        Returns:
+            One GradeCalculationResult per student, in input order.
+
+        Raises:
+            ValueError: If columns differ in length or a grade vector is
+                        invalid.
+        """
+        if not len(grades) == len(attendance) == len(consensus):
+            raise ValueError("All roster columns must have the same length")
+        fractions = self._fractions
+        count = len(fractions)
+        apply = self._rules.apply
+        results = []
+        for row, row_grades in enumerate(grades):
+            if len(row_grades) != count or (
+                validate and not self._grades_in_range(row_grades)
+            ):
+                try:
+                    self._validate_grades(row_grades)
+                except ValueError as error:
+                    raise ValueError(f"Row {row}: {error}") from error
+            weighted_average = sum(
+                grade * fraction for grade, fraction in zip(row_grades, fractions)
+            )
+            results.append(apply(weighted_average, attendance[row], consensus[row]))
+        return results
+
+    def to_evaluations(self, grades: Sequence[float]) -> List[Evaluation]:
+        """
+        Build Evaluation objects for the single-student path.
+
+        Args:
+            grades: One grade per evaluation of the template.
+
+        Returns:
+            The evaluations, paired with the template weights.
+
+        Raises:
+            ValueError: If the grades do not fit the template.
+        """
+        if len(grades) != len(self._weights):
+            raise ValueError(
+                f"Expected {len(self._weights)} grades, got {len(grades)}"
+            )
+        return [
+            Evaluation(grade, weight) for grade, weight in zip(grades, self._weights)
+        ]
+
+    @staticmethod
+    def _grades_in_range(grades: Sequence[float]) -> bool:
+        """Check the Evaluation grade range with min/max only."""
+        try:
+            return (
+                min(grades) >= Evaluation.MIN_GRADE
+                and max(grades) <= Evaluation.MAX_GRADE
+            )
+        except TypeError:
+            return False
+
+    def _validate_grades(self, grades: Sequence[float]) -> None:
+        """Check the grade count and the Evaluation grade range."""
+        if len(grades) != len(self._weights):
+            raise ValueError(
+                f"Expected {len(self._weights)} grades, got {len(grades)}"
+            )
+        for grade in grades:
+            if not isinstance(grade, (int, float)):
+                raise ValueError("Grade must be a number")
+            if not Evaluation.MIN_GRADE <= grade <= Evaluation.MAX_GRADE:
+                raise ValueError(
+                    f"Grade must be between {Evaluation.MIN_GRADE} "
+                    f"and {Evaluation.MAX_GRADE}"
+                )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two templates by weights and rules."""
+        if not isinstance(other, WeightTemplate):
+            return NotImplemented
+        return self._weights == other._weights and self._rules == other._rules
+
+    def __hash__(self) -> int:
+        """Hash the template by weights and rules."""
+        return hash((self._weights, self._rules))
+
+    def __repr__(self) -> str:
+        """String representation of the weight template."""
+        return f"WeightTemplate(weights={list(self._weights)})"
+
+
+class WeightTemplateRegistry:
+    """
+    Weight templates registered once per course.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._templates: Dict[str, WeightTemplate] = {}
+
+    def register(
+        self,
+        course: str,
+        weights: Sequence[float],
+        rules: Optional[GradingRules] = None,
+    ) -> WeightTemplate:
+        """
+        Validate and store the weights of a course.
+
+        Args:
+            course: Identifier of the course or section.
+            weights: Percentage weight of each evaluation, in order.
+            rules: Grading rules to apply. Defaults to the current rules.
+
+        Returns:
+            The registered template.
+
+        Raises:
+            ValueError: If the course is empty or the weights are invalid.
+        """
+        if not isinstance(course, str) or not course.strip():
+            raise ValueError("Course must be a non-empty string")
+        template = WeightTemplate(weights, rules)
+        self._templates[course.strip()] = template
+        return template
+
+    def get(self, course: str) -> WeightTemplate:
+        """
+        Get the template of a course.
+
+        Args:
+            course: Identifier of the course or section.
+
+        Returns:
+            The registered template.
+
+        Raises:
+            ValueError: If the course has no template.
+        """
+        template = (
+            self._templates.get(course.strip()) if isinstance(course, str) else None
+        )
+        if template is None:
+            raise ValueError(f"No weight template registered for course {course}")
+        return template
+
+    def unregister(self, course: str) -> None:
+        """
+        Remove the template of a course, if any.
+
+        Args:
+            course: Identifier of the course or section.
+        """
+        self._templates.pop(course.strip(), None)
+
+    @property
+    def courses(self) -> List[str]:
+        """Get the courses with a template, sorted."""
+        return sorted(self._templates)
+
+    def __contains__(self, course: str) -> bool:
+        """Check if a course has a template."""
+        return isinstance(course, str) and course.strip() in self._templates
+
+    def __len__(self) -> int:
+        """Get the number of registered courses."""
+        return len(self._templates)
+
+    def __repr__(self) -> str:
+        """String representation of the registry."""
+        return f"WeightTemplateRegistry(courses={len(self._templates)})"
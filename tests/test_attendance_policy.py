@@ -4,7 +4,8 @@ Unit tests for the AttendancePolicy class.
 
 import pytest
 
-from src.attendance_policy import AttendancePolicy
+from src.attendance_policy import AttendancePolicy, SessionAttendanceLog
+from src.batch_grader import BatchGradeCalculator
 
 
 class TestAttendancePolicy:
@@ -87,3 +88,79 @@ class TestAttendancePolicy:
         result2 = policy2.apply_penalty(base_grade)
 
         assert result1 == result2
+
+
+class TestSessionAttendanceLog:
+    """Test cases for SessionAttendanceLog class."""
+
+    def test_should_count_attended_sessions_per_student(self):
+        """Test popcount of each bitmap."""
+        attendance_log = SessionAttendanceLog([0b1111, 0b0101, 0], 4)
+        assert attendance_log.attended_counts() == [4, 2, 0]
+
+    def test_should_calculate_percentages(self):
+        """Test attendance percentages for the roster."""
+        attendance_log = SessionAttendanceLog([0b1111, 0b0101, 0], 4)
+        assert attendance_log.percentages() == [100.0, 50.0, 0.0]
+
+    def test_should_build_eligibility_mask_with_default_threshold(self):
+        """Test the default 70% threshold."""
+        attendance_log = SessionAttendanceLog([0b1111111, 0b1111110, 0b0111110], 10)
+        assert attendance_log.eligibility_mask() == [True, False, False]
+
+    def test_should_accept_configurable_threshold(self):
+        """Test a custom attendance threshold."""
+        attendance_log = SessionAttendanceLog([0b0101], 4)
+        assert attendance_log.eligibility_mask(50.0) == [True]
+        assert attendance_log.eligibility_mask(50.1) == [False]
+
+    def test_should_build_from_session_flags(self):
+        """Test building bitmaps from per-session flags."""
+        attendance_log = SessionAttendanceLog.from_sessions(
+            [[True, False, True], [False, False, False]], 3
+        )
+        assert attendance_log.bitmaps == [0b101, 0]
+
+    def test_should_mark_attended_session(self):
+        """Test recording attendance incrementally."""
+        attendance_log = SessionAttendanceLog([0], 2)
+        attendance_log.mark_attended(0, 1)
+        assert attendance_log.bitmaps == [0b10]
+
+    def test_should_build_policies_per_student(self):
+        """Test building one AttendancePolicy per student."""
+        policies = SessionAttendanceLog([0b11, 0b01], 2).policies(100.0)
+        assert [policy.has_reached_minimum for policy in policies] == [True, False]
+
+    def test_should_feed_mask_into_batch_grading(self):
+        """Test that the mask works as the batch attendance column."""
+        mask = SessionAttendanceLog([0b11, 0b00], 2).eligibility_mask()
+        results = BatchGradeCalculator().calculate_batch(
+            [[15.0], [15.0]], [[100.0], [100.0]], mask, [False, False]
+        )
+        assert [result.final_grade for result in results] == [15.0, 0.0]
+
+    def test_should_build_single_policy_from_bitmap(self):
+        """Test AttendancePolicy.from_session_bitmap."""
+        assert AttendancePolicy.from_session_bitmap(0b111, 4).has_reached_minimum
+        assert not AttendancePolicy.from_session_bitmap(0b11, 4).has_reached_minimum
+
+    def test_should_raise_error_when_bitmap_exceeds_sessions(self):
+        """Test that bits beyond the last session raise ValueError."""
+        with pytest.raises(ValueError, match="Row 0: bitmap"):
+            SessionAttendanceLog([0b100], 2)
+
+    def test_should_raise_error_when_sessions_not_positive(self):
+        """Test that zero sessions raise ValueError."""
+        with pytest.raises(ValueError, match="total_sessions"):
+            SessionAttendanceLog([], 0)
+
+    def test_should_raise_error_when_threshold_out_of_range(self):
+        """Test that thresholds outside 0-100 raise ValueError."""
+        with pytest.raises(ValueError, match="between 0 and 100"):
+            SessionAttendanceLog([0], 1).eligibility_mask(101.0)
+
+    def test_should_raise_error_when_marking_unknown_session(self):
+        """Test that marking a session out of range raises ValueError."""
+        with pytest.raises(ValueError, match="Session must be between"):
+            SessionAttendanceLog([0], 2).mark_attended(0, 2)
@@ -0,0 +1,112 @@
+"""
+Unit tests for the audit log module.
+"""
+
+import pytest
+
+from src.attendance_policy import AttendancePolicy
+from src.audit_log import AuditLog, AuditRecord
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+
+
+def make_record(student_id="U001", final_grade=16.0):
+    """Build an audit record with fixed inputs."""
+    return AuditRecord(
+        student_id=student_id,
+        grades=[15.0, 16.0],
+        weights=[50.0, 50.0],
+        has_reached_minimum_attendance=True,
+        consensus_history=[False, True],
+        current_year_index=1,
+        weighted_average=15.5,
+        attendance_penalty_applied=False,
+        extra_points_applied=1.0,
+        final_grade=final_grade,
+        recorded_at=0.0,
+    )
+
+
+class TestAuditRecord:
+    """Test cases for AuditRecord class."""
+
+    def test_should_round_trip_through_dict(self):
+        """Test that to_dict and from_dict are inverse."""
+        record = make_record()
+        restored = AuditRecord.from_dict(record.to_dict())
+        assert restored.to_dict() == record.to_dict()
+
+    def test_should_resolve_consensus_for_recorded_year(self):
+        """Test the consensus flag of the recorded year."""
+        assert make_record().has_extra_points_consensus is True
+
+    def test_should_raise_error_when_field_missing(self):
+        """Test that incomplete dictionaries raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid audit record"):
+            AuditRecord.from_dict({"student_id": "U001"})
+
+
+class TestAuditLog:
+    """Test cases for AuditLog class."""
+
+    def test_should_append_and_stream_records(self, tmp_path):
+        """Test that appended records are read back in order."""
+        with AuditLog(str(tmp_path / "audit.jsonl")) as audit_log:
+            audit_log.append(make_record("U001"))
+            audit_log.append(make_record("U002"))
+            ids = [record.student_id for record in audit_log]
+        assert ids == ["U001", "U002"]
+
+    def test_should_keep_existing_records_when_reopened(self, tmp_path):
+        """Test that the log is append-only across instances."""
+        path = str(tmp_path / "audit.jsonl")
+        with AuditLog(path) as audit_log:
+            audit_log.append(make_record("U001"))
+        with AuditLog(path) as audit_log:
+            audit_log.append(make_record("U002"))
+            assert len(list(audit_log)) == 2
+
+    def test_should_stream_records_in_chunks(self, tmp_path):
+        """Test chunked streaming of the log."""
+        with AuditLog(str(tmp_path / "audit.jsonl")) as audit_log:
+            for index in range(5):
+                audit_log.append(make_record(f"U{index}"))
+            sizes = [len(chunk) for chunk in audit_log.iter_chunks(2)]
+        assert sizes == [2, 2, 1]
+
+    def test_should_yield_nothing_when_file_missing(self, tmp_path):
+        """Test reading a log that was never written."""
+        assert list(AuditLog(str(tmp_path / "missing.jsonl"))) == []
+
+    def test_should_record_grade_calculator_runs(self, tmp_path):
+        """Test that GradeCalculator appends its inputs and output."""
+        evaluations = [Evaluation(16.0, 30.0), Evaluation(14.0, 70.0)]
+        with AuditLog(str(tmp_path / "audit.jsonl")) as audit_log:
+            calculator = GradeCalculator(
+                evaluations,
+                AttendancePolicy(True),
+                ExtraPointsPolicy([True]),
+                0,
+                audit_log=audit_log,
+                student_id="U001",
+            )
+            result = calculator.calculate_final_grade()
+            records = list(audit_log)
+
+        assert len(records) == 1
+        assert records[0].student_id == "U001"
+        assert records[0].grades == [16.0, 14.0]
+        assert records[0].weights == [30.0, 70.0]
+        assert records[0].consensus_history == [True]
+        assert records[0].final_grade == result.final_grade
+
+    def test_should_raise_error_when_path_empty(self):
+        """Test that an empty path raises ValueError."""
+        with pytest.raises(ValueError, match="non-empty string"):
+            AuditLog("  ")
+
+    def test_should_raise_error_when_appending_non_record(self, tmp_path):
+        """Test that only AuditRecord instances can be appended."""
+        with pytest.raises(ValueError, match="valid AuditRecord"):
+            AuditLog(str(tmp_path / "audit.jsonl")).append({"student_id": "U001"})
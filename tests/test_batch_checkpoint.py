@@ -0,0 +1,56 @@
+"""
+Unit tests for the batch checkpoint module.
+"""
+
+import os
+
+import pytest
+
+from src.batch_checkpoint import BatchCheckpoint
+from src.validation import ValidationIssue, ValidationReport
+
+
+class TestBatchCheckpoint:
+    """Test cases for BatchCheckpoint class."""
+
+    def test_should_save_and_load_progress(self, tmp_path):
+        """Test the round trip of a checkpoint file."""
+        path = str(tmp_path / "results.csv.checkpoint")
+        report = ValidationReport(
+            [ValidationIssue(3, "grades", "grade_out_of_range", {"position": 0})]
+        )
+        BatchCheckpoint("key", 100, 4096, report).save(path)
+
+        checkpoint = BatchCheckpoint.load(path)
+        assert (checkpoint.run_key, checkpoint.rows_processed) == ("key", 100)
+        assert checkpoint.output_bytes == 4096
+        assert checkpoint.validation_report.issues[0].params == {"position": 0}
+        assert os.listdir(tmp_path) == ["results.csv.checkpoint"]
+
+    def test_should_return_none_when_missing(self, tmp_path):
+        """Test loading a checkpoint that was never written."""
+        assert BatchCheckpoint.load(str(tmp_path / "missing.checkpoint")) is None
+
+    @pytest.mark.parametrize(
+        "content, message",
+        [
+            ("{", "is not valid JSON"),
+            ('{"rows_processed": 1}', "must have exactly"),
+        ],
+    )
+    def test_should_reject_corrupt_file(self, tmp_path, content, message):
+        """Test that a damaged checkpoint raises ValueError."""
+        path = tmp_path / "results.csv.checkpoint"
+        path.write_text(content)
+        with pytest.raises(ValueError, match=message):
+            BatchCheckpoint.load(str(path))
+
+    def test_should_key_runs_by_input_and_settings(self, tmp_path):
+        """Test that the run key changes with the input or the settings."""
+        path = tmp_path / "roster.csv"
+        path.write_text("student_id\n")
+        key = BatchCheckpoint.make_run_key(str(path), ["rules", True])
+        assert key == BatchCheckpoint.make_run_key(str(path), ["rules", True])
+        assert key != BatchCheckpoint.make_run_key(str(path), ["rules", False])
+        path.write_text("student_id\nU001\n")
+        assert key != BatchCheckpoint.make_run_key(str(path), ["rules", True])
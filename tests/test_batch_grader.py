@@ -0,0 +1,218 @@
+"""
+Unit tests for the batch grading module.
+"""
+
+import pytest
+
+from src.attendance_policy import AttendancePolicy
+from src.batch_grader import BatchGradeCalculator, GradingRules
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+from src.roster_generator import RosterGenerator
+from src.student import Student
+
+
+class TestGradingRules:
+    """Test cases for GradingRules class."""
+
+    def test_should_default_to_current_policy_constants(self):
+        """Test that default rules mirror the policy constants."""
+        rules = GradingRules()
+        assert rules.extra_points_value == ExtraPointsPolicy.EXTRA_POINTS_VALUE
+        assert (
+            rules.attendance_penalty
+            == AttendancePolicy.PENALTY_FOR_INSUFFICIENT_ATTENDANCE
+        )
+        assert rules.min_final_grade == GradeCalculator.MIN_FINAL_GRADE
+        assert rules.max_final_grade == GradeCalculator.MAX_FINAL_GRADE
+
+    def test_should_apply_extra_points_with_attendance_and_consensus(self):
+        """Test applying rules to a student with attendance and consensus."""
+        result = GradingRules(extra_points_value=2.0).apply(15.0, True, True)
+        assert result.extra_points_applied == 2.0
+        assert result.final_grade == 17.0
+
+    def test_should_apply_penalty_without_attendance(self):
+        """Test that the penalty replaces the grade without attendance."""
+        result = GradingRules().apply(18.0, False, True)
+        assert result.attendance_penalty_applied is True
+        assert result.extra_points_applied == 0.0
+        assert result.final_grade == 0.0
+
+    def test_should_clamp_final_grade(self):
+        """Test that the final grade is clamped to the bounds."""
+        result = GradingRules().apply(19.5, True, True)
+        assert result.final_grade == 20.0
+
+    def test_should_compare_by_value(self):
+        """Test that rules with equal values are equal."""
+        assert GradingRules() == GradingRules()
+        assert GradingRules(extra_points_value=2.0) != GradingRules()
+
+    def test_should_raise_error_when_bounds_are_inverted(self):
+        """Test that inverted bounds raise ValueError."""
+        with pytest.raises(ValueError, match="cannot be greater"):
+            GradingRules(min_final_grade=20.0, max_final_grade=0.0)
+
+    def test_should_raise_error_when_value_is_not_number(self):
+        """Test that non-numeric values raise ValueError."""
+        with pytest.raises(ValueError, match="must be numbers"):
+            GradingRules(extra_points_value="1")
+
+
+class TestBatchGradeCalculator:
+    """Test cases for BatchGradeCalculator class."""
+
+    def test_should_match_single_student_calculator(self):
+        """Test that batch results equal GradeCalculator results."""
+        grades = [[16.0, 14.0, 18.0], [0.0, 15.0], [18.0, 19.0]]
+        weights = [[30.0, 40.0, 30.0], [30.0, 70.0], [50.0, 50.0]]
+        attendance = [True, True, False]
+        policy = ExtraPointsPolicy([True, False])
+
+        results = BatchGradeCalculator().calculate_batch(
+            grades, weights, attendance, [True, True, True]
+        )
+
+        for index, result in enumerate(results):
+            evaluations = [
+                Evaluation(grade, weight)
+                for grade, weight in zip(grades[index], weights[index])
+            ]
+            expected = GradeCalculator(
+                evaluations, AttendancePolicy(attendance[index]), policy, 0
+            ).calculate_final_grade()
+            assert result.get_details() == expected.get_details()
+            assert result.weighted_average == expected.weighted_average
+
+    def test_should_grade_students(self):
+        """Test grading Student objects with a shared policy."""
+        student = Student("U001", has_reached_minimum_attendance=True)
+        student.add_evaluation(Evaluation(15.0, 50.0))
+        student.add_evaluation(Evaluation(16.0, 50.0))
+
+        results = BatchGradeCalculator().calculate_students(
+            [student], ExtraPointsPolicy([False, True]), 1
+        )
+
+        assert results[0].final_grade == 16.5
+
+    def test_should_raise_error_with_row_index_when_weights_invalid(self):
+        """Test that an invalid row reports its index."""
+        with pytest.raises(ValueError, match="Row 1: total weight"):
+            BatchGradeCalculator().calculate_batch(
+                [[15.0], [15.0, 16.0]],
+                [[100.0], [40.0, 40.0]],
+                [True, True],
+                [False, False],
+            )
+
+    def test_should_raise_error_when_grade_out_of_range(self):
+        """Test that out-of-range grades are rejected."""
+        with pytest.raises(ValueError, match="Row 0: grade must be between"):
+            BatchGradeCalculator().calculate_batch([[21.0]], [[100.0]], [True], [False])
+
+    @pytest.mark.parametrize(
+        "grades, weights",
+        [(15.0, 100.0), (None, None), ("ab", "cd"), (["a"], [100.0]), ([15.0], [None])],
+    )
+    def test_should_raise_value_error_for_malformed_rows(self, grades, weights):
+        """Test that non-list or non-numeric values raise ValueError."""
+        with pytest.raises(ValueError, match="Row 0: grades and weights must be lists"):
+            BatchGradeCalculator().calculate_batch([grades], [weights], [True], [False])
+
+    @pytest.mark.parametrize("attendance", ["n", "s", None, 1])
+    def test_should_reject_non_boolean_attendance(self, attendance):
+        """Test that attendance is not graded by truthiness."""
+        with pytest.raises(
+            ValueError, match="Row 0: has_reached_minimum_attendance must be"
+        ):
+            BatchGradeCalculator().calculate_batch(
+                [[10.0]], [[100.0]], [attendance], [False]
+            )
+
+    def test_should_raise_error_when_columns_differ_in_length(self):
+        """Test that columns of different length raise ValueError."""
+        with pytest.raises(ValueError, match="same length"):
+            BatchGradeCalculator().calculate_batch([[15.0]], [[100.0]], [], [])
+
+    def test_should_raise_error_when_workers_invalid(self):
+        """Test that a non-positive worker count raises ValueError."""
+        with pytest.raises(ValueError, match="workers"):
+            BatchGradeCalculator(workers=0)
+
+    def test_should_grade_in_parallel_chunks(self):
+        """Test that the process pool path keeps input order."""
+        grades = [[float(index % 21)] for index in range(50)]
+        weights = [[100.0]] * 50
+
+        with BatchGradeCalculator(workers=2, chunk_size=10) as calculator:
+            results = calculator.calculate_batch(
+                grades, weights, [True] * 50, [False] * 50
+            )
+
+        assert [result.final_grade for result in results] == [
+            row[0] for row in grades
+        ]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_should_match_single_student_calculator_on_generated_rosters(self, seed):
+        """Property check: batch and single-student paths agree on any roster."""
+        generator = RosterGenerator(seed=seed)
+        roster = generator.generate(100)
+        consensus = generator.create_consensus(3)
+        policy = ExtraPointsPolicy(consensus)
+
+        results = BatchGradeCalculator().calculate_batch(
+            roster.grades, roster.weights, roster.attendance, [consensus[2]] * 100
+        )
+
+        for student, result in zip(roster.to_students(), results):
+            expected = GradeCalculator(
+                student.evaluations,
+                AttendancePolicy(student.has_reached_minimum_attendance),
+                policy,
+                2,
+            ).calculate_final_grade()
+            assert result.final_grade == expected.final_grade
+            assert result.weighted_average == expected.weighted_average
+
+    def test_should_grade_students_from_several_years(self):
+        """Test that each row gets the consensus of its own year."""
+        policy = ExtraPointsPolicy([True, False, True])
+        results = BatchGradeCalculator().calculate_years(
+            [[15.0]] * 3, [[100.0]] * 3, [True] * 3, [1, 2, 0], policy
+        )
+        assert [result.final_grade for result in results] == [15.0, 16.0, 16.0]
+
+    def test_should_match_single_student_calculator_across_years(self):
+        """Test parity with GradeCalculator for a multi-year cohort."""
+        generator = RosterGenerator(seed=11)
+        roster = generator.generate(60)
+        policy = ExtraPointsPolicy(generator.create_consensus(4))
+        years = [row % 4 for row in range(60)]
+
+        results = BatchGradeCalculator().calculate_years(
+            roster.grades, roster.weights, roster.attendance, years, policy
+        )
+
+        for student, year, result in zip(roster.to_students(), years, results):
+            expected = GradeCalculator(
+                student.evaluations,
+                AttendancePolicy(student.has_reached_minimum_attendance),
+                policy,
+                year,
+            ).calculate_final_grade()
+            assert result.final_grade == expected.final_grade
+
+    def test_should_list_every_out_of_range_year(self):
+        """Test that out-of-range years are reported together."""
+        with pytest.raises(ValueError, match="2 rows out of range: 0, 2"):
+            BatchGradeCalculator().calculate_years(
+                [[15.0]] * 3,
+                [[100.0]] * 3,
+                [True] * 3,
+                [4, 0, 7],
+                ExtraPointsPolicy([True]),
+            )
@@ -0,0 +1,231 @@
+"""
+Unit tests for the batch runner module.
+"""
+
+import csv
+import json
+import os
+
+import pytest
+
+import main
+from src.batch_checkpoint import BatchCheckpoint
+from src.batch_grader import BatchGradeCalculator, GradingRules
+from src.batch_runner import BatchRunner
+from src.extra_points_policy import ExtraPointsPolicy
+from src.roster_generator import RosterGenerator
+from src.roster_io import write_roster
+
+
+def read_results(path):
+    """Read a results CSV into a list of dictionaries."""
+    with open(path, encoding="utf-8", newline="") as results_file:
+        return list(csv.DictReader(results_file))
+
+
+class CrashingCalculator(BatchGradeCalculator):
+    """Calculator that fails after grading a number of chunks."""
+
+    def __init__(self, chunks_before_crash):
+        """Initialize the calculator."""
+        super().__init__()
+        self.chunks_left = chunks_before_crash
+
+    def calculate_batch(self, *args, **kwargs):
+        """Grade a chunk, or crash when no chunks are left."""
+        if self.chunks_left == 0:
+            raise RuntimeError("worker killed")
+        self.chunks_left -= 1
+        return super().calculate_batch(*args, **kwargs)
+
+
+class TestBatchRunner:
+    """Test cases for BatchRunner class."""
+
+    def test_should_grade_every_row_across_chunks(self, tmp_path):
+        """Test that all rows are graded in input order."""
+        roster = RosterGenerator(seed=1).generate(25)
+        input_path = str(tmp_path / "roster.jsonl")
+        output_path = str(tmp_path / "results.csv")
+        write_roster(roster.iter_rows(), input_path)
+
+        summary = BatchRunner(ExtraPointsPolicy([True]), 0, chunk_size=10).run(
+            input_path, output_path
+        )
+
+        results = read_results(output_path)
+        assert summary.rows_processed == 25
+        assert [row["student_id"] for row in results] == roster.student_ids
+        assert list(results[0]) == BatchRunner.RESULT_FIELDS
+
+    def test_should_write_rounded_details(self, tmp_path):
+        """Test that results use GradeCalculationResult.get_details()."""
+        input_path = str(tmp_path / "roster.csv")
+        output_path = str(tmp_path / "results.csv")
+        write_roster([("U001", [15.556], [100.0], True)], input_path)
+
+        BatchRunner(ExtraPointsPolicy([False]), 0).run(input_path, output_path)
+
+        row = read_results(output_path)[0]
+        assert row["weighted_average"] == "15.56"
+        assert row["final_grade"] == "15.56"
+        assert row["attendance_penalty_applied"] == "False"
+
+    def test_should_report_chunk_of_invalid_row(self, tmp_path):
+        """Test that invalid rows raise ValueError with their position."""
+        input_path = str(tmp_path / "roster.csv")
+        write_roster([("U001", [15.0], [90.0], True)], input_path)
+
+        with pytest.raises(ValueError, match="row 0: Row 0: total weight"):
+            BatchRunner(ExtraPointsPolicy([False]), 0).run(
+                input_path, str(tmp_path / "results.csv")
+            )
+
+    def test_should_raise_error_when_year_out_of_range(self):
+        """Test that the year index is validated up front."""
+        with pytest.raises(ValueError, match="Year index"):
+            BatchRunner(ExtraPointsPolicy([False]), 3)
+
+    def test_should_raise_error_when_chunk_size_invalid(self):
+        """Test that a non-positive chunk size raises ValueError."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            BatchRunner(ExtraPointsPolicy([False]), 0, chunk_size=0)
+
+    def test_should_skip_and_report_invalid_rows(self, tmp_path):
+        """Test that skip_invalid keeps going and reports bad rows."""
+        input_path = str(tmp_path / "roster.csv")
+        output_path = str(tmp_path / "results.csv")
+        write_roster(
+            [
+                ("U001", [15.0], [100.0], True),
+                ("U002", [25.0], [100.0], True),
+                ("U003", [12.0], [90.0], True),
+                ("U004", [14.0], [100.0], False),
+            ],
+            input_path,
+        )
+
+        summary = BatchRunner(
+            ExtraPointsPolicy([False]), 0, chunk_size=2, skip_invalid=True
+        ).run(input_path, output_path)
+
+        assert [row["student_id"] for row in read_results(output_path)] == [
+            "U001",
+            "U004",
+        ]
+        assert summary.rows_processed == 4
+        assert summary.rows_skipped == 2
+        assert summary.validation_report.invalid_rows == [1, 2]
+
+
+    @pytest.mark.parametrize("options", [[], ["--pipeline"], ["--workers", "2"]])
+    def test_should_reject_string_attendance_from_cli(self, tmp_path, capsys, options):
+        """Test that a JSONL "n" attendance fails --batch instead of passing."""
+        input_path = tmp_path / "roster.jsonl"
+        input_path.write_text(
+            json.dumps(
+                {
+                    "student_id": "U1",
+                    "grades": [10.0],
+                    "weights": [100.0],
+                    "has_reached_minimum_attendance": "n",
+                }
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        output_path = str(tmp_path / "results.csv")
+        with pytest.raises(SystemExit) as exit_info:
+            main.main(["--batch", str(input_path), "--output", output_path] + options)
+        assert exit_info.value.code == 1
+        assert "has_reached_minimum_attendance must be a boolean" in (
+            capsys.readouterr().out
+        )
+
+
+class TestBatchRunnerCheckpoints:
+    """Test cases for checkpointed and resumed batch runs."""
+
+    def _interrupted_run(self, tmp_path, skip_invalid=False):
+        """Crash a run after 5 chunks of 10 rows, committing every 20 rows."""
+        roster = RosterGenerator(seed=4).generate(75)
+        rows = list(roster.iter_rows())
+        if skip_invalid:
+            rows[12] = ("BAD", [25.0], [100.0], True)
+        input_path = str(tmp_path / "roster.jsonl")
+        output_path = str(tmp_path / "results.csv")
+        write_roster(rows, input_path)
+        runner = BatchRunner(
+            ExtraPointsPolicy([True]),
+            0,
+            batch_calculator=CrashingCalculator(5),
+            chunk_size=10,
+            skip_invalid=skip_invalid,
+            checkpoint_every=20,
+        )
+        with pytest.raises(RuntimeError, match="worker killed"):
+            runner.run(input_path, output_path)
+        return input_path, output_path
+
+    def test_should_resume_with_each_row_written_once(self, tmp_path):
+        """Test that a resumed run matches an uninterrupted one."""
+        input_path, output_path = self._interrupted_run(tmp_path)
+        checkpoint = BatchCheckpoint.load(BatchCheckpoint.path_for(output_path))
+        assert checkpoint.rows_processed == 40
+
+        summary = BatchRunner(
+            ExtraPointsPolicy([True]), 0, chunk_size=10, checkpoint_every=20
+        ).run(input_path, output_path, resume=True)
+
+        expected_path = str(tmp_path / "expected.csv")
+        BatchRunner(ExtraPointsPolicy([True]), 0, chunk_size=10).run(
+            input_path, expected_path
+        )
+        with open(output_path, "rb") as output, open(expected_path, "rb") as expected:
+            assert output.read() == expected.read()
+        assert summary.rows_processed == 75
+        assert summary.rows_resumed == 40
+        assert not os.path.exists(BatchCheckpoint.path_for(output_path))
+
+    def test_should_keep_skipped_rows_of_resumed_part(self, tmp_path):
+        """Test that the summary includes rows skipped before the crash."""
+        input_path, output_path = self._interrupted_run(tmp_path, skip_invalid=True)
+        summary = BatchRunner(
+            ExtraPointsPolicy([True]),
+            0,
+            chunk_size=10,
+            skip_invalid=True,
+            checkpoint_every=20,
+        ).run(input_path, output_path, resume=True)
+        assert summary.validation_report.invalid_rows == [12]
+        assert len(read_results(output_path)) == 74
+
+    def test_should_start_over_without_resume(self, tmp_path):
+        """Test that a run without resume ignores and replaces the checkpoint."""
+        input_path, output_path = self._interrupted_run(tmp_path)
+        summary = BatchRunner(
+            ExtraPointsPolicy([True]), 0, chunk_size=10, checkpoint_every=20
+        ).run(input_path, output_path)
+        assert summary.rows_resumed == 0
+        assert len(read_results(output_path)) == 75
+
+    def test_should_reject_checkpoint_of_other_settings(self, tmp_path):
+        """Test that different rules cannot resume the checkpoint."""
+        input_path, output_path = self._interrupted_run(tmp_path)
+        runner = BatchRunner(
+            ExtraPointsPolicy([True]),
+            0,
+            batch_calculator=BatchGradeCalculator(GradingRules(extra_points_value=2)),
+            checkpoint_every=20,
+        )
+        with pytest.raises(ValueError, match="different input file or grading"):
+            runner.run(input_path, output_path, resume=True)
+
+    def test_should_require_checkpoint_every_to_resume(self, tmp_path):
+        """Test the resume validation."""
+        with pytest.raises(ValueError, match="resume requires checkpoint_every"):
+            BatchRunner(ExtraPointsPolicy([True]), 0).run(
+                "roster.csv", str(tmp_path / "results.csv"), resume=True
+            )
+        with pytest.raises(ValueError, match="checkpoint_every must be a positive"):
+            BatchRunner(ExtraPointsPolicy([True]), 0, checkpoint_every=0)
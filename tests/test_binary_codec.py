@@ -0,0 +1,137 @@
+"""
+Unit tests for the binary codec module.
+"""
+
+import io
+import pickle
+import struct
+
+import pytest
+
+from src.binary_codec import GradingCodec
+from src.evaluation import Evaluation
+from src.grade_calculator import GradeCalculationResult
+from src.student import Student
+
+
+def make_student(student_id="U001", grades=(15.5, 12.25), weights=(40.0, 60.0)):
+    """Build a student with attendance and the given evaluations."""
+    student = Student(student_id, has_reached_minimum_attendance=True)
+    for grade, weight in zip(grades, weights):
+        student.add_evaluation(Evaluation(grade, weight))
+    return student
+
+
+def student_state(student):
+    """Get the comparable state of a student."""
+    return (
+        student.student_id,
+        student.has_reached_minimum_attendance,
+        [(item.grade, item.weight) for item in student.evaluation_view],
+    )
+
+
+def result_state(result):
+    """Get the comparable state of a result."""
+    return (
+        result.weighted_average,
+        result.attendance_penalty_applied,
+        result.extra_points_applied,
+        result.final_grade,
+    )
+
+
+RESULTS = [
+    GradeCalculationResult(13.3, False, 1.0, 14.3),
+    GradeCalculationResult(0.1 + 0.2, True, 0.0, 0.0),
+]
+
+
+class TestGradingCodec:
+    """Test cases for GradingCodec class."""
+
+    def test_should_round_trip_student(self):
+        """Test that a student survives encoding exactly."""
+        student = make_student("Ñandú-7")
+        decoded = GradingCodec.decode_student(GradingCodec.encode_student(student))
+        assert student_state(decoded) == student_state(student)
+
+    def test_should_round_trip_result(self):
+        """Test that a result survives encoding bit for bit."""
+        data = GradingCodec.encode_result(RESULTS[1])
+        assert len(data) == GradingCodec.RESULT_RECORD.size == 25
+        assert result_state(GradingCodec.decode_result(data)) == result_state(
+            RESULTS[1]
+        )
+
+    def test_should_round_trip_batches(self):
+        """Test the framed batch formats."""
+        students = [make_student(f"U{index:03d}") for index in range(3)]
+        students.append(Student("U999"))
+        decoded = GradingCodec.decode_students(GradingCodec.encode_students(students))
+        assert list(map(student_state, decoded)) == list(map(student_state, students))
+        results = GradingCodec.decode_results(GradingCodec.encode_results(RESULTS))
+        assert list(map(result_state, results)) == list(map(result_state, RESULTS))
+        assert GradingCodec.decode_results(GradingCodec.encode_results([])) == []
+
+    def test_should_read_frames_from_stream(self):
+        """Test reading consecutive frames of different kinds."""
+        stream = io.BytesIO(
+            GradingCodec.encode_students([make_student()])
+            + GradingCodec.encode_results(RESULTS)
+        )
+        assert student_state(GradingCodec.read_frame(stream)[0]) == student_state(
+            make_student()
+        )
+        assert len(GradingCodec.read_frame(stream)) == 2
+        with pytest.raises(ValueError, match="Truncated frame"):
+            GradingCodec.read_frame(stream)
+
+    def test_should_be_smaller_than_pickle(self):
+        """Test the size advantage over pickle."""
+        students = [make_student(f"U{index:03d}") for index in range(100)]
+        results = [
+            GradeCalculationResult(index / 10, False, 0.0, index / 10)
+            for index in range(100)
+        ]
+        assert len(GradingCodec.encode_students(students)) < len(
+            pickle.dumps(students)
+        ) / 2
+        frame = GradingCodec.encode_results(results)
+        assert len(frame) == GradingCodec.FRAME_HEADER.size + 25 * len(results)
+        assert len(frame) < len(pickle.dumps(results))
+
+    @pytest.mark.parametrize(
+        "mutate, message",
+        [
+            (lambda frame: frame[:-1], "Frame payload must be"),
+            (lambda frame: b"XXXX" + frame[4:], "Not a grading codec frame"),
+            (lambda frame: frame[:5] + b"\x07" + frame[6:], "Unknown frame kind: 7"),
+            (lambda frame: frame[:3], "Truncated frame header"),
+        ],
+    )
+    def test_should_reject_malformed_frames(self, mutate, message):
+        """Test the frame validation."""
+        frame = GradingCodec.encode_results(RESULTS)
+        with pytest.raises(ValueError, match=message):
+            GradingCodec.decode_results(mutate(frame))
+
+    def test_should_reject_wrong_kind_and_bad_records(self):
+        """Test decoding errors of single records and frame kinds."""
+        with pytest.raises(ValueError, match="Expected frame kind 1, got 2"):
+            GradingCodec.decode_students(GradingCodec.encode_results(RESULTS))
+        data = GradingCodec.encode_student(make_student())
+        with pytest.raises(ValueError, match="Truncated student record"):
+            GradingCodec.decode_student(data[:-1])
+        with pytest.raises(ValueError, match="Trailing bytes"):
+            GradingCodec.decode_student(data + b"\x00")
+        with pytest.raises(ValueError, match="must be 25 bytes"):
+            GradingCodec.decode_result(b"\x00" * 24)
+
+    def test_should_validate_decoded_students(self):
+        """Test that decoding applies the Evaluation validation."""
+        data = bytearray(GradingCodec.encode_student(make_student()))
+        # The first grade starts 4 float64 values before the end.
+        data[-32:-24] = struct.pack("<d", 25.0)
+        with pytest.raises(ValueError, match="Grade must be between"):
+            GradingCodec.decode_student(bytes(data))
@@ -0,0 +1,135 @@
+"""
+Unit tests for the daemon protocol module.
+"""
+
+import os
+import socket
+import stat
+import tempfile
+
+import pytest
+
+import main
+from src.daemon_protocol import (
+    SOCKET_NAME,
+    check_socket_owner,
+    default_socket_directory,
+    ensure_private_directory,
+    send_request,
+)
+from src.grading_daemon import GradingDaemon
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available"
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    """Short socket path inside the test directory."""
+    return str(tmp_path / "grader.sock")
+
+
+@pytest.fixture
+def daemon(socket_path):
+    """A daemon serving in a background thread."""
+    grading_daemon = GradingDaemon(socket_path)
+    thread = grading_daemon.serve_in_background()
+    yield grading_daemon
+    grading_daemon.stop()
+    thread.join()
+
+
+class TestSocketLocation:
+    """Test cases for the default socket location."""
+
+    def test_should_use_runtime_directory(self, monkeypatch, tmp_path):
+        """Test that $XDG_RUNTIME_DIR is preferred."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert default_socket_directory() == str(tmp_path)
+
+    def test_should_use_user_directory_in_tempdir(self, monkeypatch):
+        """Test the per-user fallback without a runtime directory."""
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        directory = default_socket_directory()
+        assert os.path.dirname(directory) == tempfile.gettempdir()
+        assert directory.endswith(f"-{os.getuid()}")
+        assert SOCKET_NAME not in directory
+
+    def test_should_create_private_directory(self, tmp_path):
+        """Test that a new socket directory gets mode 0700."""
+        directory = str(tmp_path / "sockets")
+        ensure_private_directory(directory)
+        assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+    def test_should_reject_directory_open_to_others(self, tmp_path):
+        """Test that a pre-existing shared directory is not trusted."""
+        directory = tmp_path / "sockets"
+        directory.mkdir()
+        os.chmod(directory, 0o777)
+        with pytest.raises(OSError, match="owned by the current user"):
+            ensure_private_directory(str(directory))
+
+    def test_should_reject_path_that_is_not_a_socket(self, socket_path):
+        """Test that a regular file is never connected to."""
+        with open(socket_path, "w", encoding="utf-8"):
+            pass
+        with pytest.raises(OSError, match="is not a socket"):
+            check_socket_owner(socket_path)
+
+    def test_should_bind_socket_for_owner_only(self, daemon, socket_path):
+        """Test that the daemon socket is not accessible to other users."""
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == GradingDaemon.SOCKET_MODE
+        check_socket_owner(socket_path)
+
+
+class TestSendRequest:
+    """Test cases for send_request function."""
+
+    def test_should_answer_ping(self, daemon, socket_path):
+        """Test a round trip without GradingClient."""
+        assert send_request(socket_path, {"op": "ping"}, 5.0) == {"requests": 1}
+
+    def test_should_raise_without_daemon(self, socket_path):
+        """Test that a missing socket is a connection failure."""
+        with pytest.raises(OSError):
+            send_request(socket_path, {"op": "ping"}, 5.0)
+
+
+class TestForwardGrade:
+    """Test cases for the command-line fast path of main.py."""
+
+    def test_should_grade_on_daemon_with_one_request(self, daemon, socket_path):
+        """Test that a forwarded call sends no ping."""
+        details = main.forward_grade(
+            ["--grades", "15,12", "--weights=40,60", "--consensus", "s"]
+            + ["--socket", socket_path]
+        )
+        assert details["final_grade"] == 14.2
+        assert daemon.requests_served == 1
+
+    def test_should_apply_rounding(self, daemon, socket_path):
+        """Test that --rounding is sent to the daemon."""
+        details = main.forward_grade(
+            ["--grades", "13.37", "--weights", "100", "--rounding", "truncate"]
+            + ["--decimals", "0", "--socket", socket_path]
+        )
+        assert details["final_grade"] == 13.0
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--grades", "15", "--weights", "100", "--profile", "perfil"],
+            ["--grades", "15,12", "--weights", "100"],
+            ["--grades", "15", "--weights", "100", "--attendance", "x"],
+            ["--grades", "15", "--weights", "90"],
+        ],
+    )
+    def test_should_leave_other_calls_to_main(self, daemon, socket_path, argv):
+        """Test that unknown options and rejected requests fall back."""
+        assert main.forward_grade(argv + ["--socket", socket_path]) is None
+
+    def test_should_fall_back_without_daemon(self, socket_path):
+        """Test that an unreachable daemon falls back to main()."""
+        argv = ["--grades", "15", "--weights", "100", "--socket", socket_path]
+        assert main.forward_grade(argv) is None
@@ -0,0 +1,166 @@
+"""
+Unit tests for the delta sync module.
+"""
+
+import pytest
+
+from src.batch_grader import BatchGradeCalculator
+from src.delta_sync import (
+    ChangeSet,
+    DeltaSyncEngine,
+    EvaluationChange,
+    StudentChange,
+    fingerprint_row,
+    fingerprint_student,
+)
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.roster_columns import RosterColumns
+from src.student import Student
+
+
+def _roster(*rows):
+    """Build roster columns from rows."""
+    return RosterColumns.from_rows(list(rows))
+
+
+class _CountingCalculator(BatchGradeCalculator):
+    """Batch calculator that remembers how many rows it graded."""
+
+    def __init__(self):
+        super().__init__()
+        self.graded_rows = 0
+
+    def calculate_batch(self, grades, weights, attendance, consensus, validate=True):
+        self.graded_rows += len(grades)
+        return super().calculate_batch(grades, weights, attendance, consensus, validate)
+
+
+class TestFingerprint:
+    """Test cases for the fingerprint functions."""
+
+    def test_should_match_for_equal_inputs(self):
+        """Test that equal evaluation sets have equal fingerprints."""
+        assert fingerprint_row([15.0], [100.0], True) == fingerprint_row(
+            [15.0], [100.0], True
+        )
+
+    def test_should_differ_when_any_input_changes(self):
+        """Test that grade, weight and attendance changes alter the fingerprint."""
+        base = fingerprint_row([15.0, 10.0], [50.0, 50.0], True)
+        assert fingerprint_row([15.0, 11.0], [50.0, 50.0], True) != base
+        assert fingerprint_row([15.0, 10.0], [40.0, 60.0], True) != base
+        assert fingerprint_row([15.0, 10.0], [50.0, 50.0], False) != base
+
+    def test_should_fingerprint_student(self):
+        """Test that a Student fingerprints like its columns."""
+        student = Student("U001", has_reached_minimum_attendance=True)
+        student.add_evaluation(Evaluation(15.0, 100.0))
+        assert fingerprint_student(student) == fingerprint_row([15.0], [100.0], True)
+
+    def test_should_reject_non_numeric_values(self):
+        """Test that non-numeric grades raise ValueError."""
+        with pytest.raises(ValueError, match="must be numbers"):
+            fingerprint_row(["15"], [100.0], True)
+
+
+class TestDeltaSyncEngine:
+    """Test cases for DeltaSyncEngine class."""
+
+    def test_should_report_every_student_as_added_on_first_sync(self):
+        """Test the first import."""
+        engine = DeltaSyncEngine(ExtraPointsPolicy([True]), 0)
+        change_set = engine.sync(
+            _roster(("U1", [15.0], [100.0], True), ("U2", [8.0], [100.0], True))
+        )
+        assert [change.student_id for change in change_set.added] == ["U1", "U2"]
+        assert change_set.added[0].result.final_grade == 16.0
+        assert len(engine) == 2
+
+    def test_should_regrade_only_changed_students(self):
+        """Test that unchanged students are neither reported nor regraded."""
+        calculator = _CountingCalculator()
+        engine = DeltaSyncEngine(ExtraPointsPolicy([False]), 0, calculator)
+        rows = [(f"U{index}", [12.0], [100.0], True) for index in range(100)]
+        engine.sync(_roster(*rows))
+
+        rows[7] = ("U7", [18.0], [100.0], True)
+        calculator.graded_rows = 0
+        change_set = engine.sync(_roster(*rows))
+
+        assert calculator.graded_rows == 1
+        assert [change.student_id for change in change_set.changed] == ["U7"]
+        assert change_set.changed[0].result.final_grade == 18.0
+
+    def test_should_diff_evaluations(self):
+        """Test added, changed and removed evaluations."""
+        engine = DeltaSyncEngine(ExtraPointsPolicy([False]), 0)
+        engine.sync(_roster(("U1", [10.0, 12.0, 14.0], [30.0, 30.0, 40.0], True)))
+        change = engine.sync(_roster(("U1", [10.0, 13.0], [30.0, 70.0], False)))
+        student_change = change.changed[0]
+        kinds = [
+            (evaluation.position, evaluation.kind)
+            for evaluation in student_change.evaluation_changes
+        ]
+        assert kinds == [(1, EvaluationChange.CHANGED), (2, EvaluationChange.REMOVED)]
+        assert student_change.attendance_changed is True
+
+    def test_should_report_removed_students(self):
+        """Test that students missing from a full export are removed."""
+        engine = DeltaSyncEngine(ExtraPointsPolicy([False]), 0)
+        engine.sync(
+            _roster(("U1", [15.0], [100.0], True), ("U2", [9.0], [100.0], True))
+        )
+        change_set = engine.sync(_roster(("U1", [15.0], [100.0], True)))
+        assert [change.student_id for change in change_set.removed] == ["U2"]
+        assert change_set.removed[0].result is None
+        assert "U2" not in engine
+
+    def test_should_report_nothing_when_import_is_identical(self):
+        """Test a re-import without changes."""
+        engine = DeltaSyncEngine(ExtraPointsPolicy([False]), 0)
+        roster = _roster(("U1", [15.0], [100.0], True))
+        engine.sync(roster)
+        assert engine.sync(roster).is_empty
+
+    def test_should_apply_partial_feed(self):
+        """Test that apply() leaves students outside the feed untouched."""
+        engine = DeltaSyncEngine(ExtraPointsPolicy([False]), 0)
+        engine.sync(
+            _roster(("U1", [15.0], [100.0], True), ("U2", [9.0], [100.0], True))
+        )
+        change_set = engine.apply(_roster(("U3", [11.0], [100.0], True)), ["U1"])
+        assert [change.kind for change in change_set.changes] == [
+            StudentChange.ADDED,
+            StudentChange.REMOVED,
+        ]
+        assert "U2" in engine and "U1" not in engine
+
+    def test_should_keep_previous_import_when_a_row_is_invalid(self):
+        """Test that an invalid changed row rolls back the whole sync."""
+        engine = DeltaSyncEngine(ExtraPointsPolicy([False]), 0)
+        engine.sync(_roster(("U1", [15.0], [100.0], True)))
+        with pytest.raises(ValueError, match="Student U2"):
+            engine.sync(
+                _roster(("U1", [16.0], [100.0], True), ("U2", [25.0], [100.0], True))
+            )
+        assert "U2" not in engine
+        assert engine.sync(_roster(("U1", [16.0], [100.0], True))).changed
+
+    def test_should_reject_duplicate_student_ids(self):
+        """Test that an import with repeated IDs is rejected."""
+        engine = DeltaSyncEngine(ExtraPointsPolicy([False]), 0)
+        with pytest.raises(ValueError, match="unique"):
+            engine.sync(
+                _roster(("U1", [15.0], [100.0], True), ("U1", [9.0], [100.0], True))
+            )
+
+    def test_should_serialize_change_set(self):
+        """Test the dictionaries pushed downstream."""
+        engine = DeltaSyncEngine(ExtraPointsPolicy([False]), 0)
+        records = engine.sync(_roster(("U1", [15.0], [100.0], True))).to_dicts()
+        assert records[0]["student_id"] == "U1"
+        assert records[0]["change"] == StudentChange.ADDED
+        assert records[0]["evaluations"][0]["current"] == [15.0, 100.0]
+        assert records[0]["result"]["final_grade"] == 15.0
+        assert ChangeSet().is_empty
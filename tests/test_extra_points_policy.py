@@ -108,3 +108,42 @@ class TestExtraPointsPolicy:
         result2 = policy2.calculate_extra_points(0)
 
         assert result1 == result2
+
+    def test_should_expose_precomputed_bonus_table(self):
+        """Test that the per-year bonus table mirrors the consensus."""
+        policy = ExtraPointsPolicy([True, False, True])
+        assert policy.bonus_table == (1.0, 0.0, 1.0)
+
+    def test_should_ignore_later_changes_to_input_list(self):
+        """Test that every method reads the snapshot taken at construction."""
+        consensus = [True, False]
+        policy = ExtraPointsPolicy(consensus)
+        consensus[0] = False
+        consensus.append(True)
+        assert policy.has_consensus_for_year(0) is True
+        assert policy.calculate_extra_points(0) == 1.0
+        assert policy.has_consensus_for_year(2) is False
+        assert policy.consensus_history == [True, False]
+
+    def test_should_gather_extra_points_for_many_years(self):
+        """Test the batch lookup against the single-year method."""
+        policy = ExtraPointsPolicy([True, False, True])
+        years = [2, 0, 1, 1, 0]
+        assert policy.extra_points_for_years(years) == [
+            policy.calculate_extra_points(year) for year in years
+        ]
+        assert policy.consensus_for_years(years) == [True, True, False, False, True]
+
+    def test_should_report_every_out_of_range_year(self):
+        """Test that invalid years are reported together."""
+        policy = ExtraPointsPolicy([True, False])
+        years = [0, 5, 1, -1, 2.0]
+        assert policy.invalid_year_rows(years) == [1, 3, 4]
+        with pytest.raises(ValueError, match="3 rows out of range: 1, 3, 4$"):
+            policy.extra_points_for_years(years)
+
+    def test_should_truncate_long_list_of_invalid_rows(self):
+        """Test that the error message stays short on large rosters."""
+        policy = ExtraPointsPolicy([True])
+        with pytest.raises(ValueError, match="25 rows out of range: .* and 15 more"):
+            policy.consensus_for_years([3] * 25)
@@ -8,6 +8,7 @@ from src.attendance_policy import AttendancePolicy
 from src.evaluation import Evaluation
 from src.extra_points_policy import ExtraPointsPolicy
 from src.grade_calculator import GradeCalculationResult, GradeCalculator
+from src.student import Student
 
 
 class TestGradeCalculationResult:
@@ -150,6 +151,21 @@ class TestGradeCalculator:
         with pytest.raises(ValueError, match="Total weight must sum"):
             GradeCalculator(evaluations, attendance, extra_points, 0)
 
+    def test_should_accept_student_evaluation_view(self):
+        """Test that the tuple view grades like the copied list."""
+        student = Student("U202012345", True)
+        student.add_evaluation(Evaluation(15.0, 40.0))
+        student.add_evaluation(Evaluation(12.0, 60.0))
+        policies = (AttendancePolicy(True), ExtraPointsPolicy([True]), 0)
+
+        from_view = GradeCalculator(student.evaluation_view, *policies)
+        from_list = GradeCalculator(student.evaluations, *policies)
+
+        assert (
+            from_view.calculate_final_grade().get_details()
+            == from_list.calculate_final_grade().get_details()
+        )
+
     def test_should_raise_error_when_evaluations_not_list(self):
         """Test that non-list evaluations raises ValueError."""
         attendance = AttendancePolicy(True)
@@ -0,0 +1,157 @@
+"""
+Unit tests for the grade solver module.
+"""
+
+import math
+import random
+
+import pytest
+
+from src.attendance_policy import AttendancePolicy
+from src.batch_grader import GradingRules
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+from src.grade_solver import (
+    PassingGradeSolver,
+    RequiredGradeResult,
+    _approximate_ulp,
+)
+from src.student import Student
+
+
+def _final_grade(grades, weights, has_consensus):
+    """Grade a full set of evaluations with GradeCalculator."""
+    calculator = GradeCalculator(
+        evaluations=[
+            Evaluation(grade, weight) for grade, weight in zip(grades, weights)
+        ],
+        attendance_policy=AttendancePolicy(True),
+        extra_points_policy=ExtraPointsPolicy([has_consensus]),
+        current_year_index=0,
+    )
+    return calculator.calculate_final_grade().final_grade
+
+
+class TestPassingGradeSolver:
+    """Test cases for PassingGradeSolver class."""
+
+    def test_should_solve_required_grade_in_closed_form(self):
+        """Test the required grade for half of the course pending."""
+        result = PassingGradeSolver().solve(
+            [Evaluation(10.0, 50.0)], [50.0], True, False
+        )
+        assert result.status == RequiredGradeResult.ATTAINABLE
+        assert result.required_grade == pytest.approx(12.0)
+        assert result.current_contribution == pytest.approx(5.0)
+        assert result.pending_weight == 50.0
+
+    def test_should_account_for_extra_points(self):
+        """Test that extra points lower the required grade."""
+        result = PassingGradeSolver().solve(
+            [Evaluation(10.0, 50.0)], [50.0], True, True
+        )
+        assert result.extra_points == ExtraPointsPolicy.EXTRA_POINTS_VALUE
+        assert result.required_grade == pytest.approx(10.0)
+
+    def test_should_report_already_passed(self):
+        """Test a student who passes even with zero on pending evaluations."""
+        result = PassingGradeSolver().solve(
+            [Evaluation(20.0, 60.0)], [40.0], True, False
+        )
+        assert result.status == RequiredGradeResult.PASSED
+        assert result.required_grade == Evaluation.MIN_GRADE
+
+    def test_should_report_unreachable_above_max_grade(self):
+        """Test a student who cannot pass even with full marks."""
+        result = PassingGradeSolver().solve(
+            [Evaluation(2.0, 80.0)], [20.0], True, False
+        )
+        assert result.status == RequiredGradeResult.UNREACHABLE
+        assert result.required_grade is None
+        assert not result.can_pass
+
+    def test_should_report_unreachable_without_attendance(self):
+        """Test that insufficient attendance makes passing impossible."""
+        result = PassingGradeSolver().solve(
+            [Evaluation(20.0, 50.0)], [50.0], False, True
+        )
+        assert result.status == RequiredGradeResult.UNREACHABLE
+        assert result.extra_points == GradeCalculator.INITIAL_EXTRA_POINTS
+
+    def test_should_decide_when_nothing_is_pending(self):
+        """Test a fully graded student."""
+        solver = PassingGradeSolver()
+        assert (
+            solver.solve([Evaluation(12.0, 100.0)], [], True, False).status
+            == RequiredGradeResult.PASSED
+        )
+        assert (
+            solver.solve([Evaluation(9.0, 100.0)], [], True, False).status
+            == RequiredGradeResult.UNREACHABLE
+        )
+
+    def test_should_use_custom_rules_and_passing_grade(self):
+        """Test that rules and passing grade are configurable."""
+        solver = PassingGradeSolver(GradingRules(extra_points_value=2.0), 13.0)
+        result = solver.solve([Evaluation(10.0, 50.0)], [50.0], True, True)
+        assert result.required_grade == pytest.approx(12.0)
+
+    def test_should_solve_student_with_policy(self):
+        """Test solving from a Student and an extra points policy."""
+        student = Student("U001", has_reached_minimum_attendance=True)
+        student.add_evaluation(Evaluation(10.0, 50.0))
+        result = PassingGradeSolver().solve_student(
+            student, [50.0], ExtraPointsPolicy([False, True]), 1
+        )
+        assert result.required_grade == pytest.approx(10.0)
+
+    def test_should_reject_incomplete_weights(self):
+        """Test that graded and pending weights must cover the course."""
+        with pytest.raises(ValueError, match="Row 0: graded and pending weights"):
+            PassingGradeSolver().solve([Evaluation(10.0, 50.0)], [40.0], True, False)
+
+    def test_should_reject_columns_of_different_length(self):
+        """Test that mismatched columns are rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            PassingGradeSolver().solve_batch([[10.0]], [[50.0]], [[50.0]], [], [True])
+
+    def test_should_pass_in_grade_calculator_with_required_grade(self):
+        """Test on seeded sections that the answer passes in GradeCalculator."""
+        rng = random.Random(11)
+        grades, weights, pending, consensus = [], [], [], []
+        for _ in range(300):
+            count = rng.randint(2, GradeCalculator.MAX_EVALUATIONS)
+            cuts = sorted(rng.sample(range(1, 100), count - 1))
+            row_weights = [
+                float(end - start) for start, end in zip([0] + cuts, cuts + [100])
+            ]
+            graded = rng.randint(1, count - 1)
+            grades.append([round(rng.uniform(0.0, 20.0), 1) for _ in range(graded)])
+            weights.append(row_weights[:graded])
+            pending.append(row_weights[graded:])
+            consensus.append(rng.random() < 0.5)
+
+        results = PassingGradeSolver().solve_batch(
+            grades, weights, pending, [True] * len(grades), consensus
+        )
+        for row, result in enumerate(results):
+            if result.status != RequiredGradeResult.ATTAINABLE:
+                continue
+            full_grades = grades[row] + [result.required_grade] * len(pending[row])
+            full_weights = weights[row] + pending[row]
+            assert (
+                _final_grade(full_grades, full_weights, consensus[row])
+                >= GradeCalculator.PASSING_GRADE
+            )
+
+
+class TestApproximateUlp:
+    """Test cases for the math.ulp fallback."""
+
+    @pytest.mark.parametrize("value", [0.0, 1e-300, 10.5, 20.0])
+    def test_should_step_at_least_one_ulp(self, value):
+        """Test that the fallback step always moves to a different float."""
+        step = _approximate_ulp(value)
+        assert step >= math.ulp(value)
+        assert value + step != value
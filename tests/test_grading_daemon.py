@@ -0,0 +1,125 @@
+"""
+Unit tests for the grading daemon module.
+"""
+
+import os
+import socket
+
+import pytest
+
+from src.grading_daemon import GRADE, PING, GradingClient, GradingDaemon
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available"
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    """Short socket path inside the test directory."""
+    return str(tmp_path / "grader.sock")
+
+
+@pytest.fixture
+def daemon(socket_path):
+    """A daemon serving in a background thread."""
+    grading_daemon = GradingDaemon(socket_path)
+    thread = grading_daemon.serve_in_background()
+    yield grading_daemon
+    grading_daemon.stop()
+    thread.join()
+
+
+def grade_request(**overrides):
+    """Build a grade request."""
+    request = {
+        "op": GRADE,
+        "grades": [15.0, 12.0],
+        "weights": [40.0, 60.0],
+        "attendance": True,
+        "consensus": [True],
+        "year": 0,
+    }
+    request.update(overrides)
+    return request
+
+
+class TestGradingDaemonHandle:
+    """Test cases for GradingDaemon.handle without a socket."""
+
+    def test_should_grade_like_grade_calculator(self, socket_path):
+        """Test a grade request."""
+        response = GradingDaemon(socket_path).handle(grade_request())
+        assert response["ok"] is True
+        assert response["result"]["final_grade"] == 14.2
+
+    def test_should_return_validation_errors(self, socket_path):
+        """Test that invalid requests answer with the calculator error."""
+        response = GradingDaemon(socket_path).handle(
+            grade_request(weights=[40.0, 50.0])
+        )
+        assert response == {
+            "ok": False,
+            "error": "Total weight must sum to 100.0, got 90.0",
+        }
+
+    def test_should_reject_unknown_operation(self, socket_path):
+        """Test that unknown operations are errors."""
+        response = GradingDaemon(socket_path).handle({"op": "explode"})
+        assert response["ok"] is False
+
+    def test_should_reject_out_of_range_year(self, socket_path):
+        """Test that the year index is checked."""
+        response = GradingDaemon(socket_path).handle(grade_request(year=3))
+        assert "Year index must be between" in response["error"]
+
+    def test_should_count_requests(self, socket_path):
+        """Test the request counter."""
+        grading_daemon = GradingDaemon(socket_path)
+        grading_daemon.handle({"op": PING})
+        grading_daemon.handle(grade_request())
+        assert grading_daemon.requests_served == 2
+
+
+class TestGradingClient:
+    """Test cases for GradingClient against a running daemon."""
+
+    def test_should_report_unavailable_without_daemon(self, socket_path):
+        """Test that a missing socket means no daemon."""
+        assert GradingClient(socket_path).is_available() is False
+
+    def test_should_grade_through_socket(self, daemon, socket_path):
+        """Test a round trip through the Unix socket."""
+        client = GradingClient(socket_path)
+        assert client.is_available()
+        details = client.grade([15.0, 12.0], [40.0, 60.0], True, [True], 0)
+        assert details["final_grade"] == 14.2
+        assert daemon.requests_served >= 2
+
+    def test_should_raise_daemon_errors(self, daemon, socket_path):
+        """Test that rejected requests raise ValueError in the client."""
+        with pytest.raises(ValueError, match="Total weight"):
+            GradingClient(socket_path).grade([15.0], [90.0], True, [False], 0)
+
+    def test_should_refuse_second_daemon_on_same_socket(self, daemon, socket_path):
+        """Test that a running daemon is not replaced."""
+        with pytest.raises(OSError, match="already running"):
+            GradingDaemon(socket_path).start()
+
+    def test_should_shut_down_on_request(self, socket_path):
+        """Test that a shutdown request stops the daemon and removes the socket."""
+        thread = GradingDaemon(socket_path).serve_in_background()
+        GradingClient(socket_path).shutdown()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert not os.path.exists(socket_path)
+
+    def test_should_replace_stale_socket_file(self, socket_path):
+        """Test that a leftover socket file does not block a new daemon."""
+        with open(socket_path, "w", encoding="utf-8"):
+            pass
+        grading_daemon = GradingDaemon(socket_path)
+        thread = grading_daemon.serve_in_background()
+        assert GradingClient(socket_path).is_available()
+        grading_daemon.stop()
+        thread.join()
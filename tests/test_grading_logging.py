@@ -0,0 +1,171 @@
+"""
+Unit tests for the grading logging module.
+"""
+
+import json
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from src.batch_runner import BatchRunner
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grading_logging import (
+    LOGGER_NAME,
+    GradingLogSession,
+    JsonFormatter,
+    LevelFilter,
+    SamplingFilter,
+    get_logger,
+    log_event,
+)
+from src.roster_io import write_roster
+
+
+def _read_events(path):
+    """Read the JSON lines of a log file."""
+    with open(path, encoding="utf-8") as log_file:
+        return [json.loads(line) for line in log_file]
+
+
+def _record(event, level=logging.WARNING, **fields):
+    """Build a record like log_event does."""
+    record = logging.LogRecord("test", level, __file__, 1, event, None, None)
+    record.grading_fields = fields
+    return record
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self):
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Get the current time."""
+        return self.now
+
+
+class TestSamplingFilter:
+    """Test cases for SamplingFilter class."""
+
+    def test_should_pass_burst_then_sample(self):
+        """Test the burst and the one-in-N sampling of one kind."""
+        sampling = SamplingFilter(burst=2, sample_every=3, clock=FakeClock())
+        kept = [sampling.filter(_record("invalid_row", code="A")) for _ in range(8)]
+        assert kept == [True, True, False, False, True, False, False, True]
+        assert sampling.suppressed_total == 4
+
+    def test_should_sample_kinds_separately(self):
+        """Test that each code has its own budget."""
+        sampling = SamplingFilter(burst=1, sample_every=10, clock=FakeClock())
+        assert sampling.filter(_record("invalid_row", code="A"))
+        assert sampling.filter(_record("invalid_row", code="B"))
+        assert not sampling.filter(_record("invalid_row", code="A"))
+
+    def test_should_reset_after_interval(self):
+        """Test that a new window restores the burst."""
+        clock = FakeClock()
+        sampling = SamplingFilter(burst=1, interval=5, sample_every=10, clock=clock)
+        sampling.filter(_record("invalid_row"))
+        assert not sampling.filter(_record("invalid_row"))
+        clock.now = 5.0
+        record = _record("invalid_row")
+        assert sampling.filter(record)
+        assert record.grading_suppressed == 1
+
+    def test_should_not_sample_below_min_level(self):
+        """Test that info events always pass."""
+        sampling = SamplingFilter(burst=0, clock=FakeClock())
+        assert sampling.filter(_record("batch_started", logging.INFO))
+
+    def test_should_reject_invalid_settings(self):
+        """Test the settings validation."""
+        with pytest.raises(ValueError, match="sample_every must be a positive"):
+            SamplingFilter(sample_every=0)
+
+
+class TestJsonFormatter:
+    """Test cases for JsonFormatter class."""
+
+    def test_should_format_fields_as_json(self):
+        """Test the JSON document of a record."""
+        document = json.loads(JsonFormatter().format(_record("invalid_row", row=3)))
+        assert document["event"] == "invalid_row"
+        assert document["level"] == "WARNING"
+        assert document["row"] == 3
+        assert document["ts"].endswith("+00:00")
+
+
+class TestLevelFilter:
+    """Test cases for LevelFilter class."""
+
+    def test_should_drop_records_below_level(self):
+        """Test the level threshold."""
+        level_filter = LevelFilter(logging.ERROR)
+        assert not level_filter.filter(_record("invalid_row"))
+        assert level_filter.filter(_record("chunk_failed", logging.ERROR))
+
+
+class TestGradingLogSession:
+    """Test cases for GradingLogSession class."""
+
+    def test_should_write_events_and_count_errors(self, tmp_path):
+        """Test the queue-backed session end to end."""
+        path = str(tmp_path / "run.log")
+        logger = get_logger("test")
+        with GradingLogSession(path, "INFO") as session:
+            log_event(logger, logging.DEBUG, "ignored")
+            log_event(logger, logging.INFO, "batch_started", input="roster.csv")
+            try:
+                raise ValueError("bad row")
+            except ValueError:
+                log_event(logger, logging.ERROR, "chunk_failed", exc_info=True)
+        events = _read_events(path)
+        assert [event["event"] for event in events] == ["batch_started", "chunk_failed"]
+        assert events[1]["error"]["type"] == "ValueError"
+        assert "bad row" in events[1]["error"]["traceback"]
+        assert session.error_counts == {"ValueError": 1}
+        root_logger = logging.getLogger(LOGGER_NAME)
+        assert root_logger.propagate
+        assert not any(
+            isinstance(handler, QueueHandler) for handler in root_logger.handlers
+        )
+
+    def test_should_log_and_count_invalid_batch_rows(self, tmp_path):
+        """Test the batch runner events, sampled but fully counted."""
+        rows = [("U001", [15.0], [100.0], True)]
+        rows += [(f"U1{index:02d}", [25.0], [100.0], True) for index in range(30)]
+        input_path = str(tmp_path / "roster.csv")
+        write_roster(rows, input_path)
+        path = str(tmp_path / "run.log")
+        sampling = SamplingFilter(burst=5, sample_every=10)
+        with GradingLogSession(path, sampling_filter=sampling) as session:
+            BatchRunner(ExtraPointsPolicy([False]), 0, skip_invalid=True).run(
+                input_path, str(tmp_path / "results.csv")
+            )
+        events = _read_events(path)
+        invalid = [event for event in events if event["event"] == "invalid_row"]
+        assert len(invalid) == 7
+        assert invalid[-1]["suppressed"] == 9
+        assert events[-1]["event"] == "batch_finished"
+        assert events[-1]["skipped"] == 30
+        assert sum(session.error_counts.values()) == 30
+        assert session.suppressed == 23
+
+    def test_should_count_warnings_below_level(self, tmp_path):
+        """Test that warnings are counted even when not written."""
+        path = str(tmp_path / "run.log")
+        logger = get_logger("test")
+        with GradingLogSession(path, "ERROR") as session:
+            log_event(logger, logging.INFO, "batch_started")
+            log_event(logger, logging.WARNING, "invalid_row", code="A")
+            log_event(logger, logging.ERROR, "chunk_failed", code="B")
+        assert [event["event"] for event in _read_events(path)] == ["chunk_failed"]
+        assert session.error_counts == {"A": 1, "B": 1}
+
+    def test_should_reject_unknown_level(self):
+        """Test the level validation."""
+        with pytest.raises(ValueError, match="Unknown log level: TRACE"):
+            GradingLogSession(level="TRACE")
@@ -0,0 +1,121 @@
+"""
+Unit tests for the load generator module.
+"""
+
+import pytest
+
+from src import load_generator
+from src.grade_calculator import GradeCalculator
+from src.load_generator import LoadGenerator, LoadReport, SyntheticStudentFactory
+from src.student import Student
+
+
+class TestSyntheticStudentFactory:
+    """Test cases for SyntheticStudentFactory class."""
+
+    def test_should_create_weights_summing_to_100(self):
+        """Test that weights always sum to the expected total."""
+        factory = SyntheticStudentFactory(seed=1)
+        for count in range(1, Student.MAX_EVALUATIONS + 1):
+            weights = factory.create_weights(count)
+            assert len(weights) == count
+            assert sum(weights) == GradeCalculator.EXPECTED_TOTAL_WEIGHT
+
+    def test_should_be_reproducible_with_same_seed(self):
+        """Test that the same seed yields the same students."""
+        first = SyntheticStudentFactory(seed=7).create_student("U001")
+        second = SyntheticStudentFactory(seed=7).create_student("U001")
+        assert [(e.grade, e.weight) for e in first.evaluations] == [
+            (e.grade, e.weight) for e in second.evaluations
+        ]
+        assert (
+            first.has_reached_minimum_attendance
+            == second.has_reached_minimum_attendance
+        )
+
+    def test_should_create_consensus_vector(self):
+        """Test the length of the consensus vector."""
+        assert len(SyntheticStudentFactory(seed=1).create_consensus(4)) == 4
+
+    def test_should_raise_error_when_rate_out_of_range(self):
+        """Test that rates outside 0-1 raise ValueError."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            SyntheticStudentFactory(seed=1, attendance_rate=1.5)
+
+
+class TestLoadReport:
+    """Test cases for LoadReport class."""
+
+    def test_should_compute_nearest_rank_percentiles(self):
+        """Test latency percentiles."""
+        report = LoadReport("constant", 4, 0, 2.0, [0.4, 0.1, 0.3, 0.2], 100, 120, [])
+        assert report.percentile(50) == 0.2
+        assert report.percentile(99) == 0.4
+        assert report.throughput == 2.0
+        assert report.rss_growth_kb == 20
+
+    def test_should_handle_empty_run(self):
+        """Test a report without requests."""
+        report = LoadReport("burst", 0, 0, 0.0, [], None, None, [])
+        assert report.percentile(99) == 0.0
+        assert report.throughput == 0.0
+        assert report.to_dict()["rss_growth_kb"] is None
+        assert report.to_dict()["peak_rss_kb"] is None
+
+    def test_should_report_peak_rss_in_kilobytes(self, monkeypatch):
+        """Test that macOS ru_maxrss bytes are converted to kilobytes."""
+        resource = pytest.importorskip("resource")
+        peak_kb = load_generator._peak_rss_kb()
+        monkeypatch.setattr(load_generator.sys, "platform", "darwin")
+        expected = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+        assert load_generator._peak_rss_kb() == expected
+        assert peak_kb >= expected
+
+
+class TestLoadGenerator:
+    """Test cases for LoadGenerator class."""
+
+    def test_should_run_at_constant_rate(self):
+        """Test a short constant-rate run."""
+        report = LoadGenerator(seed=3).run_constant_rate(200, 0.05)
+        assert report.requests >= 1
+        assert report.errors == 0
+        assert report.to_dict()["mode"] == LoadGenerator.CONSTANT_MODE
+
+    def test_should_run_in_bursts(self):
+        """Test that bursts issue whole batches."""
+        report = LoadGenerator(seed=3).run_bursts(25, 0.02, 0.05)
+        assert report.requests % 25 == 0
+        assert report.requests >= 25
+
+    def test_should_not_time_student_generation(self, monkeypatch):
+        """Test that building the synthetic students is outside the latency."""
+        create_student = SyntheticStudentFactory.create_student
+
+        def slow_create_student(factory, student_id):
+            load_generator.time.sleep(0.01)
+            return create_student(factory, student_id)
+
+        monkeypatch.setattr(
+            SyntheticStudentFactory, "create_student", slow_create_student
+        )
+        report = LoadGenerator(seed=3).run_bursts(5, 0.2, 0.05)
+        assert report.requests == 5
+        assert max(report.latencies) < 0.01
+
+    def test_should_measure_from_scheduled_send_time(self, monkeypatch):
+        """Test that a run falling behind its rate reports the backlog."""
+        grade = LoadGenerator._grade
+
+        def slow_grade(generator, student, year_index):
+            load_generator.time.sleep(0.01)
+            return grade(generator, student, year_index)
+
+        monkeypatch.setattr(LoadGenerator, "_grade", slow_grade)
+        report = LoadGenerator(seed=3).run_constant_rate(1000, 0.05)
+        assert report.latencies[-1] > 10 * report.latencies[0]
+
+    def test_should_raise_error_when_rate_not_positive(self):
+        """Test that a zero rate raises ValueError."""
+        with pytest.raises(ValueError, match="rate_per_second"):
+            LoadGenerator().run_constant_rate(0, 1.0)
@@ -0,0 +1,132 @@
+"""
+Unit tests for the pass probability module.
+"""
+
+import random
+
+import pytest
+
+from src.attendance_policy import AttendancePolicy
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+from src.pass_probability import PassProbability, PassProbabilityEngine
+from src.student import Student
+
+FINAL_EXAM = [8.0, 10.0, 12.0, 14.0, 16.0]
+
+
+def _passes(grades, weights, has_consensus):
+    """Grade a full set of evaluations with GradeCalculator."""
+    calculator = GradeCalculator(
+        evaluations=[
+            Evaluation(grade, weight) for grade, weight in zip(grades, weights)
+        ],
+        attendance_policy=AttendancePolicy(True),
+        extra_points_policy=ExtraPointsPolicy([has_consensus]),
+        current_year_index=0,
+    )
+    final_grade = calculator.calculate_final_grade().final_grade
+    return final_grade >= GradeCalculator.PASSING_GRADE
+
+
+class TestPassProbabilityEngine:
+    """Test cases for PassProbabilityEngine class."""
+
+    def test_should_count_samples_like_grading_each_one(self):
+        """Test against grading every sampled outcome with GradeCalculator."""
+        distributions = [FINAL_EXAM, [5.0, 11.0, 18.0]]
+        engine = PassProbabilityEngine(distributions, samples=300, seed=3)
+        generator = random.Random(3)
+        draws = [generator.choices(observed, k=300) for observed in distributions]
+        for graded, has_consensus in [(9.0, False), (11.0, False), (10.0, True)]:
+            expected = sum(
+                _passes([graded, first, second], [40.0, 30.0, 30.0], has_consensus)
+                for first, second in zip(*draws)
+            )
+            estimate = engine.estimate(
+                [Evaluation(graded, 40.0)], [30.0, 30.0], True, has_consensus
+            )
+            assert estimate.passing_samples == expected
+
+    def test_should_resolve_exact_ties(self):
+        """Test a threshold falling exactly on sampled outcomes."""
+        engine = PassProbabilityEngine([[10.0, 12.0]], samples=1000, seed=1)
+        estimate = engine.estimate([Evaluation(10.0, 50.0)], [50.0], True, False)
+        assert 0.4 < estimate.probability < 0.6
+
+    def test_should_be_reproducible_and_independent_of_the_cohort(self):
+        """Test that a student's estimate only depends on the seed."""
+        row = ([9.0], [60.0], [40.0], True, False)
+        other = ([15.0, 3.0], [30.0, 30.0], [40.0], True, True)
+        alone = PassProbabilityEngine([FINAL_EXAM], seed=5).estimate_batch(
+            *[[value] for value in row]
+        )
+        together = PassProbabilityEngine([FINAL_EXAM], seed=5).estimate_batch(
+            *[[first, second] for first, second in zip(other, row)]
+        )
+        assert together[1].passing_samples == alone[0].passing_samples
+
+    def test_should_apply_attendance_rule(self):
+        """Test that students without attendance never pass."""
+        estimate = PassProbabilityEngine([FINAL_EXAM]).estimate(
+            [Evaluation(20.0, 60.0)], [40.0], False, True
+        )
+        assert estimate.probability == 0.0
+        assert estimate.is_at_risk
+
+    def test_should_handle_students_without_pending_evaluations(self):
+        """Test a complete course, which passes or fails with certainty."""
+        engine = PassProbabilityEngine([FINAL_EXAM], samples=50)
+        passed = engine.estimate([Evaluation(11.0, 100.0)], [], True, False)
+        failed = engine.estimate([Evaluation(10.0, 100.0)], [], True, False)
+        assert (passed.probability, failed.probability) == (1.0, 0.0)
+
+    def test_should_estimate_from_student(self):
+        """Test the Student convenience method with extra points."""
+        student = Student("U001", has_reached_minimum_attendance=True)
+        student.add_evaluation(Evaluation(8.0, 60.0))
+        engine = PassProbabilityEngine([FINAL_EXAM])
+        without, with_extra = [
+            engine.estimate_student(student, [40.0], ExtraPointsPolicy([consensus]), 0)
+            for consensus in (False, True)
+        ]
+        assert 0.0 < without.probability < with_extra.probability
+
+    def test_should_describe_estimate(self):
+        """Test the breakdown and standard error."""
+        details = PassProbability(25, 100).get_details()
+        assert details == {
+            "probability": 0.25,
+            "standard_error": 0.0433,
+            "passing_samples": 25,
+            "samples": 100,
+            "at_risk": True,
+        }
+
+    def test_should_reject_more_pending_evaluations_than_distributions(self):
+        """Test the pending evaluation count validation."""
+        with pytest.raises(ValueError, match="Row 0: has 2 pending evaluations"):
+            PassProbabilityEngine([FINAL_EXAM]).estimate(
+                [Evaluation(10.0, 50.0)], [25.0, 25.0], True, False
+            )
+
+    def test_should_reject_invalid_weights(self):
+        """Test that rows are validated like PassingGradeSolver does."""
+        with pytest.raises(ValueError, match="Row 0: graded and pending weights"):
+            PassProbabilityEngine([FINAL_EXAM]).estimate(
+                [Evaluation(10.0, 50.0)], [40.0], True, False
+            )
+
+    @pytest.mark.parametrize(
+        "distributions, samples, message",
+        [
+            ([[]], 10, "Distribution 0 must have at least one grade"),
+            ([[21.0]], 10, "Distribution 0: grade must be between"),
+            ([FINAL_EXAM], 0, "samples must be a positive integer"),
+        ],
+    )
+    def test_should_reject_invalid_engine(self, distributions, samples, message):
+        """Test the engine validation."""
+        with pytest.raises(ValueError, match=message):
+            PassProbabilityEngine(distributions, samples=samples)
@@ -0,0 +1,85 @@
+"""
+Unit tests for the profiling module.
+"""
+
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from src.evaluation import Evaluation
+from src.profiling import ProfileSession
+
+
+def build_evaluations():
+    """Allocate evaluations from src/ so they show up in the report."""
+    return [Evaluation(15.0, 10.0) for _ in range(500)]
+
+
+class TestProfileSession:
+    """Test cases for ProfileSession class."""
+
+    def test_should_write_all_reports(self, tmp_path):
+        """Test that every report file is written."""
+        with ProfileSession(str(tmp_path)):
+            build_evaluations()
+
+        for file_name in (
+            ProfileSession.RAW_STATS_FILE,
+            ProfileSession.STATS_FILE,
+            ProfileSession.COLLAPSED_FILE,
+            ProfileSession.ALLOCATIONS_FILE,
+        ):
+            assert os.path.exists(tmp_path / file_name)
+
+    def test_should_write_collapsed_stacks(self, tmp_path):
+        """Test the flamegraph collapsed-stack format."""
+        with ProfileSession(str(tmp_path)):
+            build_evaluations()
+
+        lines = (tmp_path / ProfileSession.COLLAPSED_FILE).read_text().splitlines()
+        assert lines
+        for line in lines:
+            frames, microseconds = line.rsplit(" ", 1)
+            assert frames
+            assert int(microseconds) > 0
+
+    def test_should_report_allocation_sites_in_src(self, tmp_path):
+        """Test that allocations released before the exit are reported."""
+        with ProfileSession(str(tmp_path)) as session:
+            evaluations = build_evaluations()
+            time.sleep(ProfileSession.SAMPLE_INTERVAL * 20)
+            del evaluations
+
+        assert any("evaluation.py" in site[0] for site in session.allocation_sites)
+        assert "Top allocation sites" in session.summary()
+
+    def test_should_report_only_allocations_of_the_run(self, tmp_path):
+        """Test that memory allocated before the session is not reported."""
+        tracemalloc.start()
+        try:
+            evaluations = build_evaluations()
+            with ProfileSession(str(tmp_path)) as session:
+                pass
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+        assert evaluations
+        assert not any(
+            "evaluation.py" in site[0] for site in session.allocation_sites
+        )
+
+    def test_should_write_reports_when_run_fails(self, tmp_path):
+        """Test that reports are written even if the run raises."""
+        with pytest.raises(RuntimeError):
+            with ProfileSession(str(tmp_path)):
+                raise RuntimeError("boom")
+        assert os.path.exists(tmp_path / ProfileSession.STATS_FILE)
+
+    def test_should_raise_error_when_output_directory_empty(self):
+        """Test that an empty output directory raises ValueError."""
+        with pytest.raises(ValueError, match="output_directory"):
+            ProfileSession("")
+
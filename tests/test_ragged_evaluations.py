@@ -0,0 +1,108 @@
+"""
+Unit tests for the ragged evaluations module.
+"""
+
+import math
+from array import array
+
+import pytest
+
+from src.attendance_policy import AttendancePolicy
+from src.batch_grader import BatchGradeCalculator
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+from src.ragged_evaluations import RaggedEvaluations
+from src.roster_generator import RosterGenerator
+
+
+class TestRaggedEvaluations:
+    """Test cases for RaggedEvaluations class."""
+
+    def test_should_pack_rows_back_to_back(self):
+        """Test the CSR layout of a small roster."""
+        ragged = RaggedEvaluations.from_columns(
+            [[15.0], [10.0, 20.0, 12.0]], [[100.0], [30.0, 30.0, 40.0]]
+        )
+        assert list(ragged.offsets) == [0, 1, 4]
+        assert ragged.counts() == [1, 3]
+        assert ragged.row(1) == ([10.0, 20.0, 12.0], [30.0, 30.0, 40.0])
+        assert len(ragged) == 2
+        assert ragged.nbytes == 4 * 8 * 2 + 3 * 8
+
+    def test_should_match_grade_calculator_exactly(self):
+        """Test weighted averages and results against the single-student path."""
+        roster = RosterGenerator(11).generate(300)
+        students = roster.to_students()
+        ragged = RaggedEvaluations.from_students(students)
+        assert ragged.weighted_averages() == [
+            GradeCalculator(
+                student.evaluation_view,
+                AttendancePolicy(True),
+                ExtraPointsPolicy([False]),
+                0,
+            ).calculate_final_grade().weighted_average
+            for student in students
+        ]
+
+        consensus = [index % 3 == 0 for index in range(len(roster))]
+        expected = BatchGradeCalculator().calculate_batch(
+            roster.grades, roster.weights, roster.attendance, consensus
+        )
+        results = RaggedEvaluations.from_roster(roster).grade(
+            roster.attendance, consensus
+        )
+        assert [vars(result) for result in results] == [
+            vars(result) for result in expected
+        ]
+
+    def test_should_sum_weights_per_row(self):
+        """Test the weight totals and the rows that do not reach 100."""
+        ragged = RaggedEvaluations.from_columns(
+            [[10.0, 10.0], [10.0], [10.0, 10.0]],
+            [[50.0, 50.0], [90.0], [60.0, 30.0]],
+        )
+        assert ragged.weight_totals() == [100.0, 90.0, 90.0]
+        assert ragged.invalid_weight_rows() == [1, 2]
+
+    @pytest.mark.parametrize(
+        "grades, weights, message",
+        [
+            ([[15.0], []], [[100.0], []], "Row 1: must have at least one evaluation"),
+            ([[15.0] * 11], [[100.0 / 11] * 11], "Row 0: cannot have more than 10"),
+            ([[15.0], [25.0]], [[100.0], [100.0]], "Row 1: grade must be between"),
+            ([[15.0], [math.nan]], [[100.0], [100.0]], "Row 1: grade must be between"),
+            ([[15.0], [10.0]], [[100.0], [99.0]], "Row 1: total weight must sum"),
+        ],
+    )
+    def test_should_report_first_invalid_row(self, grades, weights, message):
+        """Test that validation reports rows like validate_row does."""
+        ragged = RaggedEvaluations.from_columns(grades, weights)
+        with pytest.raises(ValueError, match=message):
+            ragged.grade([True] * len(grades), [False] * len(grades))
+
+    def test_should_reject_mismatched_rows(self):
+        """Test the packing validation."""
+        with pytest.raises(ValueError, match="Row 0: grades and weights must have"):
+            RaggedEvaluations.from_columns([[15.0, 12.0]], [[100.0]])
+        with pytest.raises(ValueError, match="Row 0: grades and weights must be"):
+            RaggedEvaluations.from_columns([["15"]], [[100.0]])
+
+    @pytest.mark.parametrize("attendance", ["n", None])
+    def test_should_reject_non_boolean_attendance(self, attendance):
+        """Test that attendance is checked before grading."""
+        ragged = RaggedEvaluations.from_columns([[10.0]], [[100.0]])
+        with pytest.raises(ValueError, match="Row 0: has_reached_minimum"):
+            ragged.grade([attendance], [False])
+
+    def test_should_reject_invalid_offsets(self):
+        """Test the layout validation of raw arrays."""
+        values = array("d", [15.0, 12.0])
+        with pytest.raises(ValueError, match="offsets must be non-decreasing"):
+            RaggedEvaluations(values, values, array("q", [0, 2, 1, 2]))
+        with pytest.raises(ValueError, match="offsets must start at 0"):
+            RaggedEvaluations(values, values, array("q", [0, 1]))
+
+    def test_should_grade_empty_roster(self):
+        """Test that an empty roster grades to no results."""
+        ragged = RaggedEvaluations.from_columns([], [])
+        assert ragged.grade([], []) == []
@@ -0,0 +1,145 @@
+"""
+Unit tests for the ranking index module.
+"""
+
+import pytest
+
+from src.grade_calculator import GradeCalculationResult
+from src.ranking_index import RankingIndex, SectionRanking
+
+
+def make_section():
+    """Build a section ranking with five students."""
+    ranking = SectionRanking()
+    for student_id, grade in [
+        ("U001", 15.0),
+        ("U002", 10.8),
+        ("U003", 11.2),
+        ("U004", 18.0),
+        ("U005", 15.0),
+    ]:
+        ranking.update(student_id, grade)
+    return ranking
+
+
+class TestSectionRanking:
+    """Test cases for SectionRanking class."""
+
+    def test_should_rank_highest_grade_first(self):
+        """Test ranks in descending grade order."""
+        ranking = make_section()
+        assert ranking.rank("U004") == 1
+        assert ranking.rank("U002") == 5
+
+    def test_should_share_rank_on_ties(self):
+        """Test that equal grades share a rank."""
+        ranking = make_section()
+        assert ranking.rank("U001") == ranking.rank("U005") == 2
+        assert ranking.rank("U003") == 4
+
+    def test_should_return_top_percent(self):
+        """Test top percentage queries round the count up."""
+        ranking = make_section()
+        assert ranking.top_percent(10) == [("U004", 18.0)]
+        assert len(ranking.top_percent(50)) == 3
+        assert ranking.top_percent(0) == []
+
+    def test_should_return_students_in_grade_band(self):
+        """Test inclusive grade band queries."""
+        ranking = make_section()
+        assert ranking.in_band(11.2, 15.0) == [
+            ("U005", 15.0),
+            ("U001", 15.0),
+            ("U003", 11.2),
+        ]
+
+    def test_should_return_students_near_passing(self):
+        """Test students within a margin of the passing grade."""
+        ranking = make_section()
+        near = [student_id for student_id, _ in ranking.near_passing(0.5)]
+        assert near == ["U003", "U002"]
+
+    def test_should_count_passing_students(self):
+        """Test the passing count."""
+        assert make_section().count_passing() == 4
+
+    def test_should_move_student_on_incremental_update(self):
+        """Test that recalculated grades replace the previous one."""
+        ranking = make_section()
+        ranking.update("U002", 19.0)
+        assert ranking.rank("U002") == 1
+        assert ranking.get_grade("U002") == 19.0
+        assert len(ranking) == 5
+
+    def test_should_remove_student(self):
+        """Test removing a student from the ranking."""
+        ranking = make_section()
+        ranking.remove("U004")
+        assert "U004" not in ranking
+        assert ranking.rank("U001") == 1
+
+    def test_should_raise_error_when_student_not_ranked(self):
+        """Test that unknown students raise ValueError."""
+        with pytest.raises(ValueError, match="not ranked"):
+            SectionRanking().rank("U999")
+
+    def test_should_raise_error_when_grade_out_of_range(self):
+        """Test that grades outside 0-20 raise ValueError."""
+        with pytest.raises(ValueError, match="between"):
+            SectionRanking().update("U001", 21.0)
+
+    def test_should_raise_error_when_band_inverted(self):
+        """Test that an inverted band raises ValueError."""
+        with pytest.raises(ValueError, match="cannot be greater"):
+            make_section().in_band(15.0, 10.0)
+
+
+class TestRankingIndex:
+    """Test cases for RankingIndex class."""
+
+    def test_should_keep_sections_separate(self):
+        """Test that each section has its own ranking."""
+        index = RankingIndex()
+        index.update("A", "U001", 12.0)
+        index.update("B", "U002", 18.0)
+        assert index.section("A").rank("U001") == 1
+        assert index.sections == ["A", "B"]
+
+    def test_should_move_student_between_sections(self):
+        """Test that updating in another section moves the student."""
+        index = RankingIndex()
+        index.update("A", "U001", 12.0)
+        index.update("B", "U001", 13.0)
+        assert "U001" not in index.section("A")
+        assert index.section_of("U001") == "B"
+
+    def test_should_leave_index_unchanged_on_invalid_move(self):
+        """Test that a rejected update keeps the student in their section."""
+        index = RankingIndex()
+        index.update("A", "U1", 12.0)
+        with pytest.raises(ValueError, match="Final grade must be between"):
+            index.update("B", "U1", 25.0)
+        assert index.section("A").get_grade("U1") == 12.0
+        assert index.sections == ["A"]
+        index.remove("U1")
+        assert index.section_of("U1") is None
+
+    def test_should_index_batch_results(self):
+        """Test indexing results of a batch calculation."""
+        index = RankingIndex()
+        results = [
+            GradeCalculationResult(14.0, False, 0.0, 14.0),
+            GradeCalculationResult(16.0, False, 1.0, 17.0),
+        ]
+        index.update_results("A", ["U001", "U002"], results)
+        assert index.section("A").top(1) == [("U002", 17.0)]
+
+    def test_should_raise_error_when_section_unknown(self):
+        """Test that unknown sections raise ValueError."""
+        with pytest.raises(ValueError, match="no ranked students"):
+            RankingIndex().section("Z")
+
+    def test_should_raise_error_when_removing_unknown_student(self):
+        """Test that removing an unknown student raises ValueError."""
+        with pytest.raises(ValueError, match="not ranked"):
+            RankingIndex().remove("U999")
@@ -0,0 +1,71 @@
+"""
+Unit tests for the regrade replay module.
+"""
+
+import pytest
+
+from src.attendance_policy import AttendancePolicy
+from src.audit_log import AuditLog
+from src.batch_grader import BatchGradeCalculator, GradingRules
+from src.evaluation import Evaluation
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+from src.regrade_replay import ReplayEngine
+
+
+def write_history(audit_log):
+    """Grade three students through GradeCalculator into the log."""
+    rows = [
+        ("U001", [(15.0, 50.0), (16.0, 50.0)], True),
+        ("U002", [(12.0, 100.0)], False),
+        ("U003", [(20.0, 100.0)], True),
+    ]
+    for student_id, evaluations, attendance in rows:
+        GradeCalculator(
+            [Evaluation(grade, weight) for grade, weight in evaluations],
+            AttendancePolicy(attendance),
+            ExtraPointsPolicy([True, False]),
+            0,
+            audit_log=audit_log,
+            student_id=student_id,
+        ).calculate_final_grade()
+
+
+class TestReplayEngine:
+    """Test cases for ReplayEngine class."""
+
+    def test_should_report_nothing_under_same_rules(self, tmp_path):
+        """Test that replaying with unchanged rules yields no changes."""
+        with AuditLog(str(tmp_path / "audit.jsonl")) as audit_log:
+            write_history(audit_log)
+            engine = ReplayEngine(BatchGradeCalculator(), chunk_size=2)
+            assert list(engine.replay(audit_log)) == []
+
+    def test_should_report_only_changed_students(self, tmp_path):
+        """Test that a new extra points value changes only affected grades."""
+        with AuditLog(str(tmp_path / "audit.jsonl")) as audit_log:
+            write_history(audit_log)
+            calculator = BatchGradeCalculator(GradingRules(extra_points_value=2.0))
+            changes = list(ReplayEngine(calculator).replay(audit_log))
+
+        assert [change.student_id for change in changes] == ["U001"]
+        assert changes[0].previous_final_grade == 16.5
+        assert changes[0].new_final_grade == 17.5
+        assert changes[0].difference == 1.0
+
+    def test_should_replace_recorded_consensus(self, tmp_path):
+        """Test replaying with a corrected consensus history."""
+        with AuditLog(str(tmp_path / "audit.jsonl")) as audit_log:
+            write_history(audit_log)
+            engine = ReplayEngine(
+                BatchGradeCalculator(), extra_points_policy=ExtraPointsPolicy([False])
+            )
+            changes = list(engine.replay(audit_log))
+
+        assert [change.student_id for change in changes] == ["U001"]
+        assert changes[0].new_final_grade == 15.5
+
+    def test_should_raise_error_when_chunk_size_invalid(self):
+        """Test that a non-positive chunk size raises ValueError."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            ReplayEngine(BatchGradeCalculator(), chunk_size=0)
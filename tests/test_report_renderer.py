@@ -0,0 +1,130 @@
+"""
+Unit tests for the report renderer module.
+"""
+
+import pytest
+
+from src.grade_calculator import GradeCalculationResult
+from src.rounding_policy import RoundingPolicy
+from src.report_renderer import (
+    HTML_FOOTER,
+    HTML_FORMAT,
+    HTML_HEADER,
+    TEXT_SLIP,
+    ReportRenderer,
+    ReportTemplate,
+)
+
+
+def make_result(final_grade=16.0, penalty=False):
+    """Build a grade calculation result."""
+    return GradeCalculationResult(15.0, penalty, 1.0, final_grade)
+
+
+class TestReportTemplate:
+    """Test cases for ReportTemplate class."""
+
+    def test_should_render_breakdown(self):
+        """Test the built-in text slip."""
+        slip = ReportTemplate(TEXT_SLIP).render("U001", make_result())
+        assert "Estudiante: U001" in slip
+        assert "  1. Promedio Ponderado: 15.00" in slip
+        assert "  2. Penalizacion por Asistencia: NO" in slip
+        assert "  3. Puntos Extra Aplicados: +1.00" in slip
+        assert "NOTA FINAL: 16.00" in slip
+
+    def test_should_show_attendance_penalty(self):
+        """Test the penalty wording."""
+        template = ReportTemplate("$attendance_penalty")
+        assert template.render("U001", make_result(0.0, True)) == "SI (Nota = 0)"
+
+    def test_should_keep_literal_braces_and_dollars(self):
+        """Test that only placeholders are substituted."""
+        template = ReportTemplate("{css} $$5 ${student_id}x")
+        assert template.render("U001", make_result()) == "{css} $5 U001x"
+        assert template.fields == ("student_id",)
+
+    def test_should_reject_unknown_field(self):
+        """Test that typos fail when the template is compiled."""
+        with pytest.raises(ValueError, match="Unknown template field: grade"):
+            ReportTemplate("$grade")
+
+    def test_should_reject_invalid_placeholder(self):
+        """Test the string.Template syntax check."""
+        with pytest.raises(ValueError, match="Invalid placeholder"):
+            ReportTemplate("cost: $ 5")
+
+    def test_should_escape_html_values(self):
+        """Test that identifiers cannot inject markup."""
+        template = ReportTemplate("<b>$student_id</b>", escape_html=True)
+        assert template.render("<U&1>", make_result()) == "<b>&lt;U&amp;1&gt;</b>"
+
+
+class TestReportRenderer:
+    """Test cases for ReportRenderer class."""
+
+    def test_should_render_batch_in_order(self):
+        """Test that batches concatenate slips in input order."""
+        renderer = ReportRenderer(template=ReportTemplate("$student_id;"))
+        slips = [("U001", make_result()), ("U002", make_result())]
+        assert renderer.render_batch(slips) == "U001;U002;"
+
+    def test_should_write_text_file_in_batches(self, tmp_path):
+        """Test writing more slips than one batch."""
+        renderer = ReportRenderer(
+            template=ReportTemplate("$student_id\n"), batch_size=2
+        )
+        path = tmp_path / "slips.txt"
+        slips = ((f"U{index}", make_result()) for index in range(5))
+        assert renderer.write(slips, str(path)) == 5
+        assert path.read_text(encoding="utf-8") == "U0\nU1\nU2\nU3\nU4\n"
+
+    def test_should_wrap_html_document(self, tmp_path):
+        """Test the HTML document around the slips."""
+        path = tmp_path / "slips.html"
+        ReportRenderer(HTML_FORMAT).write([("U001", make_result())], str(path))
+        content = path.read_text(encoding="utf-8")
+        assert content.startswith(HTML_HEADER)
+        assert content.endswith(HTML_FOOTER)
+        assert content.count('<section class="slip">') == 1
+
+    def test_should_match_sequential_output_with_workers(self, tmp_path):
+        """Test that parallel rendering keeps the input order."""
+        slips = [(f"U{index:03d}", make_result(index % 20)) for index in range(50)]
+        sequential_path = tmp_path / "sequential.txt"
+        parallel_path = tmp_path / "parallel.txt"
+        ReportRenderer(batch_size=7).write(slips, str(sequential_path))
+        written = ReportRenderer(workers=2, batch_size=7).write(
+            slips, str(parallel_path)
+        )
+        assert written == 50
+        assert parallel_path.read_text(encoding="utf-8") == (
+            sequential_path.read_text(encoding="utf-8")
+        )
+
+    def test_should_send_template_once_to_workers(self, tmp_path):
+        """Test that workers render with the renderer's own template."""
+        slips = [(f"U<{index}>", make_result(index + 0.5)) for index in range(20)]
+        sequential_path = tmp_path / "sequential.html"
+        parallel_path = tmp_path / "parallel.html"
+        policy = RoundingPolicy("truncate", 0)
+        ReportRenderer(HTML_FORMAT, rounding_policy=policy).write(
+            slips, str(sequential_path)
+        )
+        ReportRenderer(
+            HTML_FORMAT, workers=2, batch_size=3, rounding_policy=policy
+        ).write(slips, str(parallel_path))
+        content = parallel_path.read_text(encoding="utf-8")
+        assert content == sequential_path.read_text(encoding="utf-8")
+        assert "U&lt;3&gt;" in content
+
+    def test_should_reject_unknown_format(self):
+        """Test the output format check."""
+        with pytest.raises(ValueError, match="Unknown report format: pdf"):
+            ReportRenderer("pdf")
+
+    @pytest.mark.parametrize("field", ["workers", "batch_size"])
+    def test_should_reject_invalid_sizes(self, field):
+        """Test that workers and batch_size must be positive."""
+        with pytest.raises(ValueError, match=field):
+            ReportRenderer(**{field: 0})
@@ -0,0 +1,197 @@
+"""
+Unit tests for the result cache module.
+"""
+
+import csv
+import os
+
+import pytest
+
+from src.batch_grader import GradingRules
+from src.batch_runner import BatchRunner
+from src.extra_points_policy import ExtraPointsPolicy
+from src.result_cache import RULE_SOURCES, ResultCache, rules_fingerprint
+from src.roster_columns import RosterColumns
+from src.roster_generator import RosterGenerator
+from src.roster_io import write_roster
+from src.streaming_pipeline import StreamingPipeline
+
+
+def read_results(path):
+    """Read a results CSV into a list of rows."""
+    with open(path, encoding="utf-8", newline="") as results_file:
+        return list(csv.reader(results_file))
+
+
+def make_chunk(grade=15.0):
+    """Build a one-row roster chunk."""
+    return RosterColumns(["U001"], [[grade]], [[100.0]], [True])
+
+
+class TestRulesFingerprint:
+    """Test cases for rules_fingerprint function."""
+
+    def test_should_change_when_a_rule_source_changes(self, tmp_path):
+        """Test that editing a rule module changes the fingerprint."""
+        for name in RULE_SOURCES:
+            (tmp_path / name).write_text("# rules\n", encoding="utf-8")
+        before = rules_fingerprint(str(tmp_path))
+        (tmp_path / RULE_SOURCES[0]).write_text("# edited\n", encoding="utf-8")
+        assert rules_fingerprint(str(tmp_path)) != before
+
+    @pytest.mark.parametrize(
+        "name", ["rounding_policy.py", "batch_runner.py", "shared_roster.py"]
+    )
+    def test_should_change_when_result_formatting_changes(self, tmp_path, name):
+        """Test that the code producing the cached rows is fingerprinted."""
+        for source in RULE_SOURCES:
+            (tmp_path / source).write_text("# rules\n", encoding="utf-8")
+        before = rules_fingerprint(str(tmp_path))
+        (tmp_path / name).write_text("# edited\n", encoding="utf-8")
+        assert rules_fingerprint(str(tmp_path)) != before
+
+    def test_should_fingerprint_installed_sources(self):
+        """Test the default source directory."""
+        assert rules_fingerprint() == rules_fingerprint()
+        assert len(rules_fingerprint()) == 64
+
+
+class TestResultCache:
+    """Test cases for ResultCache class."""
+
+    def test_should_miss_then_hit(self, tmp_path):
+        """Test a stored entry is served back."""
+        cache = ResultCache(str(tmp_path))
+        key = cache.chunk_key(GradingRules(), True, make_chunk())
+        assert cache.get(key) is None
+        cache.put(key, [["U001", 15.0, False, 1.0, 16.0]])
+        assert cache.get(key) == [["U001", 15.0, False, 1.0, 16.0]]
+        assert cache.stats.to_dict() == {
+            "hits": 1,
+            "misses": 1,
+            "writes": 1,
+            "evictions": 0,
+        }
+
+    def test_should_address_by_inputs_rules_and_fingerprint(self, tmp_path):
+        """Test that any input change yields a different key."""
+        cache = ResultCache(str(tmp_path), fingerprint="a")
+        key = cache.chunk_key(GradingRules(), True, make_chunk())
+        assert key == cache.chunk_key(GradingRules(), True, make_chunk())
+        assert key != cache.chunk_key(GradingRules(), False, make_chunk())
+        assert key != cache.chunk_key(GradingRules(), True, make_chunk(14.0))
+        assert key != cache.chunk_key(
+            GradingRules(extra_points_value=2.0), True, make_chunk()
+        )
+        other = ResultCache(str(tmp_path), fingerprint="b")
+        assert key != other.chunk_key(GradingRules(), True, make_chunk())
+
+    def test_should_persist_across_instances(self, tmp_path):
+        """Test that a new process sees the stored entries."""
+        ResultCache(str(tmp_path)).put("ab12", [1, 2, 3])
+        cache = ResultCache(str(tmp_path))
+        assert "ab12" in cache
+        assert cache.get("ab12") == [1, 2, 3]
+        assert cache.total_bytes == len(b"[1,2,3]")
+
+    def test_should_leave_no_temporary_files(self, tmp_path):
+        """Test that writes are renamed into place."""
+        cache = ResultCache(str(tmp_path))
+        cache.put("ab12", [1])
+        cache.put("ab12", [2])
+        assert os.listdir(tmp_path / "ab") == ["ab12.json"]
+        assert cache.get("ab12") == [2]
+        assert len(cache) == 1
+
+    def test_should_evict_least_recently_used(self, tmp_path):
+        """Test size-bounded eviction."""
+        cache = ResultCache(str(tmp_path), max_bytes=20)
+        cache.put("aa", [1, 2, 3])
+        cache.put("bb", [4, 5, 6])
+        cache.get("aa")
+        cache.put("cc", [7, 8, 9])
+        assert "aa" in cache and "cc" in cache
+        assert "bb" not in cache
+        assert not os.path.exists(tmp_path / "bb" / "bb.json")
+        assert cache.stats.evictions == 1
+
+    def test_should_drop_corrupted_entry(self, tmp_path):
+        """Test that unreadable entries count as misses."""
+        cache = ResultCache(str(tmp_path))
+        cache.put("ab12", [1])
+        (tmp_path / "ab" / "ab12.json").write_text("{", encoding="utf-8")
+        assert cache.get("ab12") is None
+        assert len(cache) == 0
+
+    def test_should_clear_every_entry(self, tmp_path):
+        """Test clearing the cache."""
+        cache = ResultCache(str(tmp_path))
+        cache.put("aa", [1])
+        cache.put("bb", [2])
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+
+    def test_should_reject_invalid_size(self, tmp_path):
+        """Test that max_bytes must be positive."""
+        with pytest.raises(ValueError, match="max_bytes"):
+            ResultCache(str(tmp_path), max_bytes=0)
+
+
+class TestResultCacheWithRunners:
+    """Test cases for the cache in BatchRunner and StreamingPipeline."""
+
+    @pytest.fixture
+    def roster_path(self, tmp_path):
+        """A generated roster file."""
+        path = str(tmp_path / "roster.csv")
+        write_roster(RosterGenerator(seed=4).generate(120).iter_rows(), path)
+        return path
+
+    def test_should_reuse_chunks_on_unchanged_rerun(self, tmp_path, roster_path):
+        """Test that a rerun is served from the cache with identical output."""
+        cache_dir = str(tmp_path / "cache")
+        first_path = str(tmp_path / "first.csv")
+        second_path = str(tmp_path / "second.csv")
+
+        first = ResultCache(cache_dir)
+        BatchRunner(
+            ExtraPointsPolicy([True]), 0, chunk_size=50, result_cache=first
+        ).run(roster_path, first_path)
+        second = ResultCache(cache_dir)
+        BatchRunner(
+            ExtraPointsPolicy([True]), 0, chunk_size=50, result_cache=second
+        ).run(roster_path, second_path)
+
+        assert first.stats.misses == 3
+        assert second.stats.hits == 3
+        assert read_results(second_path) == read_results(first_path)
+
+    def test_should_miss_when_rules_fingerprint_changes(self, tmp_path, roster_path):
+        """Test that a rules change invalidates cached chunks."""
+        cache_dir = str(tmp_path / "cache")
+        BatchRunner(
+            ExtraPointsPolicy([True]),
+            0,
+            result_cache=ResultCache(cache_dir, fingerprint="v1"),
+        ).run(roster_path, str(tmp_path / "first.csv"))
+        cache = ResultCache(cache_dir, fingerprint="v2")
+        BatchRunner(ExtraPointsPolicy([True]), 0, result_cache=cache).run(
+            roster_path, str(tmp_path / "second.csv")
+        )
+        assert cache.stats.hits == 0
+
+    def test_should_share_cache_with_pipeline(self, tmp_path, roster_path):
+        """Test that the pipeline reads and writes the same cache."""
+        cache = ResultCache(str(tmp_path / "cache"))
+        expected_path = str(tmp_path / "expected.csv")
+        output_path = str(tmp_path / "results.csv")
+        BatchRunner(ExtraPointsPolicy([False]), 0).run(roster_path, expected_path)
+        pipeline = StreamingPipeline(
+            ExtraPointsPolicy([False]), 0, chunk_size=40, result_cache=cache
+        )
+        pipeline.run(roster_path, output_path)
+        pipeline.run(roster_path, output_path)
+
+        assert cache.stats.hits == 3
+        assert read_results(output_path) == read_results(expected_path)
@@ -0,0 +1,55 @@
+"""
+Unit tests for the roster generator module.
+"""
+
+import pytest
+
+from src.grade_calculator import GradeCalculator
+from src.roster_generator import RosterGenerator
+
+
+class TestRosterGenerator:
+    """Test cases for RosterGenerator class."""
+
+    def test_should_generate_requested_shape(self):
+        """Test the number of students and evaluations."""
+        roster = RosterGenerator(seed=1).generate(50, 4)
+        assert len(roster) == 50
+        assert all(len(row) == 4 for row in roster.grades)
+        assert all(len(row) == 4 for row in roster.weights)
+
+    def test_should_respect_evaluation_ranges_and_weight_sum(self):
+        """Test that every generated student is a valid GradeCalculator input."""
+        roster = RosterGenerator(seed=2).generate(200)
+        for grades, weights in zip(roster.grades, roster.weights):
+            assert 1 <= len(grades) <= GradeCalculator.MAX_EVALUATIONS
+            assert all(0.0 <= grade <= 20.0 for grade in grades)
+            assert sum(weights) == GradeCalculator.EXPECTED_TOTAL_WEIGHT
+        assert len(roster.to_students()) == 200
+
+    def test_should_be_reproducible_with_same_seed(self):
+        """Test that a seed always produces the same roster."""
+        first = RosterGenerator(seed=9).generate(20)
+        second = RosterGenerator(seed=9).generate(20)
+        assert list(first.iter_rows()) == list(second.iter_rows())
+
+    def test_should_share_weights_across_section(self):
+        """Test the shared weight vector option."""
+        roster = RosterGenerator(seed=3).generate(10, 3, shared_weights=True)
+        assert all(weights == roster.weights[0] for weights in roster.weights)
+
+    def test_should_generate_unique_ids(self):
+        """Test that student ids are unique and zero-padded."""
+        roster = RosterGenerator(seed=4).generate(100, 1)
+        assert len(set(roster.student_ids)) == 100
+        assert roster.student_ids[0] == "U000000000"
+
+    def test_should_raise_error_when_evaluation_count_out_of_range(self):
+        """Test that more than MAX_EVALUATIONS raises ValueError."""
+        with pytest.raises(ValueError, match="evaluation_count"):
+            RosterGenerator(seed=1).generate(1, 11)
+
+    def test_should_raise_error_when_sharing_weights_without_count(self):
+        """Test that shared weights need a fixed evaluation count."""
+        with pytest.raises(ValueError, match="shared_weights"):
+            RosterGenerator(seed=1).generate(1, shared_weights=True)
@@ -0,0 +1,90 @@
+"""
+Unit tests for the roster columns and roster I/O modules.
+"""
+
+import pytest
+
+from src.evaluation import Evaluation
+from src.roster_columns import RosterColumns
+from src.roster_generator import RosterGenerator
+from src.roster_io import detect_format, iter_roster, read_roster, write_roster
+from src.student import Student
+
+
+class TestRosterColumns:
+    """Test cases for RosterColumns class."""
+
+    def test_should_convert_to_and_from_students(self):
+        """Test the round trip through Student objects."""
+        student = Student("U001", has_reached_minimum_attendance=True)
+        student.add_evaluation(Evaluation(15.0, 40.0))
+        student.add_evaluation(Evaluation(16.0, 60.0))
+
+        roster = RosterColumns.from_students([student])
+        restored = roster.to_students()[0]
+
+        assert roster.grades == [[15.0, 16.0]]
+        assert restored.student_id == "U001"
+        assert restored.get_evaluation_count() == 2
+
+    def test_should_slice_rows(self):
+        """Test slicing a contiguous part of the roster."""
+        roster = RosterGenerator(seed=1).generate(10, 2)
+        part = roster.slice(2, 5)
+        assert part.student_ids == roster.student_ids[2:5]
+
+    def test_should_raise_error_when_columns_differ_in_length(self):
+        """Test that mismatched columns raise ValueError."""
+        with pytest.raises(ValueError, match="same length"):
+            RosterColumns(["U001"], [], [], [])
+
+
+class TestRosterIO:
+    """Test cases for the roster I/O functions."""
+
+    @pytest.mark.parametrize("extension", [".csv", ".jsonl", ".bin"])
+    def test_should_round_trip_every_format(self, tmp_path, extension):
+        """Test that written rosters are read back unchanged."""
+        roster = RosterGenerator(seed=5).generate(30)
+        path = str(tmp_path / f"roster{extension}")
+
+        written = write_roster(roster.iter_rows(), path)
+
+        assert written == 30
+        assert list(read_roster(path).iter_rows()) == list(roster.iter_rows())
+
+    def test_should_stream_rows(self, tmp_path):
+        """Test that iter_roster yields rows lazily."""
+        path = str(tmp_path / "roster.jsonl")
+        write_roster(RosterGenerator(seed=5).iter_rows(3, 2), path)
+        rows = iter_roster(path)
+        assert next(rows)[0] == "U000000000"
+
+    def test_should_detect_format_from_extension(self):
+        """Test format detection and override."""
+        assert detect_format("roster.CSV") == "csv"
+        assert detect_format("roster.dat", "bin") == "bin"
+
+    def test_should_raise_error_when_format_unknown(self):
+        """Test that unknown extensions raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown roster format"):
+            detect_format("roster.xlsx")
+
+    def test_should_raise_error_when_binary_truncated(self, tmp_path):
+        """Test that a truncated binary roster raises ValueError."""
+        path = tmp_path / "roster.bin"
+        write_roster(RosterGenerator(seed=5).iter_rows(2, 2), str(path))
+        path.write_bytes(path.read_bytes()[:-4])
+        with pytest.raises(ValueError, match="Truncated"):
+            list(iter_roster(str(path)))
+
+    def test_should_raise_error_when_csv_row_malformed(self, tmp_path):
+        """Test that malformed CSV rows report their line."""
+        path = tmp_path / "roster.csv"
+        path.write_text(
+            "student_id,has_reached_minimum_attendance,grades,weights\n"
+            "U001,1,abc,100.0\n",
+            encoding="utf-8",
+        )
+        with pytest.raises(ValueError, match="Line 2"):
+            list(iter_roster(str(path)))
@@ -0,0 +1,146 @@
+"""
+Unit tests for the rounding policy module.
+"""
+
+import csv
+import random
+from decimal import ROUND_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+
+import pytest
+
+from src.batch_runner import BatchRunner
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculationResult
+from src.grading_daemon import GRADE, GradingDaemon
+from src.report_renderer import ReportTemplate
+from src.rounding_policy import RoundingPolicy
+from src.roster_io import write_roster
+from src.streaming_pipeline import StreamingPipeline
+
+DECIMAL_ROUNDING = {
+    RoundingPolicy.HALF_UP: ROUND_HALF_UP,
+    RoundingPolicy.HALF_EVEN: ROUND_HALF_EVEN,
+    RoundingPolicy.TRUNCATE: ROUND_DOWN,
+}
+
+
+class TestRoundingPolicy:
+    """Test cases for RoundingPolicy class."""
+
+    @pytest.mark.parametrize(
+        "mode, decimals, value, expected",
+        [
+            (RoundingPolicy.HALF_UP, 2, 2.675, 2.68),
+            (RoundingPolicy.HALF_EVEN, 2, 2.665, 2.66),
+            (RoundingPolicy.HALF_UP, 0, 14.5, 15.0),
+            (RoundingPolicy.HALF_EVEN, 0, 14.5, 14.0),
+            (RoundingPolicy.HALF_EVEN, 0, 15.5, 16.0),
+            (RoundingPolicy.TRUNCATE, 2, 0.29, 0.29),
+            (RoundingPolicy.TRUNCATE, 0, 10.999, 10.0),
+            (RoundingPolicy.HALF_UP, 1, -1.25, -1.3),
+        ],
+    )
+    def test_should_round_printed_decimal_value(self, mode, decimals, value, expected):
+        """Test the tie rules on values as they print."""
+        assert RoundingPolicy(mode, decimals).round(value) == expected
+
+    @pytest.mark.parametrize("mode", RoundingPolicy.MODES)
+    def test_should_match_decimal_rounding_on_many_values(self, mode):
+        """Property check: the fast path agrees with Decimal."""
+        generator = random.Random(7)
+        values = [generator.uniform(0, 20) for _ in range(2000)]
+        values += [generator.randrange(0, 2001) / 1000 for _ in range(2000)]
+        for decimals in range(4):
+            policy = RoundingPolicy(mode, decimals)
+            quantum = Decimal(1).scaleb(-decimals)
+            expected = [
+                float(
+                    Decimal(repr(value)).quantize(
+                        quantum, rounding=DECIMAL_ROUNDING[mode]
+                    )
+                )
+                for value in values
+            ]
+            assert policy.round_many(values) == expected
+
+    def test_should_round_every_number_of_a_result(self):
+        """Test apply on a result."""
+        result = RoundingPolicy(RoundingPolicy.HALF_UP, 0).apply(
+            GradeCalculationResult(13.5, False, 1.0, 14.5)
+        )
+        assert (result.weighted_average, result.final_grade) == (14.0, 15.0)
+        assert result.attendance_penalty_applied is False
+
+    def test_should_describe_results_like_get_details(self):
+        """Test that details keep the get_details keys."""
+        result = GradeCalculationResult(13.456, True, 0.0, 0.0)
+        details = RoundingPolicy(decimals=1).details(result)
+        assert details.keys() == result.get_details().keys()
+        assert details["weighted_average"] == 13.5
+
+    def test_should_format_with_policy_decimals(self):
+        """Test formatting of rounded values."""
+        assert RoundingPolicy(decimals=0).format(15.0) == "15"
+        assert RoundingPolicy(decimals=3).format(1.5) == "1.500"
+
+    def test_should_reject_unknown_mode(self):
+        """Test the mode validation."""
+        with pytest.raises(ValueError, match="Unknown rounding mode: ceil"):
+            RoundingPolicy("ceil")
+
+    @pytest.mark.parametrize("decimals", [-1, 7, 1.5, True])
+    def test_should_reject_invalid_decimals(self, decimals):
+        """Test the decimals validation."""
+        with pytest.raises(ValueError, match="decimals must be between 0 and 6"):
+            RoundingPolicy(decimals=decimals)
+
+
+class TestRoundingAcrossWriters:
+    """Every writer must show the same numbers for the same policy."""
+
+    POLICY = RoundingPolicy(RoundingPolicy.HALF_UP, 0)
+    ROWS = [
+        ("U001", [14.5, 12.5], [50.0, 50.0], True),
+        ("U002", [13.45], [100.0], True),
+        ("U003", [10.49], [100.0], False),
+    ]
+
+    def test_should_write_identical_numbers(self, tmp_path):
+        """Test batch CSV, pipeline CSV, slips and the daemon agree."""
+        input_path = str(tmp_path / "roster.csv")
+        write_roster(self.ROWS, input_path)
+        outputs = []
+        for runner in (
+            BatchRunner(ExtraPointsPolicy([True]), 0, rounding_policy=self.POLICY),
+            StreamingPipeline(
+                ExtraPointsPolicy([True]), 0, rounding_policy=self.POLICY
+            ),
+        ):
+            output_path = str(tmp_path / "results.csv")
+            runner.run(input_path, output_path)
+            with open(output_path, encoding="utf-8", newline="") as output_file:
+                outputs.append(
+                    [row["final_grade"] for row in csv.DictReader(output_file)]
+                )
+        assert outputs[0] == outputs[1] == ["15.0", "14.0", "0.0"]
+
+        daemon = GradingDaemon(str(tmp_path / "grader.sock"))
+        template = ReportTemplate("$final_grade", rounding_policy=self.POLICY)
+        for (student_id, grades, weights, attendance), expected in zip(
+            self.ROWS, outputs[0]
+        ):
+            response = daemon.handle(
+                {
+                    "op": GRADE,
+                    "grades": grades,
+                    "weights": weights,
+                    "attendance": attendance,
+                    "consensus": [True],
+                    "year": 0,
+                    "rounding": {"mode": self.POLICY.mode, "decimals": 0},
+                }
+            )
+            final_grade = response["result"]["final_grade"]
+            assert final_grade == float(expected)
+            result = GradeCalculationResult(0.0, False, 0.0, final_grade)
+            assert template.render(student_id, result) == f"{float(expected):.0f}"
@@ -0,0 +1,200 @@
+"""
+Unit tests for the rule versions module.
+"""
+
+import csv
+import json
+
+import pytest
+
+from src.batch_grader import BatchGradeCalculator, GradingRules
+from src.extra_points_policy import ExtraPointsPolicy
+from src.roster_generator import RosterGenerator
+from src.roster_io import write_roster
+from src.rounding_policy import RoundingPolicy
+from src.rule_versions import (
+    DualRunComparator,
+    RuleDisagreement,
+    RuleVersionRegistry,
+)
+
+ROWS = [
+    ("U001", [10.0], [100.0], True),
+    ("U002", [15.0], [100.0], True),
+    ("U003", [20.0], [100.0], False),
+    ("U004", [19.5], [100.0], True),
+    ("U005", [9.8], [100.0], True),
+]
+
+
+class TestRuleVersionRegistry:
+    """Test cases for RuleVersionRegistry class."""
+
+    def test_should_pin_current_rules_by_default(self):
+        """Test the default registry."""
+        registry = RuleVersionRegistry()
+        assert registry.versions == [RuleVersionRegistry.CURRENT_VERSION]
+        assert registry.pinned_rules == GradingRules()
+
+    def test_should_register_and_pin_versions(self):
+        """Test registering a new version and pinning it."""
+        registry = RuleVersionRegistry()
+        registry.register("2026-1", GradingRules(extra_points_value=1.5))
+        registry.pin("2026-1")
+        assert registry.pinned == "2026-1"
+        assert registry.pinned_rules.extra_points_value == 1.5
+        assert "2026-1" in registry and len(registry) == 2
+
+    def test_should_reject_duplicates_and_unknown_versions(self):
+        """Test the registry validation."""
+        registry = RuleVersionRegistry()
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register(RuleVersionRegistry.CURRENT_VERSION, GradingRules())
+        with pytest.raises(ValueError, match="Unknown rule version: 2030"):
+            registry.pin("2030")
+
+    def test_should_load_versions_from_json(self, tmp_path):
+        """Test the JSON file format."""
+        path = tmp_path / "rules.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "pinned": "2026-1",
+                    "versions": {
+                        "2026-1": {"extra_points_value": 1.5, "attendance_penalty": 5}
+                    },
+                }
+            )
+        )
+        registry = RuleVersionRegistry.load(str(path))
+        assert registry.versions == ["current", "2026-1"]
+        assert registry.pinned_rules == GradingRules(1.5, 5.0)
+
+    @pytest.mark.parametrize(
+        "document, message",
+        [
+            ({}, "must have a 'versions' object"),
+            ({"versions": {"v2": {"bonus": 1}}}, "v2 has unknown values"),
+            ({"versions": {"v2": {}}, "pinned": "v3"}, "Unknown rule version: v3"),
+        ],
+    )
+    def test_should_reject_invalid_json(self, tmp_path, document, message):
+        """Test the JSON file validation."""
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps(document))
+        with pytest.raises(ValueError, match=message):
+            RuleVersionRegistry.from_json(str(path))
+
+
+class TestDualRunComparator:
+    """Test cases for DualRunComparator class."""
+
+    def test_should_keep_only_disagreements(self):
+        """Test a larger extra points value on a year with consensus."""
+        comparator = DualRunComparator(
+            GradingRules(), GradingRules(extra_points_value=1.5)
+        )
+        disagreements, summary = comparator.compare(ROWS, has_consensus=True)
+        # U003 has no attendance, so both versions give the penalty grade.
+        assert [item.student_id for item in disagreements] == [
+            "U001",
+            "U002",
+            "U004",
+            "U005",
+        ]
+        assert disagreements[0].difference == pytest.approx(0.5)
+        assert disagreements[0].outcome_change == RuleDisagreement.NO_OUTCOME_CHANGE
+        # U004 is capped at 20 by both, but the applied extra points differ.
+        assert disagreements[2].difference == 0.0
+        assert disagreements[3].outcome_change == RuleDisagreement.FAIL_TO_PASS
+        assert summary.to_dict() == {
+            "rows_compared": 5,
+            "disagreements": 4,
+            "pass_to_fail": 0,
+            "fail_to_pass": 1,
+        }
+
+    def test_should_match_two_separate_batch_runs(self):
+        """Test that the single pass agrees with grading twice."""
+        roster = RosterGenerator(3).generate(500)
+        baseline = GradingRules()
+        candidate = GradingRules(attendance_penalty=5.0, extra_points_value=0.5)
+        old, new = [
+            BatchGradeCalculator(rules).calculate_batch(
+                roster.grades, roster.weights, roster.attendance, [True] * 500
+            )
+            for rules in (baseline, candidate)
+        ]
+        disagreements, _ = DualRunComparator(baseline, candidate).compare(
+            roster.iter_rows(), has_consensus=True
+        )
+        assert [item.row for item in disagreements] == [
+            row
+            for row in range(500)
+            if old[row].final_grade != new[row].final_grade
+            or old[row].extra_points_applied != new[row].extra_points_applied
+        ]
+        assert all(
+            item.candidate.final_grade == new[item.row].final_grade
+            for item in disagreements
+        )
+
+    def test_should_write_disagreements_file(self, tmp_path):
+        """Test comparing a roster file between registered versions."""
+        registry = RuleVersionRegistry()
+        registry.register("strict", GradingRules(extra_points_value=0.0))
+        input_path = str(tmp_path / "roster.csv")
+        output_path = str(tmp_path / "diff.csv")
+        write_roster(ROWS, input_path)
+        summary = DualRunComparator.from_registry(
+            registry, "current", "strict"
+        ).compare_file(input_path, output_path, ExtraPointsPolicy([True]), 0)
+        with open(output_path, encoding="utf-8", newline="") as output_file:
+            rows = list(csv.DictReader(output_file))
+        assert summary.disagreements == len(rows) == 4
+        assert rows[0] == {
+            "student_id": "U001",
+            "baseline_final_grade": "11.0",
+            "candidate_final_grade": "10.0",
+            "difference": "-1.0",
+            "baseline_extra_points": "1.0",
+            "candidate_extra_points": "0.0",
+            "outcome_change": RuleDisagreement.PASS_TO_FAIL,
+        }
+
+    def test_should_write_disagreements_with_rounding_policy(self, tmp_path):
+        """Test that the written numbers follow the given rounding policy."""
+        registry = RuleVersionRegistry()
+        registry.register("half", GradingRules(extra_points_value=0.5))
+        input_path = str(tmp_path / "roster.csv")
+        output_path = str(tmp_path / "diff.csv")
+        write_roster(ROWS, input_path)
+        DualRunComparator.from_registry(registry, "current", "half").compare_file(
+            input_path,
+            output_path,
+            ExtraPointsPolicy([True]),
+            0,
+            rounding_policy=RoundingPolicy("truncate", 0),
+        )
+        with open(output_path, encoding="utf-8", newline="") as output_file:
+            rows = {row["student_id"]: row for row in csv.DictReader(output_file)}
+        assert rows["U005"]["baseline_final_grade"] == "10.0"
+        assert rows["U005"]["candidate_final_grade"] == "10.0"
+        assert rows["U005"]["candidate_extra_points"] == "0.0"
+        assert float(rows["U005"]["difference"]) == 0.0
+
+    def test_should_reject_out_of_range_year(self, tmp_path):
+        """Test that the year is checked like in the batch runner."""
+        input_path = str(tmp_path / "roster.csv")
+        write_roster(ROWS, input_path)
+        with pytest.raises(ValueError, match="Year index must be between 0 and 0"):
+            DualRunComparator(GradingRules(), GradingRules()).compare_file(
+                input_path, str(tmp_path / "diff.csv"), ExtraPointsPolicy([True]), 98
+            )
+
+    def test_should_reject_invalid_rows(self):
+        """Test that rows are validated like the batch path."""
+        with pytest.raises(ValueError, match="Row 0: total weight must sum"):
+            DualRunComparator(GradingRules(), GradingRules()).compare(
+                [("U001", [10.0], [90.0], True)], has_consensus=False
+            )
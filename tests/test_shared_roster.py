@@ -0,0 +1,112 @@
+"""
+Unit tests for the shared roster module.
+"""
+
+from multiprocessing import shared_memory
+
+import pytest
+
+from src.batch_grader import BatchGradeCalculator, GradingRules
+from src.roster_generator import RosterGenerator
+from src.shared_roster import SharedMemoryBatchGradeCalculator, SharedRoster
+
+
+def _columns(student_count: int, seed: int = 7):
+    """Build seeded roster columns."""
+    roster = RosterGenerator(seed).generate(student_count)
+    consensus = [index % 2 == 0 for index in range(student_count)]
+    return roster.grades, roster.weights, roster.attendance, consensus
+
+
+class TestSharedRoster:
+    """Test cases for SharedRoster class."""
+
+    def test_should_grade_slices_in_place(self):
+        """Test that grading slices fills the output block like the batch path."""
+        grades, weights, attendance, consensus = _columns(20)
+        expected = BatchGradeCalculator().calculate_batch(
+            grades, weights, attendance, consensus
+        )
+        with SharedRoster.create(grades, weights, attendance, consensus) as shared:
+            shared.grade_slice(GradingRules(), 0, 12)
+            shared.grade_slice(GradingRules(), 12, 20)
+            results = shared.read_results()
+        assert [result.get_details() for result in results] == [
+            result.get_details() for result in expected
+        ]
+
+    def test_should_share_blocks_with_attached_instance(self):
+        """Test that an attached instance writes into the owner's blocks."""
+        grades, weights, attendance, consensus = _columns(5)
+        with SharedRoster.create(grades, weights, attendance, consensus) as shared:
+            with SharedRoster.attach(shared.descriptor) as attached:
+                attached.grade_slice(GradingRules(), 0, 5)
+            assert shared.read_results()[0].weighted_average > 0
+
+    def test_should_unlink_blocks_when_owner_closes(self):
+        """Test that closing the owner releases the shared blocks."""
+        grades, weights, attendance, consensus = _columns(3)
+        shared = SharedRoster.create(grades, weights, attendance, consensus)
+        name = shared.descriptor.block_names[SharedRoster.GRADES]
+        shared.close()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+    def test_should_support_empty_roster(self):
+        """Test that an empty roster yields no results."""
+        with SharedRoster.create([], [], [], []) as shared:
+            assert len(shared) == 0
+            assert shared.read_results() == []
+
+    def test_should_reject_columns_of_different_length(self):
+        """Test that mismatched columns are rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            SharedRoster.create([[15.0]], [[100.0]], [], [True])
+
+    def test_should_reject_too_many_evaluations(self):
+        """Test that rows wider than the block stride are rejected."""
+        count = SharedRoster.STRIDE + 1
+        with pytest.raises(ValueError, match="Row 0"):
+            SharedRoster.create(
+                [[10.0] * count], [[100.0 / count] * count], [True], [False]
+            )
+
+    def test_should_reject_invalid_row_when_grading(self):
+        """Test that validation reports the offending row index."""
+        with SharedRoster.create(
+            [[15.0], [25.0]], [[100.0], [100.0]], [True, True], [False, False]
+        ) as shared:
+            with pytest.raises(ValueError, match="Row 1"):
+                shared.grade_slice(GradingRules(), 0, 2)
+
+
+    def test_should_reject_non_boolean_attendance(self):
+        """Test that "n" is not stored as attended."""
+        with pytest.raises(ValueError, match="Row 1: has_reached_minimum"):
+            SharedRoster.create(
+                [[15.0], [12.0]], [[100.0], [100.0]], [True, "n"], [False, False]
+            )
+
+
+class TestSharedMemoryBatchGradeCalculator:
+    """Test cases for SharedMemoryBatchGradeCalculator class."""
+
+    def test_should_match_sequential_results_with_workers(self):
+        """Test that shared-memory workers produce the sequential results."""
+        grades, weights, attendance, consensus = _columns(50)
+        expected = BatchGradeCalculator().calculate_batch(
+            grades, weights, attendance, consensus
+        )
+        with SharedMemoryBatchGradeCalculator(workers=2, chunk_size=10) as calculator:
+            results = calculator.calculate_batch(grades, weights, attendance, consensus)
+        assert [result.get_details() for result in results] == [
+            result.get_details() for result in expected
+        ]
+
+    def test_should_raise_worker_validation_error(self):
+        """Test that an invalid row graded in a worker surfaces as ValueError."""
+        grades, weights, attendance, consensus = _columns(20)
+        grades[15] = [25.0] * len(grades[15])
+        with SharedMemoryBatchGradeCalculator(workers=2, chunk_size=5) as calculator:
+            with pytest.raises(ValueError, match="Row 15"):
+                calculator.calculate_batch(grades, weights, attendance, consensus)
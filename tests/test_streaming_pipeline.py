@@ -0,0 +1,195 @@
+"""
+Unit tests for the streaming pipeline module.
+"""
+
+import csv
+import json
+import threading
+
+import pytest
+
+from src.batch_grader import BatchGradeCalculator
+from src.batch_runner import BatchRunner
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grading_logging import GradingLogSession
+from src.roster_generator import RosterGenerator
+from src.roster_io import write_roster
+from src.streaming_pipeline import StreamingPipeline
+from src.validation import BatchValidator
+
+
+def read_results(path):
+    """Read a results CSV into a list of dictionaries."""
+    with open(path, encoding="utf-8", newline="") as results_file:
+        return list(csv.DictReader(results_file))
+
+
+class _FailingCalculator(BatchGradeCalculator):
+    """Batch calculator that fails on its second chunk."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def calculate_batch(self, grades, weights, attendance, consensus, validate=True):
+        self.calls += 1
+        if self.calls == 2:
+            raise ValueError("grading failed")
+        return super().calculate_batch(grades, weights, attendance, consensus, validate)
+
+
+class TestStreamingPipeline:
+    """Test cases for StreamingPipeline class."""
+
+    def test_should_match_batch_runner_output(self, tmp_path):
+        """Test that the pipelined run writes the same results in order."""
+        roster = RosterGenerator(seed=3).generate(250)
+        input_path = str(tmp_path / "roster.jsonl")
+        write_roster(roster.iter_rows(), input_path)
+        expected_path = str(tmp_path / "expected.csv")
+        output_path = str(tmp_path / "results.csv")
+
+        BatchRunner(ExtraPointsPolicy([True]), 0).run(input_path, expected_path)
+        summary = StreamingPipeline(
+            ExtraPointsPolicy([True]), 0, chunk_size=16, queue_size=2
+        ).run(input_path, output_path)
+
+        assert read_results(output_path) == read_results(expected_path)
+        assert summary.rows_processed == 250
+
+    def test_should_report_metrics_per_stage(self, tmp_path):
+        """Test that every stage reports the rows it handled."""
+        roster = RosterGenerator(seed=3).generate(40)
+        input_path = str(tmp_path / "roster.csv")
+        write_roster(roster.iter_rows(), input_path)
+
+        summary = StreamingPipeline(ExtraPointsPolicy([False]), 0, chunk_size=10).run(
+            input_path, str(tmp_path / "results.csv")
+        )
+
+        assert [stage.name for stage in summary.stages] == [
+            StreamingPipeline.READ_STAGE,
+            StreamingPipeline.VALIDATE_STAGE,
+            StreamingPipeline.GRADE_STAGE,
+            StreamingPipeline.WRITE_STAGE,
+        ]
+        assert all(stage.rows == 40 for stage in summary.stages)
+        assert all(stage.chunks == 4 for stage in summary.stages)
+        assert summary.stages[0].to_dict()["rows"] == 40
+
+    def test_should_skip_invalid_rows(self, tmp_path):
+        """Test that invalid rows are dropped and reported with their index."""
+        input_path = str(tmp_path / "roster.csv")
+        output_path = str(tmp_path / "results.csv")
+        write_roster(
+            [
+                ("U001", [15.0], [100.0], True),
+                ("U002", [25.0], [100.0], True),
+                ("U003", [12.0], [100.0], True),
+            ],
+            input_path,
+        )
+
+        summary = StreamingPipeline(
+            ExtraPointsPolicy([False]), 0, chunk_size=2, skip_invalid=True
+        ).run(input_path, output_path)
+
+        assert [row["student_id"] for row in read_results(output_path)] == [
+            "U001",
+            "U003",
+        ]
+        assert summary.rows_skipped == 1
+        assert summary.validation_report.invalid_rows == [1]
+        assert summary.validation_report.count_by_code() == {
+            BatchValidator.GRADE_OUT_OF_RANGE: 1
+        }
+
+    def test_should_raise_invalid_row_without_skip(self, tmp_path):
+        """Test that an invalid row stops the run with its position."""
+        input_path = str(tmp_path / "roster.csv")
+        write_roster(
+            [("U001", [15.0], [100.0], True), ("U002", [15.0], [90.0], True)],
+            input_path,
+        )
+
+        with pytest.raises(ValueError, match="Row 1: Total weight"):
+            StreamingPipeline(ExtraPointsPolicy([False]), 0, chunk_size=1).run(
+                input_path, str(tmp_path / "results.csv")
+            )
+
+    def test_should_stop_every_stage_when_one_fails(self, tmp_path):
+        """Test graceful shutdown when a stage raises mid-run."""
+        roster = RosterGenerator(seed=5).generate(200)
+        input_path = str(tmp_path / "roster.csv")
+        write_roster(roster.iter_rows(), input_path)
+        threads_before = threading.active_count()
+
+        with pytest.raises(ValueError, match="grading failed"):
+            StreamingPipeline(
+                ExtraPointsPolicy([False]),
+                0,
+                batch_calculator=_FailingCalculator(),
+                chunk_size=5,
+                queue_size=1,
+            ).run(input_path, str(tmp_path / "results.csv"))
+
+        assert threading.active_count() == threads_before
+
+    def test_should_log_batch_and_invalid_row_events(self, tmp_path):
+        """Test that the stages log the same events as the batch runner."""
+        input_path = str(tmp_path / "roster.csv")
+        log_path = str(tmp_path / "run.log")
+        write_roster(
+            [("U001", [15.0], [100.0], True), ("U002", [25.0], [100.0], True)],
+            input_path,
+        )
+
+        with GradingLogSession(log_path) as session:
+            StreamingPipeline(
+                ExtraPointsPolicy([False]), 0, chunk_size=1, skip_invalid=True
+            ).run(input_path, str(tmp_path / "results.csv"))
+
+        with open(log_path, encoding="utf-8") as log_file:
+            events = [json.loads(line) for line in log_file]
+        assert [event["event"] for event in events] == [
+            "batch_started",
+            "invalid_row",
+            "batch_finished",
+        ]
+        assert events[1]["row"] == 1
+        assert events[2]["skipped"] == 1
+        assert session.error_counts == {BatchValidator.GRADE_OUT_OF_RANGE: 1}
+
+    def test_should_log_failed_chunk(self, tmp_path):
+        """Test that a chunk failing in a stage is logged with its stage."""
+        input_path = str(tmp_path / "roster.csv")
+        log_path = str(tmp_path / "run.log")
+        write_roster(
+            [("U001", [15.0], [100.0], True), ("U002", [15.0], [90.0], True)],
+            input_path,
+        )
+
+        with GradingLogSession(log_path) as session:
+            with pytest.raises(ValueError, match="Row 1"):
+                StreamingPipeline(ExtraPointsPolicy([False]), 0, chunk_size=1).run(
+                    input_path, str(tmp_path / "results.csv")
+                )
+
+        with open(log_path, encoding="utf-8") as log_file:
+            failed = [json.loads(line) for line in log_file][-1]
+        assert failed["event"] == "chunk_failed"
+        assert failed["first_row"] == 1
+        assert failed["stage"] == StreamingPipeline.VALIDATE_STAGE
+        assert session.error_counts == {"ValueError": 1}
+
+    def test_should_raise_missing_input(self, tmp_path):
+        """Test that reader errors surface from run()."""
+        with pytest.raises(OSError):
+            StreamingPipeline(ExtraPointsPolicy([False]), 0).run(
+                str(tmp_path / "missing.csv"), str(tmp_path / "results.csv")
+            )
+
+    def test_should_reject_invalid_queue_size(self):
+        """Test that queue_size must be positive."""
+        with pytest.raises(ValueError, match="queue_size"):
+            StreamingPipeline(ExtraPointsPolicy([False]), 0, queue_size=0)
@@ -93,6 +93,31 @@ class TestStudent:
 
         assert student.get_evaluation_count() == 1
 
+    def test_should_reuse_evaluation_view_until_mutation(self):
+        """Test that the tuple view is cached and refreshed on change."""
+        student = Student("U202012345")
+        student.add_evaluation(Evaluation(15.0, 50.0))
+        view = student.evaluation_view
+        assert isinstance(view, tuple)
+        assert student.evaluation_view is view
+
+        student.add_evaluation(Evaluation(16.0, 50.0))
+        assert len(view) == 1
+        assert [evaluation.grade for evaluation in student.evaluation_view] == [
+            15.0,
+            16.0,
+        ]
+        student.clear_evaluations()
+        assert student.evaluation_view == ()
+
+    def test_should_not_expose_internal_list_through_view(self):
+        """Test that the view cannot change the student's evaluations."""
+        student = Student("U202012345")
+        student.add_evaluation(Evaluation(15.0, 50.0))
+        with pytest.raises(AttributeError):
+            student.evaluation_view.append(Evaluation(16.0, 50.0))
+        assert student.get_evaluation_count() == 1
+
     def test_should_clear_all_evaluations(self):
         """Test clearing all evaluations."""
         student = Student("U202012345")
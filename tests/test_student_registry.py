@@ -0,0 +1,155 @@
+"""
+Unit tests for the student registry module.
+"""
+
+import pytest
+
+from src.evaluation import Evaluation
+from src.student import Student
+from src.student_registry import StudentRegistry
+
+
+def make_student(student_id, attendance=True, grade=None):
+    """Build a student with an optional single evaluation."""
+    student = Student(student_id, attendance)
+    if grade is not None:
+        student.add_evaluation(Evaluation(grade, 100.0))
+    return student
+
+
+class TestStudentRegistry:
+    """Test cases for StudentRegistry class."""
+
+    def test_should_find_students_by_normalized_id(self):
+        """Test that lookups strip whitespace like Student does."""
+        registry = StudentRegistry()
+        student = make_student("U001")
+        registry.add(student)
+        assert registry.get("  U001 ") is student
+        assert registry.find("U001\t") is student
+        assert " U001" in registry
+
+    def test_should_raise_for_unknown_student(self):
+        """Test that missing students raise ValueError."""
+        with pytest.raises(ValueError, match="Student U404 is not registered"):
+            StudentRegistry().get(" U404 ")
+        assert StudentRegistry().find("U404") is None
+
+    def test_should_reject_empty_id(self):
+        """Test the identifier validation."""
+        with pytest.raises(ValueError, match="Student ID must be a non-empty string"):
+            StudentRegistry().get("   ")
+
+    def test_should_reject_duplicate_add(self):
+        """Test that add() does not replace students."""
+        registry = StudentRegistry()
+        registry.add(make_student("U001"))
+        with pytest.raises(ValueError, match="already registered"):
+            registry.add(make_student("U001"))
+
+    def test_should_replace_in_place_on_upsert(self):
+        """Test that replacing a student keeps the iteration order."""
+        registry = StudentRegistry()
+        for student_id in ("U001", "U002", "U003"):
+            registry.add(make_student(student_id))
+        replacement = make_student("U002", grade=18.0)
+        assert registry.upsert(replacement) is False
+        assert [student.student_id for student in registry] == ["U001", "U002", "U003"]
+        assert registry.get("U002") is replacement
+
+    def test_should_bulk_upsert(self):
+        """Test counting added and replaced students."""
+        registry = StudentRegistry()
+        registry.add(make_student("U001"))
+        added, replaced = registry.upsert_many(
+            [make_student("U001"), make_student("U002"), make_student("U003")],
+            section="A",
+        )
+        assert (added, replaced) == (2, 1)
+        assert [student.student_id for student in registry.in_section("A")] == [
+            "U001",
+            "U002",
+            "U003",
+        ]
+
+    def test_should_not_store_anything_on_invalid_bulk(self):
+        """Test that a bad element rejects the whole bulk upsert."""
+        registry = StudentRegistry()
+        with pytest.raises(ValueError, match="valid Student"):
+            registry.upsert_many([make_student("U001"), "U002"])
+        assert len(registry) == 0
+
+    def test_should_index_sections(self):
+        """Test the section index when students move."""
+        registry = StudentRegistry()
+        registry.add(make_student("U001"), section="A")
+        registry.add(make_student("U002"), section="A")
+        registry.set_section("U001", "B")
+        assert registry.section_of("U001") == "B"
+        assert [student.student_id for student in registry.in_section("A")] == [
+            "U002"
+        ]
+        registry.set_section("U002", None)
+        assert registry.sections == ["B"]
+        assert registry.in_section("A") == []
+
+    def test_should_keep_section_on_upsert_without_section(self):
+        """Test that corrections do not drop a student's section."""
+        registry = StudentRegistry()
+        registry.add(make_student("U001"), section="A")
+        registry.upsert(make_student("U001", grade=12.0))
+        assert registry.section_of("U001") == "A"
+
+    def test_should_index_attendance(self):
+        """Test the attendance index through set_attendance and upsert."""
+        registry = StudentRegistry()
+        registry.add(make_student("U001", attendance=True))
+        registry.add(make_student("U002", attendance=False))
+        registry.set_attendance("U001", False)
+        assert [student.student_id for student in registry.with_attendance(False)] == [
+            "U002",
+            "U001",
+        ]
+        registry.upsert(make_student("U002", attendance=True))
+        assert [student.student_id for student in registry.with_attendance(True)] == [
+            "U002"
+        ]
+
+    def test_should_reindex_student_changed_through_its_setter(self):
+        """Test upsert and remove after the attendance changed directly."""
+        registry = StudentRegistry()
+        student = make_student("U1", attendance=True)
+        registry.add(student)
+        student.has_reached_minimum_attendance = False
+        registry.upsert(student)
+        assert registry.with_attendance(True) == []
+        assert registry.with_attendance(False) == [student]
+        student.has_reached_minimum_attendance = True
+        registry.remove("U1")
+        assert registry.with_attendance(True) == []
+        assert registry.with_attendance(False) == []
+
+    def test_should_remove_from_every_index(self):
+        """Test that removal cleans the secondary indexes."""
+        registry = StudentRegistry()
+        registry.add(make_student("U001"), section="A")
+        removed = registry.remove(" U001 ")
+        assert removed.student_id == "U001"
+        assert len(registry) == 0
+        assert registry.sections == []
+        assert registry.with_attendance(True) == []
+        assert registry.section_of("U001") is None
+
+    def test_should_build_roster_columns(self):
+        """Test conversion to roster columns for batch grading."""
+        registry = StudentRegistry()
+        registry.add(make_student("U001", grade=15.0), section="A")
+        registry.add(make_student("U002", grade=12.0), section="B")
+        roster = registry.to_roster()
+        assert roster.student_ids == ["U001", "U002"]
+        assert registry.to_roster("B").grades == [[12.0]]
+
+    def test_should_reject_invalid_section(self):
+        """Test the section validation."""
+        with pytest.raises(ValueError, match="Section must be a non-empty string"):
+            StudentRegistry().add(make_student("U001"), section="")
@@ -0,0 +1,112 @@
+"""
+Unit tests for the validation module.
+"""
+
+import pytest
+
+from src.extra_points_policy import ExtraPointsPolicy
+from src.roster_columns import RosterColumns
+from src.roster_generator import RosterGenerator
+from src.validation import BatchValidator, ValidationIssue, ValidationReport
+
+
+class TestBatchValidator:
+    """Test cases for BatchValidator class."""
+
+    def test_should_accept_generated_roster(self):
+        """Test that a valid roster produces an empty report."""
+        roster = RosterGenerator(seed=1).generate(100)
+        report = BatchValidator().validate_roster(roster)
+        assert report.is_valid
+        assert len(report) == 0
+
+    def test_should_collect_every_problem_without_raising(self):
+        """Test that all bad rows are reported in one pass."""
+        report = BatchValidator().validate(
+            grades=[[15.0], [21.0, 10.0], [15.0], []],
+            weights=[[100.0], [50.0, 40.0], [100.0, 0.0], []],
+        )
+        assert report.invalid_rows == [1, 2, 3]
+        assert report.count_by_code() == {
+            BatchValidator.GRADE_OUT_OF_RANGE: 1,
+            BatchValidator.WEIGHT_SUM: 1,
+            BatchValidator.LENGTH_MISMATCH: 1,
+            BatchValidator.NO_EVALUATIONS: 1,
+        }
+
+    def test_should_report_row_field_code_and_message(self):
+        """Test the contents of a single issue."""
+        report = BatchValidator().validate([[15.0, 25.0]], [[50.0, 50.0]])
+        issue = report.issues[0]
+        assert issue.to_dict() == {
+            "row": 0,
+            "field": "grades",
+            "code": BatchValidator.GRADE_OUT_OF_RANGE,
+            "message": "Grade 1 must be between 0.0 and 20.0",
+        }
+
+    def test_should_report_non_numeric_values(self):
+        """Test that non-numeric grades and weights are reported."""
+        report = BatchValidator().validate([["a"]], [["b"]])
+        assert set(report.count_by_code()) == {
+            BatchValidator.GRADE_NOT_NUMBER,
+            BatchValidator.WEIGHT_NOT_NUMBER,
+        }
+
+    @pytest.mark.parametrize(
+        "grades, weights, field",
+        [
+            (15.0, [100.0], "grades"),
+            ("ab", [100.0], "grades"),
+            ([15.0], None, "weights"),
+        ],
+    )
+    def test_should_report_values_that_are_not_lists(self, grades, weights, field):
+        """Test that a grades or weights value that is not a list is reported."""
+        report = BatchValidator().validate([grades], [weights])
+        assert report.count_by_code() == {BatchValidator.NOT_A_LIST: 1}
+        assert report.issues[0].field == field
+        assert report.issues[0].message == f"{field} must be a list of numbers"
+
+    def test_should_report_too_many_evaluations(self):
+        """Test the evaluation limit."""
+        report = BatchValidator().validate([[10.0] * 11], [[100.0 / 11] * 11])
+        assert BatchValidator.TOO_MANY_EVALUATIONS in report.count_by_code()
+
+    def test_should_report_identifier_and_attendance_problems(self):
+        """Test the optional student id and attendance columns."""
+        roster = RosterColumns([" "], [[15.0]], [[100.0]], ["yes"])
+        report = BatchValidator().validate_roster(roster)
+        assert report.count_by_code() == {
+            BatchValidator.STUDENT_ID_EMPTY: 1,
+            BatchValidator.ATTENDANCE_NOT_BOOLEAN: 1,
+        }
+
+    def test_should_raise_error_when_columns_differ_in_length(self):
+        """Test that mismatched columns are a caller error."""
+        with pytest.raises(ValueError, match="same length"):
+            BatchValidator().validate([[15.0]], [])
+
+    def test_should_report_out_of_range_years_in_bulk(self):
+        """Test that every invalid year index becomes one issue."""
+        report = BatchValidator().validate_years(
+            [0, 3, 1, -1], ExtraPointsPolicy([True, False])
+        )
+        assert report.invalid_rows == [1, 3]
+        assert report.count_by_code() == {BatchValidator.YEAR_OUT_OF_RANGE: 2}
+        assert report.issues[0].message == "Year index must be between 0 and 1, got 3"
+
+
+class TestValidationReport:
+    """Test cases for ValidationReport class."""
+
+    def test_should_build_valid_mask(self):
+        """Test the mask of valid rows."""
+        report = ValidationReport([ValidationIssue(1, "grades", "x", {})])
+        assert report.valid_mask(3) == [True, False, True]
+
+    def test_should_extend_with_row_offset(self):
+        """Test merging the report of a later chunk."""
+        report = ValidationReport()
+        report.extend(ValidationReport([ValidationIssue(2, "grades", "x", {})]), 10)
+        assert report.invalid_rows == [12]
@@ -0,0 +1,126 @@
+"""
+Unit tests for the weight template module.
+"""
+
+import pytest
+
+from src.attendance_policy import AttendancePolicy
+from src.batch_grader import GradingRules
+from src.extra_points_policy import ExtraPointsPolicy
+from src.grade_calculator import GradeCalculator
+from src.roster_generator import RosterGenerator
+from src.weight_template import WeightTemplate, WeightTemplateRegistry
+
+
+class TestWeightTemplate:
+    """Test cases for WeightTemplate class."""
+
+    def test_should_store_weights_as_fractions(self):
+        """Test that weights are normalized once."""
+        template = WeightTemplate([30, 40, 30])
+        assert template.weights == (30.0, 40.0, 30.0)
+        assert template.fractions == (0.3, 0.4, 0.3)
+        assert len(template) == 3
+
+    def test_should_reject_weights_not_summing_to_100(self):
+        """Test that invalid weights are rejected at registration."""
+        with pytest.raises(ValueError, match="Total weight must sum to 100.0"):
+            WeightTemplate([30.0, 40.0])
+
+    def test_should_reject_too_many_evaluations(self):
+        """Test the evaluation count limit."""
+        count = GradeCalculator.MAX_EVALUATIONS + 1
+        with pytest.raises(ValueError, match="Cannot have more than"):
+            WeightTemplate([100.0 / count] * count)
+
+    def test_should_reject_out_of_range_weight(self):
+        """Test the Evaluation weight range."""
+        with pytest.raises(ValueError, match="Weight must be between"):
+            WeightTemplate([150.0, -50.0])
+
+    def test_should_match_grade_calculator_exactly(self):
+        """Test parity with GradeCalculator on seeded grade vectors."""
+        generator = RosterGenerator(seed=9)
+        weights = generator.create_weights(5)
+        template = WeightTemplate(weights)
+        policy = ExtraPointsPolicy([True])
+        for _ in range(200):
+            grades = generator.create_grades(5)
+            expected = GradeCalculator(
+                evaluations=template.to_evaluations(grades),
+                attendance_policy=AttendancePolicy(True),
+                extra_points_policy=policy,
+                current_year_index=0,
+            ).calculate_final_grade()
+            result = template.calculate(grades, True, True)
+            assert result.weighted_average == expected.weighted_average
+            assert result.final_grade == expected.final_grade
+
+    def test_should_apply_attendance_penalty(self):
+        """Test that the template applies the grading rules."""
+        result = WeightTemplate([50.0, 50.0]).calculate([18.0, 16.0], False, True)
+        assert result.attendance_penalty_applied is True
+        assert result.final_grade == 0.0
+
+    def test_should_use_custom_rules(self):
+        """Test that templates carry their own rules."""
+        template = WeightTemplate([100.0], GradingRules(extra_points_value=2.0))
+        assert template.calculate([15.0], True, True).final_grade == 17.0
+
+    def test_should_reject_wrong_grade_count(self):
+        """Test that the grade vector must fit the template."""
+        with pytest.raises(ValueError, match="Expected 2 grades, got 1"):
+            WeightTemplate([50.0, 50.0]).calculate([15.0], True, False)
+
+    def test_should_reject_out_of_range_grade(self):
+        """Test the Evaluation grade range."""
+        with pytest.raises(ValueError, match="Grade must be between"):
+            WeightTemplate([100.0]).calculate([21.0], True, False)
+
+    def test_should_grade_a_section(self):
+        """Test batch grading of grade vectors."""
+        results = WeightTemplate([50.0, 50.0]).calculate_batch(
+            [[10.0, 12.0], [20.0, 20.0]], [True, True], [False, True]
+        )
+        assert [result.final_grade for result in results] == [11.0, 20.0]
+
+    def test_should_report_row_of_invalid_grades(self):
+        """Test that batch errors name the offending row."""
+        with pytest.raises(ValueError, match="Row 1: Grade must be between"):
+            WeightTemplate([100.0]).calculate_batch(
+                [[10.0], [25.0]], [True, True], [False, False]
+            )
+
+
+class TestWeightTemplateRegistry:
+    """Test cases for WeightTemplateRegistry class."""
+
+    def test_should_register_and_get_template(self):
+        """Test registering a template per course."""
+        registry = WeightTemplateRegistry()
+        template = registry.register("CS1111", [30.0, 40.0, 30.0])
+        assert registry.get(" CS1111 ") is template
+        assert "CS1111" in registry
+        assert registry.courses == ["CS1111"]
+
+    def test_should_raise_for_unknown_course(self):
+        """Test that unknown courses raise ValueError."""
+        with pytest.raises(ValueError, match="No weight template"):
+            WeightTemplateRegistry().get("CS9999")
+
+    def test_should_reject_empty_course(self):
+        """Test that the course identifier is required."""
+        with pytest.raises(ValueError, match="Course must be a non-empty string"):
+            WeightTemplateRegistry().register(" ", [100.0])
+
+    def test_should_unregister_course(self):
+        """Test removing a course template."""
+        registry = WeightTemplateRegistry()
+        registry.register("CS1111", [100.0])
+        registry.unregister("CS1111")
+        assert len(registry) == 0
+
+    def test_should_compare_templates_by_value(self):
+        """Test template equality."""
+        assert WeightTemplate([50, 50]) == WeightTemplate([50.0, 50.0])
+        assert WeightTemplate([50, 50]) != WeightTemplate([40.0, 60.0])